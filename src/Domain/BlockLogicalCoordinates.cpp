@@ -3,19 +3,24 @@
 
 #include "Domain/BlockLogicalCoordinates.hpp"
 
+#include <algorithm>
 #include <cstddef>
+#include <optional>
 #include <vector>
 
 #include "DataStructures/IdPair.hpp"
 #include "DataStructures/Tensor/Tensor.hpp"
 #include "DataStructures/Tensor/TypeAliases.hpp"
 #include "Domain/Block.hpp"
+#include "Domain/BlockSpatialIndex.hpp"
 #include "Domain/Domain.hpp"
 #include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
 #include "Domain/Structure/BlockId.hpp"
 #include "Utilities/EqualWithinRoundoff.hpp"
+#include "Utilities/ErrorHandling/Assert.hpp"
 #include "Utilities/ErrorHandling/Error.hpp"
 #include "Utilities/GenerateInstantiations.hpp"
+#include "Utilities/Gsl.hpp"
 
 template <size_t Dim, typename Fr>
 std::optional<tnsr::I<double, Dim, ::Frame::BlockLogical>>
@@ -165,6 +170,66 @@ std::vector<BlockLogicalCoords<Dim>> block_logical_coordinates(
   return block_coord_holders;
 }
 
+template <size_t Dim>
+std::vector<BlockLogicalCoords<Dim>> block_logical_coordinates(
+    const Domain<Dim>& domain, const BlockSpatialIndex<Dim>& spatial_index,
+    const tnsr::I<DataVector, Dim, Frame::Inertial>& x, const double time,
+    const domain::FunctionsOfTimeMap& functions_of_time) {
+  ASSERT(spatial_index.number_of_blocks() == domain.blocks().size(),
+         "The spatial index has " << spatial_index.number_of_blocks()
+                                  << " blocks, but the domain has "
+                                  << domain.blocks().size()
+                                  << ". Build the index from the same domain.");
+  const size_t num_pts = get<0>(x).size();
+  std::vector<BlockLogicalCoords<Dim>> block_coord_holders(num_pts);
+  std::vector<size_t> candidate_blocks{};
+  for (size_t s = 0; s < num_pts; ++s) {
+    tnsr::I<double, Dim, Frame::Inertial> x_frame(0.0);
+    for (size_t d = 0; d < Dim; ++d) {
+      x_frame.get(d) = x.get(d)[s];
+    }
+    block_coord_holders[s] = block_logical_coordinates_single_point(
+        make_not_null(&candidate_blocks), x_frame, domain, spatial_index, time,
+        functions_of_time);
+  }
+  return block_coord_holders;
+}
+
+template <size_t Dim>
+BlockLogicalCoords<Dim> block_logical_coordinates_single_point(
+    const gsl::not_null<std::vector<size_t>*> candidate_blocks,
+    const tnsr::I<double, Dim, Frame::Inertial>& input_point,
+    const Domain<Dim>& domain, const BlockSpatialIndex<Dim>& spatial_index,
+    const double time, const domain::FunctionsOfTimeMap& functions_of_time) {
+  // The candidate blocks are sorted by block ID, so points on a shared
+  // boundary are assigned to the same block as without the index
+  spatial_index.candidate_blocks(candidate_blocks, input_point);
+  for (const size_t block_id : *candidate_blocks) {
+    auto x_logical = block_logical_coordinates_single_point(
+        input_point, domain.blocks()[block_id], time, functions_of_time);
+    if (x_logical.has_value()) {
+      return make_id_pair(domain::BlockId(block_id),
+                          std::move(x_logical.value()));
+    }
+  }
+  // The bounding boxes are padded heuristically, so they may miss parts of
+  // strongly curved blocks. Try the remaining blocks before concluding that
+  // the point is outside the domain.
+  for (size_t block_id = 0; block_id < domain.blocks().size(); ++block_id) {
+    if (std::binary_search(candidate_blocks->begin(), candidate_blocks->end(),
+                           block_id)) {
+      continue;
+    }
+    auto x_logical = block_logical_coordinates_single_point(
+        input_point, domain.blocks()[block_id], time, functions_of_time);
+    if (x_logical.has_value()) {
+      return make_id_pair(domain::BlockId(block_id),
+                          std::move(x_logical.value()));
+    }
+  }
+  return std::nullopt;
+}
+
 // Explicit instantiations
 #define DIM(data) BOOST_PP_TUPLE_ELEM(0, data)
 #define FRAME(data) BOOST_PP_TUPLE_ELEM(1, data)
@@ -184,6 +249,24 @@ std::vector<BlockLogicalCoords<Dim>> block_logical_coordinates(
 GENERATE_INSTANTIATIONS(INSTANTIATE, (1, 2, 3),
                         (::Frame::Grid, ::Frame::Distorted, ::Frame::Inertial))
 
+#define INSTANTIATE_INDEX(_, data)                                             \
+  template std::vector<BlockLogicalCoords<DIM(data)>>                          \
+  block_logical_coordinates(                                                   \
+      const Domain<DIM(data)>& domain,                                         \
+      const BlockSpatialIndex<DIM(data)>& spatial_index,                       \
+      const tnsr::I<DataVector, DIM(data), Frame::Inertial>& x,                \
+      const double time, const domain::FunctionsOfTimeMap& functions_of_time); \
+  template BlockLogicalCoords<DIM(data)>                                       \
+  block_logical_coordinates_single_point(                                      \
+      const gsl::not_null<std::vector<size_t>*> candidate_blocks,              \
+      const tnsr::I<double, DIM(data), Frame::Inertial>& input_point,          \
+      const Domain<DIM(data)>& domain,                                         \
+      const BlockSpatialIndex<DIM(data)>& spatial_index, const double time,    \
+      const domain::FunctionsOfTimeMap& functions_of_time);
+
+GENERATE_INSTANTIATIONS(INSTANTIATE_INDEX, (1, 2, 3))
+
 #undef FRAME
 #undef DIM
 #undef INSTANTIATE
+#undef INSTANTIATE_INDEX
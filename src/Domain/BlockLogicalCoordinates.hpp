@@ -14,6 +14,7 @@
 #include "DataStructures/Tensor/TypeAliases.hpp"
 #include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
 #include "Domain/Structure/BlockId.hpp"
+#include "Utilities/Gsl.hpp"
 
 /// \cond
 class DataVector;
@@ -21,6 +22,8 @@ template <size_t VolumeDim>
 class Domain;
 template <size_t VolumeDim>
 class Block;
+template <size_t Dim>
+class BlockSpatialIndex;
 /// \endcond
 
 template <size_t Dim>
@@ -43,10 +46,22 @@ using BlockLogicalCoords = std::optional<
 /// returned only once, and is considered to belong to the `Block`
 /// with the smaller `BlockId`.
 ///
+/// The overload that takes a `BlockSpatialIndex` only tries the blocks whose
+/// bounding box contains the point, which is much faster for domains with many
+/// blocks. The index must be built from the same `domain` (and, for
+/// time-dependent domains, at the same `time` with the same
+/// `functions_of_time`). It supports only points in the inertial frame. The
+/// bounding boxes may miss parts of strongly curved blocks, so if none of the
+/// candidate blocks contains a point, all other blocks are tried as well.
+/// Points outside the domain therefore still cost a search over all blocks.
+///
 /// The `block_logical_coordinates_single_point` function will search the passed
 /// in block for the passed in coordinate and return the logical coordinates of
 /// that point. It will return a `std::nullopt` if it can't find the point in
-/// that block.
+/// that block. The overload that takes a `BlockSpatialIndex` searches the
+/// whole `domain` like `block_logical_coordinates` and returns the containing
+/// `BlockId` along with the logical coordinates. Its `candidate_blocks` are a
+/// buffer to avoid allocations when called for many points.
 ///
 /// \warning Since map inverses can involve numerical roundoff error, care must
 /// be taken with points on shared block boundaries. They will be assigned to
@@ -69,10 +84,26 @@ auto block_logical_coordinates(
     const domain::FunctionsOfTimeMap& functions_of_time = {})
     -> std::vector<BlockLogicalCoords<Dim>>;
 
+template <size_t Dim>
+auto block_logical_coordinates(
+    const Domain<Dim>& domain, const BlockSpatialIndex<Dim>& spatial_index,
+    const tnsr::I<DataVector, Dim, Frame::Inertial>& x,
+    double time = std::numeric_limits<double>::signaling_NaN(),
+    const domain::FunctionsOfTimeMap& functions_of_time = {})
+    -> std::vector<BlockLogicalCoords<Dim>>;
+
 template <size_t Dim, typename Fr>
 std::optional<tnsr::I<double, Dim, ::Frame::BlockLogical>>
 block_logical_coordinates_single_point(
     const tnsr::I<double, Dim, Fr>& input_point, const Block<Dim>& block,
     double time = std::numeric_limits<double>::signaling_NaN(),
     const domain::FunctionsOfTimeMap& functions_of_time = {});
+
+template <size_t Dim>
+BlockLogicalCoords<Dim> block_logical_coordinates_single_point(
+    gsl::not_null<std::vector<size_t>*> candidate_blocks,
+    const tnsr::I<double, Dim, Frame::Inertial>& input_point,
+    const Domain<Dim>& domain, const BlockSpatialIndex<Dim>& spatial_index,
+    double time = std::numeric_limits<double>::signaling_NaN(),
+    const domain::FunctionsOfTimeMap& functions_of_time = {});
 /// @}
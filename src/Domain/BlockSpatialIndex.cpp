@@ -0,0 +1,208 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "Domain/BlockSpatialIndex.hpp"
+
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <cstddef>
+#include <limits>
+#include <utility>
+#include <vector>
+
+#include "DataStructures/DataVector.hpp"
+#include "DataStructures/Tensor/Tensor.hpp"
+#include "Domain/Block.hpp"
+#include "Domain/Domain.hpp"
+#include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
+#include "Utilities/ErrorHandling/Assert.hpp"
+#include "Utilities/Gsl.hpp"
+
+namespace {
+template <size_t Dim>
+bool box_contains(const std::array<double, Dim>& lower,
+                  const std::array<double, Dim>& upper,
+                  const tnsr::I<double, Dim, Frame::Inertial>& point) {
+  for (size_t d = 0; d < Dim; ++d) {
+    if (point.get(d) < gsl::at(lower, d) or point.get(d) > gsl::at(upper, d)) {
+      return false;
+    }
+  }
+  return true;
+}
+}  // namespace
+
+template <size_t Dim>
+BlockSpatialIndex<Dim>::BlockSpatialIndex(
+    const Domain<Dim>& domain, const double time,
+    const domain::FunctionsOfTimeMap& functions_of_time) {
+  // Block-logical sample points on a uniform grid that includes the block
+  // boundaries
+  size_t num_samples = 1;
+  for (size_t d = 0; d < Dim; ++d) {
+    num_samples *= number_of_samples_per_dim;
+  }
+  tnsr::I<DataVector, Dim, Frame::BlockLogical> logical_samples{num_samples};
+  for (size_t i = 0; i < num_samples; ++i) {
+    size_t index = i;
+    for (size_t d = 0; d < Dim; ++d) {
+      logical_samples.get(d)[i] =
+          -1. + 2. * static_cast<double>(index % number_of_samples_per_dim) /
+                    static_cast<double>(number_of_samples_per_dim - 1);
+      index /= number_of_samples_per_dim;
+    }
+  }
+
+  // Bounding boxes of the sampled points in the inertial frame
+  const auto& blocks = domain.blocks();
+  bounding_boxes_.resize(blocks.size());
+  for (size_t block_id = 0; block_id < blocks.size(); ++block_id) {
+    const auto& block = blocks[block_id];
+    const auto inertial_samples =
+        block.is_time_dependent()
+            ? block.moving_mesh_grid_to_inertial_map()(
+                  block.moving_mesh_logical_to_grid_map()(logical_samples),
+                  time, functions_of_time)
+            : block.stationary_map()(logical_samples);
+    auto& [lower, upper] = bounding_boxes_[block_id];
+    double max_extent = 0.;
+    double max_abs_coord = 1.;
+    for (size_t d = 0; d < Dim; ++d) {
+      gsl::at(lower, d) = min(inertial_samples.get(d));
+      gsl::at(upper, d) = max(inertial_samples.get(d));
+      max_extent = std::max(max_extent, gsl::at(upper, d) - gsl::at(lower, d));
+      max_abs_coord = std::max({max_abs_coord, std::abs(gsl::at(lower, d)),
+                                std::abs(gsl::at(upper, d))});
+    }
+    // Pad the box to account for the block boundaries bulging out between the
+    // sampled points, and for roundoff error in the map inverses
+    const double padding =
+        padding_fraction * max_extent +
+        100. * std::numeric_limits<double>::epsilon() * max_abs_coord;
+    for (size_t d = 0; d < Dim; ++d) {
+      gsl::at(lower, d) -= padding;
+      gsl::at(upper, d) += padding;
+    }
+  }
+
+  // Arrange the blocks in a tree
+  block_order_.resize(blocks.size());
+  for (size_t block_id = 0; block_id < blocks.size(); ++block_id) {
+    block_order_[block_id] = block_id;
+  }
+  nodes_.clear();
+  if (not blocks.empty()) {
+    build_node(0, blocks.size());
+  }
+}
+
+template <size_t Dim>
+size_t BlockSpatialIndex<Dim>::build_node(const size_t begin,
+                                          const size_t end) {
+  const size_t node_index = nodes_.size();
+  Node node{};
+  node.begin = begin;
+  node.end = end;
+  node.left = 0;
+  node.right = 0;
+  std::array<double, Dim> centers_lower{};
+  std::array<double, Dim> centers_upper{};
+  for (size_t d = 0; d < Dim; ++d) {
+    gsl::at(node.lower, d) = std::numeric_limits<double>::max();
+    gsl::at(node.upper, d) = std::numeric_limits<double>::lowest();
+    gsl::at(centers_lower, d) = std::numeric_limits<double>::max();
+    gsl::at(centers_upper, d) = std::numeric_limits<double>::lowest();
+  }
+  for (size_t i = begin; i < end; ++i) {
+    const auto& [lower, upper] = bounding_boxes_[block_order_[i]];
+    for (size_t d = 0; d < Dim; ++d) {
+      gsl::at(node.lower, d) =
+          std::min(gsl::at(node.lower, d), gsl::at(lower, d));
+      gsl::at(node.upper, d) =
+          std::max(gsl::at(node.upper, d), gsl::at(upper, d));
+      const double center = 0.5 * (gsl::at(lower, d) + gsl::at(upper, d));
+      gsl::at(centers_lower, d) = std::min(gsl::at(centers_lower, d), center);
+      gsl::at(centers_upper, d) = std::max(gsl::at(centers_upper, d), center);
+    }
+  }
+  nodes_.push_back(node);
+  if (end - begin <= max_leaf_size) {
+    return node_index;
+  }
+  // Split the blocks in half at the median of the box centers along the
+  // dimension in which the centers are spread the most
+  size_t split_dim = 0;
+  for (size_t d = 1; d < Dim; ++d) {
+    if (gsl::at(centers_upper, d) - gsl::at(centers_lower, d) >
+        gsl::at(centers_upper, split_dim) - gsl::at(centers_lower, split_dim)) {
+      split_dim = d;
+    }
+  }
+  const size_t middle = begin + (end - begin) / 2;
+  std::nth_element(block_order_.begin() + static_cast<std::ptrdiff_t>(begin),
+                   block_order_.begin() + static_cast<std::ptrdiff_t>(middle),
+                   block_order_.begin() + static_cast<std::ptrdiff_t>(end),
+                   [this, &split_dim](const size_t lhs, const size_t rhs) {
+                     return gsl::at(bounding_boxes_[lhs].first, split_dim) +
+                                gsl::at(bounding_boxes_[lhs].second,
+                                        split_dim) <
+                            gsl::at(bounding_boxes_[rhs].first, split_dim) +
+                                gsl::at(bounding_boxes_[rhs].second, split_dim);
+                   });
+  const size_t left = build_node(begin, middle);
+  const size_t right = build_node(middle, end);
+  nodes_[node_index].left = left;
+  nodes_[node_index].right = right;
+  return node_index;
+}
+
+template <size_t Dim>
+void BlockSpatialIndex<Dim>::candidate_blocks(
+    const gsl::not_null<std::vector<size_t>*> result,
+    const tnsr::I<double, Dim, Frame::Inertial>& point) const {
+  result->clear();
+  if (nodes_.empty()) {
+    return;
+  }
+  // Depth-first traversal of the tree. The tree is balanced, so its depth is
+  // logarithmic in the number of blocks and a small stack suffices.
+  std::array<size_t, 64> stack{};
+  size_t stack_size = 0;
+  gsl::at(stack, stack_size++) = 0;
+  while (stack_size > 0) {
+    const Node& node = nodes_[gsl::at(stack, --stack_size)];
+    if (not box_contains(node.lower, node.upper, point)) {
+      continue;
+    }
+    if (node.left == 0) {
+      for (size_t i = node.begin; i < node.end; ++i) {
+        const size_t block_id = block_order_[i];
+        const auto& [lower, upper] = bounding_boxes_[block_id];
+        if (box_contains(lower, upper, point)) {
+          result->push_back(block_id);
+        }
+      }
+    } else {
+      ASSERT(stack_size + 2 <= stack.size(),
+             "The tree of blocks is deeper than expected.");
+      gsl::at(stack, stack_size++) = node.right;
+      gsl::at(stack, stack_size++) = node.left;
+    }
+  }
+  // Blocks are tried in order of their ID, so points on shared block
+  // boundaries are assigned to the same block as without the index
+  std::sort(result->begin(), result->end());
+}
+
+template <size_t Dim>
+std::vector<size_t> BlockSpatialIndex<Dim>::candidate_blocks(
+    const tnsr::I<double, Dim, Frame::Inertial>& point) const {
+  std::vector<size_t> result{};
+  candidate_blocks(make_not_null(&result), point);
+  return result;
+}
+
+template class BlockSpatialIndex<1>;
+template class BlockSpatialIndex<2>;
+template class BlockSpatialIndex<3>;
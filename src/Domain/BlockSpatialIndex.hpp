@@ -0,0 +1,105 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#pragma once
+
+#include <array>
+#include <cstddef>
+#include <limits>
+#include <utility>
+#include <vector>
+
+#include "DataStructures/Tensor/TypeAliases.hpp"
+#include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
+#include "Utilities/Gsl.hpp"
+
+/// \cond
+template <size_t VolumeDim>
+class Domain;
+/// \endcond
+
+/*!
+ * \ingroup ComputationalDomainGroup
+ * \brief A bounding volume hierarchy over the blocks of a `Domain` to find
+ * the blocks that may contain a point in the inertial frame.
+ *
+ * Finding the block that contains a point, e.g. in `block_logical_coordinates`,
+ * means inverting block maps until one of them succeeds. With many blocks and
+ * many points this is expensive. This index keeps an axis-aligned bounding box
+ * in the inertial frame for every block, arranged in a tree, so only the few
+ * blocks whose bounding box contains a point have to be tried.
+ *
+ * The bounding boxes are computed by evaluating the block maps on a grid of
+ * block-logical points, and are then padded by a fraction of their size to
+ * account for the curvature of the block boundaries between the sampled
+ * points. The padding is a heuristic: it suffices for the blocks of typical
+ * domains, but a strongly curved block can bulge out of its bounding box
+ * between the sampled points. Therefore, a point that is in none of the
+ * candidate blocks may still be in another block, and
+ * `block_logical_coordinates` falls back to trying all other blocks in that
+ * case.
+ *
+ * For time-dependent blocks the bounding boxes are computed at the `time` and
+ * with the `functions_of_time` passed to the constructor. Build a new index
+ * when the time or the functions of time change. The index doesn't hold a
+ * reference to the domain.
+ */
+template <size_t Dim>
+class BlockSpatialIndex {
+ public:
+  /// Number of block-logical points per dimension at which the block maps are
+  /// evaluated to compute the bounding boxes
+  static constexpr size_t number_of_samples_per_dim = 9;
+  /// The bounding boxes are padded by this fraction of their largest extent
+  static constexpr double padding_fraction = 0.1;
+  /// Maximum number of blocks in the leaves of the tree
+  static constexpr size_t max_leaf_size = 4;
+
+  BlockSpatialIndex() = default;
+
+  explicit BlockSpatialIndex(
+      const Domain<Dim>& domain,
+      double time = std::numeric_limits<double>::signaling_NaN(),
+      const domain::FunctionsOfTimeMap& functions_of_time = {});
+
+  /// @{
+  /// IDs of the blocks whose bounding box contains the `point`, in ascending
+  /// order. The point is usually in one of these blocks, if it's in the domain
+  /// at all (see the class documentation).
+  void candidate_blocks(
+      gsl::not_null<std::vector<size_t>*> result,
+      const tnsr::I<double, Dim, Frame::Inertial>& point) const;
+  std::vector<size_t> candidate_blocks(
+      const tnsr::I<double, Dim, Frame::Inertial>& point) const;
+  /// @}
+
+  size_t number_of_blocks() const { return bounding_boxes_.size(); }
+
+  /// The lower and upper corners of the (padded) bounding box of each block in
+  /// the inertial frame
+  const std::vector<
+      std::pair<std::array<double, Dim>, std::array<double, Dim>>>&
+  bounding_boxes() const {
+    return bounding_boxes_;
+  }
+
+ private:
+  struct Node {
+    std::array<double, Dim> lower;
+    std::array<double, Dim> upper;
+    // Range of `block_order_` in this node. Only leaves hold blocks directly.
+    size_t begin;
+    size_t end;
+    // Indices of the children in `nodes_`. Both are zero for leaves because
+    // the root is never a child.
+    size_t left;
+    size_t right;
+  };
+
+  size_t build_node(size_t begin, size_t end);
+
+  std::vector<std::pair<std::array<double, Dim>, std::array<double, Dim>>>
+      bounding_boxes_{};
+  std::vector<size_t> block_order_{};
+  std::vector<Node> nodes_{};
+};
@@ -0,0 +1,98 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "Domain/DeserializationCache.hpp"
+
+#include <cstddef>
+#include <functional>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <pup_stl.h>
+#include <string_view>
+#include <vector>
+
+#include "Domain/Domain.hpp"
+#include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
+#include "Utilities/GenerateInstantiations.hpp"
+#include "Utilities/Serialization/Serialize.hpp"
+
+namespace domain {
+namespace {
+template <typename T>
+class DeserializationCache {
+ public:
+  std::shared_ptr<const T> operator()(const std::vector<char>& serialized) {
+    const size_t hash = std::hash<std::string_view>{}(
+        std::string_view{serialized.data(), serialized.size()});
+    const std::lock_guard lock(mutex_);
+    for (auto it = entries_.begin(); it != entries_.end(); ++it) {
+      if (it->hash == hash and it->serialized == serialized) {
+        // Move to the front of the list
+        entries_.splice(entries_.begin(), entries_, it);
+        return it->deserialized;
+      }
+    }
+    auto deserialized =
+        std::make_shared<const T>(deserialize<T>(serialized.data()));
+    entries_.push_front(Entry{hash, serialized, deserialized});
+    if (entries_.size() > deserialization_cache_size) {
+      entries_.pop_back();
+    }
+    return deserialized;
+  }
+
+  void clear() {
+    const std::lock_guard lock(mutex_);
+    entries_.clear();
+  }
+
+ private:
+  struct Entry {
+    size_t hash;
+    std::vector<char> serialized;
+    std::shared_ptr<const T> deserialized;
+  };
+
+  std::mutex mutex_{};
+  // Most recently used entry first
+  std::list<Entry> entries_{};
+};
+
+template <typename T>
+DeserializationCache<T>& deserialization_cache() {
+  static DeserializationCache<T> cache{};
+  return cache;
+}
+}  // namespace
+
+template <size_t Dim>
+std::shared_ptr<const Domain<Dim>> deserialize_domain_cached(
+    const std::vector<char>& serialized_domain) {
+  return deserialization_cache<Domain<Dim>>()(serialized_domain);
+}
+
+std::shared_ptr<const FunctionsOfTimeMap> deserialize_functions_of_time_cached(
+    const std::vector<char>& serialized_functions_of_time) {
+  return deserialization_cache<FunctionsOfTimeMap>()(
+      serialized_functions_of_time);
+}
+
+void clear_deserialization_cache() {
+  deserialization_cache<Domain<1>>().clear();
+  deserialization_cache<Domain<2>>().clear();
+  deserialization_cache<Domain<3>>().clear();
+  deserialization_cache<FunctionsOfTimeMap>().clear();
+}
+
+#define DIM(data) BOOST_PP_TUPLE_ELEM(0, data)
+
+#define INSTANTIATE(_, data)                                                   \
+  template std::shared_ptr<const Domain<DIM(data)>> deserialize_domain_cached( \
+      const std::vector<char>& serialized_domain);
+
+GENERATE_INSTANTIATIONS(INSTANTIATE, (1, 2, 3))
+
+#undef INSTANTIATE
+#undef DIM
+}  // namespace domain
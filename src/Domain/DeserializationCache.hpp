@@ -0,0 +1,54 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#pragma once
+
+#include <cstddef>
+#include <memory>
+#include <vector>
+
+#include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
+
+/// \cond
+template <size_t VolumeDim>
+class Domain;
+/// \endcond
+
+namespace domain {
+/// @{
+/*!
+ * \brief Deserialize a domain or a map of functions of time, reusing the result
+ * of a previous call with the same serialized data.
+ *
+ * Volume data files store the serialized domain and functions of time with
+ * every observation, and the bytes are identical across the files written by
+ * the different nodes of a simulation (and for the domain usually across all
+ * observations). Tools that read many files would deserialize the same data
+ * over and over. These functions keep the most recently used
+ * `deserialization_cache_size` results for each type in a process-wide cache,
+ * keyed by a hash of the serialized data. Cache hits are confirmed by comparing
+ * the full serialized data, so different data never maps to the same result.
+ *
+ * The returned objects are shared between all callers with the same data, so
+ * they are `const`.
+ *
+ * \note The derived classes in the serialized data must be registered with
+ * Charm++ before calling these functions, just like for `deserialize`.
+ */
+template <size_t Dim>
+std::shared_ptr<const Domain<Dim>> deserialize_domain_cached(
+    const std::vector<char>& serialized_domain);
+
+std::shared_ptr<const FunctionsOfTimeMap> deserialize_functions_of_time_cached(
+    const std::vector<char>& serialized_functions_of_time);
+/// @}
+
+/// The number of deserialized domains and functions of time (each) that are
+/// kept by `deserialize_domain_cached` and
+/// `deserialize_functions_of_time_cached`
+constexpr size_t deserialization_cache_size = 8;
+
+/// Forget all results cached by `deserialize_domain_cached` and
+/// `deserialize_functions_of_time_cached`
+void clear_deserialization_cache();
+}  // namespace domain
@@ -0,0 +1,475 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "Domain/Python/BatchedElementMap.hpp"
+
+#include <array>
+#include <cstddef>
+#include <exception>
+#include <limits>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <stdexcept>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+#ifdef _OPENMP
+#include <omp.h>
+#endif  // _OPENMP
+
+#include "DataStructures/DataVector.hpp"
+#include "DataStructures/Tensor/EagerMath/Determinant.hpp"
+#include "DataStructures/Tensor/Tensor.hpp"
+#include "Domain/Block.hpp"
+#include "Domain/CoordinateMaps/CoordinateMap.hpp"
+#include "Domain/Domain.hpp"
+#include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
+#include "Domain/Structure/ElementId.hpp"
+#include "Domain/Structure/SegmentId.hpp"
+#include "Domain/Structure/Side.hpp"
+#include "NumericalAlgorithms/Spectral/LogicalCoordinates.hpp"
+#include "NumericalAlgorithms/Spectral/Mesh.hpp"
+#include "Utilities/GetOutput.hpp"
+#include "Utilities/Gsl.hpp"
+
+namespace py = pybind11;
+
+// Ignore OpenMP pragmas when OpenMP is not enabled
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wunknown-pragmas"
+
+namespace domain::py_bindings {
+
+namespace {
+using FuncOfTimeMap =
+    std::unordered_map<std::string,
+                       const domain::FunctionsOfTime::FunctionOfTime&>;
+
+// Calls `func(b)` for all `b` in `[0, size)` in parallel. Exceptions can't
+// propagate out of an OpenMP region, so the first one is rethrown after the
+// loop.
+template <typename Func>
+void parallel_for(const size_t size, [[maybe_unused]] const size_t num_threads,
+                  const Func& func) {
+  std::exception_ptr error{};
+#pragma omp parallel for num_threads(num_threads) schedule(dynamic)
+  for (size_t b = 0; b < size; ++b) {
+    try {
+      func(b);
+    } catch (...) {
+#pragma omp critical
+      {
+        if (not error) {
+          error = std::current_exception();
+        }
+      }
+    }
+  }
+  if (error) {
+    std::rethrow_exception(error);
+  }
+}
+
+// The maps of the elements in one block. For time-dependent blocks the
+// time-independent ElementLogical -> Grid part of the maps is evaluated once,
+// so only the Grid -> Inertial map has to be evaluated at every time. For
+// time-independent blocks the full maps are evaluated once.
+template <size_t Dim>
+struct BlockPoints {
+  size_t block_id;
+  bool is_time_dependent;
+  // Indices of the elements in this block
+  std::vector<size_t> elements{};
+  // Diagonal Jacobian of the ElementLogical -> BlockLogical map of each element
+  std::vector<std::array<double, Dim>> scales{};
+  size_t num_points = 0;
+  // Only set for time-dependent blocks
+  tnsr::I<DataVector, Dim, Frame::Grid> grid_coords{};
+  std::optional<Jacobian<DataVector, Dim, Frame::ElementLogical, Frame::Grid>>
+      grid_jacobian{};
+  std::optional<
+      InverseJacobian<DataVector, Dim, Frame::ElementLogical, Frame::Grid>>
+      grid_inv_jacobian{};
+  // Only set for time-independent blocks
+  tnsr::I<DataVector, Dim, Frame::Inertial> inertial_coords{};
+  std::optional<
+      Jacobian<DataVector, Dim, Frame::ElementLogical, Frame::Inertial>>
+      inertial_jacobian{};
+  std::optional<
+      InverseJacobian<DataVector, Dim, Frame::ElementLogical, Frame::Inertial>>
+      inertial_inv_jacobian{};
+};
+
+// Evaluates the ElementLogical -> Inertial maps of many elements, grouped by
+// block. The ElementLogical -> BlockLogical part of an element map is an
+// affine map, so we transform the logical coordinates of all elements in a
+// block to block-logical coordinates, evaluate the block map on all of them at
+// once, and then rescale the Jacobians of the block map for each element.
+template <size_t Dim>
+class BatchedElementMaps {
+ public:
+  BatchedElementMaps(std::vector<ElementId<Dim>> element_ids,
+                     std::vector<Mesh<Dim>> meshes, const Domain<Dim>& domain,
+                     const std::optional<size_t> num_threads)
+      : element_ids_(std::move(element_ids)), meshes_(std::move(meshes)) {
+    if (meshes_.size() != element_ids_.size()) {
+      throw std::invalid_argument(
+          "Expected one mesh per element, but got " +
+          std::to_string(meshes_.size()) + " meshes for " +
+          std::to_string(element_ids_.size()) + " elements.");
+    }
+#ifdef _OPENMP
+    num_threads_ = num_threads.value_or(omp_get_max_threads());
+#else
+    if (num_threads.has_value()) {
+      throw std::invalid_argument(
+          "OpenMP is not available, so num_threads cannot be specified.");
+    }
+#endif  // _OPENMP
+
+    // Offsets of the elements in the concatenated data, and the elements in
+    // each block
+    const auto& blocks = domain.blocks();
+    offsets_.resize(element_ids_.size() + 1, 0);
+    std::vector<std::optional<size_t>> block_index(blocks.size());
+    for (size_t i = 0; i < element_ids_.size(); ++i) {
+      offsets_[i + 1] = offsets_[i] + meshes_[i].number_of_grid_points();
+      const size_t block_id = element_ids_[i].block_id();
+      if (block_id >= blocks.size()) {
+        throw std::invalid_argument("The element " +
+                                    get_output(element_ids_[i]) +
+                                    " is not in the domain.");
+      }
+      if (not block_index[block_id].has_value()) {
+        block_index[block_id] = blocks_.size();
+        blocks_.push_back(
+            BlockPoints<Dim>{block_id, blocks[block_id].is_time_dependent()});
+      }
+      auto& block_points = blocks_[*block_index[block_id]];
+      block_points.elements.push_back(i);
+      block_points.num_points += meshes_[i].number_of_grid_points();
+      auto& scale = block_points.scales.emplace_back();
+      for (size_t d = 0; d < Dim; ++d) {
+        const auto& segment_id = element_ids_[i].segment_id(d);
+        gsl::at(scale, d) = 0.5 * (segment_id.endpoint(Side::Upper) -
+                                   segment_id.endpoint(Side::Lower));
+      }
+    }
+    // Keep the block maps, so the domain doesn't have to outlive this object
+    stationary_maps_.resize(blocks_.size());
+    logical_to_grid_maps_.resize(blocks_.size());
+    grid_to_inertial_maps_.resize(blocks_.size());
+    for (size_t b = 0; b < blocks_.size(); ++b) {
+      const auto& block = blocks[blocks_[b].block_id];
+      if (block.is_time_dependent()) {
+        logical_to_grid_maps_[b] =
+            block.moving_mesh_logical_to_grid_map().get_clone();
+        grid_to_inertial_maps_[b] =
+            block.moving_mesh_grid_to_inertial_map().get_clone();
+      } else {
+        stationary_maps_[b] = block.stationary_map().get_clone();
+      }
+    }
+
+    // Evaluate the time-independent parts of the maps
+    const py::gil_scoped_release release_gil{};
+    parallel_for(blocks_.size(), num_threads_, [this](const size_t b) {
+      auto& block_points = blocks_[b];
+      const auto block_logical_coords = block_logical_coordinates(b);
+      if (block_points.is_time_dependent) {
+        block_points.grid_coords =
+            (*logical_to_grid_maps_[b])(block_logical_coords);
+      } else {
+        block_points.inertial_coords =
+            (*stationary_maps_[b])(block_logical_coords);
+      }
+    });
+  }
+
+  size_t number_of_grid_points() const { return offsets_.back(); }
+
+  py::array_t<double> inertial_coordinates(
+      const std::optional<double> time,
+      const std::optional<FuncOfTimeMap>& functions_of_time) const {
+    const auto functions_of_time_ptrs = clone(functions_of_time);
+    const double resolved_time =
+        time.value_or(std::numeric_limits<double>::signaling_NaN());
+    auto result = make_array(Dim);
+    double* const result_data = result.mutable_data();
+    const py::gil_scoped_release release_gil{};
+    parallel_for(blocks_.size(), num_threads_, [&](const size_t b) {
+      const auto& block_points = blocks_[b];
+      if (block_points.is_time_dependent) {
+        const auto coords = (*grid_to_inertial_maps_[b])(
+            block_points.grid_coords, resolved_time, functions_of_time_ptrs);
+        scatter(result_data, b, coords);
+      } else {
+        scatter(result_data, b, block_points.inertial_coords);
+      }
+    });
+    return result;
+  }
+
+  py::tuple jacobians(const std::optional<double> time,
+                      const std::optional<FuncOfTimeMap>& functions_of_time) {
+    using JacobianType =
+        Jacobian<DataVector, Dim, Frame::ElementLogical, Frame::Inertial>;
+    using InverseJacobianType =
+        InverseJacobian<DataVector, Dim, Frame::ElementLogical,
+                        Frame::Inertial>;
+    const auto functions_of_time_ptrs = clone(functions_of_time);
+    const double resolved_time =
+        time.value_or(std::numeric_limits<double>::signaling_NaN());
+    auto jacobian = make_array(JacobianType::size());
+    auto inv_jacobian = make_array(InverseJacobianType::size());
+    py::array_t<double> det_jacobian(
+        static_cast<py::ssize_t>(number_of_grid_points()));
+    double* const jacobian_data = jacobian.mutable_data();
+    double* const inv_jacobian_data = inv_jacobian.mutable_data();
+    double* const det_jacobian_data = det_jacobian.mutable_data();
+    const py::gil_scoped_release release_gil{};
+    // The time-independent Jacobians are computed the first time they are
+    // needed, and another thread may be computing them as well
+    const std::lock_guard lock{jacobians_mutex_};
+    parallel_for(blocks_.size(), num_threads_, [&](const size_t b) {
+      auto& block_points = blocks_[b];
+      if (block_points.is_time_dependent) {
+        if (not block_points.grid_jacobian.has_value()) {
+          const auto block_logical_coords = block_logical_coordinates(b);
+          block_points.grid_jacobian = rescale_jacobian<Frame::Grid>(
+              logical_to_grid_maps_[b]->jacobian(block_logical_coords), b);
+          block_points.grid_inv_jacobian = rescale_inv_jacobian<Frame::Grid>(
+              logical_to_grid_maps_[b]->inv_jacobian(block_logical_coords), b);
+        }
+        // Chain the ElementLogical -> Grid Jacobians with the Grid -> Inertial
+        // Jacobians
+        const auto& grid_to_inertial_map = *grid_to_inertial_maps_[b];
+        const auto grid_to_inertial_jacobian = grid_to_inertial_map.jacobian(
+            block_points.grid_coords, resolved_time, functions_of_time_ptrs);
+        const auto grid_to_inertial_inv_jacobian =
+            grid_to_inertial_map.inv_jacobian(block_points.grid_coords,
+                                              resolved_time,
+                                              functions_of_time_ptrs);
+        JacobianType block_jacobian{block_points.num_points, 0.};
+        InverseJacobianType block_inv_jacobian{block_points.num_points, 0.};
+        for (size_t i = 0; i < Dim; ++i) {
+          for (size_t j = 0; j < Dim; ++j) {
+            for (size_t k = 0; k < Dim; ++k) {
+              block_jacobian.get(i, j) += grid_to_inertial_jacobian.get(i, k) *
+                                          block_points.grid_jacobian->get(k, j);
+              block_inv_jacobian.get(i, j) +=
+                  block_points.grid_inv_jacobian->get(i, k) *
+                  grid_to_inertial_inv_jacobian.get(k, j);
+            }
+          }
+        }
+        scatter(jacobian_data, b, block_jacobian);
+        scatter(inv_jacobian_data, b, block_inv_jacobian);
+        scatter(det_jacobian_data, b, determinant(block_jacobian));
+      } else {
+        if (not block_points.inertial_jacobian.has_value()) {
+          const auto block_logical_coords = block_logical_coordinates(b);
+          block_points.inertial_jacobian = rescale_jacobian<Frame::Inertial>(
+              stationary_maps_[b]->jacobian(block_logical_coords), b);
+          block_points.inertial_inv_jacobian =
+              rescale_inv_jacobian<Frame::Inertial>(
+                  stationary_maps_[b]->inv_jacobian(block_logical_coords), b);
+        }
+        scatter(jacobian_data, b, *block_points.inertial_jacobian);
+        scatter(inv_jacobian_data, b, *block_points.inertial_inv_jacobian);
+        scatter(det_jacobian_data, b,
+                determinant(*block_points.inertial_jacobian));
+      }
+    });
+    return py::make_tuple(jacobian, inv_jacobian, det_jacobian);
+  }
+
+ private:
+  static std::unordered_map<
+      std::string, std::unique_ptr<domain::FunctionsOfTime::FunctionOfTime>>
+  clone(const std::optional<FuncOfTimeMap>& functions_of_time) {
+    std::unordered_map<std::string,
+                       std::unique_ptr<domain::FunctionsOfTime::FunctionOfTime>>
+        functions_of_time_ptrs{};
+    if (functions_of_time.has_value()) {
+      for (const auto& [name, fot] : *functions_of_time) {
+        functions_of_time_ptrs[name] = fot.get_clone();
+      }
+    }
+    return functions_of_time_ptrs;
+  }
+
+  py::array_t<double> make_array(const size_t num_components) const {
+    return py::array_t<double>(std::vector<py::ssize_t>{
+        static_cast<py::ssize_t>(num_components),
+        static_cast<py::ssize_t>(number_of_grid_points())});
+  }
+
+  // Block-logical coordinates of all elements in the block, one element after
+  // the other
+  tnsr::I<DataVector, Dim, Frame::BlockLogical> block_logical_coordinates(
+      const size_t b) const {
+    const auto& block_points = blocks_[b];
+    tnsr::I<DataVector, Dim, Frame::BlockLogical> block_logical_coords{
+        block_points.num_points};
+    size_t offset = 0;
+    for (size_t e = 0; e < block_points.elements.size(); ++e) {
+      const auto& element_id = element_ids_[block_points.elements[e]];
+      const auto& mesh = meshes_[block_points.elements[e]];
+      const auto element_logical_coords = logical_coordinates(mesh);
+      for (size_t d = 0; d < Dim; ++d) {
+        const auto& segment_id = element_id.segment_id(d);
+        const double center = 0.5 * (segment_id.endpoint(Side::Upper) +
+                                     segment_id.endpoint(Side::Lower));
+        for (size_t k = 0; k < mesh.number_of_grid_points(); ++k) {
+          block_logical_coords.get(d)[offset + k] =
+              center + gsl::at(block_points.scales[e], d) *
+                           element_logical_coords.get(d)[k];
+        }
+      }
+      offset += mesh.number_of_grid_points();
+    }
+    return block_logical_coords;
+  }
+
+  // Rescale by the Jacobian of the ElementLogical -> BlockLogical map, which
+  // is diagonal
+  template <typename TargetFrame>
+  Jacobian<DataVector, Dim, Frame::ElementLogical, TargetFrame>
+  rescale_jacobian(const Jacobian<DataVector, Dim, Frame::BlockLogical,
+                                  TargetFrame>& block_jacobian,
+                   const size_t b) const {
+    const auto& block_points = blocks_[b];
+    Jacobian<DataVector, Dim, Frame::ElementLogical, TargetFrame> result{
+        block_points.num_points};
+    size_t offset = 0;
+    for (size_t e = 0; e < block_points.elements.size(); ++e) {
+      const size_t num_points =
+          meshes_[block_points.elements[e]].number_of_grid_points();
+      for (size_t i = 0; i < Dim; ++i) {
+        for (size_t j = 0; j < Dim; ++j) {
+          for (size_t k = offset; k < offset + num_points; ++k) {
+            result.get(i, j)[k] = block_jacobian.get(i, j)[k] *
+                                  gsl::at(block_points.scales[e], j);
+          }
+        }
+      }
+      offset += num_points;
+    }
+    return result;
+  }
+
+  template <typename TargetFrame>
+  InverseJacobian<DataVector, Dim, Frame::ElementLogical, TargetFrame>
+  rescale_inv_jacobian(
+      const InverseJacobian<DataVector, Dim, Frame::BlockLogical, TargetFrame>&
+          block_inv_jacobian,
+      const size_t b) const {
+    const auto& block_points = blocks_[b];
+    InverseJacobian<DataVector, Dim, Frame::ElementLogical, TargetFrame> result{
+        block_points.num_points};
+    size_t offset = 0;
+    for (size_t e = 0; e < block_points.elements.size(); ++e) {
+      const size_t num_points =
+          meshes_[block_points.elements[e]].number_of_grid_points();
+      for (size_t i = 0; i < Dim; ++i) {
+        for (size_t j = 0; j < Dim; ++j) {
+          for (size_t k = offset; k < offset + num_points; ++k) {
+            result.get(i, j)[k] = block_inv_jacobian.get(i, j)[k] /
+                                  gsl::at(block_points.scales[e], i);
+          }
+        }
+      }
+      offset += num_points;
+    }
+    return result;
+  }
+
+  // Write the components of a tensor over the points of the block `b` into
+  // the concatenated data of all elements, in the storage order of the tensor
+  template <typename TensorType>
+  void scatter(double* const data, const size_t b,
+               const TensorType& tensor) const {
+    const auto& block_points = blocks_[b];
+    const size_t total_num_points = number_of_grid_points();
+    size_t offset = 0;
+    for (const size_t element_index : block_points.elements) {
+      const size_t element_offset = offsets_[element_index];
+      const size_t num_points = offsets_[element_index + 1] - element_offset;
+      for (size_t component = 0; component < tensor.size(); ++component) {
+        for (size_t k = 0; k < num_points; ++k) {
+          data[component * total_num_points + element_offset + k] =
+              tensor[component][offset + k];
+        }
+      }
+      offset += num_points;
+    }
+  }
+
+  std::vector<ElementId<Dim>> element_ids_;
+  std::vector<Mesh<Dim>> meshes_;
+  size_t num_threads_ = 1;
+  std::vector<size_t> offsets_{};
+  std::vector<BlockPoints<Dim>> blocks_{};
+  std::vector<std::unique_ptr<
+      CoordinateMapBase<Frame::BlockLogical, Frame::Inertial, Dim>>>
+      stationary_maps_{};
+  std::vector<
+      std::unique_ptr<CoordinateMapBase<Frame::BlockLogical, Frame::Grid, Dim>>>
+      logical_to_grid_maps_{};
+  std::vector<
+      std::unique_ptr<CoordinateMapBase<Frame::Grid, Frame::Inertial, Dim>>>
+      grid_to_inertial_maps_{};
+  std::mutex jacobians_mutex_{};
+};
+
+template <size_t Dim>
+void bind_batched_element_map_impl(py::module& m) {  // NOLINT
+  py::class_<BatchedElementMaps<Dim>>(
+      m, ("BatchedElementMaps" + get_output(Dim) + "D").c_str(),
+      "The element maps of many elements, evaluated at the logical "
+      "coordinates of the elements all at once.\n\n"
+      "The results are arrays with the data of all elements, one element "
+      "after the other. Each block map is evaluated only once for all "
+      "elements in the block. For time-dependent blocks the "
+      "ElementLogical -> Grid coordinates are computed when this object is "
+      "constructed, so only the Grid -> Inertial map is evaluated at each "
+      "time. Blocks are processed in parallel if OpenMP is linked in (see "
+      "'num_threads' in 'spectre.IO.Exporter.interpolate_to_points').")
+      .def(py::init<std::vector<ElementId<Dim>>, std::vector<Mesh<Dim>>,
+                    const Domain<Dim>&, std::optional<size_t>>(),
+           py::arg("element_ids"), py::arg("meshes"), py::arg("domain"),
+           py::arg("num_threads") = std::nullopt)
+      .def_property_readonly("number_of_grid_points",
+                             &BatchedElementMaps<Dim>::number_of_grid_points)
+      .def("inertial_coordinates",
+           &BatchedElementMaps<Dim>::inertial_coordinates,
+           py::arg("time") = std::nullopt,
+           py::arg("functions_of_time") = std::nullopt,
+           "The inertial coordinates as an array with shape "
+           "(dim, num_points).")
+      .def("jacobians", &BatchedElementMaps<Dim>::jacobians,
+           py::arg("time") = std::nullopt,
+           py::arg("functions_of_time") = std::nullopt,
+           "The Jacobians, inverse Jacobians, and Jacobian determinants as "
+           "arrays with shapes (dim**2, num_points), (dim**2, num_points), "
+           "and (num_points,). The components of the Jacobians are in the "
+           "storage order of the 'Jacobian' and 'InverseJacobian' tensor "
+           "types. The time-independent parts are computed the first time "
+           "and then reused.");
+}
+}  // namespace
+
+void bind_batched_element_map(py::module& m) {  // NOLINT
+  bind_batched_element_map_impl<1>(m);
+  bind_batched_element_map_impl<2>(m);
+  bind_batched_element_map_impl<3>(m);
+}
+}  // namespace domain::py_bindings
+
+#pragma GCC diagnostic pop
@@ -3,6 +3,7 @@
 
 #include <pybind11/pybind11.h>
 
+#include "Domain/Python/BatchedElementMap.hpp"
 #include "Domain/Python/Block.hpp"
 #include "Domain/Python/BlockLogicalCoordinates.hpp"
 #include "Domain/Python/Domain.hpp"
@@ -25,9 +26,11 @@ PYBIND11_MODULE(_Pybindings, m) {  // NOLINT
   py::module_::import("spectre.DataStructures");
   py::module_::import("spectre.DataStructures.Tensor");
   py::module_::import("spectre.Domain.CoordinateMaps");
+  py::module_::import("spectre.Spectral");
   py::enum_<Side>(m, "Side")
       .value("Lower", Side::Lower)
       .value("Upper", Side::Upper);
+  py_bindings::bind_batched_element_map(m);
   py_bindings::bind_block(m);
   py_bindings::bind_block_logical_coordinates(m);
   py_bindings::bind_domain(m);
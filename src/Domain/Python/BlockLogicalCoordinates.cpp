@@ -5,6 +5,7 @@
 
 #include <array>
 #include <cstddef>
+#include <limits>
 #include <memory>
 #include <optional>
 #include <pybind11/pybind11.h>
@@ -17,6 +18,7 @@
 #include "DataStructures/IdPair.hpp"
 #include "DataStructures/Tensor/Tensor.hpp"
 #include "Domain/BlockLogicalCoordinates.hpp"
+#include "Domain/BlockSpatialIndex.hpp"
 #include "Domain/Domain.hpp"
 #include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
 #include "Domain/Structure/BlockId.hpp"
@@ -29,38 +31,86 @@ namespace py = pybind11;
 namespace domain::py_bindings {
 
 namespace {
+using FuncOfTimeMap =
+    std::unordered_map<std::string,
+                       const domain::FunctionsOfTime::FunctionOfTime&>;
+
+// Transform functions-of-time map to unique_ptrs because pybind11 can't
+// handle unique_ptrs easily as function arguments (it's hard to transfer
+// ownership of a Python object to C++)
+domain::FunctionsOfTimeMap clone_functions_of_time(
+    const std::optional<FuncOfTimeMap>& functions_of_time) {
+  domain::FunctionsOfTimeMap functions_of_time_ptrs{};
+  if (functions_of_time.has_value()) {
+    for (const auto& [name, fot] : *functions_of_time) {
+      functions_of_time_ptrs[name] = fot.get_clone();
+    }
+  }
+  return functions_of_time_ptrs;
+}
+
 template <size_t Dim>
 void bind_block_logical_coordinates_impl(py::module& m) {  // NOLINT
-  py::class_<
-      IdPair<domain::BlockId, tnsr::I<double, Dim, Frame::BlockLogical>>>(
-      m, ("BlockIdAndLogicalCoord" + get_output(Dim) + "D").c_str());
+  using BlockIdAndLogicalCoord =
+      IdPair<domain::BlockId, tnsr::I<double, Dim, Frame::BlockLogical>>;
+  py::class_<BlockIdAndLogicalCoord>(
+      m, ("BlockIdAndLogicalCoord" + get_output(Dim) + "D").c_str())
+      .def_readonly("id", &BlockIdAndLogicalCoord::id)
+      .def_readonly("data", &BlockIdAndLogicalCoord::data);
+  py::class_<BlockSpatialIndex<Dim>>(
+      m, ("BlockSpatialIndex" + get_output(Dim) + "D").c_str(),
+      "Bounding boxes of the blocks of a domain in the inertial frame, "
+      "arranged in a tree. Pass it to 'block_logical_coordinates' to search "
+      "each point only in the blocks that may contain it. For time-dependent "
+      "domains, build a new index when the time or the functions of time "
+      "change.")
+      .def(py::init([](const Domain<Dim>& domain,
+                       const std::optional<double>& time,
+                       const std::optional<FuncOfTimeMap>& functions_of_time) {
+             return BlockSpatialIndex<Dim>{
+                 domain,
+                 time.value_or(std::numeric_limits<double>::signaling_NaN()),
+                 clone_functions_of_time(functions_of_time)};
+           }),
+           py::arg("domain"), py::arg("time") = std::nullopt,
+           py::arg("functions_of_time") = std::nullopt)
+      .def(
+          "candidate_blocks",
+          [](const BlockSpatialIndex<Dim>& spatial_index,
+             const std::array<double, Dim>& point) {
+            return spatial_index.candidate_blocks(
+                tnsr::I<double, Dim, Frame::Inertial>{point});
+          },
+          py::arg("point"),
+          "IDs of the blocks whose bounding box contains the point, in "
+          "ascending order.")
+      .def_property_readonly("bounding_boxes",
+                             &BlockSpatialIndex<Dim>::bounding_boxes)
+      .def_property_readonly("number_of_blocks",
+                             &BlockSpatialIndex<Dim>::number_of_blocks);
   m.def(
       "block_logical_coordinates",
       [](const Domain<Dim>& domain,
          const tnsr::I<DataVector, Dim>& inertial_coords,
-         const std::optional<double>& time = std::nullopt,
-         const std::optional<std::unordered_map<
-             std::string, const domain::FunctionsOfTime::FunctionOfTime&>>&
-             functions_of_time = std::nullopt) {
-        // Transform functions-of-time map to unique_ptrs because pybind11 can't
-        // handle unique_ptrs easily as function arguments (it's hard to
-        // transfer ownership of a Python object to C++)
-        std::unordered_map<
-            std::string,
-            std::unique_ptr<domain::FunctionsOfTime::FunctionOfTime>>
-            functions_of_time_ptrs{};
-        if (functions_of_time.has_value()) {
-          for (const auto& [name, fot] : *functions_of_time) {
-            functions_of_time_ptrs[name] = fot.get_clone();
-          }
+         const std::optional<double>& time,
+         const std::optional<FuncOfTimeMap>& functions_of_time,
+         const BlockSpatialIndex<Dim>* const spatial_index) {
+        const double resolved_time =
+            time.value_or(std::numeric_limits<double>::signaling_NaN());
+        const auto functions_of_time_ptrs =
+            clone_functions_of_time(functions_of_time);
+        if (spatial_index != nullptr) {
+          return block_logical_coordinates(domain, *spatial_index,
+                                           inertial_coords, resolved_time,
+                                           functions_of_time_ptrs);
         }
-        return block_logical_coordinates(
-            domain, inertial_coords,
-            time.value_or(std::numeric_limits<double>::signaling_NaN()),
-            functions_of_time_ptrs);
+        return block_logical_coordinates(domain, inertial_coords, resolved_time,
+                                         functions_of_time_ptrs);
       },
-      py::arg("domain"), py::arg("inertial_coords"), py::arg("time"),
-      py::arg("functions_of_time"));
+      py::arg("domain"), py::arg("inertial_coords"),
+      py::arg("time") = std::nullopt,
+      py::arg("functions_of_time") = std::nullopt,
+      py::arg("spatial_index") = nullptr);
 }
 }  // namespace
 
@@ -4,6 +4,7 @@
 #include "Domain/Python/Domain.hpp"
 
 #include <cstddef>
+#include <memory>
 #include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -12,6 +13,7 @@
 
 #include "Domain/Creators/RegisterDerivedWithCharm.hpp"
 #include "Domain/Creators/TimeDependence/RegisterDerivedWithCharm.hpp"
+#include "Domain/DeserializationCache.hpp"
 #include "Domain/Domain.hpp"
 #include "Utilities/GetOutput.hpp"
 #include "Utilities/Serialization/Serialize.hpp"
@@ -36,9 +38,20 @@ void bind_domain_impl(py::module& m) {  // NOLINT
   m.def("serialize_domain", &serialize<Domain<Dim>>);
   m.def(("deserialize_domain_" + get_output(Dim) + "d").c_str(),
         [](const std::vector<char>& serialized_domain) {
-          return deserialize<Domain<Dim>>(serialized_domain.data());
+          // The deserialized domain is shared with the cache, so we return a
+          // reference that keeps the shared domain alive
+          using SharedDomain = std::shared_ptr<const Domain<Dim>>;
+          auto* const shared_domain = new SharedDomain(
+              domain::deserialize_domain_cached<Dim>(serialized_domain));
+          const py::capsule owner(shared_domain, [](void* ptr) {
+            delete static_cast<SharedDomain*>(ptr);
+          });
+          return py::cast(shared_domain->get(),
+                          py::return_value_policy::reference_internal, owner);
         },
-        py::arg("serialized_domain"));
+        py::arg("serialized_domain"),
+        "Deserialize a domain. The result is cached, so deserializing the same "
+        "data again returns the same (shared) domain.");
 }
 }  // namespace
 
@@ -4,16 +4,15 @@
 #include "Domain/Python/FunctionsOfTime.hpp"
 
 #include <memory>
-#include <pup.h>
-#include <pup_stl.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <string>
 #include <unordered_map>
+#include <vector>
 
+#include "Domain/DeserializationCache.hpp"
 #include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
 #include "Domain/FunctionsOfTime/RegisterDerivedWithCharm.hpp"
-#include "Utilities/Serialization/Serialize.hpp"
 
 namespace py = pybind11;
 
@@ -31,12 +30,25 @@ void bind_functions_of_time(py::module& m) {  // NOLINT
   m.def(
       "deserialize_functions_of_time",
       [](const std::vector<char>& serialized_functions_of_time) {
-        return deserialize<std::unordered_map<
-            std::string,
-            std::unique_ptr<domain::FunctionsOfTime::FunctionOfTime>>>(
-            serialized_functions_of_time.data());
+        // The deserialized functions of time are shared with the cache, so
+        // we return references that keep the shared map alive
+        using SharedMap = std::shared_ptr<const FunctionsOfTimeMap>;
+        auto* const shared_map = new SharedMap(
+            deserialize_functions_of_time_cached(serialized_functions_of_time));
+        const py::capsule owner(
+            shared_map, [](void* ptr) { delete static_cast<SharedMap*>(ptr); });
+        py::dict result{};
+        for (const auto& [name, function_of_time] : **shared_map) {
+          result[py::str(name)] =
+              py::cast(function_of_time.get(),
+                       py::return_value_policy::reference_internal, owner);
+        }
+        return result;
       },
-      py::arg("serialized_functions_of_time"));
+      py::arg("serialized_functions_of_time"),
+      "Deserialize a map of functions of time. The result is cached, so "
+      "deserializing the same data again returns the same (shared) "
+      "functions of time.");
 }
 
 }  // namespace domain::py_bindings
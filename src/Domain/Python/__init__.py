@@ -3,7 +3,17 @@
 
 from ._Pybindings import *
 
+BatchedElementMaps = {
+    1: BatchedElementMaps1D,
+    2: BatchedElementMaps2D,
+    3: BatchedElementMaps3D,
+}
 Block = {1: Block1D, 2: Block2D, 3: Block3D}
+BlockSpatialIndex = {
+    1: BlockSpatialIndex1D,
+    2: BlockSpatialIndex2D,
+    3: BlockSpatialIndex3D,
+}
 Domain = {1: Domain1D, 2: Domain2D, 3: Domain3D}
 ElementId = {1: ElementId1D, 2: ElementId2D, 3: ElementId3D}
 
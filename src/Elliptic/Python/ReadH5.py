@@ -1,30 +1,96 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
-from typing import Sequence, Union
+import functools
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 import spectre.IO.H5 as spectre_h5
-from spectre.IO.H5.IterElements import iter_elements
+from spectre.IO.H5.IterElements import (
+    Element,
+    iter_elements,
+    map_reduce_elements,
+)
 
 
-def read_matrix(volfiles: Union[spectre_h5.H5Vol, Sequence[spectre_h5.H5Vol]]):
+def _fill_column(
+    column: np.ndarray,
+    slice_start_per_element: Dict[str, int],
+    element: Element,
+    tensor_data: np.ndarray,
+):
+    # Slice of the row is determined by ordering of elements
+    slice_length = np.prod(tensor_data.shape)
+    slice_start = slice_start_per_element[str(element.id)]
+    column[slice_start : slice_start + slice_length] = np.concatenate(
+        tensor_data
+    )
+
+
+def _matrix_column(
+    slice_start_per_element: Dict[str, int],
+    size: int,
+    elements: List[Tuple[Element, np.ndarray]],
+) -> Dict[int, np.ndarray]:
+    """Assemble the column of the matrix from the elements of an observation"""
+    # Column of the matrix is the observation ID
+    col = int(elements[0][0].time)
+    column = np.zeros(size)
+    for element, tensor_data in elements:
+        _fill_column(column, slice_start_per_element, element, tensor_data)
+    return {col: column}
+
+
+def _merge_columns(
+    columns: Dict[int, np.ndarray], other_columns: Dict[int, np.ndarray]
+) -> Dict[int, np.ndarray]:
+    columns.update(other_columns)
+    return columns
+
+
+def read_matrix(
+    volfiles: Union[
+        str, Sequence[str], spectre_h5.H5Vol, Sequence[spectre_h5.H5Vol]
+    ],
+    subfile_name: Optional[str] = None,
+    num_processes: Optional[int] = None,
+):
     """Read matrix representation written by elliptic solver.
 
     Arguments:
       volfiles: Open spectre H5 volume files that contain volume data written
-        by the 'BuildMatrix' phase of an elliptic solve.
+        by the 'BuildMatrix' phase of an elliptic solve. Alternatively, paths to
+        the H5 files, in which case the 'subfile_name' must be specified and
+        the columns of the matrix are read in parallel (see
+        'spectre.IO.H5.IterElements.map_reduce_elements').
+      subfile_name: Name of the volume data subfile in the H5 files. Only used
+        if 'volfiles' are paths.
+      num_processes: Number of worker processes to read the columns with. Only
+        used if 'volfiles' are paths. Defaults to the number of CPUs.
 
     Returns: The matrix as a dense numpy array. If memory becomes a concern, we
       can change this to a sparse matrix.
     """
-    if isinstance(volfiles, spectre_h5.H5Vol):
+    if isinstance(volfiles, (str, spectre_h5.H5Vol)):
         volfiles = [volfiles]
+    h5_files = None
+    if isinstance(volfiles[0], str):
+        assert (
+            subfile_name
+        ), "Specify the 'subfile_name' to read the matrix from the H5 files."
+        h5_files = volfiles
+        # Read the structure of the data, then close the files again so they
+        # aren't inherited by the worker processes
+        open_h5_files = [
+            spectre_h5.H5File(h5_file, "r") for h5_file in h5_files
+        ]
+        volfiles = [
+            open_h5_file.get_vol(subfile_name) for open_h5_file in open_h5_files
+        ]
     # Each observation is a column of the matrix
     obs_ids = volfiles[0].list_observation_ids()
     size = len(obs_ids)
-    matrix = np.zeros((size, size))
     # Collect all variables to be able to order them
     all_tensor_components = volfiles[0].list_tensor_components(obs_ids[0])
     variables = sorted(
@@ -44,20 +110,34 @@ def read_matrix(volfiles: Union[spectre_h5.H5Vol, Sequence[spectre_h5.H5Vol]]):
     slice_start_per_element = {}
     slice_start = 0
     for element_id in element_ids:
-        slice_start_per_element[element_id] = slice_start
+        slice_start_per_element[str(element_id)] = slice_start
         slice_start += num_points_per_element[element_id] * len(variables)
     del num_points_per_element
-    # Fill matrix
-    for element, tensor_data in iter_elements(
-        volfiles, obs_ids=None, tensor_components=variables
-    ):
-        # Column of the matrix is the observation ID
-        col = int(element.time)
-        # Slice of the row is determined by ordering of elements
-        slice_length = np.prod(tensor_data.shape)
-        slice_start = slice_start_per_element[element.id]
-        matrix[
-            slice_start : slice_start + slice_length,
-            col,
-        ] = np.concatenate(tensor_data)
+    matrix = np.zeros((size, size))
+    if h5_files is None:
+        # Fill matrix
+        for element, tensor_data in iter_elements(
+            volfiles, obs_ids=None, tensor_components=variables
+        ):
+            # Column of the matrix is the observation ID
+            col = int(element.time)
+            _fill_column(
+                matrix[:, col], slice_start_per_element, element, tensor_data
+            )
+        return matrix
+    # Assemble the columns from the elements of each observation in all files
+    del volfiles
+    for open_h5_file in open_h5_files:
+        open_h5_file.close()
+    columns = map_reduce_elements(
+        h5_files,
+        subfile_name,
+        functools.partial(_matrix_column, slice_start_per_element, size),
+        _merge_columns,
+        tensor_components=variables,
+        per_observation=True,
+        num_processes=num_processes,
+    )
+    for col, column in (columns or {}).items():
+        matrix[:, col] = column
     return matrix
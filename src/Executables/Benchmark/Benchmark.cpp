@@ -5,8 +5,13 @@
 #pragma GCC diagnostic ignored "-Wredundant-decls"
 #include <benchmark/benchmark.h>
 #pragma GCC diagnostic pop
+#include <algorithm>
 #include <charm++.h>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include "DataStructures/DataBox/Tag.hpp"
@@ -19,11 +24,19 @@
 #include "Domain/CoordinateMaps/ProductMaps.hpp"
 #include "Domain/CoordinateMaps/ProductMaps.tpp"
 #include "Domain/Structure/Element.hpp"
+#include "IO/H5/AccessType.hpp"
+#include "IO/H5/File.hpp"
+#include "IO/H5/TensorData.hpp"
+#include "IO/H5/VolumeData.hpp"
+#include "IO/H5/WriteOptions.hpp"
+#include "NumericalAlgorithms/Interpolation/IrregularInterpolant.hpp"
 #include "NumericalAlgorithms/LinearOperators/PartialDerivatives.tpp"
 #include "NumericalAlgorithms/Spectral/LogicalCoordinates.hpp"
 #include "NumericalAlgorithms/Spectral/Mesh.hpp"
 #include "NumericalAlgorithms/Spectral/Spectral.hpp"
 #include "PointwiseFunctions/MathFunctions/PowX.hpp"
+#include "Utilities/FileSystem.hpp"
+#include "Utilities/Gsl.hpp"
 
 // Charm looks for this function but since we build without a main function or
 // main module we just have it be empty
@@ -108,6 +121,206 @@ void bench_all_gradient(benchmark::State& state) {  // NOLINT
 BENCHMARK(bench_all_gradient);  // NOLINT
 }  // namespace
 
+namespace {
+// Benchmark of writing volume data with different `h5::WriteOptions`. The
+// arguments are the compression level, whether or not to apply the shuffle
+// filter, the chunk size in bytes (zero for contiguous datasets), and whether
+// or not to downcast the data to float. The file size is reported as a counter
+// so the write throughput can be weighed against the size of the output.
+//
+// clang-tidy: don't pass be non-const reference
+void bench_write_volume_data(benchmark::State& state) {  // NOLINT
+  constexpr size_t num_elements = 64;
+  constexpr size_t pts_1d = 8;
+  constexpr size_t num_components = 10;
+  constexpr size_t num_points = pts_1d * pts_1d * pts_1d;
+  h5::WriteOptions write_options{};
+  write_options.compression_level = static_cast<size_t>(state.range(0));
+  write_options.shuffle = state.range(1) != 0;
+  write_options.chunk_size = static_cast<size_t>(state.range(2));
+  if (state.range(3) != 0) {
+    for (size_t j = 0; j < num_components; ++j) {
+      write_options.float_tensor_components.push_back("Component" +
+                                                      std::to_string(j));
+    }
+  }
+  std::vector<ElementVolumeData> elements{};
+  elements.reserve(num_elements);
+  for (size_t i = 0; i < num_elements; ++i) {
+    std::vector<TensorComponent> components{};
+    for (size_t j = 0; j < num_components; ++j) {
+      // Smooth data, similar to a solution on a spectral grid
+      DataVector data(num_points);
+      for (size_t k = 0; k < num_points; ++k) {
+        data[k] = sin(0.01 * static_cast<double>(k + num_points * i) +
+                      static_cast<double>(j));
+      }
+      components.emplace_back("Component" + std::to_string(j), std::move(data));
+    }
+    elements.emplace_back(
+        "[B0,(L2I" + std::to_string(i) + ",L0I0,L0I0)]", std::move(components),
+        std::vector<size_t>(3, pts_1d),
+        std::vector<Spectral::Basis>(3, Spectral::Basis::Legendre),
+        std::vector<Spectral::Quadrature>(3, Spectral::Quadrature::Gauss));
+  }
+  const std::string file_name = "BenchWriteVolumeData.h5";
+  size_t observation_id = 0;
+  {
+    if (file_system::check_if_file_exists(file_name)) {
+      file_system::rm(file_name, true);
+    }
+    h5::H5File<h5::AccessType::ReadWrite> h5_file{file_name};
+    auto& volfile = h5_file.insert<h5::VolumeData>("/VolumeData");
+    volfile.set_write_options(write_options);
+    while (state.KeepRunning()) {
+      volfile.write_volume_data(observation_id,
+                                static_cast<double>(observation_id), elements);
+      ++observation_id;
+    }
+  }
+  state.SetBytesProcessed(
+      static_cast<int64_t>(state.iterations() * num_elements * num_components *
+                           num_points * sizeof(double)));
+  state.counters["FileSizePerObservation"] =
+      static_cast<double>(file_system::file_size(file_name)) /
+      static_cast<double>(observation_id);
+  file_system::rm(file_name, true);
+}
+// Arguments: compression level, shuffle, chunk size, float
+BENCHMARK(bench_write_volume_data)  // NOLINT
+    ->Args({5, 1, 131'072, 0})
+    ->Args({1, 1, 131'072, 0})
+    ->Args({9, 1, 131'072, 0})
+    ->Args({5, 0, 131'072, 0})
+    ->Args({5, 1, 1'048'576, 0})
+    ->Args({0, 0, 131'072, 0})
+    ->Args({0, 0, 0, 0})
+    ->Args({5, 1, 131'072, 1})
+    ->Args({0, 0, 0, 1});
+}  // namespace
+
+namespace {
+// Benchmark of interpolating many tensor components of an element to a few
+// target points, like the Exporter does when a horizon finder requests the
+// metric and its derivatives. The components of the element are stored
+// `stride` apart, as in a buffer that holds the data of many elements. The
+// first argument selects interpolating each component separately (0) or all
+// components with a single matrix-matrix multiplication (1), and the second
+// argument is the number of components. Run it with
+// `--benchmark_filter=bench_interpolate_components` to compare the two.
+//
+// clang-tidy: don't pass be non-const reference
+void bench_interpolate_components(benchmark::State& state) {  // NOLINT
+  constexpr size_t pts_1d = 8;
+  constexpr size_t num_target_points = 50;
+  const bool batched = state.range(0) != 0;
+  const auto num_components = static_cast<size_t>(state.range(1));
+  const Mesh<3> mesh{pts_1d, Spectral::Basis::Legendre,
+                     Spectral::Quadrature::GaussLobatto};
+  const size_t num_points = mesh.number_of_grid_points();
+  tnsr::I<DataVector, 3, Frame::ElementLogical> target_points{
+      num_target_points};
+  for (size_t d = 0; d < 3; ++d) {
+    for (size_t i = 0; i < num_target_points; ++i) {
+      target_points.get(d)[i] =
+          sin(static_cast<double>(i) + static_cast<double>(d));
+    }
+  }
+  const intrp::Irregular<3> interpolant{mesh, target_points};
+  // Leave room for the data of other elements between the components
+  const size_t stride = 10 * num_points;
+  std::vector<double> input(num_components * stride);
+  for (size_t k = 0; k < input.size(); ++k) {
+    input[k] = sin(0.01 * static_cast<double>(k));
+  }
+  std::vector<double> output(num_components * num_target_points);
+  while (state.KeepRunning()) {
+    if (batched) {
+      gsl::span<double> output_view{output.data(), output.size()};
+      interpolant.interpolate(
+          make_not_null(&output_view),
+          gsl::span<const double>{input.data(),
+                                  (num_components - 1) * stride + num_points},
+          num_components, stride);
+    } else {
+      for (size_t c = 0; c < num_components; ++c) {
+        gsl::span<double> output_view{output.data() + c * num_target_points,
+                                      num_target_points};
+        interpolant.interpolate(
+            make_not_null(&output_view),
+            gsl::span<const double>{input.data() + c * stride, num_points});
+      }
+    }
+    benchmark::DoNotOptimize(output.data());
+    benchmark::ClobberMemory();
+  }
+}
+// Arguments: batched, number of components
+BENCHMARK(bench_interpolate_components)  // NOLINT
+    ->Args({0, 1})
+    ->Args({1, 1})
+    ->Args({0, 10})
+    ->Args({1, 10})
+    ->Args({0, 40})
+    ->Args({1, 40});
+
+// Benchmark of interpolating single-precision tensor components, like the
+// Exporter does for volume data stored in single precision. The first argument
+// selects converting the input to double precision and interpolating with
+// BLAS (0) or interpolating the single-precision input directly with the
+// hand-written matrix multiplication (1), and the second argument is the
+// number of components.
+//
+// clang-tidy: don't pass be non-const reference
+void bench_interpolate_single_precision(benchmark::State& state) {  // NOLINT
+  constexpr size_t pts_1d = 8;
+  constexpr size_t num_target_points = 50;
+  const bool direct = state.range(0) != 0;
+  const auto num_components = static_cast<size_t>(state.range(1));
+  const Mesh<3> mesh{pts_1d, Spectral::Basis::Legendre,
+                     Spectral::Quadrature::GaussLobatto};
+  const size_t num_points = mesh.number_of_grid_points();
+  tnsr::I<DataVector, 3, Frame::ElementLogical> target_points{
+      num_target_points};
+  for (size_t d = 0; d < 3; ++d) {
+    for (size_t i = 0; i < num_target_points; ++i) {
+      target_points.get(d)[i] =
+          sin(static_cast<double>(i) + static_cast<double>(d));
+    }
+  }
+  const intrp::Irregular<3> interpolant{mesh, target_points};
+  std::vector<float> input(num_components * num_points);
+  for (size_t k = 0; k < input.size(); ++k) {
+    input[k] = static_cast<float>(sin(0.01 * static_cast<double>(k)));
+  }
+  std::vector<double> converted_input(input.size());
+  std::vector<double> output(num_components * num_target_points);
+  while (state.KeepRunning()) {
+    gsl::span<double> output_view{output.data(), output.size()};
+    if (direct) {
+      interpolant.interpolate(
+          make_not_null(&output_view),
+          gsl::span<const float>{input.data(), input.size()});
+    } else {
+      std::copy(input.begin(), input.end(), converted_input.begin());
+      interpolant.interpolate(make_not_null(&output_view),
+                              gsl::span<const double>{converted_input.data(),
+                                                      converted_input.size()});
+    }
+    benchmark::DoNotOptimize(output.data());
+    benchmark::ClobberMemory();
+  }
+}
+// Arguments: direct, number of components
+BENCHMARK(bench_interpolate_single_precision)  // NOLINT
+    ->Args({0, 1})
+    ->Args({1, 1})
+    ->Args({0, 10})
+    ->Args({1, 10})
+    ->Args({0, 40})
+    ->Args({1, 40});
+}  // namespace
+
 // Ignore the warning about an extra ';' because some versions of benchmark
 // require it
 #pragma GCC diagnostic push
@@ -3,30 +3,45 @@
 
 #include "IO/Exporter/Exporter.hpp"
 
+#include <algorithm>
+#include <array>
 #include <csignal>  // For Blaze error handling without PCH
+#include <cstddef>
+#include <limits>
+#include <memory>
+#include <optional>
+#include <utility>
+#include <vector>
 #ifdef _OPENMP
 #include <omp.h>
 #endif  // _OPENMP
 
+#include "DataStructures/DataVector.hpp"
 #include "DataStructures/Tensor/EagerMath/CartesianToSpherical.hpp"
+#include "DataStructures/Tensor/Tensor.hpp"
 #include "Domain/BlockLogicalCoordinates.hpp"
+#include "Domain/BlockSpatialIndex.hpp"
 #include "Domain/Creators/RegisterDerivedWithCharm.hpp"
 #include "Domain/Creators/TimeDependence/RegisterDerivedWithCharm.hpp"
+#include "Domain/DeserializationCache.hpp"
 #include "Domain/Domain.hpp"
 #include "Domain/ElementLogicalCoordinates.hpp"
 #include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
 #include "Domain/FunctionsOfTime/RegisterDerivedWithCharm.hpp"
 #include "IO/H5/File.hpp"
+#include "IO/H5/FilePool.hpp"
 #include "IO/H5/TensorData.hpp"
 #include "IO/H5/VolumeData.hpp"
 #include "NumericalAlgorithms/Interpolation/IrregularInterpolant.hpp"
 #include "NumericalAlgorithms/Interpolation/PolynomialInterpolation.hpp"
+#include "NumericalAlgorithms/Spectral/Mesh.hpp"
+#include "Utilities/Algorithm.hpp"
 #include "Utilities/FileSystem.hpp"
 #include "Utilities/GenerateInstantiations.hpp"
-#include "Utilities/GetOutput.hpp"
 #include "Utilities/Gsl.hpp"
+#include "Utilities/MakeArray.hpp"
 #include "Utilities/Overloader.hpp"
-#include "Utilities/Serialization/Serialize.hpp"
+#include "Utilities/TMPL.hpp"
 
 // Ignore OpenMP pragmas when OpenMP is not enabled
 #pragma GCC diagnostic push
@@ -35,97 +50,202 @@
 namespace spectre::Exporter {
 
 namespace {
+// Interpolants from the elements in a volume file to the target points that
+// they contain. They can be reused for other observations as long as the
+// block-logical coordinates of the target points and the elements in the file
+// don't change.
 template <size_t Dim>
-void interpolate_to_points(
-    const gsl::not_null<std::vector<std::vector<double>>*> result,
-    const gsl::not_null<std::vector<bool>*> filled_data,
-    const std::string& filename, const std::string& subfile_name,
-    const size_t obs_id, const std::vector<std::string>& tensor_components,
+struct ElementInterpolants {
+  // The elements in the file, to check if the interpolants can be reused
+  std::vector<std::string> grid_names{};
+  std::vector<std::vector<size_t>> extents{};
+  std::vector<std::vector<Spectral::Basis>> bases{};
+  std::vector<std::vector<Spectral::Quadrature>> quadratures{};
+  // The mapping of the target points that the interpolants were set up for
+  // (see `InterpolationPlan::Impl::mapping_version`)
+  size_t mapping_version = 0;
+  // The grids that contain target points, the interpolants to these target
+  // points, the indices of these target points in the result, and their
+  // element-logical coordinates
+  std::vector<size_t> selected_grid_indices{};
+  std::vector<intrp::Irregular<Dim>> interpolants{};
+  std::vector<std::vector<size_t>> target_indices{};
+  std::vector<tnsr::I<DataVector, Dim, Frame::ElementLogical>> target_coords{};
+};
+
+template <size_t Dim>
+bool elements_match(const ElementInterpolants<Dim>& element_interpolants,
+                    const h5::VolumeData& volfile, const size_t obs_id) {
+  return volfile.get_grid_names(obs_id) == element_interpolants.grid_names and
+         volfile.get_extents(obs_id) == element_interpolants.extents and
+         volfile.get_bases(obs_id) == element_interpolants.bases and
+         volfile.get_quadratures(obs_id) == element_interpolants.quadratures;
+}
+
+// Sets up the interpolants from the elements in the file to the target points.
+// The `previous` interpolants, set up for the same elements but a different
+// mapping of the target points, are reused for all elements whose target points
+// didn't move. This is the case for elements in time-independent blocks.
+template <size_t Dim>
+ElementInterpolants<Dim> make_element_interpolants(
+    const h5::VolumeData& volfile, const size_t obs_id,
     const std::vector<BlockLogicalCoords<Dim>>& block_logical_coords,
+    const size_t mapping_version,
+    std::optional<ElementInterpolants<Dim>> previous,
     [[maybe_unused]] const size_t num_threads) {
-  const h5::H5File<h5::AccessType::ReadOnly> h5file(filename);
-  const auto& volfile = h5file.get<h5::VolumeData>(subfile_name);
-  const auto grid_names = volfile.get_grid_names(obs_id);
-  const auto all_extents = volfile.get_extents(obs_id);
-  const auto all_bases = volfile.get_bases(obs_id);
-  const auto all_quadratures = volfile.get_quadratures(obs_id);
-  // Reconstruct element IDs & meshes in the volume data file.
+  ElementInterpolants<Dim> result{};
+  result.mapping_version = mapping_version;
+  result.grid_names = volfile.get_grid_names(obs_id);
+  result.extents = volfile.get_extents(obs_id);
+  result.bases = volfile.get_bases(obs_id);
+  result.quadratures = volfile.get_quadratures(obs_id);
+  // Reconstruct element IDs & meshes in the volume data file, in the order in
+  // which they are stored in the file.
   // This can be simplified by using ElementId and Mesh in the VolumeData class.
+  const size_t num_grids = result.grid_names.size();
   std::vector<ElementId<Dim>> element_ids{};
-  std::unordered_map<ElementId<Dim>, Mesh<Dim>> meshes{};
-  element_ids.reserve(grid_names.size());
-  for (const auto& grid_name : grid_names) {
-    const ElementId<Dim> element_id(grid_name);
-    element_ids.push_back(element_id);
-    meshes[element_id] = h5::mesh_for_grid<Dim>(
-        grid_name, grid_names, all_extents, all_bases, all_quadratures);
+  std::vector<Mesh<Dim>> meshes{};
+  element_ids.reserve(num_grids);
+  meshes.reserve(num_grids);
+  for (size_t grid_index = 0; grid_index < num_grids; ++grid_index) {
+    element_ids.emplace_back(result.grid_names[grid_index]);
+    meshes.emplace_back(
+        make_array<size_t, Dim>(result.extents[grid_index]),
+        make_array<Spectral::Basis, Dim>(result.bases[grid_index]),
+        make_array<Spectral::Quadrature, Dim>(result.quadratures[grid_index]));
   }
   // Map the target points to element-logical coordinates. This selects the
   // subset of target points that are in the volume data file's elements.
   const auto element_logical_coords =
       element_logical_coordinates(element_ids, block_logical_coords);
-  if (element_logical_coords.empty()) {
-    return;
+  for (size_t grid_index = 0; grid_index < num_grids; ++grid_index) {
+    if (element_logical_coords.contains(element_ids[grid_index])) {
+      result.selected_grid_indices.push_back(grid_index);
+    }
+  }
+  const size_t num_selected_grids = result.selected_grid_indices.size();
+  result.interpolants.resize(num_selected_grids);
+  result.target_indices.resize(num_selected_grids);
+  result.target_coords.resize(num_selected_grids);
+  // Index of each grid in the previous interpolants, if it was selected there
+  std::vector<std::optional<size_t>> previous_selected_index(num_grids);
+  if (previous.has_value()) {
+    for (size_t i = 0; i < previous->selected_grid_indices.size(); ++i) {
+      previous_selected_index[previous->selected_grid_indices[i]] = i;
+    }
   }
-  // Load the tensor data for all grids in the file because it's stored
-  // contiguously
-  std::vector<DataVector> tensor_data{};
-  tensor_data.reserve(tensor_components.size());
-  for (const auto& tensor_component : tensor_components) {
-    auto component_data =
-        volfile.get_tensor_component(obs_id, tensor_component).data;
-    if (std::holds_alternative<DataVector>(component_data)) {
-      tensor_data.push_back(std::get<DataVector>(std::move(component_data)));
+#pragma omp parallel for num_threads(num_threads)
+  for (size_t selected_index = 0; selected_index < num_selected_grids;
+       ++selected_index) {
+    const size_t grid_index = result.selected_grid_indices[selected_index];
+    const auto& points = element_logical_coords.at(element_ids[grid_index]);
+    result.target_indices[selected_index] = points.offsets;
+    result.target_coords[selected_index] = points.element_logical_coords;
+    if (const auto& i = previous_selected_index[grid_index];
+        i.has_value() and previous->target_indices[*i] == points.offsets and
+        previous->target_coords[*i] == points.element_logical_coords) {
+      result.interpolants[selected_index] =
+          std::move(previous->interpolants[*i]);
     } else {
-      // Possible optimization: do single-precision interpolation if the
-      // volume data is single-precision
-      const auto& float_component_data =
-          std::get<std::vector<float>>(component_data);
-      DataVector double_component_data(float_component_data.size());
-      for (size_t i = 0; i < float_component_data.size(); ++i) {
-        double_component_data[i] = float_component_data[i];
-      }
-      tensor_data.push_back(std::move(double_component_data));
+      result.interpolants[selected_index] = intrp::Irregular<Dim>(
+          meshes[grid_index], points.element_logical_coords);
     }
   }
-  h5file.close();
+  return result;
+}
+
+template <size_t Dim, typename ResultType>
+void interpolate_from_file(
+    const gsl::not_null<std::vector<std::vector<ResultType>>*> result,
+    const gsl::not_null<std::vector<bool>*> filled_data,
+    const h5::VolumeData& volfile, const size_t obs_id,
+    const std::vector<std::string>& tensor_components,
+    const ElementInterpolants<Dim>& element_interpolants,
+    [[maybe_unused]] const size_t num_threads) {
+  const auto& selected_grid_indices =
+      element_interpolants.selected_grid_indices;
+  if (selected_grid_indices.empty() or tensor_components.empty()) {
+    return;
+  }
+  // Load only the tensor data of the grids that contain target points. The
+  // data of the selected grids is read one after the other, and all components
+  // are read into a single buffer, one after the other.
+  const auto all_offsets_and_lengths = volfile.get_offsets_and_lengths(obs_id);
+  std::vector<std::pair<size_t, size_t>> selected_offsets_and_lengths{};
+  std::vector<size_t> selected_offsets{};
+  size_t num_points = 0;
+  for (const size_t grid_index : selected_grid_indices) {
+    selected_offsets_and_lengths.push_back(all_offsets_and_lengths[grid_index]);
+    selected_offsets.push_back(num_points);
+    num_points += all_offsets_and_lengths[grid_index].second;
+  }
+  // If all components are stored in single precision we keep them in single
+  // precision, which halves the size of the buffer and avoids converting the
+  // data. The interpolation accumulates in double precision either way. Mixed
+  // precision data is converted to double precision while reading.
+  const bool single_precision = alg::all_of(
+      tensor_components, [&volfile, &obs_id](const std::string& component) {
+        return volfile
+            .get_tensor_component_size_and_precision(obs_id, component)
+            .second;
+      });
+  const auto read_and_interpolate = [&](const auto data_type_v) {
+    using DataType = tmpl::type_from<decltype(data_type_v)>;
+    std::vector<DataType> tensor_data(tensor_components.size() * num_points);
+    {
+      gsl::span<DataType> tensor_data_view{tensor_data.data(),
+                                           tensor_data.size()};
+      volfile.read_tensor_components(make_not_null(&tensor_data_view), obs_id,
+                                     tensor_components,
+                                     selected_offsets_and_lengths);
+    }
 #pragma omp parallel num_threads(num_threads)
-  {
-    DataVector interpolated_data{};
+    {
+      DataVector interpolated_data{};
 #pragma omp for
-    for (const auto& element_id : element_ids) {
-      const auto found_points = element_logical_coords.find(element_id);
-      if (found_points == element_logical_coords.end()) {
-        continue;
-      }
-      const auto& points = found_points->second;
-      const auto [offset, length] = h5::offset_and_length_for_grid(
-          get_output(element_id), grid_names, all_extents);
-      // Interpolate!
-      // Possible optimization: rather than interpolating each tensor component
-      // separately, we could interpolate all components at once. This would
-      // need an offset and stride to be passed to the interpolator, since the
-      // tensor components for all elements are stored contiguously.
-      const intrp::Irregular<Dim> interpolant(meshes[element_id],
-                                              points.element_logical_coords);
-      const size_t num_element_target_points =
-          points.element_logical_coords.begin()->size();
-      if (interpolated_data.size() < num_element_target_points) {
-        interpolated_data.destructive_resize(num_element_target_points);
-      }
-      for (size_t i = 0; i < tensor_components.size(); ++i) {
+      for (size_t selected_index = 0;
+           selected_index < selected_grid_indices.size(); ++selected_index) {
+        const auto& interpolant =
+            element_interpolants.interpolants[selected_index];
+        const auto& target_indices =
+            element_interpolants.target_indices[selected_index];
+        const size_t offset = selected_offsets[selected_index];
+        const size_t length =
+            selected_offsets_and_lengths[selected_index].second;
+        // Interpolate all tensor components at once. The components of this
+        // element are `num_points` apart in the buffer, so they are
+        // interpolated in place without copying them out first.
+        // Only this element's interpolated data is held in double precision.
+        const size_t num_element_target_points = target_indices.size();
+        const size_t num_interpolated_points =
+            num_element_target_points * tensor_components.size();
+        if (interpolated_data.size() < num_interpolated_points) {
+          interpolated_data.destructive_resize(num_interpolated_points);
+        }
         auto output_data =
-            gsl::make_span(interpolated_data.data(), num_element_target_points);
-        const auto input_data =
-            gsl::make_span(tensor_data[i].data() + offset, length);
-        interpolant.interpolate(make_not_null(&output_data), input_data);
+            gsl::make_span(interpolated_data.data(), num_interpolated_points);
+        const gsl::span<const DataType> input_data = gsl::make_span(
+            tensor_data.data() + offset,
+            (tensor_components.size() - 1) * num_points + length);
+        interpolant.interpolate(make_not_null(&output_data), input_data,
+                                tensor_components.size(), num_points);
+        for (size_t i = 0; i < tensor_components.size(); ++i) {
+          for (size_t j = 0; j < num_element_target_points; ++j) {
+            (*result)[i][target_indices[j]] = static_cast<ResultType>(
+                interpolated_data[i * num_element_target_points + j]);
+          }
+        }
         for (size_t j = 0; j < num_element_target_points; ++j) {
-          (*result)[i][points.offsets[j]] = interpolated_data[j];
-          (*filled_data)[points.offsets[j]] = true;
+          (*filled_data)[target_indices[j]] = true;
         }
-      }
-    }  // omp for
-  }  // omp parallel
+      }  // omp for
+    }  // omp parallel
+  };
+  if (single_precision) {
+    read_and_interpolate(tmpl::type_<float>{});
+  } else {
+    read_and_interpolate(tmpl::type_<double>{});
+  }
 }
 
 // Data structure for extrapolation of tensor components into excisions
@@ -319,36 +439,191 @@ struct SelectObservation {
   const h5::VolumeData& volfile;
 };
 
+constexpr size_t num_extrapolation_anchors = 8;
+
+// Look up block logical coordinates for all target points by mapping them
+// through the domain. We also set up the extrapolation into excisions here.
+// Anchor points are added to the `block_logical_coords` and additional
+// information is collected in `extrapolation_info` for later extrapolation.
+//
+// If `remap_time_dependent_only` is true, the `block_logical_coords` hold the
+// mapping of the target points through the same domain at a different time or
+// with different functions of time. Then the target points in time-independent
+// blocks keep their block-logical coordinates, and the target points in
+// time-dependent blocks first try the block they were in before.
+template <size_t Dim>
+void map_target_points(
+    const gsl::not_null<std::vector<BlockLogicalCoords<Dim>>*>
+        block_logical_coords,
+    const gsl::not_null<
+        std::vector<ExtrapolationInfo<num_extrapolation_anchors>>*>
+        extrapolation_info,
+    const std::array<std::vector<double>, Dim>& target_points,
+    const Domain<Dim>& domain, const double time,
+    const domain::FunctionsOfTimeMap& functions_of_time,
+    const bool extrapolate_into_excisions, const bool remap_time_dependent_only,
+    [[maybe_unused]] const size_t num_threads) {
+  const size_t num_target_points = target_points[0].size();
+  // Drop the extrapolation anchors, which are set up again below
+  block_logical_coords->resize(num_target_points);
+  extrapolation_info->clear();
+  const double extrapolation_spacing = 0.3;
+  // The target points that have to be looked up in all blocks
+  std::vector<size_t> unresolved_points{};
+  if (remap_time_dependent_only) {
+    // Target points usually stay in the same block between observations
+    std::vector<char> resolved(num_target_points, 0);
+#pragma omp parallel num_threads(num_threads)
+    {
+      tnsr::I<double, Dim, Frame::Inertial> target_point{};
+#pragma omp for
+      for (size_t s = 0; s < num_target_points; ++s) {
+        auto& x_block_logical = (*block_logical_coords)[s];
+        if (not x_block_logical.has_value()) {
+          continue;
+        }
+        const auto& block = domain.blocks()[x_block_logical->id.get_index()];
+        if (not block.is_time_dependent()) {
+          resolved[s] = 1;
+          continue;
+        }
+        for (size_t d = 0; d < Dim; ++d) {
+          target_point.get(d) = gsl::at(target_points, d)[s];
+        }
+        auto x_logical = block_logical_coordinates_single_point(
+            target_point, block, time, functions_of_time);
+        if (x_logical.has_value()) {
+          x_block_logical->data = std::move(x_logical.value());
+          resolved[s] = 1;
+        } else {
+          x_block_logical.reset();
+        }
+      }  // omp for target points
+    }  // omp parallel
+    for (size_t s = 0; s < num_target_points; ++s) {
+      if (resolved[s] == 0) {
+        unresolved_points.push_back(s);
+      }
+    }
+    if (unresolved_points.empty()) {
+      return;
+    }
+  } else {
+    block_logical_coords->assign(num_target_points, std::nullopt);
+    unresolved_points.resize(num_target_points);
+    for (size_t s = 0; s < num_target_points; ++s) {
+      unresolved_points[s] = s;
+    }
+  }
+  // Try the blocks whose bounding box contains the target point first
+  const BlockSpatialIndex<Dim> spatial_index{domain, time, functions_of_time};
+  // This is the most expensive part of the interpolation, so we parallelize the
+  // loop.
+#pragma omp parallel num_threads(num_threads)
+  {
+    // Set up thread-local variables
+    tnsr::I<double, Dim, Frame::Inertial> target_point{};
+    std::vector<size_t> candidate_blocks{};
+    std::vector<BlockLogicalCoords<Dim>> extra_block_logical_coords{};
+    std::vector<ExtrapolationInfo<num_extrapolation_anchors>>
+        extra_extrapolation_info{};
+#pragma omp for nowait
+    for (size_t i = 0; i < unresolved_points.size(); ++i) {
+      const size_t s = unresolved_points[i];
+      for (size_t d = 0; d < Dim; ++d) {
+        target_point.get(d) = gsl::at(target_points, d)[s];
+      }
+      (*block_logical_coords)[s] = block_logical_coordinates_single_point(
+          make_not_null(&candidate_blocks), target_point, domain, spatial_index,
+          time, functions_of_time);
+      if ((*block_logical_coords)[s].has_value() or
+          not extrapolate_into_excisions) {
+        continue;
+      }
+      // The point wasn't found in any block. Check if it's in an excision and
+      // set up extrapolation if requested.
+      for (const auto& [name, excision_sphere] : domain.excision_spheres()) {
+        if (add_extrapolation_anchors(
+                make_not_null(&extra_block_logical_coords),
+                make_not_null(&extra_extrapolation_info), excision_sphere,
+                domain, target_point, time, functions_of_time,
+                extrapolation_spacing)) {
+          extra_extrapolation_info.back().target_index = s;
+          break;
+        }
+      }
+    }  // omp for target points
+#pragma omp critical
+    {
+      // Append the extra block logical coordinates and extrapolation info from
+      // this thread to the global vectors. Also set the source index to the
+      // index in `block_logical_coords` where we're going to insert the new
+      // coordinates.
+      for (auto& info : extra_extrapolation_info) {
+        info.source_index += block_logical_coords->size();
+      }
+      block_logical_coords->insert(block_logical_coords->end(),
+                                   extra_block_logical_coords.begin(),
+                                   extra_block_logical_coords.end());
+      extrapolation_info->insert(extrapolation_info->end(),
+                                 extra_extrapolation_info.begin(),
+                                 extra_extrapolation_info.end());
+    }  // omp critical
+  }  // omp parallel
+}
+
 }  // namespace
 
 template <size_t Dim>
-std::vector<std::vector<double>> interpolate_to_points(
+struct InterpolationPlan<Dim>::Impl {
+  std::vector<std::string> filenames;
+  std::string subfile_name;
+  std::array<std::vector<double>, Dim> target_points;
+  bool extrapolate_into_excisions;
+  size_t num_threads;
+  // The domain, time and functions of time for which the target points were
+  // mapped to the blocks of the domain. The domain is null until the first
+  // observation is interpolated.
+  std::shared_ptr<const Domain<Dim>> domain{};
+  double time = 0.;
+  std::shared_ptr<const domain::FunctionsOfTimeMap> functions_of_time{};
+  std::vector<BlockLogicalCoords<Dim>> block_logical_coords{};
+  std::vector<ExtrapolationInfo<num_extrapolation_anchors>>
+      extrapolation_info{};
+  // Incremented every time the target points are mapped, so the element
+  // interpolants know when to check if their target points moved
+  size_t mapping_version = 0;
+  // Interpolants for the elements in each volume file, in the order of
+  // `filenames`. They are set up when a file is first needed.
+  std::vector<std::optional<ElementInterpolants<Dim>>> element_interpolants{};
+};
+
+template <size_t Dim>
+InterpolationPlan<Dim>::InterpolationPlan(
     const std::variant<std::vector<std::string>, std::string>&
         volume_files_or_glob,
-    const std::string& subfile_name,
-    const std::variant<ObservationId, ObservationStep>& observation,
-    const std::vector<std::string>& tensor_components,
-    const std::array<std::vector<double>, Dim>& target_points,
+    std::string subfile_name,
+    std::array<std::vector<double>, Dim> target_points,
     const bool extrapolate_into_excisions,
-    const std::optional<size_t> num_threads) {
+    const std::optional<size_t> num_threads)
+    : impl_(std::make_unique<Impl>()) {
   domain::creators::register_derived_with_charm();
   domain::creators::time_dependence::register_derived_with_charm();
   domain::FunctionsOfTime::register_derived_with_charm();
 
   // Resolve number of threads to use in OpenMP parallelization
 #ifdef _OPENMP
-  const size_t resolved_num_threads =
-      num_threads.value_or(omp_get_max_threads());
+  impl_->num_threads = num_threads.value_or(omp_get_max_threads());
 #else
   if (num_threads.has_value()) {
     ERROR_NO_TRACE(
         "OpenMP is not available, so num_threads cannot be specified.");
   }
-  const size_t resolved_num_threads = 1;
+  impl_->num_threads = 1;
 #endif  // _OPENMP
 
   // Get the list of volume data files
-  const std::vector<std::string> filenames =
+  impl_->filenames =
       std::visit(Overloader{[](const std::vector<std::string>& volume_files) {
                               return volume_files;
                             },
@@ -356,13 +631,49 @@ std::vector<std::vector<double>> interpolate_to_points(
                               return file_system::glob(volume_files_glob);
                             }},
                  volume_files_or_glob);
-  if (filenames.empty()) {
+  if (impl_->filenames.empty()) {
     ERROR_NO_TRACE("No volume files found. Specify at least one volume file.");
   }
+  impl_->element_interpolants.resize(impl_->filenames.size());
+  impl_->subfile_name = std::move(subfile_name);
+
+  // Check target points have the same number of points in each dimension
+  const size_t num_target_points = target_points[0].size();
+  for (size_t d = 0; d < Dim; ++d) {
+    const auto& target_coord = gsl::at(target_points, d);
+    if (target_coord.size() != num_target_points) {
+      ERROR_NO_TRACE("Mismatched number of target points: coordinate 0 has "
+                     << num_target_points << " points, but coordinate " << d
+                     << " has " << target_coord.size() << " points.");
+    }
+  }
+  impl_->target_points = std::move(target_points);
+  impl_->extrapolate_into_excisions = extrapolate_into_excisions;
+}
+
+template <size_t Dim>
+InterpolationPlan<Dim>::InterpolationPlan(InterpolationPlan&&) noexcept =
+    default;
+
+template <size_t Dim>
+InterpolationPlan<Dim>& InterpolationPlan<Dim>::operator=(
+    InterpolationPlan&&) noexcept = default;
+
+template <size_t Dim>
+InterpolationPlan<Dim>::~InterpolationPlan() = default;
+
+template <size_t Dim>
+template <typename DataType>
+std::vector<std::vector<DataType>> InterpolationPlan<Dim>::interpolate(
+    const std::variant<ObservationId, ObservationStep>& observation,
+    const std::vector<std::string>& tensor_components) {
+  auto& plan = *impl_;
 
   // Retrieve info from the first volume file
-  const h5::H5File<h5::AccessType::ReadOnly> first_h5file(filenames.front());
-  const auto& first_volfile = first_h5file.get<h5::VolumeData>(subfile_name);
+  const auto first_h5file =
+      h5::pooled_file<h5::AccessType::ReadOnly>(plan.filenames.front());
+  const auto& first_volfile =
+      first_h5file->get_or_reuse<h5::VolumeData>(plan.subfile_name);
   const auto dim = first_volfile.get_dimension();
   if (dim != Dim) {
     ERROR_NO_TRACE("Mismatched dimensions: expected "
@@ -375,117 +686,88 @@ std::vector<std::vector<double>> interpolate_to_points(
   // `Visualization.ReadH5:select_observation` and possibly move it to C++.
   const size_t obs_id =
       std::visit(SelectObservation{first_volfile}, observation);
-  // Get domain, time, functions of time
-  const auto domain =
-      deserialize<Domain<Dim>>(first_volfile.get_domain(obs_id)->data());
+  // Get domain, time, functions of time. The deserialized domain and functions
+  // of time are cached, so repeated calls with the same volume data (e.g. in
+  // every iteration of a horizon find) don't deserialize them again.
+  const auto domain_ptr =
+      domain::deserialize_domain_cached<Dim>(*first_volfile.get_domain(obs_id));
+  const auto& domain = *domain_ptr;
   const auto time_and_fot = [&first_volfile, &obs_id, &domain]() {
     if (domain.is_time_dependent()) {
-      return std::make_pair(
-          first_volfile.get_observation_value(obs_id),
-          deserialize<domain::FunctionsOfTimeMap>(
-              first_volfile.get_functions_of_time(obs_id)->data()));
+      return std::make_pair(first_volfile.get_observation_value(obs_id),
+                            domain::deserialize_functions_of_time_cached(
+                                *first_volfile.get_functions_of_time(obs_id)));
     } else {
-      return std::make_pair(0., domain::FunctionsOfTimeMap{});
+      return std::make_pair(
+          0., std::make_shared<const domain::FunctionsOfTimeMap>());
     }
   }();
-  const double time = time_and_fot.first;
-  const auto& functions_of_time = time_and_fot.second;
-  first_h5file.close();
 
-  // Check target points have the same number of points in each dimension
-  const size_t num_target_points = target_points[0].size();
-  for (size_t d = 0; d < Dim; ++d) {
-    const auto& target_coord = gsl::at(target_points, d);
-    if (target_coord.size() != num_target_points) {
-      ERROR_NO_TRACE("Mismatched number of target points: coordinate 0 has "
-                     << num_target_points << " points, but coordinate " << d
-                     << " has " << target_coord.size() << " points.");
+  // Map the target points to the blocks of the domain, unless they are already
+  // mapped for this domain. Time-dependent maps have to be evaluated again at
+  // a different time or with different functions of time, but only for the
+  // target points in time-dependent blocks.
+  const bool same_domain = plan.domain == domain_ptr;
+  if (not same_domain or (domain.is_time_dependent() and
+                          (time_and_fot.first != plan.time or
+                           time_and_fot.second != plan.functions_of_time))) {
+    map_target_points(make_not_null(&plan.block_logical_coords),
+                      make_not_null(&plan.extrapolation_info),
+                      plan.target_points, domain, time_and_fot.first,
+                      *time_and_fot.second, plan.extrapolate_into_excisions,
+                      same_domain, plan.num_threads);
+    plan.domain = domain_ptr;
+    plan.time = time_and_fot.first;
+    plan.functions_of_time = time_and_fot.second;
+    ++plan.mapping_version;
+    if (not same_domain) {
+      for (auto& element_interpolants : plan.element_interpolants) {
+        element_interpolants.reset();
+      }
     }
   }
+  const size_t num_target_points = plan.target_points[0].size();
 
-  // Look up block logical coordinates for all target points by mapping them
-  // through the domain. This is the most expensive part of the function, so we
-  // parallelize the loop.
-  std::vector<BlockLogicalCoords<Dim>> block_logical_coords(num_target_points);
-  // We also set up the extrapolation into excisions here. Anchor points are
-  // added to the `block_logical_coords` and additional information is collected
-  // in `extrapolation_info` for later extrapolation.
-  constexpr size_t num_extrapolation_anchors = 8;
-  const double extrapolation_spacing = 0.3;
-  std::vector<ExtrapolationInfo<num_extrapolation_anchors>>
-      extrapolation_info{};
-#pragma omp parallel num_threads(resolved_num_threads)
-  {
-    // Set up thread-local variables
-    tnsr::I<double, Dim, Frame::Inertial> target_point{};
-    std::vector<BlockLogicalCoords<Dim>> extra_block_logical_coords{};
-    std::vector<ExtrapolationInfo<num_extrapolation_anchors>>
-        extra_extrapolation_info{};
-#pragma omp for nowait
-    for (size_t s = 0; s < num_target_points; ++s) {
-      for (size_t d = 0; d < Dim; ++d) {
-        target_point.get(d) = gsl::at(target_points, d)[s];
-      }
-      for (const auto& block : domain.blocks()) {
-        auto x_logical = block_logical_coordinates_single_point(
-            target_point, block, time, functions_of_time);
-        if (x_logical.has_value()) {
-          block_logical_coords[s] = {domain::BlockId(block.id()),
-                                     std::move(x_logical.value())};
-          break;
-        }
-      }  // for blocks
-      if (block_logical_coords[s].has_value() or
-          not extrapolate_into_excisions) {
-        continue;
-      }
-      // The point wasn't found in any block. Check if it's in an excision and
-      // set up extrapolation if requested.
-      for (const auto& [name, excision_sphere] : domain.excision_spheres()) {
-        if (add_extrapolation_anchors(
-                make_not_null(&extra_block_logical_coords),
-                make_not_null(&extra_extrapolation_info), excision_sphere,
-                domain, target_point, time, functions_of_time,
-                extrapolation_spacing)) {
-          extra_extrapolation_info.back().target_index = s;
-          break;
-        }
-      }
-    }  // omp for target points
-#pragma omp critical
-    {
-      // Append the extra block logical coordinates and extrapolation info from
-      // this thread to the global vectors. Also set the source index to the
-      // index in `block_logical_coords` where we're going to insert the new
-      // coordinates.
-      for (auto& info : extra_extrapolation_info) {
-        info.source_index += block_logical_coords.size();
-      }
-      block_logical_coords.insert(block_logical_coords.end(),
-                                  extra_block_logical_coords.begin(),
-                                  extra_block_logical_coords.end());
-      extrapolation_info.insert(extrapolation_info.end(),
-                                extra_extrapolation_info.begin(),
-                                extra_extrapolation_info.end());
-    }  // omp critical
-  }  // omp parallel
-
-  // Allocate memory for result
-  std::vector<std::vector<double>> result{};
+  // Allocate memory for result. The interpolation accumulates in double
+  // precision, but the interpolated values are written straight to the result
+  // in the requested precision, so single-precision results take half the
+  // memory.
+  std::vector<std::vector<DataType>> result{};
   result.reserve(tensor_components.size());
   for (size_t i = 0; i < tensor_components.size(); ++i) {
-    result.emplace_back(block_logical_coords.size(),
-                        std::numeric_limits<double>::signaling_NaN());
+    result.emplace_back(plan.block_logical_coords.size(),
+                        std::numeric_limits<DataType>::signaling_NaN());
   }
-  std::vector<bool> filled_data(block_logical_coords.size(), false);
+  std::vector<bool> filled_data(plan.block_logical_coords.size(), false);
 
   // Process all volume files in serial, because loading data with H5 must be
   // done in serial anyway. Instead, the loop over elements within each file is
   // parallelized with OpenMP.
-  for (const auto& filename : filenames) {
-    interpolate_to_points(make_not_null(&result), make_not_null(&filled_data),
-                          filename, subfile_name, obs_id, tensor_components,
-                          block_logical_coords, resolved_num_threads);
+  for (size_t file_index = 0; file_index < plan.filenames.size();
+       ++file_index) {
+    // Files are kept open in a pool so repeated calls, e.g. in every iteration
+    // of a horizon find, don't have to reopen them and re-parse their metadata
+    const auto h5file =
+        h5::pooled_file<h5::AccessType::ReadOnly>(plan.filenames[file_index]);
+    const auto& volfile =
+        h5file->get_or_reuse<h5::VolumeData>(plan.subfile_name);
+    // Reuse the interpolants unless the elements in the file changed. If only
+    // the target points in time-dependent blocks were mapped again, only the
+    // interpolants of the elements whose target points moved are set up again.
+    auto& element_interpolants = plan.element_interpolants[file_index];
+    if (not element_interpolants.has_value() or
+        not elements_match(*element_interpolants, volfile, obs_id)) {
+      element_interpolants = make_element_interpolants(
+          volfile, obs_id, plan.block_logical_coords, plan.mapping_version,
+          std::nullopt, plan.num_threads);
+    } else if (element_interpolants->mapping_version != plan.mapping_version) {
+      element_interpolants = make_element_interpolants(
+          volfile, obs_id, plan.block_logical_coords, plan.mapping_version,
+          std::move(element_interpolants), plan.num_threads);
+    }
+    interpolate_from_file(make_not_null(&result), make_not_null(&filled_data),
+                          volfile, obs_id, tensor_components,
+                          *element_interpolants, plan.num_threads);
     // Terminate early if all data has been filled
     if (std::all_of(filled_data.begin(), filled_data.end(),
                     [](const bool filled) { return filled; })) {
@@ -493,20 +775,29 @@ std::vector<std::vector<double>> interpolate_to_points(
     }
   }
 
-  if (extrapolate_into_excisions) {
+  if (plan.extrapolate_into_excisions) {
     // Extrapolate into excisions from the anchor points
-#pragma omp parallel for num_threads(resolved_num_threads)
-    for (const auto& extrapolation : extrapolation_info) {
+#pragma omp parallel for num_threads(plan.num_threads)
+    for (const auto& extrapolation : plan.extrapolation_info) {
       double extrapolation_error = 0.;
       for (size_t i = 0; i < tensor_components.size(); ++i) {
+        // The anchor values are read back from the result, so for
+        // single-precision results they are already rounded to single
+        // precision. Only the polynomial extrapolation itself is evaluated in
+        // double precision.
+        std::array<double, num_extrapolation_anchors> anchor_values{};
+        std::copy_n(result[i].begin() +
+                        static_cast<std::ptrdiff_t>(extrapolation.source_index),
+                    num_extrapolation_anchors, anchor_values.begin());
+        double extrapolated_value = 0.;
         intrp::polynomial_interpolation<num_extrapolation_anchors - 1>(
-            make_not_null(&result[i][extrapolation.target_index]),
+            make_not_null(&extrapolated_value),
             make_not_null(&extrapolation_error), extrapolation.target_point,
-            // NOLINTNEXTLINE(cppcoreguidelines-pro-bounds-pointer-arithmetic)
-            gsl::make_span(result[i].data() + extrapolation.source_index,
-                           num_extrapolation_anchors),
+            gsl::make_span(anchor_values.data(), num_extrapolation_anchors),
             gsl::make_span(extrapolation.anchors.data(),
                            num_extrapolation_anchors));
+        result[i][extrapolation.target_index] =
+            static_cast<DataType>(extrapolated_value);
       }
     }
     // Clear the anchor points from the result
@@ -518,24 +809,53 @@ std::vector<std::vector<double>> interpolate_to_points(
   return result;
 }
 
+template <size_t Dim, typename DataType>
+std::vector<std::vector<DataType>> interpolate_to_points(
+    const std::variant<std::vector<std::string>, std::string>&
+        volume_files_or_glob,
+    const std::string& subfile_name,
+    const std::variant<ObservationId, ObservationStep>& observation,
+    const std::vector<std::string>& tensor_components,
+    const std::array<std::vector<double>, Dim>& target_points,
+    const bool extrapolate_into_excisions,
+    const std::optional<size_t> num_threads) {
+  return InterpolationPlan<Dim>{volume_files_or_glob, subfile_name,
+                                target_points, extrapolate_into_excisions,
+                                num_threads}
+      .template interpolate<DataType>(observation, tensor_components);
+}
+
 // Generate instantiations
 
 #define DIM(data) BOOST_PP_TUPLE_ELEM(0, data)
+#define DTYPE(data) BOOST_PP_TUPLE_ELEM(1, data)
 
-#define INSTANTIATE(_, data)                                                  \
-  template std::vector<std::vector<double>> interpolate_to_points<DIM(data)>( \
-      const std::variant<std::vector<std::string>, std::string>&              \
-          volume_files_or_glob,                                               \
-      const std::string& subfile_name,                                        \
-      const std::variant<ObservationId, ObservationStep>& observation,        \
-      const std::vector<std::string>& tensor_components,                      \
-      const std::array<std::vector<double>, DIM(data)>& target_points,        \
-      bool extrapolate_into_excisions,                                        \
-      const std::optional<size_t> num_threads);
+#define INSTANTIATE(_, data)                                           \
+  template std::vector<std::vector<DTYPE(data)>>                       \
+  interpolate_to_points<DIM(data), DTYPE(data)>(                       \
+      const std::variant<std::vector<std::string>, std::string>&       \
+          volume_files_or_glob,                                        \
+      const std::string& subfile_name,                                 \
+      const std::variant<ObservationId, ObservationStep>& observation, \
+      const std::vector<std::string>& tensor_components,               \
+      const std::array<std::vector<double>, DIM(data)>& target_points, \
+      bool extrapolate_into_excisions,                                 \
+      const std::optional<size_t> num_threads);                        \
+  template std::vector<std::vector<DTYPE(data)>>                       \
+  InterpolationPlan<DIM(data)>::interpolate<DTYPE(data)>(              \
+      const std::variant<ObservationId, ObservationStep>& observation, \
+      const std::vector<std::string>& tensor_components);
 
-GENERATE_INSTANTIATIONS(INSTANTIATE, (1, 2, 3))
+GENERATE_INSTANTIATIONS(INSTANTIATE, (1, 2, 3), (double, float))
 
 #undef INSTANTIATE
+
+#define INSTANTIATE_PLAN(_, data) template class InterpolationPlan<DIM(data)>;
+
+GENERATE_INSTANTIATIONS(INSTANTIATE_PLAN, (1, 2, 3))
+
+#undef INSTANTIATE_PLAN
+#undef DTYPE
 #undef DIM
 
 }  // namespace spectre::Exporter
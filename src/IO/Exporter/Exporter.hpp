@@ -10,6 +10,7 @@
 
 #include <array>
 #include <cstddef>
+#include <memory>
 #include <optional>
 #include <string>
 #include <variant>
@@ -36,6 +37,9 @@ struct ObservationStep {
  * \brief Interpolate data in volume files to target points
  *
  * \tparam Dim Dimension of the domain
+ * \tparam DataType Precision of the returned data, `double` or `float`. The
+ * interpolation is always done in double precision. Volume data that is stored
+ * in single precision is interpolated directly without converting it first.
  * \param volume_files_or_glob The list of H5 files, or a glob pattern
  * \param subfile_name The name of the subfile in the H5 files containing the
  * volume data
@@ -61,12 +65,12 @@ struct ObservationStep {
  * It's also possible to set the number of threads using the environment
  * variable OMP_NUM_THREADS. It's an error to specify num_threads if OpenMP is
  * not linked in. Set num_threads to 1 to disable OpenMP.
- * \return std::vector<std::vector<double>> The interpolated data. The first
+ * \return std::vector<std::vector<DataType>> The interpolated data. The first
  * dimension corresponds to the selected tensor components, and the second
  * dimension corresponds to the target points.
  */
-template <size_t Dim>
-std::vector<std::vector<double>> interpolate_to_points(
+template <size_t Dim, typename DataType = double>
+std::vector<std::vector<DataType>> interpolate_to_points(
     const std::variant<std::vector<std::string>, std::string>&
         volume_files_or_glob,
     const std::string& subfile_name,
@@ -76,4 +80,55 @@ std::vector<std::vector<double>> interpolate_to_points(
     bool extrapolate_into_excisions = false,
     std::optional<size_t> num_threads = std::nullopt);
 
+/*!
+ * \brief Interpolate data in volume files to the same target points repeatedly
+ *
+ * Works like `interpolate_to_points`, but keeps the work that doesn't depend on
+ * the tensor data so it can be reused for other observations and tensor
+ * components. This is useful to interpolate many observations to the same
+ * target points, e.g. to animate a slice through the volume data or to extract
+ * data at probe points.
+ *
+ * The plan is set up when the first observation is interpolated. It is updated
+ * as needed when `interpolate` is called with other observations:
+ * - The target points are mapped to the blocks of the domain again if the
+ *   domain in the volume data changes. If the domain is time dependent, they
+ *   are mapped again whenever the observation has a different time or
+ *   different functions of time.
+ * - The interpolants from the elements in a volume file to the target points
+ *   are set up again if the target points were mapped again, or if the
+ *   elements or their meshes in the file change.
+ *
+ * The volume files are resolved when the plan is constructed. See
+ * `interpolate_to_points` for details on the arguments. Calling `interpolate`
+ * updates the plan, so don't call it concurrently on the same plan.
+ */
+template <size_t Dim>
+class InterpolationPlan {
+ public:
+  InterpolationPlan(const std::variant<std::vector<std::string>, std::string>&
+                        volume_files_or_glob,
+                    std::string subfile_name,
+                    std::array<std::vector<double>, Dim> target_points,
+                    bool extrapolate_into_excisions = false,
+                    std::optional<size_t> num_threads = std::nullopt);
+
+  InterpolationPlan(const InterpolationPlan&) = delete;
+  InterpolationPlan& operator=(const InterpolationPlan&) = delete;
+  InterpolationPlan(InterpolationPlan&&) noexcept;
+  InterpolationPlan& operator=(InterpolationPlan&&) noexcept;
+  ~InterpolationPlan();
+
+  /// Interpolate the `tensor_components` at the `observation` to the target
+  /// points. The result is the same as with `interpolate_to_points`.
+  template <typename DataType = double>
+  std::vector<std::vector<DataType>> interpolate(
+      const std::variant<ObservationId, ObservationStep>& observation,
+      const std::vector<std::string>& tensor_components);
+
+ private:
+  struct Impl;
+  std::unique_ptr<Impl> impl_;
+};
+
 }  // namespace spectre::Exporter
@@ -4,6 +4,8 @@
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <stdexcept>
+#include <string>
 
 #include "IO/Exporter/Exporter.hpp"
 #include "Utilities/ErrorHandling/Error.hpp"
@@ -12,6 +14,98 @@
 
 namespace py = pybind11;
 
+namespace {
+template <typename DataType>
+std::vector<std::vector<DataType>> interpolate_to_points(
+    const std::variant<std::vector<std::string>, std::string>&
+        volume_files_or_glob,
+    const std::string& subfile_name, const size_t observation_id,
+    const std::vector<std::string>& tensor_components,
+    std::vector<std::vector<double>> target_points,
+    const bool extrapolate_into_excisions,
+    const std::optional<size_t>& num_threads) {
+  const size_t dim = target_points.size();
+  const spectre::Exporter::ObservationId obs_id{observation_id};
+  if (dim == 1) {
+    return spectre::Exporter::interpolate_to_points<1, DataType>(
+        volume_files_or_glob, subfile_name, obs_id, tensor_components,
+        make_array<std::vector<double>, 1>(std::move(target_points)),
+        extrapolate_into_excisions, num_threads);
+  } else if (dim == 2) {
+    return spectre::Exporter::interpolate_to_points<2, DataType>(
+        volume_files_or_glob, subfile_name, obs_id, tensor_components,
+        make_array<std::vector<double>, 2>(std::move(target_points)),
+        extrapolate_into_excisions, num_threads);
+  } else if (dim == 3) {
+    return spectre::Exporter::interpolate_to_points<3, DataType>(
+        volume_files_or_glob, subfile_name, obs_id, tensor_components,
+        make_array<std::vector<double>, 3>(std::move(target_points)),
+        extrapolate_into_excisions, num_threads);
+  } else {
+    ERROR("Invalid dimension of target points: "
+          << dim
+          << ". Must be 1, 2, or 3. The first dimension of the "
+             "target points must the spatial dimension of the volume "
+             "data, and the second dimension is the number of points.");
+  }
+}
+
+template <size_t Dim>
+void bind_interpolation_plan(py::module& m) {  // NOLINT
+  using Plan = spectre::Exporter::InterpolationPlan<Dim>;
+  py::class_<Plan>(m, ("InterpolationPlan" + std::to_string(Dim) + "D").c_str(),
+                   "Interpolate volume data to the same target points for "
+                   "many observations. Work that doesn't depend on the tensor "
+                   "data, like finding the target points in the domain and "
+                   "setting up the interpolants, is reused between calls to "
+                   "'interpolate' and only redone when the domain, the time "
+                   "of a time-dependent domain, or the elements in a volume "
+                   "file change.")
+      .def(py::init([](const std::variant<std::vector<std::string>,
+                                          std::string>& volume_files_or_glob,
+                       std::string subfile_name,
+                       std::vector<std::vector<double>> target_points,
+                       const bool extrapolate_into_excisions,
+                       const std::optional<size_t>& num_threads) {
+             if (target_points.size() != Dim) {
+               throw std::invalid_argument(
+                   "Expected target points in " + std::to_string(Dim) +
+                   " dimensions, but got " +
+                   std::to_string(target_points.size()) +
+                   ". The first dimension of the target points must be the "
+                   "spatial dimension of the volume data, and the second "
+                   "dimension is the number of points.");
+             }
+             return Plan{
+                 volume_files_or_glob, std::move(subfile_name),
+                 make_array<std::vector<double>, Dim>(std::move(target_points)),
+                 extrapolate_into_excisions, num_threads};
+           }),
+           py::arg("volume_files_or_glob"), py::arg("subfile_name"),
+           py::arg("target_points"),
+           py::arg("extrapolate_into_excisions") = false,
+           py::arg("num_threads") = std::nullopt)
+      .def(
+          "interpolate",
+          [](Plan& plan, const size_t observation_id,
+             const std::vector<std::string>& tensor_components,
+             const bool single_precision) -> py::object {
+            const spectre::Exporter::ObservationId obs_id{observation_id};
+            if (single_precision) {
+              return py::cast(
+                  plan.template interpolate<float>(obs_id, tensor_components));
+            } else {
+              return py::cast(
+                  plan.template interpolate<double>(obs_id, tensor_components));
+            }
+          },
+          py::arg("observation_id"), py::arg("tensor_components"),
+          py::arg("single_precision") = false,
+          "Interpolate the tensor components at the observation to the target "
+          "points. Returns the same as 'interpolate_to_points'.");
+}
+}  // namespace
+
 PYBIND11_MODULE(_Pybindings, m) {  // NOLINT
   enable_segfault_handler();
   m.def(
@@ -21,35 +115,30 @@ PYBIND11_MODULE(_Pybindings, m) {  // NOLINT
          const std::string& subfile_name, const size_t observation_id,
          const std::vector<std::string>& tensor_components,
          std::vector<std::vector<double>> target_points,
-         bool extrapolate_into_excisions,
-         const std::optional<size_t>& num_threads) {
-        const size_t dim = target_points.size();
-        const spectre::Exporter::ObservationId obs_id{observation_id};
-        if (dim == 1) {
-          return spectre::Exporter::interpolate_to_points(
-              volume_files_or_glob, subfile_name, obs_id, tensor_components,
-              make_array<std::vector<double>, 1>(std::move(target_points)),
-              extrapolate_into_excisions, num_threads);
-        } else if (dim == 2) {
-          return spectre::Exporter::interpolate_to_points(
-              volume_files_or_glob, subfile_name, obs_id, tensor_components,
-              make_array<std::vector<double>, 2>(std::move(target_points)),
-              extrapolate_into_excisions, num_threads);
-        } else if (dim == 3) {
-          return spectre::Exporter::interpolate_to_points(
-              volume_files_or_glob, subfile_name, obs_id, tensor_components,
-              make_array<std::vector<double>, 3>(std::move(target_points)),
-              extrapolate_into_excisions, num_threads);
+         const bool extrapolate_into_excisions,
+         const std::optional<size_t>& num_threads,
+         const bool single_precision) -> py::object {
+        if (single_precision) {
+          return py::cast(interpolate_to_points<float>(
+              volume_files_or_glob, subfile_name, observation_id,
+              tensor_components, std::move(target_points),
+              extrapolate_into_excisions, num_threads));
         } else {
-          ERROR("Invalid dimension of target points: "
-                << dim
-                << ". Must be 1, 2, or 3. The first dimension of the "
-                   "target points must the spatial dimension of the volume "
-                   "data, and the second dimension is the number of points.");
+          return py::cast(interpolate_to_points<double>(
+              volume_files_or_glob, subfile_name, observation_id,
+              tensor_components, std::move(target_points),
+              extrapolate_into_excisions, num_threads));
         }
       },
       py::arg("volume_files_or_glob"), py::arg("subfile_name"),
       py::arg("observation_id"), py::arg("tensor_components"),
       py::arg("target_points"), py::arg("extrapolate_into_excisions") = false,
-      py::arg("num_threads") = std::nullopt);
+      py::arg("num_threads") = std::nullopt,
+      py::arg("single_precision") = false,
+      "Interpolate volume data to target points. Set 'single_precision' to "
+      "return the interpolated data in single precision. The interpolation is "
+      "always done in double precision.");
+  bind_interpolation_plan<1>(m);
+  bind_interpolation_plan<2>(m);
+  bind_interpolation_plan<3>(m);
 }
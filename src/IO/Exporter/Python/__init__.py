@@ -5,6 +5,12 @@ from typing import Sequence, Type
 
 from ._Pybindings import *
 
+InterpolationPlan = {
+    1: InterpolationPlan1D,
+    2: InterpolationPlan2D,
+    3: InterpolationPlan3D,
+}
+
 
 def interpolate_tensors_to_points(
     *args,
@@ -0,0 +1,126 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "IO/H5/BufferedDatWriter.hpp"
+
+#include <charm++.h>
+#include <chrono>
+#include <cstddef>
+#include <exception>
+#include <optional>
+#include <vector>
+
+#include "DataStructures/Matrix.hpp"
+#include "IO/H5/Dat.hpp"
+#include "Utilities/ErrorHandling/Error.hpp"
+#include "Utilities/Gsl.hpp"
+
+namespace h5 {
+BufferedDatWriter::BufferedDatWriter(
+    const gsl::not_null<Dat*> dat, const size_t max_buffered_rows,
+    std::optional<std::chrono::duration<double>> max_buffer_time)
+    : dat_(dat),
+      max_buffered_rows_(max_buffered_rows),
+      max_buffer_time_(max_buffer_time),
+      number_of_columns_(dat->get_legend().size()) {
+  if (max_buffered_rows_ == 0) {
+    ERROR("The maximum number of buffered rows must be positive.");
+  }
+  if (dat->buffered_writer_ != nullptr) {
+    ERROR("The Dat subfile '"
+          << dat->subfile_path()
+          << "' already has a buffered writer. A subfile can have "
+             "only one writer at a time.");
+  }
+  buffer_.reserve(max_buffered_rows_ * number_of_columns_);
+  dat->buffered_writer_ = this;
+}
+
+BufferedDatWriter::~BufferedDatWriter() { detach(); }
+
+void BufferedDatWriter::append(const std::vector<double>& data) {
+  if (dat_ == nullptr) {
+    ERROR(
+        "Cannot append to the buffered writer because its Dat subfile was "
+        "closed.");
+  }
+  check_number_of_columns(data.size());
+  if (buffer_.empty()) {
+    first_buffered_row_time_ = std::chrono::steady_clock::now();
+  }
+  buffer_.insert(buffer_.end(), data.begin(), data.end());
+  flush_if_needed();
+}
+
+void BufferedDatWriter::append(const std::vector<std::vector<double>>& data) {
+  for (const auto& row : data) {
+    append(row);
+  }
+}
+
+void BufferedDatWriter::append(const Matrix& data) {
+  if (data.rows() == 0) {
+    return;
+  }
+  check_number_of_columns(data.columns());
+  std::vector<double> row(data.columns());
+  for (size_t i = 0; i < data.rows(); ++i) {
+    for (size_t j = 0; j < data.columns(); ++j) {
+      row[j] = data(i, j);
+    }
+    append(row);
+  }
+}
+
+void BufferedDatWriter::flush() {
+  if (buffer_.empty()) {
+    return;
+  }
+  if (dat_ == nullptr) {
+    ERROR("Cannot flush " << number_of_buffered_rows()
+                          << " buffered rows because the Dat subfile "
+                             "was closed.");
+  }
+  dat_->append(buffer_, number_of_buffered_rows());
+  buffer_.clear();
+}
+
+void BufferedDatWriter::detach() noexcept {
+  if (dat_ == nullptr) {
+    return;
+  }
+  try {
+    flush();
+  } catch (const std::exception& error) {
+    // NOLINTNEXTLINE(cppcoreguidelines-pro-type-vararg)
+    CkError(
+        "Dropping %zu buffered rows that could not be written to '%s':\n%s\n",
+        number_of_buffered_rows(), dat_->subfile_path().c_str(), error.what());
+    buffer_.clear();
+  }
+  dat_->buffered_writer_ = nullptr;
+  dat_ = nullptr;
+}
+
+size_t BufferedDatWriter::number_of_buffered_rows() const {
+  return number_of_columns_ == 0 ? 0 : buffer_.size() / number_of_columns_;
+}
+
+void BufferedDatWriter::check_number_of_columns(
+    const size_t number_of_columns) const {
+  if (number_of_columns != number_of_columns_) {
+    ERROR("Cannot add columns to Dat files. Current number of columns is "
+          << number_of_columns_ << " but received " << number_of_columns
+          << " entries.");
+  }
+}
+
+void BufferedDatWriter::flush_if_needed() {
+  if (number_of_buffered_rows() >= max_buffered_rows_ or
+      (max_buffer_time_.has_value() and
+       std::chrono::steady_clock::now() - first_buffered_row_time_ >=
+           *max_buffer_time_)) {
+    flush();
+  }
+}
+}  // namespace h5
@@ -0,0 +1,114 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+/// \file
+/// Defines class h5::BufferedDatWriter
+
+#pragma once
+
+#include <chrono>
+#include <cstddef>
+#include <optional>
+#include <vector>
+
+#include "Utilities/Gsl.hpp"
+
+/// \cond
+class Matrix;
+namespace h5 {
+class Dat;
+}  // namespace h5
+/// \endcond
+
+namespace h5 {
+/*!
+ * \ingroup HDF5Group
+ * \brief Collects rows in memory and appends them to an `h5::Dat` subfile in
+ * large blocks
+ *
+ * Every call to `h5::Dat::append` extends the dataset on disk and writes the
+ * new rows. Appending many single rows this way is slow. This class instead
+ * buffers the rows and appends them to the `h5::Dat` subfile all at once when
+ * one of these happens:
+ *
+ * - `max_buffered_rows` rows are buffered.
+ * - The first buffered row was appended more than `max_buffer_time` ago (if
+ *   specified). This is only checked when rows are appended.
+ * - `flush()` is called.
+ * - The writer or the `h5::Dat` subfile is destroyed, e.g. when the subfile
+ *   is closed with `h5::H5File::close_current_object()`.
+ *
+ * The buffered rows are not visible in the `h5::Dat` subfile until they are
+ * flushed. A subfile can have only one writer at a time.
+ *
+ * Once the subfile is closed the writer can't be used anymore and appending to
+ * it is an error. Errors while flushing in a destructor can't be thrown, so
+ * they are printed and the rows that failed to write are dropped. Call
+ * `flush()` before closing the subfile to handle these errors.
+ */
+class BufferedDatWriter {
+ public:
+  BufferedDatWriter(gsl::not_null<Dat*> dat, size_t max_buffered_rows = 1024,
+                    std::optional<std::chrono::duration<double>>
+                        max_buffer_time = std::nullopt);
+
+  BufferedDatWriter(const BufferedDatWriter& /*rhs*/) = delete;
+  BufferedDatWriter& operator=(const BufferedDatWriter& /*rhs*/) = delete;
+  BufferedDatWriter(BufferedDatWriter&& /*rhs*/) = delete;             // NOLINT
+  BufferedDatWriter& operator=(BufferedDatWriter&& /*rhs*/) = delete;  // NOLINT
+
+  /// Flushes all buffered rows if the subfile is still open
+  ~BufferedDatWriter();
+
+  /*!
+   * \requires `data.size()` is the same as the number of columns in the file
+   * \effects buffers `data` as a new row
+   */
+  void append(const std::vector<double>& data);
+
+  /*!
+   * \requires `data[i].size()` is the same as the number of columns in the
+   * file for all rows `i`
+   * \effects buffers all rows in `data`
+   */
+  void append(const std::vector<std::vector<double>>& data);
+
+  /*!
+   * \requires `data.columns()` is the same as the number of columns in the file
+   * \effects buffers all rows in `data`
+   */
+  void append(const Matrix& data);
+
+  /// Append all buffered rows to the `h5::Dat` subfile
+  void flush();
+
+  /// The number of rows that are buffered and not yet written to the file
+  size_t number_of_buffered_rows() const;
+
+  /// Whether the subfile is still open, so rows can be appended
+  bool is_open() const { return dat_ != nullptr; }
+
+  size_t max_buffered_rows() const { return max_buffered_rows_; }
+
+  const std::optional<std::chrono::duration<double>>& max_buffer_time() const {
+    return max_buffer_time_;
+  }
+
+ private:
+  // The subfile flushes the writer and detaches it when it is closed
+  friend class Dat;
+
+  void check_number_of_columns(size_t number_of_columns) const;
+  void flush_if_needed();
+  // Flush without throwing and stop using the subfile
+  void detach() noexcept;
+
+  Dat* dat_;
+  size_t max_buffered_rows_;
+  std::optional<std::chrono::duration<double>> max_buffer_time_;
+  size_t number_of_columns_;
+  // Buffered rows, contiguous in row-major order
+  std::vector<double> buffer_{};
+  std::chrono::steady_clock::time_point first_buffered_row_time_{};
+};
+}  // namespace h5
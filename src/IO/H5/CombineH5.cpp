@@ -3,58 +3,79 @@
 
 #include "IO/H5/CombineH5.hpp"
 
-#include <boost/program_options.hpp>
+#include <algorithm>
 #include <cstddef>
 #include <cstdlib>
-#include <iterator>
+#include <limits>
+#include <optional>
 #include <string>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
 #include <vector>
 
-#include "DataStructures/DataVector.hpp"
 #include "IO/H5/AccessType.hpp"
 #include "IO/H5/CheckH5PropertiesMatch.hpp"
 #include "IO/H5/File.hpp"
-#include "IO/H5/SourceArchive.hpp"
 #include "IO/H5/TensorData.hpp"
 #include "IO/H5/VolumeData.hpp"
 #include "Parallel/Printf/Printf.hpp"
-#include "Utilities/FileSystem.hpp"
+#include "Utilities/Algorithm.hpp"
+#include "Utilities/ErrorHandling/Error.hpp"
 #include "Utilities/MakeString.hpp"
 #include "Utilities/StdHelpers.hpp"
 
 namespace {
-// Returns all the observation_ids stored in the volume files. Assumes all
-// volume files have the same observation ids
-std::vector<size_t> get_observation_ids(
-    const std::vector<std::string>& file_names,
-    const std::string& subfile_name) {
-  const h5::H5File<h5::AccessType::ReadOnly> initial_file(file_names[0], false);
-  const auto& initial_volume_file =
-      initial_file.get<h5::VolumeData>(subfile_name);
-  return initial_volume_file.list_observation_ids();
-}
-
-// Returns total number of elements for an observation id across all volume data
-// files
-size_t get_number_of_elements(const std::vector<std::string>& input_filenames,
-                              const std::string& subfile_name,
-                              const size_t& observation_id) {
-  size_t total_elements = 0;
-  for (const auto& input_filename : input_filenames) {
-    const h5::H5File<h5::AccessType::ReadOnly> original_file(input_filename,
-                                                             false);
-    const auto& original_volume_file =
-        original_file.get<h5::VolumeData>(subfile_name);
-    total_elements += original_volume_file.get_extents(observation_id).size();
+// The observations in all volume files
+struct Observations {
+  // Observation IDs in any of the volume files, sorted by observation value
+  std::vector<size_t> observation_ids{};
+  std::unordered_map<size_t, double> observation_values{};
+  // Observation IDs in each of the volume files
+  std::vector<std::unordered_set<size_t>> observation_ids_in_file{};
+};
+
+Observations get_observations(const std::vector<std::string>& file_names,
+                              const std::string& subfile_name) {
+  Observations result{};
+  result.observation_ids_in_file.reserve(file_names.size());
+  for (const auto& file_name : file_names) {
+    const h5::H5File<h5::AccessType::ReadOnly> file(file_name, false);
+    const auto& volume_file = file.get<h5::VolumeData>(subfile_name);
+    const std::vector<size_t> observation_ids =
+        volume_file.list_observation_ids();
+    for (const size_t observation_id : observation_ids) {
+      // The observation value is taken from the last file that contains the
+      // observation, like its elements
+      const bool inserted =
+          result.observation_values
+              .insert_or_assign(
+                  observation_id,
+                  volume_file.get_observation_value(observation_id))
+              .second;
+      if (inserted) {
+        result.observation_ids.push_back(observation_id);
+      }
+    }
+    result.observation_ids_in_file.emplace_back(observation_ids.begin(),
+                                                observation_ids.end());
   }
-  return total_elements;
+  std::stable_sort(result.observation_ids.begin(), result.observation_ids.end(),
+                   [&result](const size_t lhs, const size_t rhs) {
+                     return result.observation_values.at(lhs) <
+                            result.observation_values.at(rhs);
+                   });
+  return result;
 }
 }  // namespace
+
 namespace h5 {
 
 void combine_h5(const std::vector<std::string>& file_names,
                 const std::string& subfile_name, const std::string& output,
-                const bool check_src) {
+                const bool check_src,
+                const std::optional<std::vector<size_t>>& observation_ids,
+                const std::optional<std::vector<double>>& observation_values) {
   // Parses for and stores all input files to be looped over
   Parallel::printf("Processing files:\n%s\n",
                    std::string{MakeString{} << file_names}.c_str());
@@ -69,84 +90,124 @@ void combine_h5(const std::vector<std::string>& file_names,
     }
   }
 
-  // Checks that volume data files contain the same observation ids
-  if (!h5::check_observation_ids_match(file_names, subfile_name)) {
-    ERROR(
-        "One or more of your files were found to have differing observation "
-        "ids, meaning they may be from different runs of your SpECTRE "
-        "executable or were corrupted.");
+  // Obtains list of observation ids to loop over. Input files can contain
+  // different observations, e.g. from different segments of a simulation.
+  Observations observations{};
+  if (observation_values.has_value()) {
+    if (not observation_ids.has_value() or
+        observation_ids->size() != observation_values->size()) {
+      ERROR_NO_TRACE(
+          "Specify the observation IDs along with the observation values, one "
+          "value for every ID.");
+    }
+    observations.observation_ids = *observation_ids;
+    for (size_t i = 0; i < observation_ids->size(); ++i) {
+      observations.observation_values.emplace(observation_ids->at(i),
+                                              observation_values->at(i));
+    }
+    observations.observation_ids_in_file.resize(
+        file_names.size(), std::unordered_set<size_t>(observation_ids->begin(),
+                                                      observation_ids->end()));
+  } else {
+    observations = get_observations(file_names, subfile_name);
+  }
+  std::vector<size_t> selected_observation_ids = observations.observation_ids;
+  if (observation_ids.has_value() and not observation_values.has_value()) {
+    for (const size_t obs_id : *observation_ids) {
+      if (observations.observation_values.count(obs_id) == 0) {
+        ERROR_NO_TRACE("Observation ID " << obs_id
+                                         << " not found in any of the files.");
+      }
+    }
+    const std::unordered_set<size_t> selected(observation_ids->begin(),
+                                              observation_ids->end());
+    selected_observation_ids.erase(
+        alg::remove_if(selected_observation_ids,
+                       [&selected](const size_t obs_id) {
+                         return selected.count(obs_id) == 0;
+                       }),
+        selected_observation_ids.end());
   }
 
-  // Braces to specify scope for H5 file
-  {
-    // Instantiates the output file and the .vol subfile to be filled with the
-    // combined data later
-    Parallel::printf("Creating output file: %s\n", output.c_str());
-    h5::H5File<h5::AccessType::ReadWrite> new_file(output, true);
-    new_file.insert<h5::VolumeData>(subfile_name);
-    new_file.close_current_object();
-  }  // End of scope for H5 file
-
-  // Obtains list of observation ids to loop over
-  const std::vector<size_t> observation_ids =
-      get_observation_ids(file_names, subfile_name);
+  // Instantiates the output file and the .vol subfile to be filled with the
+  // combined data. The output file stays open while the observations are
+  // written one at a time.
+  Parallel::printf("Creating output file: %s\n", output.c_str());
+  h5::H5File<h5::AccessType::ReadWrite> new_file(output, true);
+  auto& new_volume_file = new_file.try_insert<h5::VolumeData>(subfile_name);
 
   // Loops over observation ids to write volume data by observation id
-  for (size_t obs_index = 0; obs_index < observation_ids.size(); ++obs_index) {
-    const size_t obs_id = observation_ids[obs_index];
-    // Pre-calculates size of vector to store element data and allocates
-    // corresponding memory
-    const size_t vector_dim =
-        get_number_of_elements(file_names, subfile_name, obs_id);
-    std::vector<ElementVolumeData> element_data;
-    element_data.reserve(vector_dim);
-
-    double obs_val = 0.0;
+  for (size_t obs_index = 0; obs_index < selected_observation_ids.size();
+       ++obs_index) {
+    const size_t obs_id = selected_observation_ids[obs_index];
+    const double obs_val = observations.observation_values.at(obs_id);
+    Parallel::printf(
+        "Processing obsevation ID %lo (%lo/%lo) with value %1.14e\n", obs_id,
+        obs_index, selected_observation_ids.size(), obs_val);
+
+    std::vector<ElementVolumeData> element_data{};
+    // Position of each element in `element_data`, to find elements that are
+    // contained in multiple input files
+    std::unordered_map<std::string, size_t> element_indices{};
     std::optional<std::vector<char>> serialized_domain{};
     std::optional<std::vector<char>> serialized_functions_of_time{};
 
     // Loops over input files to append element data into a single vector to be
     // stored in a single H5
-    bool printed = false;
-    for (auto const& file_name : file_names) {
+    for (size_t file_index = 0; file_index < file_names.size(); ++file_index) {
+      if (observations.observation_ids_in_file[file_index].count(obs_id) == 0) {
+        continue;
+      }
+      const auto& file_name = file_names[file_index];
+      Parallel::printf("  Processing file: %s\n", file_name.c_str());
       const h5::H5File<h5::AccessType::ReadOnly> original_file(file_name,
                                                                false);
       const auto& original_volume_file =
           original_file.get<h5::VolumeData>(subfile_name);
-      obs_val = original_volume_file.get_observation_value(obs_id);
-      if (not printed) {
-        Parallel::printf(
-            "Processing obsevation ID %lo (%lo/%lo) with value %1.14e\n",
-            obs_id, obs_index, observation_ids.size(), obs_val);
-        printed = true;
-      }
-      Parallel::printf("  Processing file: %s\n", file_name.c_str());
 
-      serialized_domain = original_volume_file.get_domain(obs_id);
-      serialized_functions_of_time =
+      auto domain = original_volume_file.get_domain(obs_id);
+      if (domain.has_value()) {
+        serialized_domain = std::move(domain);
+      }
+      auto functions_of_time =
           original_volume_file.get_functions_of_time(obs_id);
+      if (functions_of_time.has_value()) {
+        serialized_functions_of_time = std::move(functions_of_time);
+      }
 
-      // Get vector of element data for this `obs_id` and `file_name`
+      // Get vector of element data for this `obs_id` and `file_name`. The
+      // observation value in this file can differ from the one that is written
+      // to the output file, so look up the observation by its value in this
+      // file.
+      const double file_obs_val =
+          original_volume_file.get_observation_value(obs_id);
       std::vector<ElementVolumeData> data_by_element =
           std::move(std::get<2>(original_volume_file.get_data_by_element(
-              obs_val * (1.0 - 4.0 * std::numeric_limits<double>::epsilon()),
-              obs_val * (1.0 + 4.0 * std::numeric_limits<double>::epsilon()),
+              file_obs_val *
+                  (1.0 - 4.0 * std::numeric_limits<double>::epsilon()),
+              file_obs_val *
+                  (1.0 + 4.0 * std::numeric_limits<double>::epsilon()),
               std::nullopt)[0]));
 
-      // Append vector to total vector of element data for this `obs_id`
-      element_data.insert(element_data.end(),
-                          std::make_move_iterator(data_by_element.begin()),
-                          std::make_move_iterator(data_by_element.end()));
-      data_by_element.clear();
+      // Append the elements to the element data for this `obs_id`. Elements
+      // that were already found in an earlier file, e.g. because a segment was
+      // restarted from an earlier checkpoint, are replaced.
+      for (auto& element : data_by_element) {
+        const auto [it, inserted] =
+            element_indices.emplace(element.element_name, element_data.size());
+        if (inserted) {
+          element_data.push_back(std::move(element));
+        } else {
+          element_data[it->second] = std::move(element);
+        }
+      }
       original_file.close_current_object();
     }
 
-    h5::H5File<h5::AccessType::ReadWrite> new_file(output, true);
-    auto& new_volume_file = new_file.get<h5::VolumeData>(subfile_name);
     new_volume_file.write_volume_data(obs_id, obs_val, element_data,
                                       serialized_domain,
                                       serialized_functions_of_time);
-    new_file.close_current_object();
   }
+  new_file.close_current_object();
 }
 }  // namespace h5
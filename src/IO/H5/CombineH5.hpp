@@ -3,13 +3,47 @@
 
 #pragma once
 
+#include <cstddef>
+#include <optional>
 #include <string>
 #include <vector>
 
 namespace h5 {
 
-void combine_h5(const std::vector<std::string>& file_names,
-                const std::string& subfile_name, const std::string& output,
-                const bool check_src = true);
+/*!
+ * \brief Combine the volume data subfile `subfile_name` in `file_names` into a
+ * single file `output`
+ *
+ * The observations are written to the output file one at a time, so only the
+ * data of a single observation is held in memory. The input files can contain
+ * different observation IDs, e.g. when they are from different segments of a
+ * simulation, and the output file contains all of them. The elements of an
+ * observation are gathered from all input files that contain it. If an
+ * element is found in multiple input files, e.g. because a segment was
+ * restarted from an earlier checkpoint and repeats some observations, the
+ * data from the input file that comes last in `file_names` is used. The
+ * observation value is also taken from the last input file that contains the
+ * observation.
+ *
+ * \param file_names The input H5 files
+ * \param subfile_name The volume data subfile in the input files
+ * \param output The output H5 file. Is created if it doesn't exist.
+ * \param check_src Check that all input files were written by the same
+ * version of SpECTRE
+ * \param observation_ids Combine only these observations. Defaults to all
+ * observations in any of the input files. If empty, only the volume data
+ * subfile is created in the output file.
+ * \param observation_values The observation values of the `observation_ids`
+ * in the output file. If specified, the observations aren't looked up in the
+ * metadata of the input files, and every input file must contain all
+ * `observation_ids`. This avoids reading the metadata of all input files
+ * repeatedly when the observations are combined in separate calls.
+ */
+void combine_h5(
+    const std::vector<std::string>& file_names, const std::string& subfile_name,
+    const std::string& output, bool check_src = true,
+    const std::optional<std::vector<size_t>>& observation_ids = std::nullopt,
+    const std::optional<std::vector<double>>& observation_values =
+        std::nullopt);
 
 }  // namespace h5
@@ -7,9 +7,13 @@
 #include <hdf5.h>
 #include <iosfwd>
 #include <memory>
+#include <numeric>
+#include <optional>
 #include <ostream>
+#include <vector>
 
 #include "DataStructures/Matrix.hpp"
+#include "IO/H5/BufferedDatWriter.hpp"
 #include "IO/H5/CheckH5.hpp"
 #include "IO/H5/Header.hpp"
 #include "IO/H5/Helpers.hpp"
@@ -86,6 +90,11 @@ Dat::Dat(const bool exists, detail::OpenGroup&& group, const hid_t location,
 }
 
 Dat::~Dat() {
+  // Write the rows the writer still buffers while the dataset is open, and
+  // make sure the writer doesn't use this subfile anymore
+  if (buffered_writer_ != nullptr) {
+    buffered_writer_->detach();
+  }
 #ifdef __clang__
   CHECK_H5(H5Dclose(dataset_id_), "Failed to close dataset");
 #else
@@ -109,6 +118,19 @@ void Dat::append(const std::vector<double>& data) {
   size_ = h5::append_to_dataset(dataset_id_, name_, data, 1, size_);
 }
 
+void Dat::append(const std::vector<double>& data, const size_t number_of_rows) {
+  if (number_of_rows == 0) {
+    return;
+  }
+  if (data.size() != number_of_rows * size_[1]) {
+    ERROR("Cannot add columns to Dat files. Current number of columns is "
+          << size_[1] << " but received " << data.size() << " entries for "
+          << number_of_rows << " rows.");
+  }
+  size_ =
+      h5::append_to_dataset(dataset_id_, name_, data, number_of_rows, size_);
+}
+
 void Dat::append(const std::vector<std::vector<double>>& data) {
   if (data.empty()) {
     return;
@@ -170,4 +192,51 @@ Matrix Dat::get_data_subset(const std::vector<size_t>& these_columns,
   return retrieve_dataset_subset(dataset_id_, these_columns, first_row,
                                  num_rows, size_);
 }
+
+Matrix Dat::get_rows_in_time_range(
+    const double start_time, const double end_time,
+    const std::optional<std::vector<size_t>>& these_columns) const {
+  std::vector<size_t> columns{};
+  if (these_columns.has_value()) {
+    columns = *these_columns;
+  } else {
+    columns.resize(size_[1]);
+    std::iota(columns.begin(), columns.end(), size_t{0});
+  }
+  if (size_[0] == 0 or size_[1] == 0 or start_time > end_time) {
+    return Matrix(0, columns.size());
+  }
+  // Bisect the rows until only a few are left, then read their times all at
+  // once. Returns the first row from `first_row` on that isn't `before` the
+  // time.
+  const auto find_row = [this](size_t first_row, const auto& before) {
+    // Reading a single value of the time column costs about as much as reading
+    // a few hundred, so stop bisecting at this number of rows
+    constexpr size_t rows_per_read = 256;
+    size_t last_row = size_[0];
+    while (last_row - first_row > rows_per_read) {
+      const size_t row = first_row + (last_row - first_row) / 2;
+      if (before(
+              retrieve_dataset_subset(dataset_id_, {0}, row, 1, size_)(0, 0))) {
+        first_row = row + 1;
+      } else {
+        last_row = row;
+      }
+    }
+    const Matrix times = retrieve_dataset_subset(dataset_id_, {0}, first_row,
+                                                 last_row - first_row, size_);
+    for (size_t i = 0; i < times.rows(); ++i) {
+      if (not before(times(i, 0))) {
+        return first_row + i;
+      }
+    }
+    return last_row;
+  };
+  const size_t first_row = find_row(
+      0, [&start_time](const double time) { return time < start_time; });
+  const size_t end_row = find_row(
+      first_row, [&end_time](const double time) { return time <= end_time; });
+  return retrieve_dataset_subset(dataset_id_, columns, first_row,
+                                 end_row - first_row, size_);
+}
 }  // namespace h5
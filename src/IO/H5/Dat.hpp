@@ -10,6 +10,7 @@
 #include <cstddef>
 #include <cstdint>
 #include <hdf5.h>
+#include <optional>
 #include <string>
 #include <vector>
 
@@ -18,6 +19,9 @@
 
 /// \cond
 class Matrix;
+namespace h5 {
+class BufferedDatWriter;
+}  // namespace h5
 /// \endcond
 
 namespace h5 {
@@ -37,7 +41,9 @@ namespace h5 {
  * different dat files being stored as individual files is solved.
  *
  * \note This class does not do any caching of data so all data is written as
- * soon as append() is called.
+ * soon as append() is called. Use `h5::BufferedDatWriter` to collect many rows
+ * in memory and append them all at once. The writer is flushed and detached
+ * when the subfile is closed.
  */
 class Dat : public h5::Object {
  public:
@@ -62,6 +68,14 @@ class Dat : public h5::Object {
    */
   void append(const std::vector<double>& data);
 
+  /*!
+   * \requires `data.size()` is `number_of_rows` times the number of columns in
+   * the file
+   * \effects appends the rows in `data`, which are stored contiguously in
+   * row-major order, to the Dat file
+   */
+  void append(const std::vector<double>& data, size_t number_of_rows);
+
   /*!
    * \requires `data[0].size()` is the same as the number of columns in the file
    * \effects appends `data` to the Dat file
@@ -100,6 +114,25 @@ class Dat : public h5::Object {
   Matrix get_data_subset(const std::vector<size_t>& these_columns,
                          size_t first_row = 0, size_t num_rows = 1) const;
 
+  /*!
+   * \brief Get the rows with a time between `start_time` and `end_time`
+   * (inclusive), and optionally only some columns
+   *
+   * The first column of the Dat file must be the time and must be sorted in
+   * ascending order (repeated times are allowed). The rows are found by
+   * bisecting the time column, reading only a single value at a time until
+   * few rows are left, so only the selected rows and columns and a few more
+   * values are read from the file.
+   *
+   * \requires all members of `these_columns` have a value less than the number
+   * of columns
+   * \returns the selected rows of all columns, or only of `these_columns` if
+   * specified
+   */
+  Matrix get_rows_in_time_range(double start_time, double end_time,
+                                const std::optional<std::vector<size_t>>&
+                                    these_columns = std::nullopt) const;
+
   /*!
    * \returns the number of rows (first index) and columns (second index)
    */
@@ -130,6 +163,10 @@ class Dat : public h5::Object {
   std::array<hsize_t, 2> size_;
   std::string header_;
   hid_t dataset_id_{-1};
+  // The writer that buffers rows for this subfile, if any. It is flushed and
+  // detached when the subfile is closed.
+  friend class BufferedDatWriter;
+  BufferedDatWriter* buffered_writer_{nullptr};
   /// \endcond HIDDEN_SYMBOLS
 };
 }  // namespace h5
@@ -11,6 +11,7 @@
 
 #include "IO/H5/AccessType.hpp"
 #include "IO/H5/CheckH5.hpp"
+#include "IO/H5/FilePool.hpp"
 #include "IO/H5/Header.hpp"
 #include "IO/H5/Helpers.hpp"
 #include "IO/H5/Object.hpp"
@@ -49,6 +50,12 @@ H5File<Access_t>::H5File(std::string file_name, bool append_to_file,
                       "library in SpECTRE or through your shell.");
   }
 
+  if constexpr (AccessType::ReadWrite == Access_t) {
+    // HDF5 can't open the same file in both modes at once, so release the
+    // handle that may be kept open in the pool of read-only files
+    release_pooled_file(file_name_);
+  }
+
   const hid_t fapl_id = H5Pcreate(H5P_FILE_ACCESS);
   CHECK_H5(fapl_id, "Failed to create file access property list.");
 #ifdef HDF5_SUPPORTS_SET_FILE_LOCKING
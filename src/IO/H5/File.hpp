@@ -148,6 +148,19 @@ class H5File {
 
   template <typename ObjectType, typename... Args>
   const ObjectType& get(const std::string& path, Args&&... args) const;
+
+  /*!
+   * \brief Like `get`, but returns the current object without reopening it if
+   * it is the requested object.
+   *
+   * If another object is open it is closed first. Reopening an object can be
+   * expensive, e.g. `h5::VolumeData` reads its observation index when it is
+   * opened and caches metadata while it is open, so this is useful when the
+   * same object is accessed repeatedly through a long-lived file (see
+   * `h5::pooled_file`).
+   */
+  template <typename ObjectType>
+  const ObjectType& get_or_reuse(const std::string& path) const;
   /// @}
 
   /*!
@@ -308,6 +321,31 @@ const ObjectType& H5File<Access_t>::get(const std::string& path,
   return dynamic_cast<const ObjectType&>(*current_object_);
 }
 
+template <AccessType Access_t>
+template <typename ObjectType>
+const ObjectType& H5File<Access_t>::get_or_reuse(
+    const std::string& path) const {
+  if (current_object_ != nullptr) {
+    // Normalize the path like `check_if_object_exists` does, so it can be
+    // compared to the path of the current object
+    std::string normalized_path = path.front() == '/' ? path : '/' + path;
+    const size_t extension_length = ObjectType::extension().size();
+    if (normalized_path.size() > extension_length and
+        normalized_path.substr(normalized_path.size() - extension_length) ==
+            ObjectType::extension()) {
+      normalized_path.resize(normalized_path.size() - extension_length);
+    }
+    const auto* const current_object =
+        dynamic_cast<const ObjectType*>(current_object_.get());
+    if (current_object != nullptr and
+        current_object->subfile_path() == normalized_path) {
+      return *current_object;
+    }
+    close_current_object();
+  }
+  return get<ObjectType>(path);
+}
+
 template <AccessType Access_t>
 template <typename ObjectType, typename... Args>
 ObjectType& H5File<Access_t>::insert(const std::string& path, Args&&... args) {
@@ -0,0 +1,151 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "IO/H5/FilePool.hpp"
+
+#include <cstddef>
+#include <cstdint>
+#include <filesystem>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <utility>
+#include <variant>
+
+#include "IO/H5/AccessType.hpp"
+#include "IO/H5/File.hpp"
+#include "Utilities/Gsl.hpp"
+
+namespace h5 {
+namespace {
+struct PooledFile {
+  std::string path;
+  std::filesystem::file_time_type last_write_time;
+  std::uintmax_t file_size;
+  std::variant<std::shared_ptr<H5File<AccessType::ReadOnly>>,
+               std::shared_ptr<H5File<AccessType::ReadWrite>>>
+      file;
+};
+
+struct FilePool {
+  // Recursive because opening a file in ReadWrite mode through the pool
+  // releases pooled handles to it
+  std::recursive_mutex mutex{};
+  size_t max_size = 32;
+  // Most recently used file first
+  std::list<PooledFile> files{};
+};
+
+FilePool*& file_pool_ptr() {
+  // Intentionally leaked so the files aren't closed after HDF5 has shut down
+  // at program exit. HDF5 closes all open files itself when it shuts down.
+  static auto* pool = new FilePool{};
+  return pool;
+}
+
+FilePool& file_pool() { return *file_pool_ptr(); }
+
+std::string pool_key(const std::string& file_name) {
+  return std::filesystem::absolute(file_name).lexically_normal().string();
+}
+
+void evict_least_recently_used(const gsl::not_null<FilePool*> pool) {
+  while (pool->files.size() > pool->max_size) {
+    pool->files.pop_back();
+  }
+}
+}  // namespace
+
+template <AccessType Access_t>
+std::shared_ptr<H5File<Access_t>> pooled_file(const std::string& file_name) {
+  constexpr bool read_write = Access_t == AccessType::ReadWrite;
+  auto& pool = file_pool();
+  const std::lock_guard lock(pool.mutex);
+  if (pool.max_size == 0) {
+    return std::make_shared<H5File<Access_t>>(file_name, read_write);
+  }
+  const std::string path = pool_key(file_name);
+  for (auto it = pool.files.begin(); it != pool.files.end(); ++it) {
+    if (it->path != path) {
+      continue;
+    }
+    auto* const file =
+        std::get_if<std::shared_ptr<H5File<Access_t>>>(&it->file);
+    if (file == nullptr) {
+      // The file is pooled in the other access mode. HDF5 can't open it in
+      // both modes at once, so we release the other handle.
+      pool.files.erase(it);
+      break;
+    }
+    if constexpr (not read_write) {
+      // Reopen the file if it has changed so we don't read stale metadata.
+      // Also handles the file being deleted and recreated.
+      std::error_code error{};
+      const auto last_write_time =
+          std::filesystem::last_write_time(path, error);
+      const auto file_size = std::filesystem::file_size(path, error);
+      if (error or last_write_time != it->last_write_time or
+          file_size != it->file_size) {
+        pool.files.erase(it);
+        break;
+      }
+    }
+    // Move to the front of the list
+    pool.files.splice(pool.files.begin(), pool.files, it);
+    return *file;
+  }
+  // Opening the file in ReadWrite mode releases any pooled handle to it, so
+  // this must happen before we insert it into the pool
+  auto file = std::make_shared<H5File<Access_t>>(file_name, read_write);
+  pool.files.push_front(PooledFile{path, std::filesystem::last_write_time(path),
+                                   std::filesystem::file_size(path), file});
+  evict_least_recently_used(make_not_null(&pool));
+  return file;
+}
+
+void release_pooled_file(const std::string& file_name) {
+  auto& pool = file_pool();
+  const std::lock_guard lock(pool.mutex);
+  if (pool.files.empty()) {
+    return;
+  }
+  const std::string path = pool_key(file_name);
+  pool.files.remove_if(
+      [&path](const PooledFile& pooled) { return pooled.path == path; });
+}
+
+void clear_file_pool() {
+  auto& pool = file_pool();
+  const std::lock_guard lock(pool.mutex);
+  pool.files.clear();
+}
+
+void forget_file_pool() {
+  // Don't lock the mutex: it may have been held by another thread of the
+  // parent process at the time of the fork, and that thread doesn't exist in
+  // the child. The old pool is intentionally leaked so its files stay open.
+  auto& pool = file_pool_ptr();
+  const size_t max_size = pool->max_size;
+  pool = new FilePool{};
+  pool->max_size = max_size;
+}
+
+size_t file_pool_size() {
+  auto& pool = file_pool();
+  const std::lock_guard lock(pool.mutex);
+  return pool.max_size;
+}
+
+void set_file_pool_size(const size_t max_size) {
+  auto& pool = file_pool();
+  const std::lock_guard lock(pool.mutex);
+  pool.max_size = max_size;
+  evict_least_recently_used(make_not_null(&pool));
+}
+
+template std::shared_ptr<H5File<AccessType::ReadOnly>> pooled_file(
+    const std::string& file_name);
+template std::shared_ptr<H5File<AccessType::ReadWrite>> pooled_file(
+    const std::string& file_name);
+}  // namespace h5
@@ -0,0 +1,73 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#pragma once
+
+#include <cstddef>
+#include <memory>
+#include <string>
+
+#include "IO/H5/AccessType.hpp"
+#include "IO/H5/File.hpp"
+
+namespace h5 {
+/*!
+ * \ingroup HDF5Group
+ * \brief Retrieve an open H5 file from a process-wide pool of open files
+ *
+ * Opening an H5 file and parsing the metadata of its subfiles has a noticeable
+ * overhead when the same files are queried over and over, e.g. when volume data
+ * is interpolated in every iteration of a horizon find or when the frames of an
+ * animation are rendered. The pool keeps up to `file_pool_size()` files open,
+ * keyed by their absolute path and the access type, and closes the least
+ * recently used file when it is full. Use `H5File::get_or_reuse` on the
+ * returned file to also avoid reopening the subfile if it is the same as last
+ * time.
+ *
+ * Files opened in `AccessType::ReadOnly` mode are reopened when their
+ * modification time or size changes, e.g. because a simulation appended
+ * data. This also discards all metadata that was cached for the file's
+ * subfiles. Opening a file in `AccessType::ReadWrite` mode (through the pool or
+ * not) releases the pooled read-only handle to the file, since HDF5 can't open
+ * the same file in both modes at once.
+ *
+ * \warning The returned file is shared with all other callers that request the
+ * same file, and only one subfile can be open in an `H5File` at a time. So
+ * don't hold on to a subfile while other code may access the same file, and
+ * don't access the same file from multiple threads.
+ */
+template <AccessType Access_t>
+std::shared_ptr<H5File<Access_t>> pooled_file(const std::string& file_name);
+
+/// \ingroup HDF5Group
+/// Remove the file from the pool of open H5 files. It is closed once all
+/// other handles to it are released.
+void release_pooled_file(const std::string& file_name);
+
+/// \ingroup HDF5Group
+/// Close all files in the pool of open H5 files that aren't used elsewhere.
+void clear_file_pool();
+
+/*!
+ * \ingroup HDF5Group
+ * \brief Forget all files in the pool of open H5 files without closing them
+ *
+ * Call this in a child process right after `fork()`, e.g. from a
+ * `pthread_atfork` or Python `os.register_at_fork` handler. The child inherits
+ * the HDF5 handles of the parent, and closing them in the child would flush
+ * the parent's file metadata from the wrong process. The child then opens its
+ * own handles when it requests files from the pool.
+ *
+ * This function isn't thread-safe. It doesn't lock the pool, since a thread of
+ * the parent may have held the lock at the time of the fork.
+ */
+void forget_file_pool();
+
+/// @{
+/// \ingroup HDF5Group
+/// The maximum number of files in the pool of open H5 files. Setting it to zero
+/// disables the pool, so `pooled_file` opens a new file every time.
+size_t file_pool_size();
+void set_file_pool_size(size_t max_size);
+/// @}
+}  // namespace h5
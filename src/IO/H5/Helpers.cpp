@@ -11,6 +11,7 @@
 #include <string>
 #include <type_traits>
 #include <typeinfo>
+#include <utility>
 
 #include "DataStructures/BoostMultiArray.hpp"
 #include "DataStructures/DataVector.hpp"
@@ -178,59 +179,69 @@ bool types_equal(const hid_t dtype1, const hid_t dtype2) {
   return equal > 0;
 }
 
-template <typename T>
-void write_data(const hid_t group_id, const std::vector<T>& data,
-                const std::vector<size_t>& extents, const std::string& name,
-                const bool overwrite_existing) {
-  std::vector<hsize_t> chunk_size(extents.size());
-  for (size_t i = 0; i < chunk_size.size(); ++i) {
-    // Setting the target number of bytes per chunk to a power of 2 is important
-    // for reducing the cost of writing to disk. Setting to a non-power of 2
-    // increases the compression overhead by ~>10x.
-    constexpr size_t target_number_of_bytes_per_chunk = 131'072;
-    chunk_size[i] = target_number_of_bytes_per_chunk / sizeof(T) > extents[i]
-                        ? extents[i]
-                        : target_number_of_bytes_per_chunk / sizeof(T);
+namespace {
+bool filter_available(const H5Z_filter_t filter) {
+  if (not static_cast<bool>(H5Zfilter_avail(filter))) {
+    return false;
   }
-  ASSERT(alg::none_of(extents, [](const size_t extent) { return extent == 0; }),
-         "Got zero extent when trying to write data.");
+  unsigned int filter_info = 0;
+  const auto status = H5Zget_filter_info(filter, &filter_info);
+  return status >= 0 and (filter_info & H5Z_FILTER_CONFIG_ENCODE_ENABLED) and
+         (filter_info & H5Z_FILTER_CONFIG_DECODE_ENABLED);
+}
+
+template <typename T>
+void write_data_impl(const hid_t group_id, const T* const data,
+                     const std::vector<size_t>& extents,
+                     const std::string& name, const bool overwrite_existing,
+                     const WriteOptions& options) {
+  detail::check_write_options(options);
+  // Empty data, e.g. a tensor component on an empty set of points, is written
+  // to a contiguous dataset because chunks can't have zero size
+  const bool is_empty =
+      alg::any_of(extents, [](const size_t extent) { return extent == 0; });
 
   const std::vector<hsize_t> dims(extents.begin(), extents.end());
   const hid_t space_id = H5Screate_simple(dims.size(), dims.data(), nullptr);
   CHECK_H5(space_id, "Failed to create dataspace");
   const hid_t contained_type = h5::h5_type<tt::get_fundamental_type_t<T>>();
 
-  // Check for available filters and write with GZIP+shuffle if available
-  const bool use_gzip_filter = []() {
-    if (not static_cast<bool>(H5Zfilter_avail(H5Z_FILTER_DEFLATE))) {
-      return false;
-    }
-    unsigned int filter_info = 0;
-    const auto status = H5Zget_filter_info(H5Z_FILTER_DEFLATE, &filter_info);
-    return status >= 0 and (filter_info & H5Z_FILTER_CONFIG_ENCODE_ENABLED) and
-           (filter_info & H5Z_FILTER_CONFIG_DECODE_ENABLED);
-  }();
-  const bool use_shuffle_filter = []() {
-    if (not static_cast<bool>(H5Zfilter_avail(H5Z_FILTER_SHUFFLE))) {
-      return false;
-    }
-    unsigned int filter_info = 0;
-    const auto status = H5Zget_filter_info(H5Z_FILTER_SHUFFLE, &filter_info);
-    return status >= 0 and (filter_info & H5Z_FILTER_CONFIG_ENCODE_ENABLED) and
-           (filter_info & H5Z_FILTER_CONFIG_DECODE_ENABLED);
-  }();
+  // Check for available filters and only compress if gzip is available
+  static const bool gzip_filter_available =
+      filter_available(H5Z_FILTER_DEFLATE);
+  static const bool shuffle_filter_available =
+      filter_available(H5Z_FILTER_SHUFFLE);
+  const bool use_gzip_filter =
+      options.compression_level > 0 and gzip_filter_available;
+  const bool use_shuffle_filter =
+      use_gzip_filter and options.shuffle and shuffle_filter_available;
 
   hid_t property_list = h5::h5p_default();
-  // We can't compress a single number. Since there's not much to reduce anyway,
+  // We can't chunk a single number. Since there's not much to reduce anyway,
   // we just skip compression.
-  if (not extents.empty() and use_gzip_filter) {
+  if (not extents.empty() and not is_empty and options.chunk_size > 0 and
+      (use_gzip_filter or options.compression_level == 0)) {
+    std::vector<hsize_t> chunk_size(extents.size());
+    for (size_t i = 0; i < chunk_size.size(); ++i) {
+      // Setting the target number of bytes per chunk to a power of 2 is
+      // important for reducing the cost of writing to disk. Setting to a
+      // non-power of 2 increases the compression overhead by ~>10x.
+      const size_t target_number_of_values_per_chunk =
+          std::max(options.chunk_size / sizeof(T), size_t{1});
+      chunk_size[i] = std::min(target_number_of_values_per_chunk, extents[i]);
+    }
     property_list = H5Pcreate(H5P_DATASET_CREATE);
+    CHECK_H5(property_list,
+             "Failed to create property list for dataset " << name);
     if (use_shuffle_filter) {
       CHECK_H5(H5Pset_shuffle(property_list),
                "Failed to enable shuffle filter on dataset " << name);
     }
-    CHECK_H5(H5Pset_deflate(property_list, 5),
-             "Failed to enable gzip filter on dataset " << name);
+    if (use_gzip_filter) {
+      CHECK_H5(H5Pset_deflate(property_list,
+                              static_cast<unsigned>(options.compression_level)),
+               "Failed to enable gzip filter on dataset " << name);
+    }
     CHECK_H5(H5Pset_chunk(property_list, chunk_size.size(), chunk_size.data()),
              "Failed to set chunk size on dataset " << name);
     CHECK_H5(H5Pset_fill_time(property_list, H5D_FILL_TIME_NEVER),
@@ -252,37 +263,32 @@ void write_data(const hid_t group_id, const std::vector<T>& data,
       H5Dcreate2(group_id, name.c_str(), contained_type, space_id,
                  h5::h5p_default(), property_list, h5::h5p_default());
   CHECK_H5(dataset_id, "Failed to create dataset");
-  CHECK_H5(H5Dwrite(dataset_id, contained_type, h5::h5s_all(), h5::h5s_all(),
-                    h5::h5p_default(), static_cast<const void*>(data.data())),
-           "Failed to write data to dataset");
+  if (not is_empty) {
+    CHECK_H5(H5Dwrite(dataset_id, contained_type, h5::h5s_all(), h5::h5s_all(),
+                      h5::h5p_default(), static_cast<const void*>(data)),
+             "Failed to write data to dataset");
+  }
+  if (property_list != h5::h5p_default()) {
+    CHECK_H5(H5Pclose(property_list), "Failed to close property list");
+  }
   CHECK_H5(H5Sclose(space_id), "Failed to close dataspace");
   CHECK_H5(H5Dclose(dataset_id), "Failed to close dataset");
 }
+}  // namespace
+
+template <typename T>
+void write_data(const hid_t group_id, const std::vector<T>& data,
+                const std::vector<size_t>& extents, const std::string& name,
+                const bool overwrite_existing, const WriteOptions& options) {
+  write_data_impl(group_id, data.data(), extents, name, overwrite_existing,
+                  options);
+}
 
 void write_data(const hid_t group_id, const DataVector& data,
-                const std::string& name, const bool overwrite_existing) {
-  const auto number_of_points = static_cast<hsize_t>(data.size());
-  const hid_t space_id = H5Screate_simple(1, &number_of_points, nullptr);
-  CHECK_H5(space_id, "Failed to create dataspace");
-  const hid_t contained_type = h5::h5_type<double>();
-  if (H5Lexists(group_id, name.c_str(), h5::h5p_default()) != 0) {
-    if (not overwrite_existing) {
-      ERROR("Dataset already exists with name '" << name << "'.");
-    }
-    // Possible optimization: resize existing dataset if it has the same
-    // dimensions.
-    CHECK_H5(H5Ldelete(group_id, name.c_str(), h5::h5p_default()),
-             "Failed to delete existing dataset");
-  }
-  const hid_t dataset_id =
-      H5Dcreate2(group_id, name.c_str(), contained_type, space_id,
-                 h5::h5p_default(), h5::h5p_default(), h5::h5p_default());
-  CHECK_H5(dataset_id, "Failed to create dataset");
-  CHECK_H5(H5Dwrite(dataset_id, contained_type, h5::h5s_all(), h5::h5s_all(),
-                    h5::h5p_default(), static_cast<const void*>(data.data())),
-           "Failed to write data to dataset");
-  CHECK_H5(H5Sclose(space_id), "Failed to close dataspace");
-  CHECK_H5(H5Dclose(dataset_id), "Failed to close dataset");
+                const std::string& name, const bool overwrite_existing,
+                const WriteOptions& options) {
+  write_data_impl(group_id, data.data(), {data.size()}, name,
+                  overwrite_existing, options);
 }
 
 template <size_t Dim>
@@ -374,6 +380,61 @@ std::array<hsize_t, 2> append_to_dataset(
   return new_size;
 }
 
+template <typename T>
+size_t append_to_rank1_dataset(const hid_t group_id, const std::string& name,
+                               const std::vector<T>& data) {
+  hsize_t current_size = 0;
+  if (contains_dataset_or_group(group_id, "", name)) {
+    const detail::ScopedId dataset{open_dataset(group_id, name), H5Dclose};
+    const detail::ScopedId dataspace{open_dataspace(dataset.id()), H5Sclose};
+    if (H5Sget_simple_extent_ndims(dataspace.id()) != 1) {
+      ERROR("Can only append to rank-1 datasets, but dataset '"
+            << name << "' has rank "
+            << H5Sget_simple_extent_ndims(dataspace.id()));
+    }
+    H5Sget_simple_extent_dims(dataspace.id(), &current_size, nullptr);
+  } else {
+    const hsize_t initial_size = 0;
+    const hsize_t max_size = H5S_UNLIMITED;
+    // Large enough that small appends don't fragment the dataset into many
+    // chunks, and large enough to hold the first append
+    const hsize_t chunk_size = std::clamp(static_cast<hsize_t>(data.size()),
+                                          hsize_t{1024}, hsize_t{1024 * 1024});
+    const detail::ScopedId dataspace{
+        H5Screate_simple(1, &initial_size, &max_size), H5Sclose};
+    CHECK_H5(dataspace.id(), "Failed to create extensible dataspace");
+    const detail::ScopedId property_list{H5Pcreate(H5P_DATASET_CREATE),
+                                         H5Pclose};
+    CHECK_H5(property_list.id(), "Failed to create property list");
+    CHECK_H5(H5Pset_chunk(property_list.id(), 1, &chunk_size),
+             "Failed to set chunk size");
+    const detail::ScopedId dataset{
+        H5Dcreate2(group_id, name.c_str(), h5_type<T>(), dataspace.id(),
+                   h5p_default(), property_list.id(), h5p_default()),
+        H5Dclose};
+    CHECK_H5(dataset.id(), "Failed to create dataset '" << name << "'");
+  }
+  if (data.empty()) {
+    return static_cast<size_t>(current_size);
+  }
+  const detail::ScopedId dataset{open_dataset(group_id, name), H5Dclose};
+  const hsize_t new_size = current_size + data.size();
+  CHECK_H5(H5Dset_extent(dataset.id(), &new_size),
+           "Failed to extend dataset '" << name << "'");
+  const detail::ScopedId dataspace{open_dataspace(dataset.id()), H5Sclose};
+  const hsize_t count = data.size();
+  CHECK_H5(H5Sselect_hyperslab(dataspace.id(), H5S_SELECT_SET, &current_size,
+                               nullptr, &count, nullptr),
+           "Failed to select the appended part of dataset '" << name << "'");
+  const detail::ScopedId memspace{H5Screate_simple(1, &count, nullptr),
+                                  H5Sclose};
+  CHECK_H5(memspace.id(), "Failed to create memory space");
+  CHECK_H5(H5Dwrite(dataset.id(), h5_type<T>(), memspace.id(), dataspace.id(),
+                    h5p_default(), data.data()),
+           "Failed to append to dataset '" << name << "'");
+  return static_cast<size_t>(new_size);
+}
+
 Matrix retrieve_dataset(const hid_t file_id,
                         const std::array<hsize_t, 2>& file_size) {
   const hid_t dataspace_id = H5Dget_space(file_id);
@@ -897,6 +958,101 @@ T read_data(const hid_t group_id, const std::string& dataset_name) {
   return VectorTo<Rank, T>::apply(std::move(data), size);
 }
 
+template <typename T>
+void read_data(const gsl::not_null<gsl::span<T>*> buffer, const hid_t group_id,
+               const std::string& dataset_name) {
+  // The identifiers are closed also if an error is thrown
+  const detail::ScopedId dataset{open_dataset(group_id, dataset_name),
+                                 H5Dclose};
+  hssize_t num_points = 0;
+  {
+    const detail::ScopedId dataspace{open_dataspace(dataset.id()), H5Sclose};
+    num_points = H5Sget_simple_extent_npoints(dataspace.id());
+  }
+  CHECK_H5(num_points,
+           "Failed to get the size of dataset '" << dataset_name << "'");
+  if (UNLIKELY(static_cast<size_t>(num_points) != buffer->size())) {
+    ERROR("The buffer has size " << buffer->size() << " but the dataset '"
+                                 << dataset_name << "' holds " << num_points
+                                 << " values.");
+  }
+  CHECK_H5(H5Dread(dataset.id(), h5_type<T>(), h5s_all(), h5s_all(),
+                   h5p_default(), buffer->data()),
+           "Failed to read dataset: '" << dataset_name << "'");
+}
+
+template <typename T>
+void read_data(
+    const gsl::not_null<gsl::span<T>*> buffer, const hid_t group_id,
+    const std::string& dataset_name,
+    const std::vector<std::pair<size_t, size_t>>& offsets_and_lengths) {
+  const size_t total_length = std::accumulate(
+      offsets_and_lengths.begin(), offsets_and_lengths.end(), size_t{0},
+      [](const size_t sum, const std::pair<size_t, size_t>& offset_and_length) {
+        return sum + offset_and_length.second;
+      });
+  if (UNLIKELY(total_length != buffer->size())) {
+    ERROR("The buffer has size " << buffer->size() << " but the selected "
+                                 << "ranges of dataset '" << dataset_name
+                                 << "' hold " << total_length << " values.");
+  }
+  if (total_length == 0) {
+    return;
+  }
+  // The identifiers are closed also if an error is thrown
+  const detail::ScopedId dataset{open_dataset(group_id, dataset_name),
+                                 H5Dclose};
+  const detail::ScopedId dataspace{open_dataspace(dataset.id()), H5Sclose};
+  const hid_t dataspace_id = dataspace.id();
+  if (H5Sget_simple_extent_ndims(dataspace_id) != 1) {
+    ERROR("Can only select ranges of rank-1 datasets, but dataset '"
+          << dataset_name << "' has rank "
+          << H5Sget_simple_extent_ndims(dataspace_id));
+  }
+  hsize_t dataset_size = 0;
+  H5Sget_simple_extent_dims(dataspace_id, &dataset_size, nullptr);
+  CHECK_H5(H5Sselect_none(dataspace_id),
+           "Failed to select none of the dataspace");
+  size_t previous_end = 0;
+  for (size_t i = 0; i < offsets_and_lengths.size(); ++i) {
+    const size_t offset = offsets_and_lengths[i].first;
+    size_t length = offsets_and_lengths[i].second;
+    // Merge adjacent ranges into a single block to keep the selection simple
+    while (i + 1 < offsets_and_lengths.size() and
+           offsets_and_lengths[i + 1].first == offset + length) {
+      ++i;
+      length += offsets_and_lengths[i].second;
+    }
+    if (UNLIKELY(offset < previous_end or offset + length > dataset_size)) {
+      ERROR("The selected ranges of dataset '"
+            << dataset_name
+            << "' must be sorted, must not overlap, and must lie within the "
+               "dataset of size "
+            << dataset_size << ", but found the range starting at " << offset
+            << " with length " << length << ".");
+    }
+    if (length == 0) {
+      continue;
+    }
+    const auto start = static_cast<hsize_t>(offset);
+    const hsize_t count = 1;
+    const auto block = static_cast<hsize_t>(length);
+    CHECK_H5(H5Sselect_hyperslab(dataspace_id, H5S_SELECT_OR, &start, nullptr,
+                                 &count, &block),
+             "Failed to select range starting at " << offset << " with length "
+                                                   << length);
+    previous_end = offset + length;
+  }
+  const auto memspace_size = static_cast<hsize_t>(total_length);
+  const detail::ScopedId memspace{H5Screate_simple(1, &memspace_size, nullptr),
+                                  H5Sclose};
+  CHECK_H5(memspace.id(), "Failed to create memory space");
+  CHECK_H5(
+      H5Dread(dataset.id(), h5_type<T>(), memspace.id(), dataspace_id,
+              h5p_default(), buffer->data()),
+      "Failed to read selected ranges of dataset: '" << dataset_name << "'");
+}
+
 template <size_t Dim>
 Index<Dim> read_extents(const hid_t group_id, const std::string& extents_name) {
   const hid_t attr_id = H5Aopen(group_id, extents_name.c_str(), h5p_default());
@@ -931,7 +1087,7 @@ template Index<3> read_extents<3>(const hid_t group_id,
   template void write_data<TYPE(DATA)>(                            \
       const hid_t group_id, const std::vector<TYPE(DATA)>& data,   \
       const std::vector<size_t>& extents, const std::string& name, \
-      bool overwrite_existing);
+      bool overwrite_existing, const WriteOptions& options);
 
 GENERATE_INSTANTIATIONS(INSTANTIATE_WRITE_DATA,
                         (float, double, int, unsigned int, long, unsigned long,
@@ -1019,6 +1175,26 @@ GENERATE_INSTANTIATIONS(INSTANTIATE_READ_MULTIARRAY,
                          long long, unsigned long long, char),
                         (2, 3, 5))
 
+#define INSTANTIATE_READ_INTO_BUFFER(_, DATA)                 \
+  template void read_data<TYPE(DATA)>(                        \
+      const gsl::not_null<gsl::span<TYPE(DATA)>*> buffer,     \
+      const hid_t group_id, const std::string& dataset_name); \
+  template void read_data<TYPE(DATA)>(                        \
+      const gsl::not_null<gsl::span<TYPE(DATA)>*> buffer,     \
+      const hid_t group_id, const std::string& dataset_name,  \
+      const std::vector<std::pair<size_t, size_t>>& offsets_and_lengths);
+
+GENERATE_INSTANTIATIONS(INSTANTIATE_READ_INTO_BUFFER,
+                        (float, double, char, int, long, size_t))
+
+#define INSTANTIATE_APPEND_RANK1(_, DATA)              \
+  template size_t append_to_rank1_dataset<TYPE(DATA)>( \
+      const hid_t group_id, const std::string& name,   \
+      const std::vector<TYPE(DATA)>& data);
+
+GENERATE_INSTANTIATIONS(INSTANTIATE_APPEND_RANK1,
+                        (double, char, int, long, size_t))
+
 #define INSTANTIATE_READ_DATAVECTOR(_, DATA)             \
   template TYPE(DATA) read_data<RANK(DATA), TYPE(DATA)>( \
       const hid_t group_id, const std::string& dataset_name);
@@ -1031,6 +1207,8 @@ GENERATE_INSTANTIATIONS(INSTANTIATE_READ_DATAVECTOR, (DataVector), (1, 2, 3))
 #undef INSTANTIATE_READ_VECTOR
 #undef INSTANTIATE_READ_MULTIARRAY
 #undef INSTANTIATE_READ_DATAVECTOR
+#undef INSTANTIATE_READ_INTO_BUFFER
+#undef INSTANTIATE_APPEND_RANK1
 #undef TYPE
 #undef RANK
 }  // namespace h5
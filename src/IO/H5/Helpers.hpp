@@ -10,9 +10,12 @@
 #include <cstddef>
 #include <hdf5.h>
 #include <string>
+#include <utility>
 #include <vector>
 
 #include "DataStructures/Index.hpp"
+#include "IO/H5/WriteOptions.hpp"
+#include "Utilities/Gsl.hpp"
 
 /// \cond
 class DataVector;
@@ -29,19 +32,27 @@ bool types_equal(hid_t dtype1, hid_t dtype2);
 /*!
  * \ingroup HDF5Group
  * \brief Write a std::vector named `name` to the group `group_id`
+ *
+ * The `options` control how the dataset is stored, e.g. whether or not it is
+ * compressed. See `h5::WriteOptions` for details.
  */
 template <typename T>
 void write_data(hid_t group_id, const std::vector<T>& data,
                 const std::vector<size_t>& extents,
                 const std::string& name = "scalar",
-                const bool overwrite_existing = false);
+                const bool overwrite_existing = false,
+                const WriteOptions& options = {});
 
 /*!
  * \ingroup HDF5Group
  * \brief Write a DataVector named `name` to the group `group_id`
+ *
+ * By default, the data is stored contiguously and uncompressed. Pass `options`
+ * to change how the dataset is stored. See `h5::WriteOptions` for details.
  */
 void write_data(hid_t group_id, const DataVector& data, const std::string& name,
-                const bool overwrite_existing = false);
+                const bool overwrite_existing = false,
+                const WriteOptions& options = WriteOptions::uncompressed());
 
 /*!
  * \ingroup HDF5Group
@@ -130,6 +141,20 @@ std::array<hsize_t, 2> append_to_dataset(
     hid_t file_id, const std::string& name, const std::vector<double>& data,
     hsize_t number_of_rows, const std::array<hsize_t, 2>& current_file_size);
 
+/*!
+ * \ingroup HDF5Group
+ * \brief Append `data` to the rank-1 dataset `name` in the group `group_id`
+ *
+ * The dataset is created with chunked storage and unlimited maximum size if it
+ * doesn't exist yet, so it can keep growing without rewriting the data that is
+ * already in the file.
+ *
+ * \return The new size of the dataset
+ */
+template <typename T>
+size_t append_to_rank1_dataset(hid_t group_id, const std::string& name,
+                               const std::vector<T>& data);
+
 /// @{
 /*!
  * \ingroup HDF5Group
@@ -204,6 +229,36 @@ void close_dataspace(hid_t dataspace_id);
 template <size_t Rank, typename T>
 T read_data(hid_t group_id, const std::string& dataset_name);
 
+/*!
+ * \ingroup HDF5Group
+ * \brief Read a dataset of any rank directly into the preallocated `buffer`.
+ *
+ * The data is read in row-major order without any intermediate copies. If the
+ * dataset is stored with a different floating point precision than `T`, HDF5
+ * converts the values while reading. The size of `buffer` must match the total
+ * number of values in the dataset.
+ */
+template <typename T>
+void read_data(gsl::not_null<gsl::span<T>*> buffer, hid_t group_id,
+               const std::string& dataset_name);
+
+/*!
+ * \ingroup HDF5Group
+ * \brief Read only the ranges `offsets_and_lengths` of a rank-1 dataset into
+ * the preallocated `buffer`.
+ *
+ * The ranges are selected as a single hyperslab and read one after the other
+ * into the `buffer`, so only the chunks of the dataset that overlap the ranges
+ * are read from disk and decompressed. The ranges must be sorted by their
+ * offset and must not overlap. The size of `buffer` must be the sum of the
+ * lengths of the ranges.
+ */
+template <typename T>
+void read_data(
+    gsl::not_null<gsl::span<T>*> buffer, hid_t group_id,
+    const std::string& dataset_name,
+    const std::vector<std::pair<size_t, size_t>>& offsets_and_lengths);
+
 /*!
  * \ingroup HDF5Group
  * \brief Read the HDF5 attribute representing extents from a group
@@ -234,5 +289,48 @@ hid_t create_extensible_dataset(hid_t group_id, const std::string& name,
                                 const std::array<hsize_t, Dims>& initial_size,
                                 const std::array<hsize_t, Dims>& chunk_size,
                                 const std::array<hsize_t, Dims>& max_size);
+
+/*!
+ * \ingroup HDF5Group
+ * \brief Holds an HDF5 identifier, e.g. of a dataset or dataspace, and closes
+ * it when going out of scope
+ *
+ * Use this for identifiers opened with the HDF5 C API so they are also closed
+ * when an error is thrown while they are open, e.g. when the error is caught by
+ * the Python bindings and the file stays open. Failures to close the
+ * identifier are ignored because the destructor can't throw.
+ */
+class ScopedId {
+ public:
+  using CloseFunction = herr_t (*)(hid_t);
+
+  ScopedId(const hid_t id, const CloseFunction close)
+      : id_(id), close_(close) {}
+
+  /// \cond HIDDEN_SYMBOLS
+  ~ScopedId() {
+    if (id_ >= 0) {
+      close_(id_);
+    }
+  }
+  /// \endcond
+
+  /// @{
+  /// \cond HIDDEN_SYMBOLS
+  /// Copying or moving does not make sense since the identifier would then be
+  /// closed twice.
+  ScopedId(const ScopedId& /*rhs*/) = delete;
+  ScopedId& operator=(const ScopedId& /*rhs*/) = delete;
+  ScopedId(ScopedId&& /*rhs*/) = delete;
+  ScopedId& operator=(ScopedId&& /*rhs*/) = delete;
+  /// \endcond
+  /// @}
+
+  hid_t id() const { return id_; }
+
+ private:
+  hid_t id_;
+  CloseFunction close_;
+};
 }  // namespace detail
 }  // namespace h5
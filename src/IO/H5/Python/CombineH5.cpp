@@ -3,9 +3,11 @@
 
 #include "IO/H5/Python/CombineH5.hpp"
 
+#include <optional>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <string>
+#include <vector>
 
 #include "IO/H5/CombineH5.hpp"
 
@@ -15,6 +17,8 @@ namespace py_bindings {
 void bind_h5combine(py::module& m) {
   // Wrapper for combining h5 files
   m.def("combine_h5", &h5::combine_h5, py::arg("file_names"),
-        py::arg("subfile_name"), py::arg("output"), py::arg("check_src"));
+        py::arg("subfile_name"), py::arg("output"), py::arg("check_src") = true,
+        py::arg("observation_ids") = std::nullopt,
+        py::arg("observation_values") = std::nullopt);
 }
 }  // namespace py_bindings
@@ -1,8 +1,12 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
+import collections
 import logging
+import multiprocessing
 import os
+import tempfile
+from typing import Optional, Sequence
 
 import click
 import rich
@@ -12,6 +16,123 @@ from spectre.IO.H5.CombineH5Dat import combine_h5_dat_command
 from spectre.support.CliExceptions import RequiredChoiceError
 
 
+def _combine_observation(task) -> str:
+    """Combine one observation of the input files into a temporary file
+
+    Runs in a worker process. Each task opens the files itself, so no HDF5
+    handles are shared between processes. The task lists only the files that
+    contain the observation, and the observation value, so the metadata of the
+    other files isn't read. Returns the temporary file name.
+    """
+    h5files, subfile_name, output, obs_id, obs_value = task
+    spectre_h5.combine_h5(
+        h5files,
+        subfile_name,
+        output,
+        check_src=False,
+        observation_ids=[obs_id],
+        observation_values=[obs_value],
+    )
+    return output
+
+
+def combine_h5_vol(
+    h5files: Sequence[str],
+    subfile_name: str,
+    output: str,
+    check_src: bool = True,
+    num_jobs: Optional[int] = 1,
+):
+    """Combine volume data spread over multiple H5 files into a single file
+
+    The input files can contain different observations, e.g. when they are from
+    different segments of a simulation, and the output file contains all of
+    them. See 'spectre.IO.H5.combine_h5' for details.
+
+    With more than one job, the observations (not the input files) are
+    distributed over a pool of worker processes. Each worker reads one
+    observation from all input files that contain it and writes it to a
+    temporary file next to the output file. This process then writes the
+    finished observations to the output file in order of their observation
+    value, with 'spectre.IO.H5.combine_h5', so the output file is written just
+    like in serial. Only a bounded number of observations is in flight at any
+    time, so the temporary files don't pile up. The observations in the input
+    files are listed only once, by this process.
+
+    Arguments:
+      h5files: Paths to the input H5 files.
+      subfile_name: Name of the volume data subfile in the H5 files.
+      output: Path to the output H5 file.
+      check_src: Check that all input files were written by the same version
+        of SpECTRE.
+      num_jobs: Number of worker processes. Defaults to 1, which combines the
+        files in this process. Set to None to use all CPUs.
+    """
+    if num_jobs is None:
+        num_jobs = multiprocessing.cpu_count()
+    if num_jobs <= 1:
+        spectre_h5.combine_h5(h5files, subfile_name, output, check_src)
+        return
+
+    # List the observations once. Like their elements, the observation values
+    # are taken from the last file that contains them (see
+    # 'spectre.IO.H5.combine_h5').
+    observation_values = {}
+    observation_files = collections.defaultdict(list)
+    for h5file in h5files:
+        with spectre_h5.H5File(h5file, "r") as open_h5file:
+            volfile = open_h5file.get_vol(subfile_name)
+            for obs_id in volfile.list_observation_ids():
+                observation_values[obs_id] = volfile.get_observation_value(
+                    obs_id
+                )
+                observation_files[obs_id].append(h5file)
+    obs_ids = sorted(observation_values, key=observation_values.get)
+
+    # Create the output subfile
+    spectre_h5.combine_h5(
+        h5files,
+        subfile_name,
+        output,
+        check_src,
+        observation_ids=[],
+        observation_values=[],
+    )
+
+    with tempfile.TemporaryDirectory(
+        dir=os.path.dirname(os.path.abspath(output))
+    ) as tmp_dir, multiprocessing.Pool(num_jobs) as pool:
+
+        def write_observation(result, obs_id):
+            tmp_file_name = result.get()
+            spectre_h5.combine_h5(
+                [tmp_file_name],
+                subfile_name,
+                output,
+                check_src=False,
+                observation_ids=[obs_id],
+                observation_values=[observation_values[obs_id]],
+            )
+            os.remove(tmp_file_name)
+
+        pending = collections.deque()
+        for obs_id in obs_ids:
+            task = (
+                observation_files[obs_id],
+                subfile_name,
+                os.path.join(tmp_dir, f"ObservationId{obs_id}.h5"),
+                obs_id,
+                observation_values[obs_id],
+            )
+            pending.append(
+                (pool.apply_async(_combine_observation, (task,)), obs_id)
+            )
+            if len(pending) >= 2 * num_jobs:
+                write_observation(*pending.popleft())
+        while pending:
+            write_observation(*pending.popleft())
+
+
 @click.group(name="combine-h5")
 def combine_h5_command():
     """Combines multiple HDF5 files"""
@@ -55,7 +176,18 @@ combine_h5_command.add_command(combine_h5_dat_command, name="dat")
         " checked, False implies no src files to check."
     ),
 )
-def combine_h5_vol_command(h5files, subfile_name, output, check_src):
+@click.option(
+    "--num-jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    help=(
+        "Number of worker processes. Each worker reads one observation at a"
+        " time from the input files. The output file is written by a single"
+        " process."
+    ),
+)
+def combine_h5_vol_command(h5files, subfile_name, output, check_src, num_jobs):
     """Combines volume data spread over multiple H5 files into a single file
 
     The typical use case is to combine volume data from multiple nodes into a
@@ -64,9 +196,11 @@ def combine_h5_vol_command(h5files, subfile_name, output, check_src):
     necessary to combine the volume data into a single file, as most commands
     can operate on multiple input H5 files (e.g. 'generate-xdmf').
 
-    Note that this command does not currently combine volume data from different
-    time steps (e.g. from multiple segments of a simulation). All input H5 files
-    must contain the same set of observation IDs.
+    The input H5 files can contain different observations, e.g. from multiple
+    segments of a simulation. The output file contains all of them. If a
+    segment was restarted from an earlier checkpoint and repeats observations,
+    the data and observation values from the input file that is listed last
+    are used.
     """
     # Print available subfile names and exit
     if not subfile_name:
@@ -82,7 +216,7 @@ def combine_h5_vol_command(h5files, subfile_name, output, check_src):
     if not output.endswith(".h5"):
         output += ".h5"
 
-    spectre_h5.combine_h5(h5files, subfile_name, output, check_src)
+    combine_h5_vol(h5files, subfile_name, output, check_src, num_jobs)
 
 
 if __name__ == "__main__":
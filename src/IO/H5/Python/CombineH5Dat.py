@@ -8,10 +8,78 @@ import shutil
 import click
 import h5py
 
-from spectre.Visualization.ReadH5 import available_subfiles
+from spectre.Visualization.ReadH5 import _find_row, available_subfiles
 
+# Attributes of the combined dat files that record which input files were
+# combined, and how many rows of each input file
+_SOURCES_ATTR = "CombinedSources"
+_NUM_ROWS_ATTR = "CombinedNumRows"
 
-def combine_h5_dat(h5files, output, force):
+
+def _append_rows(out_dataset: h5py.Dataset, new_rows):
+    """Append rows to a dat file, replacing rows at or after their start time
+
+    When a simulation is restarted from an earlier checkpoint, the new segment
+    repeats times that the previous segment already wrote. The rows of the
+    new segment take precedence.
+    """
+    num_rows = _find_row(out_dataset, lambda time: time < new_rows[0, 0])
+    if num_rows < len(out_dataset):
+        logging.info(
+            f"CombineH5Dat: Replacing {len(out_dataset) - num_rows} rows of"
+            f" dat file '{out_dataset.name}' at or after time"
+            f" {new_rows[0, 0]}."
+        )
+    out_dataset.resize(num_rows + len(new_rows), axis=0)
+    out_dataset[num_rows:] = new_rows
+
+
+def _combine_dat_file(
+    out_dataset: h5py.Dataset, input_file: h5py.File, input_file_path: str
+):
+    """Append the rows of the input file that weren't combined yet"""
+    if _SOURCES_ATTR not in out_dataset.attrs:
+        raise ValueError(
+            f"Dat file '{out_dataset.name}' in '{out_dataset.file.filename}'"
+            " has no record of the combined input files, so it can't be"
+            " updated incrementally. To recombine all input files, use"
+            " --force."
+        )
+    sources = list(out_dataset.attrs[_SOURCES_ATTR])
+    num_rows = list(out_dataset.attrs[_NUM_ROWS_ATTR])
+    input_dataset = input_file.get(out_dataset.name)
+    available_rows = 0 if input_dataset is None else len(input_dataset)
+    if input_file_path in sources:
+        source_index = sources.index(input_file_path)
+        first_row = num_rows[source_index]
+        if available_rows == first_row:
+            return
+        # Only the segment that was combined last can still be running
+        if source_index != len(sources) - 1 or available_rows < first_row:
+            raise ValueError(
+                f"Dat file '{out_dataset.name}' in input file"
+                f" '{input_file_path}' has changed since it was combined into"
+                f" '{out_dataset.file.filename}'. Only the input file that was"
+                " combined last can grow. To recombine all input files, use"
+                " --force."
+            )
+        num_rows[source_index] = available_rows
+    else:
+        if input_dataset is None:
+            logging.warning(
+                f"CombineH5Dat: Dat file '{out_dataset.name}'"
+                f" not found in input file '{input_file_path}'"
+            )
+        first_row = 0
+        sources.append(input_file_path)
+        num_rows.append(available_rows)
+    if available_rows > first_row:
+        _append_rows(out_dataset, input_dataset[first_row:])
+    out_dataset.attrs[_SOURCES_ATTR] = sources
+    out_dataset.attrs[_NUM_ROWS_ATTR] = num_rows
+
+
+def combine_h5_dat(h5files, output, force, incremental=False):
     """Combines multiple HDF5 dat files
 
     This executable is used for combining a series of HDF5 files, each
@@ -20,42 +88,53 @@ def combine_h5_dat(h5files, output, force):
     of a simulation, with each segment containing values of the dat files
     during different time intervals.
 
+    When a segment starts at an earlier time than the previous segments
+    ended, e.g. because the simulation was restarted from an earlier
+    checkpoint, the overlapping rows of the previous segments are replaced.
+
+    The combined dat files record which input files and how many of their
+    rows were combined. With '--incremental', an existing output file is
+    updated by appending only the rows of new input files and the new rows of
+    the input file that was combined last. This allows to rerun the command
+    cheaply as a simulation progresses.
+
     \f
     Arguments:
       h5files: List of H5 dat files to join
       output: Output filename. An extension '.h5' will be added if not present.
       force: If specified, overwrite output file if it already exists
+      incremental: If specified, update the output file if it already exists
     """
     # Copy first input file to output file
     if not output.endswith(".h5"):
         output += ".h5"
-    # If output file exists, exit unless the user specifies `--force`
-    if os.path.exists(output) and not force:
-        raise ValueError(f"File '{output}' exists; to overwrite, use --force")
-    shutil.copy(h5files[0], output)
+    # Input files are identified by their absolute path in incremental updates
+    h5files = [os.path.abspath(h5file) for h5file in h5files]
+    if not (incremental and os.path.exists(output)):
+        # If output file exists, exit unless the user specifies `--force`
+        if os.path.exists(output) and not force:
+            raise ValueError(
+                f"File '{output}' exists; to overwrite, use --force, or to"
+                " update it, use --incremental"
+            )
+        shutil.copy(h5files[0], output)
+        with h5py.File(output, "r+") as out:
+            for dat_file_key in available_subfiles(out, extension=".dat"):
+                out[dat_file_key].attrs[_SOURCES_ATTR] = h5files[:1]
+                out[dat_file_key].attrs[_NUM_ROWS_ATTR] = [
+                    len(out[dat_file_key])
+                ]
 
     # Open the output file for appending
     with h5py.File(output, "r+") as out:
         # Get a list of all dat file keys (keys ending in ".dat")
         dat_file_keys = available_subfiles(out, extension=".dat")
 
-        # Loop over remaining input files, appending each dat file
-        for input_file in h5files[1:]:
+        # Loop over input files, appending the new rows of each dat file
+        for input_file in h5files:
             with h5py.File(input_file, "r") as input:
                 for dat_file_key in dat_file_keys:
-                    if dat_file_key in input.keys():
-                        data_to_append = input[dat_file_key]
-                        start_size = out[dat_file_key].shape[0]
-                        append_size = input[dat_file_key].shape[0]
-                        out[dat_file_key].resize(
-                            start_size + append_size, axis=0
-                        )
-                        out[dat_file_key][start_size:] = input[dat_file_key]
-                    else:
-                        logging.warning(
-                            f"CombineH5Dat: Dat file '{dat_file_key}'"
-                            f" not found in input file '{input_file}'"
-                        )
+                    _combine_dat_file(out[dat_file_key], input, input_file)
 
 
 @click.command(name="combine-h5-dat", help=combine_h5_dat.__doc__)
@@ -89,8 +168,16 @@ def combine_h5_dat(h5files, output, force):
     is_flag=True,
     help="If the output file already exists, overwrite it.",
 )
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help=(
+        "If the output file already exists, append only the rows that weren't"
+        " combined yet."
+    ),
+)
 def combine_h5_dat_command(**kwargs):
-    combine_h5_dat(kwargs["h5files"], kwargs["output"], kwargs["force"])
+    combine_h5_dat(**kwargs)
 
 
 if __name__ == "__main__":
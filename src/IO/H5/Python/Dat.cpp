@@ -3,12 +3,17 @@
 
 #include "IO/H5/Python/Dat.hpp"
 
+#include <chrono>
+#include <cstddef>
+#include <memory>
+#include <optional>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <string>
 #include <vector>
 
 #include "DataStructures/Matrix.hpp"
+#include "IO/H5/BufferedDatWriter.hpp"
 #include "IO/H5/Dat.hpp"
 
 namespace py = pybind11;
@@ -32,8 +37,55 @@ void bind_h5dat(py::module& m) {
       .def("get_data", &h5::Dat::get_data)
       .def("get_data_subset", &h5::Dat::get_data_subset, py::arg("columns"),
            py::arg("first_row") = 0, py::arg("num_rows") = 1)
+      .def("get_rows_in_time_range", &h5::Dat::get_rows_in_time_range,
+           py::arg("start_time"), py::arg("end_time"),
+           py::arg("columns") = std::nullopt)
       .def("get_dimensions", &h5::Dat::get_dimensions)
       .def("get_header", &h5::Dat::get_header)
-      .def("get_version", &h5::Dat::get_version);
+      .def("get_version", &h5::Dat::get_version)
+      .def("subfile_path", &h5::Dat::subfile_path);
+  py::class_<h5::BufferedDatWriter>(m, "BufferedDatWriter")
+      .def(py::init([](h5::Dat& dat, const size_t max_buffered_rows,
+                       const std::optional<double> max_buffer_time) {
+             return std::make_unique<h5::BufferedDatWriter>(
+                 &dat, max_buffered_rows,
+                 max_buffer_time.has_value()
+                     ? std::optional<std::chrono::duration<double>>(
+                           *max_buffer_time)
+                     : std::nullopt);
+           }),
+           py::arg("dat"), py::arg("max_buffered_rows") = 1024,
+           py::arg("max_buffer_time") = std::nullopt,
+           "Collects rows in memory and appends them to the 'dat' subfile in "
+           "large blocks. Rows are appended when 'max_buffered_rows' rows are "
+           "buffered, when the first buffered row is older than "
+           "'max_buffer_time' seconds, on 'flush()', when leaving the "
+           "context, and when the subfile is closed. The writer can't be "
+           "used after the subfile is closed.")
+      .def("append",
+           static_cast<void (h5::BufferedDatWriter::*)(
+               const std::vector<double>&)>(&h5::BufferedDatWriter::append),
+           py::arg("data"))
+      .def("append",
+           static_cast<void (h5::BufferedDatWriter::*)(const Matrix&)>(
+               &h5::BufferedDatWriter::append),
+           py::arg("data"))
+      .def("append",
+           static_cast<void (h5::BufferedDatWriter::*)(
+               const std::vector<std::vector<double>>&)>(
+               &h5::BufferedDatWriter::append),
+           py::arg("data"))
+      .def("flush", &h5::BufferedDatWriter::flush)
+      .def_property_readonly("number_of_buffered_rows",
+                             &h5::BufferedDatWriter::number_of_buffered_rows)
+      .def_property_readonly("is_open", &h5::BufferedDatWriter::is_open)
+      .def("__enter__",
+           [](h5::BufferedDatWriter& writer) -> h5::BufferedDatWriter& {
+             return writer;
+           })
+      .def("__exit__", [](h5::BufferedDatWriter& writer,
+                          const py::object& /*exception_type*/,
+                          const py::object& /*exception_value*/,
+                          const py::object& /*traceback*/) { writer.flush(); });
 }
 }  // namespace py_bindings
@@ -3,9 +3,11 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
+import importlib.util
 import multiprocessing as mp
 import os
 import shutil
+import zipfile
 
 import click
 import h5py
@@ -15,8 +17,63 @@ import rich
 
 from spectre.Visualization.ReadH5 import available_subfiles
 
+# Output formats in addition to the plain-text '.dat' format. The Arrow formats
+# require the optional 'pyarrow' package.
+BINARY_FORMATS = ["npy", "npz", "feather", "parquet"]
+ARROW_FORMATS = ["feather", "parquet"]
 
-def write_dat_data(dat_path, h5_filename, out_dir, precision):
+# Number of rows that are read from the H5 file at once when writing binary
+# formats, so the memory usage is bounded for large subfiles
+ROWS_PER_CHUNK = 65536
+
+
+def _iter_chunks(dat_file):
+    for first_row in range(0, len(dat_file), ROWS_PER_CHUNK):
+        yield dat_file[first_row : first_row + ROWS_PER_CHUNK]
+
+
+def _write_npy(open_file, dat_file):
+    """Stream the subfile into an open file in the '.npy' format"""
+    np.lib.format.write_array_header_1_0(
+        open_file,
+        {
+            "descr": np.lib.format.dtype_to_descr(dat_file.dtype),
+            "fortran_order": False,
+            "shape": dat_file.shape,
+        },
+    )
+    for chunk in _iter_chunks(dat_file):
+        open_file.write(np.ascontiguousarray(chunk).tobytes())
+
+
+def _write_arrow(filename, dat_file, legend, format):
+    """Stream the subfile into a Feather (Arrow IPC) or Parquet file"""
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [
+            pa.field(str(name), pa.from_numpy_dtype(dat_file.dtype))
+            for name in legend
+        ]
+    )
+    if format == "feather":
+        import pyarrow.ipc
+
+        writer = pa.ipc.new_file(filename, schema)
+    else:
+        import pyarrow.parquet
+
+        writer = pa.parquet.ParquetWriter(filename, schema)
+    with writer:
+        for chunk in _iter_chunks(dat_file):
+            writer.write_batch(
+                pa.record_batch(
+                    list(np.ascontiguousarray(chunk.T)), schema=schema
+                )
+            )
+
+
+def write_dat_data(dat_path, h5_filename, out_dir, precision, format="dat"):
     with h5py.File(h5_filename, "r") as h5file:
         if not dat_path.endswith(".dat"):
             dat_path = dat_path + ".dat"
@@ -28,6 +85,30 @@ def write_dat_data(dat_path, h5_filename, out_dir, precision):
                 f"files are:\n{subfiles}"
             )
         legend = dat_file.attrs["Legend"]
+
+        # Binary formats are streamed from the H5 file in chunks of rows
+        if format in BINARY_FORMATS:
+            dat_dir = os.path.join(out_dir, os.path.dirname(dat_path))
+            os.makedirs(dat_dir, exist_ok=True)
+            filename = os.path.join(
+                out_dir, dat_path[: -len(".dat")] + "." + format
+            )
+            if format == "npy":
+                with open(filename, "wb") as open_file:
+                    _write_npy(open_file, dat_file)
+            elif format == "npz":
+                # Same layout as 'np.savez(filename, data=..., legend=...)'
+                with zipfile.ZipFile(filename, "w", allowZip64=True) as npz:
+                    with npz.open("data.npy", "w", force_zip64=True) as f:
+                        _write_npy(f, dat_file)
+                    with npz.open("legend.npy", "w") as f:
+                        np.lib.format.write_array(
+                            f, np.array(legend, dtype=str)
+                        )
+            else:
+                _write_arrow(filename, dat_file, legend, format)
+            return
+
         dat_data = np.array(dat_file)
 
     header = "\n".join(f"[{i}] " + "{}" for i in range(len(legend))).format(
@@ -65,6 +146,7 @@ def extract_dat_files(
     list=False,
     force=False,
     subfiles=None,
+    format="dat",
 ):
     """Extract dat files from an H5 file
 
@@ -72,6 +154,14 @@ def extract_dat_files(
     be put into the 'OUT_DIR' if specified, or printed to standard output. The
     directory structure will be identical to the group structure inside the
     HDF5 file.
+
+    By default, the Dat files are written as text. Large Dat files are much
+    faster to extract into one of the binary formats: 'npy' (a single array,
+    load with 'numpy.load'), 'npz' (arrays 'data' and 'legend'), or the Arrow
+    formats 'feather' and 'parquet' (a table with named columns, load with
+    'pandas.read_feather' or 'pandas.read_parquet'). The Arrow formats require
+    the 'pyarrow' package. Binary formats can only be written to an
+    'OUT_DIR'.
     """
     if list:
         import rich.columns
@@ -80,6 +170,17 @@ def extract_dat_files(
         rich.print(rich.columns.Columns(subfiles))
         return
 
+    if format in BINARY_FORMATS and not out_dir:
+        raise ValueError(
+            f"The '{format}' format can only be written to an output"
+            " directory, not to stdout."
+        )
+    if format in ARROW_FORMATS and importlib.util.find_spec("pyarrow") is None:
+        raise ImportError(
+            f"Writing '{format}' files requires the 'pyarrow' package."
+            " Install it with 'pip install pyarrow'."
+        )
+
     if subfiles:
         all_dat_files = subfiles
     else:
@@ -116,11 +217,12 @@ def extract_dat_files(
                     [filename] * num_dat_files,
                     [out_dir] * num_dat_files,
                     [precision] * num_dat_files,
+                    [format] * num_dat_files,
                 ),
             )
     else:
         for dat_filename in all_dat_files:
-            write_dat_data(dat_filename, filename, out_dir, precision)
+            write_dat_data(dat_filename, filename, out_dir, precision, format)
 
     if out_dir:
         print(f"Successfully extracted all Dat files into '{out_dir}'")
@@ -150,6 +252,17 @@ def extract_dat_files(
     show_default=True,
     help="Precision with which to save (or print) the data.",
 )
+@click.option(
+    "--format",
+    type=click.Choice(["dat"] + BINARY_FORMATS),
+    default="dat",
+    show_default=True,
+    help=(
+        "Output format. 'dat' writes text files with the given precision. The"
+        " binary formats are much faster for large Dat files. 'feather' and"
+        " 'parquet' require the 'pyarrow' package."
+    ),
+)
 @click.option(
     "--force",
     "-f",
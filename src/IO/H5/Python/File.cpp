@@ -13,6 +13,7 @@
 #include "IO/H5/Cce.hpp"
 #include "IO/H5/Dat.hpp"
 #include "IO/H5/File.hpp"
+#include "IO/H5/FilePool.hpp"
 #include "IO/H5/VolumeData.hpp"
 #include "Utilities/MakeString.hpp"
 
@@ -155,5 +156,15 @@ void bind_h5file(py::module& m) {
       "open\nmode: mode to open the file. Available modes are 'r', 'r+', 'w-', "
       "'x', and 'a'. For details see "
       "https://docs.h5py.org/en/stable/high/file.html");
+  m.def(
+      "release_pooled_h5file",
+      [](const std::filesystem::path& file_name) {
+        h5::release_pooled_file(file_name.string());
+      },
+      py::arg("file_name"));
+  m.def("clear_file_pool", &h5::clear_file_pool);
+  m.def("forget_file_pool", &h5::forget_file_pool);
+  m.def("file_pool_size", &h5::file_pool_size);
+  m.def("set_file_pool_size", &h5::set_file_pool_size, py::arg("max_size"));
 }
 }  // namespace py_bindings
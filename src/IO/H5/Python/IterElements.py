@@ -1,16 +1,41 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
+import collections
+import contextlib
 import fnmatch
-from dataclasses import dataclass
+import functools
+import multiprocessing
+import threading
+from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Dict, Iterable, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 
 import spectre.IO.H5 as spectre_h5
+from spectre.DataStructures import DataVector
+from spectre.DataStructures.Tensor import (
+    Frame,
+    InverseJacobian,
+    Jacobian,
+    Scalar,
+    tnsr,
+)
 from spectre.DataStructures.Tensor.EagerMath import determinant
 from spectre.Domain import (
+    BatchedElementMaps,
+    Domain,
     ElementId,
     ElementMap,
     FunctionOfTime,
@@ -22,7 +47,289 @@ from spectre.Domain.CoordinateMaps import (
     CoordinateMapElementLogicalToInertial2D,
     CoordinateMapElementLogicalToInertial3D,
 )
-from spectre.Spectral import Mesh, logical_coordinates
+from spectre.IO.H5.MemoryMap import map_tensor_components
+from spectre.Spectral import Basis, Mesh, Quadrature, logical_coordinates
+
+
+class _ElementGeometry:
+    """Geometry of an element that is shared between observations
+
+    Holds the element map and logical coordinates. For elements in
+    time-independent blocks the inertial coordinates and Jacobians are also
+    computed only once. Elements in time-dependent blocks are mapped at every
+    observation, all at once with '_ObservationGeometry'.
+
+    The returned tensors are shared between observations, so don't modify them.
+    """
+
+    def __init__(
+        self,
+        element_id: Union[ElementId[1], ElementId[2], ElementId[3]],
+        mesh: Union[Mesh[1], Mesh[2], Mesh[3]],
+        domain: Union[Domain[1], Domain[2], Domain[3]],
+    ):
+        # Keep the domain alive so its `id` remains a valid cache key
+        self.domain = domain
+        self.num_points = mesh.number_of_grid_points()
+        self.map = ElementMap(element_id, domain)
+        self.logical_coordinates = logical_coordinates(mesh)
+        self.is_time_dependent = domain.blocks[
+            element_id.block_id
+        ].is_time_dependent()
+
+    @cached_property
+    def _static_inertial_coordinates(self):
+        return self.map(self.logical_coordinates)
+
+    @cached_property
+    def _static_jacobian(self):
+        return self.map.jacobian(self.logical_coordinates)
+
+    @cached_property
+    def _static_inv_jacobian(self):
+        return self.map.inv_jacobian(self.logical_coordinates)
+
+    @cached_property
+    def _static_det_jacobian(self):
+        return determinant(self._static_jacobian)
+
+    def inertial_coordinates(self, time, functions_of_time):
+        if not self.is_time_dependent:
+            return self._static_inertial_coordinates
+        return self.map(self.logical_coordinates, time, functions_of_time)
+
+    def jacobian(self, time, functions_of_time):
+        if not self.is_time_dependent:
+            return self._static_jacobian
+        return self.map.jacobian(
+            self.logical_coordinates, time, functions_of_time
+        )
+
+    def inv_jacobian(self, time, functions_of_time):
+        if not self.is_time_dependent:
+            return self._static_inv_jacobian
+        return self.map.inv_jacobian(
+            self.logical_coordinates, time, functions_of_time
+        )
+
+    def det_jacobian(self, jacobian):
+        if not self.is_time_dependent:
+            return self._static_det_jacobian
+        return determinant(jacobian)
+
+
+class _ObservationGeometry:
+    """Inertial coordinates and Jacobians of elements at one observation
+
+    They are computed for all elements at once with 'BatchedElementMaps' when
+    the first element needs them, so add all elements before accessing any.
+    The Jacobians are only computed if an element needs them.
+    """
+
+    def __init__(
+        self,
+        domain: Union[Domain[1], Domain[2], Domain[3]],
+        time: float,
+        functions_of_time: Optional[Dict[str, FunctionOfTime]],
+    ):
+        self.domain = domain
+        self.time = time
+        self.functions_of_time = functions_of_time
+        self.element_ids = []
+        self.meshes = []
+        self.mesh_keys = []
+        self.num_points = 0
+
+    def add(
+        self,
+        element_id: Union[ElementId[1], ElementId[2], ElementId[3]],
+        mesh: Union[Mesh[1], Mesh[2], Mesh[3]],
+        mesh_key: Tuple,
+    ) -> slice:
+        """Add an element and return the slice of its points in the data"""
+        start = self.num_points
+        self.element_ids.append(element_id)
+        self.meshes.append(mesh)
+        self.mesh_keys.append(mesh_key)
+        self.num_points += mesh.number_of_grid_points()
+        return slice(start, self.num_points)
+
+    @cached_property
+    def maps(self):
+        return _batched_element_maps_cache.get(
+            self.element_ids, self.meshes, self.mesh_keys, self.domain
+        )
+
+    @cached_property
+    def inertial_coordinates(self) -> np.ndarray:
+        return self.maps.inertial_coordinates(self.time, self.functions_of_time)
+
+    @cached_property
+    def jacobians(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return self.maps.jacobians(self.time, self.functions_of_time)
+
+
+class _BatchedElementGeometry:
+    """Geometry of an element that is a slice of an '_ObservationGeometry'"""
+
+    def __init__(
+        self,
+        geometry: _ElementGeometry,
+        observation_geometry: _ObservationGeometry,
+        points: slice,
+    ):
+        self.map = geometry.map
+        self.logical_coordinates = geometry.logical_coordinates
+        self.dim = len(self.logical_coordinates)
+        self._observation_geometry = observation_geometry
+        self._points = points
+
+    def inertial_coordinates(self, time, functions_of_time):
+        return tnsr.I[DataVector, self.dim, Frame.Inertial](
+            self._observation_geometry.inertial_coordinates[:, self._points]
+        )
+
+    def jacobian(self, time, functions_of_time):
+        return Jacobian[DataVector, self.dim](
+            self._observation_geometry.jacobians[0][:, self._points]
+        )
+
+    def inv_jacobian(self, time, functions_of_time):
+        return InverseJacobian[DataVector, self.dim](
+            self._observation_geometry.jacobians[1][:, self._points]
+        )
+
+    def det_jacobian(self, jacobian):
+        return Scalar[DataVector](
+            self._observation_geometry.jacobians[2][self._points]
+        )
+
+
+class _BatchedElementMapsCache:
+    """The 'BatchedElementMaps' of the last set of elements that was mapped
+
+    Consecutive observations usually have the same elements in time-dependent
+    blocks, so their ElementLogical -> Grid coordinates and Jacobians are
+    reused and only the Grid -> Inertial maps are evaluated.
+    """
+
+    def __init__(self):
+        self._key = None
+        # Keep the domain alive so its `id` remains a valid cache key
+        self._domain = None
+        self._maps = None
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        element_ids: Sequence[Union[ElementId[1], ElementId[2], ElementId[3]]],
+        meshes: Sequence[Union[Mesh[1], Mesh[2], Mesh[3]]],
+        mesh_keys: Sequence[Tuple],
+        domain: Union[Domain[1], Domain[2], Domain[3]],
+    ):
+        key = (
+            id(domain),
+            tuple(str(element_id) for element_id in element_ids),
+            tuple(mesh_keys),
+        )
+        with self._lock:
+            if key == self._key:
+                return self._maps
+        maps = BatchedElementMaps[meshes[0].dim](element_ids, meshes, domain)
+        with self._lock:
+            self._key = key
+            self._domain = domain
+            self._maps = maps
+        return maps
+
+    def clear(self):
+        with self._lock:
+            self._key = None
+            self._domain = None
+            self._maps = None
+
+
+_batched_element_maps_cache = _BatchedElementMapsCache()
+
+
+class _ElementGeometryCache:
+    """Least-recently-used cache of '_ElementGeometry'
+
+    The memory is bounded by the total number of grid points of the cached
+    elements. The most recently used element is always kept.
+    """
+
+    def __init__(self, max_num_points: int):
+        self.max_num_points = max_num_points
+        self._entries = collections.OrderedDict()
+        self._num_points = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(
+        self,
+        element_id: Union[ElementId[1], ElementId[2], ElementId[3]],
+        mesh: Union[Mesh[1], Mesh[2], Mesh[3]],
+        mesh_key: Tuple,
+        domain: Union[Domain[1], Domain[2], Domain[3]],
+    ) -> _ElementGeometry:
+        key = (id(domain), str(element_id), mesh_key)
+        with self._lock:
+            geometry = self._entries.get(key)
+            if geometry is not None:
+                self._entries.move_to_end(key)
+                return geometry
+        geometry = _ElementGeometry(element_id, mesh, domain)
+        with self._lock:
+            if key not in self._entries:
+                self._num_points += geometry.num_points
+            self._entries[key] = geometry
+            self._evict()
+        return geometry
+
+    def resize(self, max_num_points: int):
+        with self._lock:
+            self.max_num_points = max_num_points
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._num_points = 0
+
+    def _evict(self):
+        while self._num_points > self.max_num_points and len(self._entries) > 1:
+            _, geometry = self._entries.popitem(last=False)
+            self._num_points -= geometry.num_points
+
+
+# A 3D element with 10^3 grid points takes up about 0.4 MB in the cache if its
+# Jacobians are used, so the default size corresponds to a few hundred MB.
+_element_geometry_cache = _ElementGeometryCache(max_num_points=2**20)
+
+
+def clear_element_geometry_cache():
+    """Discard the element maps and coordinates cached by 'iter_elements'"""
+    _element_geometry_cache.clear()
+    _batched_element_maps_cache.clear()
+
+
+def set_element_geometry_cache_size(max_num_points: int):
+    """Bound the total number of grid points cached by 'iter_elements'
+
+    'iter_elements' caches the element maps, logical coordinates, and
+    time-independent parts of the inertial coordinates and Jacobians of the
+    elements it iterates over, so they aren't recomputed for every observation.
+    The memory this cache takes up is proportional to 'max_num_points'.
+    """
+    if max_num_points < 0:
+        raise ValueError(
+            "The element geometry cache size must be non-negative, but is"
+            f" {max_num_points}."
+        )
+    _element_geometry_cache.resize(max_num_points)
 
 
 @dataclass(frozen=True)
@@ -40,6 +347,10 @@ class Element:
     functions_of_time: Optional[Dict[str, FunctionOfTime]] = None
     # Offset and length in contiguous tensor data corresponding to this element
     data_slice: Optional[slice] = None
+    # Geometry shared with the same element at other observations
+    _geometry: Optional[Union[_ElementGeometry, _BatchedElementGeometry]] = (
+        field(default=None, repr=False, compare=False)
+    )
 
     @property
     def dim(self):
@@ -47,6 +358,8 @@ class Element:
 
     @cached_property
     def logical_coordinates(self):
+        if self._geometry is not None:
+            return self._geometry.logical_coordinates
         return logical_coordinates(self.mesh)
 
     @cached_property
@@ -55,6 +368,10 @@ class Element:
             "No element map available. Ensure the domain is written in the H5"
             " file."
         )
+        if self._geometry is not None:
+            return self._geometry.inertial_coordinates(
+                self.time, self.functions_of_time
+            )
         return self.map(
             self.logical_coordinates, self.time, self.functions_of_time
         )
@@ -65,6 +382,10 @@ class Element:
             "No element map available. Ensure the domain is written in the H5"
             " file."
         )
+        if self._geometry is not None:
+            return self._geometry.inv_jacobian(
+                self.time, self.functions_of_time
+            )
         return self.map.inv_jacobian(
             self.logical_coordinates, self.time, self.functions_of_time
         )
@@ -75,12 +396,16 @@ class Element:
             "No element map available. Ensure the domain is written in the H5"
             " file."
         )
+        if self._geometry is not None:
+            return self._geometry.jacobian(self.time, self.functions_of_time)
         return self.map.jacobian(
             self.logical_coordinates, self.time, self.functions_of_time
         )
 
     @cached_property
     def det_jacobian(self):
+        if self._geometry is not None:
+            return self._geometry.det_jacobian(self.jacobian)
         return determinant(self.jacobian)
 
 
@@ -113,33 +438,65 @@ def include_element(
     )
 
 
-def iter_elements(
-    volfiles: Union[spectre_h5.H5Vol, Iterable[spectre_h5.H5Vol]],
-    obs_ids: Optional[Union[int, Sequence[int]]],
-    tensor_components: Optional[Iterable[str]] = None,
-    element_patterns: Optional[Sequence[str]] = None,
-):
-    """Return volume data by element
+@dataclass(frozen=True)
+class _ObservationData:
+    """Everything 'iter_elements' reads from a volume file for an observation"""
 
-    Arguments:
-      volfiles: Open spectre H5 volume files. Can be a single volfile or a list,
-        but can also be an iterator that opens and closes the files on demand.
-      obs_id: An observation ID, a list of observation IDs, or None to iterate
-        over all observation IDs.
-      tensor_components: Tensor components to retrieve. Can be empty.
-      element_patterns: If specified, include only elements that match any of
-        these glob patterns. See 'IterElements.include_element' for details.
+    dim: int
+    grid_names: Sequence[str]
+    # Indices of the grids that are included in the iteration
+    grid_indices: Sequence[int]
+    extents: Sequence[Sequence[int]]
+    bases: Sequence[Sequence[Basis]]
+    quadratures: Sequence[Sequence[Quadrature]]
+    offsets_and_lengths: Sequence[Tuple[int, int]]
+    time: float
+    domain: Optional[Union[Domain[1], Domain[2], Domain[3]]]
+    functions_of_time: Optional[Dict[str, FunctionOfTime]]
+    # Tensor data read from the file and the slice of each included grid's data
+    # in it, in the order of 'grid_indices'
+    tensor_data: Optional[np.ndarray] = None
+    tensor_data_slices: Optional[Sequence[slice]] = None
+    # Number of grid points of the included grids in time-dependent blocks.
+    # Their coordinates and Jacobians are computed for every observation.
+    num_time_dependent_points: int = 0
 
-    Returns: Iterator over all elements in all 'volfiles'. Yields either just
-      the 'Element' with structural information if 'tensor_components' is
-      empty, or both the 'Element' and an 'np.ndarray' with the tensor data
-      listed in 'tensor_components'. The tensor data has shape
-      `(len(tensor_components), num_points)`.
+    @property
+    def nbytes(self) -> int:
+        """Memory taken up by the tensor data and the geometry of the
+        observation
+
+        The geometry of elements in time-dependent blocks is computed for every
+        observation: inertial coordinates and, if needed, Jacobian, inverse
+        Jacobian, and its determinant. This counts all of them, so it is an
+        upper bound. The geometry of elements in time-independent blocks is
+        bounded by the element geometry cache instead (see
+        'set_element_geometry_cache_size').
+        """
+        tensor_bytes = (
+            0 if self.tensor_data is None else self.tensor_data.nbytes
+        )
+        values_per_point = self.dim + 2 * self.dim**2 + 1
+        geometry_bytes = (
+            self.num_time_dependent_points
+            * values_per_point
+            * np.dtype(np.float64).itemsize
+        )
+        return tensor_bytes + geometry_bytes
+
+
+def _read_observations(
+    volfiles: Iterable[spectre_h5.H5Vol],
+    obs_ids: Optional[Sequence[int]],
+    tensor_components: Optional[Sequence[str]],
+    element_patterns: Optional[Sequence[str]],
+    memory_map: bool = False,
+    dtype: Optional[np.dtype] = None,
+) -> Iterator[_ObservationData]:
+    """Read the data that 'iter_elements' needs for one observation at a time
+
+    This is the only part of 'iter_elements' that accesses the volume files.
     """
-    if isinstance(volfiles, spectre_h5.H5Vol):
-        volfiles = [volfiles]
-    if isinstance(obs_ids, int):
-        obs_ids = [obs_ids]
     # Assuming the domain is the same in all volfiles at all observations to
     # speed up the script
     domain = None
@@ -157,69 +514,499 @@ def iter_elements(
             # if the volfile doesn't contain any of the requested elements
             all_grid_names = volfile.get_grid_names(obs_id)
             if element_patterns is not None:
-                grid_names = [
-                    grid_name
-                    for grid_name in all_grid_names
+                grid_indices = [
+                    i
+                    for i, grid_name in enumerate(all_grid_names)
                     if include_element(grid_name, element_patterns)
                 ]
             else:
-                grid_names = all_grid_names
-            if not grid_names:
+                grid_indices = range(len(all_grid_names))
+            if not grid_indices:
                 continue
-            element_ids = [ElementId[dim](name) for name in grid_names]
-            # Reconstruct meshes
-            all_extents = volfile.get_extents(obs_id)
-            all_bases = volfile.get_bases(obs_id)
-            all_quadratures = volfile.get_quadratures(obs_id)
-            meshes = [
-                Mesh[dim](extents, bases, quadratures)
-                for grid_name, extents, bases, quadratures in zip(
-                    all_grid_names, all_extents, all_bases, all_quadratures
-                )
-                if grid_name in grid_names
-            ]
+            all_offsets_and_lengths = volfile.get_offsets_and_lengths(obs_id)
             # Deserialize domain and functions of time
             if not domain:
                 serialized_domain = volfile.get_domain(obs_id)
                 if serialized_domain:
                     domain = deserialize_domain[dim](serialized_domain)
-            time = volfile.get_observation_value(obs_id)
+            extents = volfile.get_extents(obs_id)
+            num_time_dependent_points = 0
             if domain and domain.is_time_dependent():
                 functions_of_time = deserialize_functions_of_time(
                     volfile.get_functions_of_time(obs_id)
                 )
+                for i in grid_indices:
+                    block_id = ElementId[dim](all_grid_names[i]).block_id
+                    if domain.blocks[block_id].is_time_dependent():
+                        num_time_dependent_points += np.prod(extents[i])
             else:
                 functions_of_time = None
             # Pre-load the tensor data because it's stored contiguously for all
-            # grids in the file
+            # grids in the file. If only some elements are selected, read only
+            # their data. The selected data is stored one element after the
+            # other, so we keep track of where each element's data starts.
+            tensor_data = None
+            tensor_data_slices = None
             if tensor_components:
-                tensor_data = np.asarray(
-                    [
-                        volfile.get_tensor_component(obs_id, component).data
-                        for component in tensor_components
+                if memory_map:
+                    # Slicing memory-mapped data is lazy, so there's no need to
+                    # select the data of individual elements. Memory-mapped data
+                    # can't be converted to another 'dtype' without reading it.
+                    tensor_data = map_tensor_components(
+                        volfile, obs_id, tensor_components
+                    )
+                    if dtype is not None and tensor_data.dtype != dtype:
+                        tensor_data = None
+                    tensor_data_slices = [
+                        slice(offset, offset + length)
+                        for offset, length in (
+                            all_offsets_and_lengths[i] for i in grid_indices
+                        )
                     ]
+                if tensor_data is None and element_patterns is not None:
+                    selected_offsets_and_lengths = [
+                        all_offsets_and_lengths[i] for i in grid_indices
+                    ]
+                    tensor_data = volfile.get_tensor_components(
+                        obs_id,
+                        tensor_components,
+                        dtype=dtype,
+                        offsets_and_lengths=selected_offsets_and_lengths,
+                    )
+                    selected_offsets = np.cumsum(
+                        [0]
+                        + [length for _, length in selected_offsets_and_lengths]
+                    )
+                    tensor_data_slices = [
+                        slice(offset, next_offset)
+                        for offset, next_offset in zip(
+                            selected_offsets[:-1], selected_offsets[1:]
+                        )
+                    ]
+                elif tensor_data is None:
+                    tensor_data = volfile.get_tensor_components(
+                        obs_id, tensor_components, dtype=dtype
+                    )
+                    tensor_data_slices = [
+                        slice(offset, offset + length)
+                        for offset, length in all_offsets_and_lengths
+                    ]
+            yield _ObservationData(
+                dim=dim,
+                grid_names=all_grid_names,
+                grid_indices=grid_indices,
+                extents=extents,
+                bases=volfile.get_bases(obs_id),
+                quadratures=volfile.get_quadratures(obs_id),
+                offsets_and_lengths=all_offsets_and_lengths,
+                time=volfile.get_observation_value(obs_id),
+                domain=domain,
+                functions_of_time=functions_of_time,
+                tensor_data=tensor_data,
+                tensor_data_slices=tensor_data_slices,
+                num_time_dependent_points=int(num_time_dependent_points),
+            )
+
+
+class _PrefetchError:
+    """Wraps an exception raised while prefetching observations"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch(
+    observations: Iterator[_ObservationData],
+    depth: int,
+    memory_budget: Optional[int],
+) -> Iterator[_ObservationData]:
+    """Read 'observations' ahead in a background thread
+
+    Up to 'depth' observations are read ahead of the one that is being consumed.
+    If 'memory_budget' is specified, no further observations are read ahead
+    while the observations that were read ahead and the one that is being
+    consumed take up at least this many bytes (see '_ObservationData.nbytes').
+
+    Only the background thread accesses the volume files while the iteration is
+    running. The bulk reads of tensor data release the GIL, so they overlap
+    with the consumer, and they are serialized by a lock in the HDF5 bindings.
+    Other HDF5 calls hold the GIL. Therefore, HDF5 is never called
+    concurrently, as long as the consumer doesn't make HDF5 calls itself
+    (e.g. with h5py) while the iteration is running.
+    """
+    queue = collections.deque()
+    condition = threading.Condition()
+    pending_bytes = 0
+    stop = False
+
+    def has_capacity():
+        return stop or (
+            len(queue) < depth
+            and (
+                memory_budget is None
+                or not queue
+                or pending_bytes < memory_budget
+            )
+        )
+
+    def read_ahead():
+        nonlocal pending_bytes
+        while True:
+            with condition:
+                condition.wait_for(has_capacity)
+                if stop:
+                    return
+            try:
+                observation = next(observations, _PREFETCH_DONE)
+            except BaseException as error:
+                observation = _PrefetchError(error)
+            with condition:
+                queue.append(observation)
+                if isinstance(observation, _ObservationData):
+                    pending_bytes += observation.nbytes
+                condition.notify_all()
+            if not isinstance(observation, _ObservationData):
+                return
+
+    thread = threading.Thread(
+        target=read_ahead, name="iter_elements prefetch", daemon=True
+    )
+    thread.start()
+    # The observation that is being consumed counts against the memory budget
+    # until the consumer asks for the next one, because its data and geometry
+    # are still in use
+    consumed_bytes = 0
+    try:
+        while True:
+            with condition:
+                pending_bytes -= consumed_bytes
+                consumed_bytes = 0
+                condition.notify_all()
+                condition.wait_for(lambda: queue)
+                observation = queue.popleft()
+                if isinstance(observation, _ObservationData):
+                    consumed_bytes = observation.nbytes
+            if observation is _PREFETCH_DONE:
+                return
+            if isinstance(observation, _PrefetchError):
+                raise observation.error
+            yield observation
+    finally:
+        with condition:
+            stop = True
+            condition.notify_all()
+        thread.join()
+
+
+def iter_elements(
+    volfiles: Union[spectre_h5.H5Vol, Iterable[spectre_h5.H5Vol]],
+    obs_ids: Optional[Union[int, Sequence[int]]],
+    tensor_components: Optional[Iterable[str]] = None,
+    element_patterns: Optional[Sequence[str]] = None,
+    prefetch: int = 0,
+    prefetch_memory_budget: Optional[int] = None,
+    memory_map: bool = False,
+    dtype: Optional[np.dtype] = None,
+):
+    """Return volume data by element
+
+    Arguments:
+      volfiles: Open spectre H5 volume files. Can be a single volfile or a list,
+        but can also be an iterator that opens and closes the files on demand.
+      obs_id: An observation ID, a list of observation IDs, or None to iterate
+        over all observation IDs.
+      tensor_components: Tensor components to retrieve. Can be empty.
+      element_patterns: If specified, include only elements that match any of
+        these glob patterns. See 'IterElements.include_element' for details.
+      prefetch: Number of observations to read ahead in a background thread
+        while the elements of the current observation are being consumed. The
+        next observation can also be in the next volfile. Set to 0 (default)
+        to read synchronously. Don't access the 'volfiles' while iterating in
+        this mode, because they are being read in the background. They may
+        also be advanced (e.g. opened and closed) ahead of the iteration.
+        Reading the tensor data releases the GIL, so it overlaps with the
+        processing of the elements. Don't make other HDF5 calls (e.g. with
+        h5py) while iterating in this mode unless the HDF5 library is
+        thread-safe, because only the reads of the volfiles are serialized.
+      prefetch_memory_budget: If specified, stop reading ahead while the
+        observations that were read ahead and the one that is being consumed
+        take up at least this many bytes. This includes their tensor data and
+        the inertial coordinates and Jacobians of elements in time-dependent
+        blocks. At least one observation is always read ahead.
+      memory_map: Memory-map the tensor data if the volfiles store it
+        contiguously and uncompressed (see
+        'spectre.IO.H5.MemoryMap.map_tensor_components'). The yielded tensor
+        data are then lazy read-only views into the files in the precision
+        the data is stored in. Falls back to reading the data otherwise.
+      dtype: Data type of the yielded tensor data, float32 or float64. Data
+        stored in a different precision is converted while reading, so no
+        intermediate copy is made. Defaults to the precision the data is stored
+        in: float32 if all 'tensor_components' are stored in single precision,
+        and float64 otherwise. Pass 'np.float64' to construct 'DataVector's or
+        'Tensor's from the tensor data.
+
+    Returns: Iterator over all elements in all 'volfiles'. Yields either just
+      the 'Element' with structural information if 'tensor_components' is
+      empty, or both the 'Element' and an 'np.ndarray' with the tensor data
+      listed in 'tensor_components'. The tensor data has shape
+      `(len(tensor_components), num_points)` and the data type 'dtype'.
+    """
+    if isinstance(volfiles, spectre_h5.H5Vol):
+        volfiles = [volfiles]
+    if isinstance(obs_ids, int):
+        obs_ids = [obs_ids]
+    if tensor_components is not None:
+        tensor_components = list(tensor_components)
+    if prefetch < 0:
+        raise ValueError(
+            f"The prefetch depth must be non-negative, but is {prefetch}."
+        )
+    observations = _read_observations(
+        volfiles,
+        obs_ids,
+        tensor_components,
+        element_patterns,
+        memory_map,
+        dtype,
+    )
+    if prefetch > 0:
+        observations = _prefetch(
+            observations, depth=prefetch, memory_budget=prefetch_memory_budget
+        )
+    for observation in observations:
+        dim = observation.dim
+        # Elements in time-dependent blocks are mapped to inertial coordinates
+        # all at once, so collect all elements of this observation first
+        observation_geometry = (
+            _ObservationGeometry(
+                observation.domain,
+                observation.time,
+                observation.functions_of_time,
+            )
+            if observation.domain
+            else None
+        )
+        elements = []
+        for i in observation.grid_indices:
+            element_id = ElementId[dim](observation.grid_names[i])
+            mesh = Mesh[dim](
+                observation.extents[i],
+                observation.bases[i],
+                observation.quadratures[i],
+            )
+            offset, length = observation.offsets_and_lengths[i]
+            data_slice = slice(offset, offset + length)
+            if observation.domain:
+                # Reuse the element map and coordinates from previous
+                # observations
+                mesh_key = (
+                    tuple(observation.extents[i]),
+                    tuple(observation.bases[i]),
+                    tuple(observation.quadratures[i]),
                 )
-            # Iterate elements in this file
-            for grid_name, element_id, mesh in zip(
-                grid_names, element_ids, meshes
-            ):
-                offset, length = spectre_h5.offset_and_length_for_grid(
-                    grid_name, all_grid_names, all_extents
+                geometry = _element_geometry_cache.get(
+                    element_id, mesh, mesh_key, observation.domain
                 )
-                data_slice = slice(offset, offset + length)
-                if domain:
-                    element_map = ElementMap(element_id, domain)
-                else:
-                    element_map = None
-                element = Element(
+                element_map = geometry.map
+                if geometry.is_time_dependent:
+                    geometry = _BatchedElementGeometry(
+                        geometry,
+                        observation_geometry,
+                        observation_geometry.add(element_id, mesh, mesh_key),
+                    )
+            else:
+                geometry = None
+                element_map = None
+            elements.append(
+                Element(
                     element_id,
                     mesh=mesh,
                     map=element_map,
-                    time=time,
-                    functions_of_time=functions_of_time,
+                    time=observation.time,
+                    functions_of_time=observation.functions_of_time,
                     data_slice=data_slice,
+                    _geometry=geometry,
                 )
-                if tensor_components:
-                    yield element, tensor_data[:, offset : offset + length]
-                else:
-                    yield element
+            )
+        # Iterate elements in this observation
+        for selected_index, element in enumerate(elements):
+            if tensor_components:
+                yield element, observation.tensor_data[
+                    :, observation.tensor_data_slices[selected_index]
+                ]
+            else:
+                yield element
+
+
+# Arguments shared by all tasks of 'map_reduce_elements'. They are set once in
+# every worker process by '_init_map_reduce_worker', so they aren't sent along
+# with every task.
+_map_reduce_args = None
+
+
+def _init_map_reduce_worker(*args):
+    global _map_reduce_args
+    _map_reduce_args = args
+
+
+def _map_reduce_task(task, args=None) -> Tuple[bool, Any]:
+    """Map and reduce the elements of one observation in some files
+
+    Runs in a worker process. Each worker opens the files itself, so no HDF5
+    handles are shared between processes. Returns whether any element was
+    included, and the reduced result.
+    """
+    h5_files, obs_id = task
+    if args is None:
+        args = _map_reduce_args
+    (
+        subfile_name,
+        map_func,
+        reduce_func,
+        tensor_components,
+        element_patterns,
+        per_observation,
+        dtype,
+    ) = args
+    with contextlib.ExitStack() as open_h5_files:
+        volfiles = [
+            open_h5_files.enter_context(
+                spectre_h5.H5File(h5_file, "r")
+            ).get_vol(subfile_name)
+            for h5_file in h5_files
+        ]
+        items = iter_elements(
+            volfiles, obs_id, tensor_components, element_patterns, dtype=dtype
+        )
+        if per_observation:
+            items = list(items)
+            if not items:
+                return False, None
+            return True, map_func(items)
+        if tensor_components:
+            results = (map_func(*item) for item in items)
+        else:
+            results = (map_func(item) for item in items)
+        sentinel = object()
+        result = next(results, sentinel)
+        if result is sentinel:
+            return False, None
+        return True, functools.reduce(reduce_func, results, result)
+
+
+def map_reduce_elements(
+    h5_files: Union[str, Sequence[str]],
+    subfile_name: str,
+    map_func: Callable[..., Any],
+    reduce_func: Callable[[Any, Any], Any],
+    obs_ids: Optional[Union[int, Sequence[int]]] = None,
+    tensor_components: Optional[Iterable[str]] = None,
+    element_patterns: Optional[Sequence[str]] = None,
+    per_observation: bool = False,
+    dtype: Optional[np.dtype] = None,
+    num_processes: Optional[int] = None,
+):
+    """Map a function over volume data elements in parallel and reduce results
+
+    The observations in all 'h5_files' are distributed over a pool of worker
+    processes. Each worker opens the files itself, so no HDF5 handles are
+    shared between processes (HDF5 is not thread-safe). The workers iterate
+    over the elements with 'iter_elements', apply 'map_func', and reduce the
+    results with 'reduce_func'. The partial results of all workers are then
+    reduced with 'reduce_func' in the order of the files and observations.
+
+    The worker processes are forked from this process on platforms that
+    support it, so they inherit its open HDF5 files. HDF5 shares the state of
+    a file that is opened more than once in a process, so close all files that
+    are passed in 'h5_files' before calling this function. This function
+    releases them from the pool of open H5 files of this process (see
+    'spectre.IO.H5.release_pooled_h5file') before forking.
+
+    Arguments:
+      h5_files: Paths to the H5 files containing volume data.
+      subfile_name: Name of the volume data subfile in the H5 files.
+      map_func: Function to apply to every element. It is called with the same
+        arguments that 'iter_elements' yields, i.e. either just the 'Element'
+        or the 'Element' and its tensor data. If 'per_observation' is True, it
+        is called once per observation with a list of these items. Must be
+        picklable, i.e. defined at module level (use 'functools.partial' to
+        pass additional arguments), unless the worker processes are forked.
+      reduce_func: Function that combines two results of 'map_func' (or two
+        already combined results) into one. Must be associative, and picklable
+        unless the worker processes are forked (see 'map_func'). The results
+        must be picklable.
+      obs_ids: An observation ID, a list of observation IDs, or None to process
+        all observation IDs.
+      tensor_components: Tensor components to retrieve. Can be empty.
+      element_patterns: If specified, include only elements that match any of
+        these glob patterns. See 'IterElements.include_element' for details.
+      per_observation: Call 'map_func' once per observation rather than once
+        per element. It receives the elements of the observation from all
+        'h5_files', in the order of the files. The results are reduced in the
+        order in which the observations first appear in the files.
+      dtype: Data type of the tensor data passed to 'map_func'. See
+        'iter_elements' for details.
+      num_processes: Number of worker processes. Defaults to the number of
+        CPUs. Set to 1 to run serially in this process.
+
+    Returns: The reduced result, or None if no element was included.
+    """
+    if isinstance(h5_files, str):
+        h5_files = [h5_files]
+    if isinstance(obs_ids, int):
+        obs_ids = [obs_ids]
+    selected_obs_ids = set(obs_ids) if obs_ids else None
+    if tensor_components is not None:
+        tensor_components = list(tensor_components)
+    # Each task is a list of files and an observation ID. With
+    # 'per_observation', the task holds all files that contain the observation.
+    # Otherwise, every file is a separate task so the files are read in
+    # parallel as well.
+    tasks = []
+    observation_tasks = {}
+    for h5_file in h5_files:
+        # Don't keep the file open, so it isn't inherited by the workers
+        spectre_h5.release_pooled_h5file(h5_file)
+        with spectre_h5.H5File(h5_file, "r") as open_h5_file:
+            all_obs_ids = open_h5_file.get_vol(
+                subfile_name
+            ).list_observation_ids()
+        for obs_id in all_obs_ids:
+            if selected_obs_ids is not None and obs_id not in selected_obs_ids:
+                continue
+            if not per_observation:
+                tasks.append(([h5_file], obs_id))
+            elif obs_id in observation_tasks:
+                observation_tasks[obs_id][0].append(h5_file)
+            else:
+                observation_tasks[obs_id] = ([h5_file], obs_id)
+                tasks.append(observation_tasks[obs_id])
+    args = (
+        subfile_name,
+        map_func,
+        reduce_func,
+        tensor_components,
+        element_patterns,
+        per_observation,
+        dtype,
+    )
+    if num_processes == 1 or len(tasks) <= 1:
+        partial_results = [_map_reduce_task(task, args) for task in tasks]
+    else:
+        with multiprocessing.Pool(
+            num_processes,
+            initializer=_init_map_reduce_worker,
+            initargs=args,
+        ) as pool:
+            # The tasks hold only file names and an observation ID, so
+            # distributing them one at a time balances the load cheaply
+            partial_results = pool.map(_map_reduce_task, tasks, chunksize=1)
+    partial_results = [
+        result for has_result, result in partial_results if has_result
+    ]
+    if not partial_results:
+        return None
+    return functools.reduce(reduce_func, partial_results)
@@ -0,0 +1,123 @@
+# Distributed under the MIT License.
+# See LICENSE.txt for details.
+
+import logging
+from typing import Optional, Sequence
+
+import numpy as np
+
+import spectre.IO.H5 as spectre_h5
+
+logger = logging.getLogger(__name__)
+
+
+def _dtype(use_float: bool) -> np.dtype:
+    return np.dtype(np.float32 if use_float else np.float64)
+
+
+def map_tensor_component(
+    volfile: spectre_h5.H5Vol, obs_id: int, tensor_component: str
+) -> np.ndarray:
+    """Read-only view of a tensor component that is memory-mapped if possible
+
+    If the tensor component is stored contiguously and uncompressed in the H5
+    file, the returned array is a memory-mapped view of the data in the file.
+    Its values are only paged in from disk when they are accessed, and
+    accessing the same observation repeatedly doesn't read and copy the data
+    again. Otherwise, the data is read into memory.
+
+    The returned array has the precision the data is stored in and is
+    read-only.
+    """
+    size, use_float = volfile.get_tensor_component_size_and_precision(
+        obs_id, tensor_component
+    )
+    location = volfile.get_tensor_component_file_location(
+        obs_id, tensor_component
+    )
+    if location is None:
+        data = volfile.get_tensor_component_array(obs_id, tensor_component)
+        data.flags.writeable = False
+        return data
+    file_name, offset = location
+    return np.memmap(
+        file_name,
+        dtype=_dtype(use_float),
+        mode="r",
+        offset=offset,
+        shape=(size,),
+    )
+
+
+def _map_tensor_components(
+    volfile: spectre_h5.H5Vol, obs_id: int, tensor_components: Sequence[str]
+) -> Optional[np.ndarray]:
+    """Memory-map the tensor components as a 2D array, or return None
+
+    This works if all components are stored contiguously with the same
+    precision, and the spacing between consecutive components in the file is
+    the same, which is the case when they were written one after the other.
+    """
+    sizes_and_precisions = [
+        volfile.get_tensor_component_size_and_precision(obs_id, component)
+        for component in tensor_components
+    ]
+    if len(set(sizes_and_precisions)) != 1:
+        return None
+    size, use_float = sizes_and_precisions[0]
+    locations = [
+        volfile.get_tensor_component_file_location(obs_id, component)
+        for component in tensor_components
+    ]
+    if any(location is None for location in locations):
+        return None
+    file_names = set(file_name for file_name, _ in locations)
+    if len(file_names) != 1:
+        return None
+    offsets = np.array([offset for _, offset in locations])
+    dtype = _dtype(use_float)
+    row_stride = offsets[1] - offsets[0] if len(offsets) > 1 else 0
+    if len(offsets) > 1 and (
+        row_stride < size * dtype.itemsize
+        or np.any(np.diff(offsets) != row_stride)
+    ):
+        return None
+    mapped_bytes = np.memmap(
+        file_names.pop(),
+        dtype=np.uint8,
+        mode="r",
+        offset=offsets[0],
+        shape=(row_stride * (len(offsets) - 1) + size * dtype.itemsize,),
+    )
+    return np.ndarray(
+        shape=(len(tensor_components), size),
+        dtype=dtype,
+        buffer=mapped_bytes,
+        strides=(row_stride, dtype.itemsize),
+    )
+
+
+def map_tensor_components(
+    volfile: spectre_h5.H5Vol, obs_id: int, tensor_components: Sequence[str]
+) -> np.ndarray:
+    """Read-only (components x points) view that is memory-mapped if possible
+
+    Like 'map_tensor_component', but returns the data of all
+    'tensor_components' in a 2D array with one row per component. The array is
+    a memory-mapped view of the file if all components are stored contiguously
+    and uncompressed with the same precision and at equal spacing in the file
+    (which is the case when they were written one after the other). Otherwise,
+    the data is read into memory with 'H5Vol.get_tensor_components'.
+    """
+    tensor_components = list(tensor_components)
+    if tensor_components:
+        mapped_data = _map_tensor_components(volfile, obs_id, tensor_components)
+        if mapped_data is not None:
+            return mapped_data
+        logger.debug(
+            "Can't memory-map tensor components at observation"
+            f" {obs_id}. Reading them instead."
+        )
+    data = volfile.get_tensor_components(obs_id, tensor_components)
+    data.flags.writeable = False
+    return data
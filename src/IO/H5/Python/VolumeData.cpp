@@ -3,24 +3,125 @@
 
 #include "IO/H5/Python/VolumeData.hpp"
 
+#include <cstddef>
+#include <mutex>
+#include <optional>
+#include <pybind11/numpy.h>
+#include <pybind11/operators.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
+#include <stdexcept>
 #include <string>
+#include <utility>
+#include <vector>
 
 #include "DataStructures/DataVector.hpp"
 #include "IO/H5/TensorData.hpp"
 #include "IO/H5/VolumeData.hpp"
+#include "IO/H5/WriteOptions.hpp"
+#include "Utilities/GetOutput.hpp"
+#include "Utilities/Gsl.hpp"
+#include "Utilities/TMPL.hpp"
 
 namespace py = pybind11;
 
 namespace py_bindings {
+namespace {
+// Serializes the bulk reads below, which run without the GIL. Only these reads
+// take the lock, so any other HDF5 call (e.g. from other bindings or from
+// h5py) must not run concurrently with them unless the HDF5 library is
+// thread-safe.
+std::mutex& bulk_read_mutex() {
+  static std::mutex mutex{};
+  return mutex;
+}
+
+// Invoke `read` with a `gsl::span` that views the memory of the Python `buffer`
+// so HDF5 can decode data into it directly. The buffer must be writable,
+// C-contiguous, and hold float32 or float64 values.
+template <typename ReadFunction>
+void read_into_buffer(const py::buffer& buffer, const ReadFunction& read) {
+  const py::buffer_info info = buffer.request(true);
+  const auto read_typed = [&info, &read](auto type_v) {
+    using T = tmpl::type_from<decltype(type_v)>;
+    // Only C-contiguous buffers can be filled by HDF5 directly
+    auto expected_stride = static_cast<py::ssize_t>(sizeof(T));
+    for (auto dim = static_cast<size_t>(info.ndim); dim > 0; --dim) {
+      if (info.shape[dim - 1] > 1 and
+          info.strides[dim - 1] != expected_stride) {
+        throw std::invalid_argument(
+            "The output buffer must be C-contiguous to read data into it.");
+      }
+      expected_stride *= info.shape[dim - 1];
+    }
+    gsl::span<T> span{static_cast<T*>(info.ptr),
+                      static_cast<size_t>(info.size)};
+    // Reading and decompressing the data can take a while, so let other Python
+    // threads run in the meantime (e.g. to consume data that was prefetched in
+    // a background thread). Release the GIL before taking the lock so a thread
+    // that waits for the lock never blocks the thread that holds it.
+    const py::gil_scoped_release release_gil{};
+    const std::lock_guard lock{bulk_read_mutex()};
+    read(make_not_null(&span));
+  };
+  if (info.format == py::format_descriptor<float>::format()) {
+    read_typed(tmpl::type_<float>{});
+  } else if (info.format == py::format_descriptor<double>::format()) {
+    read_typed(tmpl::type_<double>{});
+  } else {
+    throw std::invalid_argument(
+        "The output buffer must hold float32 or float64 values, but has "
+        "format '" +
+        info.format + "'.");
+  }
+}
+
+// Total number of values in the selected ranges of the contiguous data
+size_t selected_size(
+    const std::vector<std::pair<size_t, size_t>>& offsets_and_lengths) {
+  size_t size = 0;
+  for (const auto& offset_and_length : offsets_and_lengths) {
+    size += offset_and_length.second;
+  }
+  return size;
+}
+}  // namespace
+
 void bind_h5vol(py::module& m) {
+  py::class_<h5::WriteOptions>(m, "WriteOptions")
+      .def(py::init([](const size_t compression_level, const bool shuffle,
+                       const size_t chunk_size,
+                       std::vector<std::string> float_tensor_components) {
+             h5::WriteOptions options{compression_level, shuffle, chunk_size,
+                                      std::move(float_tensor_components)};
+             h5::detail::check_write_options(options);
+             return options;
+           }),
+           py::arg("compression_level") = 5, py::arg("shuffle") = true,
+           py::arg("chunk_size") = 131'072,
+           py::arg("float_tensor_components") = std::vector<std::string>{})
+      .def_static("uncompressed", &h5::WriteOptions::uncompressed)
+      .def_readwrite("compression_level", &h5::WriteOptions::compression_level)
+      .def_readwrite("shuffle", &h5::WriteOptions::shuffle)
+      .def_readwrite("chunk_size", &h5::WriteOptions::chunk_size)
+      .def_readwrite("float_tensor_components",
+                     &h5::WriteOptions::float_tensor_components)
+      .def("__repr__",
+           [](const h5::WriteOptions& options) {
+             return "WriteOptions" + get_output(options);
+           })
+      .def(py::self == py::self)
+      .def(py::self != py::self);
   // Wrapper for basic H5VolumeData operations
   py::class_<h5::VolumeData>(m, "H5Vol")
       .def_static("extension", &h5::VolumeData::extension)
+      .def_static("index_extension", &h5::VolumeData::index_extension)
       .def("get_header", &h5::VolumeData::get_header)
       .def("get_version", &h5::VolumeData::get_version)
       .def("get_dimension", &h5::VolumeData::get_dimension)
+      .def("get_write_options", &h5::VolumeData::get_write_options)
+      .def("set_write_options", &h5::VolumeData::set_write_options,
+           py::arg("write_options"))
       .def("write_volume_data", &h5::VolumeData::write_volume_data,
            py::arg("observation_id"), py::arg("observation_value"),
            py::arg("elements"), py::arg("serialized_domain") = std::nullopt,
@@ -38,10 +139,116 @@ void bind_h5vol(py::module& m) {
            py::arg("observation_id"))
       .def("list_tensor_components", &h5::VolumeData::list_tensor_components,
            py::arg("observation_id"))
-      .def("get_tensor_component", &h5::VolumeData::get_tensor_component,
+      .def("get_tensor_component",
+           py::overload_cast<size_t, const std::string&>(
+               &h5::VolumeData::get_tensor_component, py::const_),
+           py::arg("observation_id"), py::arg("tensor_component"))
+      .def("get_tensor_component",
+           py::overload_cast<size_t, const std::string&,
+                             const std::vector<std::pair<size_t, size_t>>&>(
+               &h5::VolumeData::get_tensor_component, py::const_),
+           py::arg("observation_id"), py::arg("tensor_component"),
+           py::arg("offsets_and_lengths"))
+      .def("get_tensor_component_size_and_precision",
+           &h5::VolumeData::get_tensor_component_size_and_precision,
+           py::arg("observation_id"), py::arg("tensor_component"))
+      .def("get_tensor_component_file_location",
+           &h5::VolumeData::get_tensor_component_file_location,
            py::arg("observation_id"), py::arg("tensor_component"))
+      .def(
+          "get_tensor_component_array",
+          [](const h5::VolumeData& volfile, const size_t observation_id,
+             const std::string& tensor_component, std::optional<py::buffer> out,
+             const std::optional<std::vector<std::pair<size_t, size_t>>>&
+                 offsets_and_lengths) -> py::buffer {
+            if (not out.has_value()) {
+              auto [size, use_float] =
+                  volfile.get_tensor_component_size_and_precision(
+                      observation_id, tensor_component);
+              if (offsets_and_lengths.has_value()) {
+                size = selected_size(*offsets_and_lengths);
+              }
+              if (use_float) {
+                out = py::array_t<float>(static_cast<py::ssize_t>(size));
+              } else {
+                out = py::array_t<double>(static_cast<py::ssize_t>(size));
+              }
+            }
+            read_into_buffer(
+                *out, [&volfile, &observation_id, &tensor_component,
+                       &offsets_and_lengths](const auto buffer) {
+                  volfile.read_tensor_component(buffer, observation_id,
+                                                tensor_component,
+                                                offsets_and_lengths);
+                });
+            return *std::move(out);
+          },
+          py::arg("observation_id"), py::arg("tensor_component"),
+          py::arg("out") = std::nullopt,
+          py::arg("offsets_and_lengths") = std::nullopt,
+          "Read the tensor component from all grids directly into a buffer "
+          "without intermediate copies.\n\n"
+          "If 'out' is None, a new NumPy array is allocated with the precision "
+          "the data is stored in (float32 or float64). Otherwise, 'out' must "
+          "be a writable, C-contiguous float32 or float64 buffer (e.g. a NumPy "
+          "array) with the size of the tensor component, and is filled in "
+          "place. Data stored in a different precision is converted while "
+          "reading. Returns the filled buffer.\n\n"
+          "If 'offsets_and_lengths' is specified, only these sorted, "
+          "non-overlapping ranges of the data are read (e.g. the data of a "
+          "subset of the grids, see 'get_offsets_and_lengths').")
+      .def(
+          "get_tensor_components",
+          [](const h5::VolumeData& volfile, const size_t observation_id,
+             const std::vector<std::string>& tensor_components,
+             const py::object& dtype,
+             const std::optional<std::vector<std::pair<size_t, size_t>>>&
+                 offsets_and_lengths) -> py::array {
+            const size_t num_points =
+                selected_size(offsets_and_lengths.value_or(
+                    volfile.get_offsets_and_lengths(observation_id)));
+            bool all_use_float = not tensor_components.empty();
+            if (dtype.is_none()) {
+              for (const auto& tensor_component : tensor_components) {
+                all_use_float &= volfile
+                                     .get_tensor_component_size_and_precision(
+                                         observation_id, tensor_component)
+                                     .second;
+              }
+            }
+            py::array result{
+                dtype.is_none() ? (all_use_float ? py::dtype::of<float>()
+                                                 : py::dtype::of<double>())
+                                : py::dtype::from_args(dtype),
+                std::vector<py::ssize_t>{
+                    static_cast<py::ssize_t>(tensor_components.size()),
+                    static_cast<py::ssize_t>(num_points)}};
+            read_into_buffer(
+                result, [&volfile, &observation_id, &tensor_components,
+                         &offsets_and_lengths](const auto buffer) {
+                  volfile.read_tensor_components(buffer, observation_id,
+                                                 tensor_components,
+                                                 offsets_and_lengths);
+                });
+            return result;
+          },
+          py::arg("observation_id"), py::arg("tensor_components"),
+          py::arg("dtype") = py::none(),
+          py::arg("offsets_and_lengths") = std::nullopt,
+          "Read the tensor components from all grids into a single "
+          "(components x points) NumPy array, opening the observation only "
+          "once.\n\n"
+          "The 'dtype' can be float32 or float64. If it is None, float32 is "
+          "used if all components are stored in single precision, and float64 "
+          "otherwise. Data stored in a different precision is converted while "
+          "reading.\n\n"
+          "If 'offsets_and_lengths' is specified, only these sorted, "
+          "non-overlapping ranges of the data are read (e.g. the data of a "
+          "subset of the grids, see 'get_offsets_and_lengths').")
       .def("get_extents", &h5::VolumeData::get_extents,
            py::arg("observation_id"))
+      .def("get_offsets_and_lengths", &h5::VolumeData::get_offsets_and_lengths,
+           py::arg("observation_id"))
       .def("get_quadratures", &h5::VolumeData::get_quadratures,
            py::arg("observation_id"))
       .def("get_bases", &h5::VolumeData::get_bases, py::arg("observation_id"))
@@ -63,5 +270,7 @@ void bind_h5vol(py::module& m) {
   m.def("offset_and_length_for_grid", &h5::offset_and_length_for_grid,
         py::arg("grid_name"), py::arg("all_grid_names"),
         py::arg("all_extents"));
+  m.def("offsets_and_lengths_for_grids", &h5::offsets_and_lengths_for_grids,
+        py::arg("all_extents"));
 }
 }  // namespace py_bindings
@@ -1,4 +1,12 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
+import os
+
 from ._Pybindings import *
+
+# Child processes, e.g. the workers of a `multiprocessing.Pool`, must not use
+# the HDF5 handles that the parent process keeps in its pool of open files. We
+# forget them in the child without closing them, because closing them would
+# also affect the parent.
+os.register_at_fork(after_in_child=forget_file_pool)
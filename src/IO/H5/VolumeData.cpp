@@ -10,14 +10,20 @@
 #include <cstddef>
 #include <hdf5.h>
 #include <memory>
+#include <numeric>
 #include <optional>
 #include <ostream>
 #include <string>
+#include <type_traits>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
 #include <vector>
 
 #include "DataStructures/DataVector.hpp"
 #include "IO/Connectivity.hpp"
 #include "IO/H5/AccessType.hpp"
+#include "IO/H5/CheckH5.hpp"
 #include "IO/H5/ExtendConnectivityHelpers.hpp"
 #include "IO/H5/Header.hpp"
 #include "IO/H5/Helpers.hpp"
@@ -25,6 +31,7 @@
 #include "IO/H5/TensorData.hpp"
 #include "IO/H5/Type.hpp"
 #include "IO/H5/Version.hpp"
+#include "IO/H5/WriteOptions.hpp"
 #include "NumericalAlgorithms/Spectral/Basis.hpp"
 #include "NumericalAlgorithms/Spectral/Mesh.hpp"
 #include "NumericalAlgorithms/Spectral/Quadrature.hpp"
@@ -33,6 +40,7 @@
 #include "Utilities/ErrorHandling/Assert.hpp"
 #include "Utilities/ErrorHandling/Error.hpp"
 #include "Utilities/ErrorHandling/ExpectsAndEnsures.hpp"
+#include "Utilities/FileSystem.hpp"
 #include "Utilities/GenerateInstantiations.hpp"
 #include "Utilities/GetOutput.hpp"
 #include "Utilities/Gsl.hpp"
@@ -144,6 +152,72 @@ void append_element_extents_and_connectivity(
   }
 }
 
+// The element metadata datasets in the observation groups. The metadata sets
+// in the observation index store their end in these datasets in this order.
+constexpr std::array<const char*, 4> element_metadata_names{
+    {"grid_names", "total_extents", "bases", "quadratures"}};
+
+size_t element_metadata_field(const std::string& name) {
+  const auto found = alg::find(element_metadata_names, name);
+  ASSERT(found != element_metadata_names.end(),
+         "'" << name << "' is not an element metadata dataset.");
+  return static_cast<size_t>(
+      std::distance(element_metadata_names.begin(), found));
+}
+
+// Size of the rank-1 dataset `name`, or zero if it doesn't exist
+size_t rank1_dataset_size(const hid_t group_id, const std::string& name) {
+  if (not contains_dataset_or_group(group_id, "", name)) {
+    return 0;
+  }
+  const detail::ScopedId dataset{open_dataset(group_id, name), H5Dclose};
+  const detail::ScopedId dataspace{open_dataspace(dataset.id()), H5Sclose};
+  const hssize_t size = H5Sget_simple_extent_npoints(dataspace.id());
+  CHECK_H5(size, "Failed to get the size of dataset '" << name << "'");
+  return static_cast<size_t>(size);
+}
+
+// Read the range [offset, offset + length) of the rank-1 dataset `name`
+template <typename T>
+std::vector<T> read_rank1_range(const hid_t group_id, const std::string& name,
+                                const size_t offset, const size_t length) {
+  std::vector<T> result(length);
+  gsl::span<T> buffer{result.data(), result.size()};
+  h5::read_data(make_not_null(&buffer), group_id, name, {{offset, length}});
+  return result;
+}
+
+// Read the rank-1 dataset `name`, which may be empty or not exist
+template <typename T>
+std::vector<T> read_rank1_dataset(const hid_t group_id,
+                                  const std::string& name) {
+  return read_rank1_range<T>(group_id, name, 0,
+                             rank1_dataset_size(group_id, name));
+}
+
+// Read the element metadata dataset `name` from the `group`, or only the
+// `range` of it
+template <typename T>
+std::vector<T> read_element_metadata(
+    const detail::OpenGroup& group, const std::string& name,
+    const std::optional<std::pair<size_t, size_t>>& range) {
+  if (range.has_value()) {
+    return read_rank1_range<T>(group.id(), name, range->first, range->second);
+  }
+  return h5::read_data<1, std::vector<T>>(group.id(), name);
+}
+
+void write_spectral_dictionaries(const detail::OpenGroup& group) {
+  const auto io_quadratures = Spectral::all_quadratures();
+  std::vector<std::string> quadrature_dict(io_quadratures.size());
+  alg::transform(io_quadratures, quadrature_dict.begin(),
+                 get_output<Spectral::Quadrature>);
+  h5_detail::write_dictionary("Quadrature dictionary", quadrature_dict, group);
+  const auto io_bases = Spectral::all_bases();
+  std::vector<std::string> basis_dict(io_bases.size());
+  alg::transform(io_bases, basis_dict.begin(), get_output<Spectral::Basis>);
+  h5_detail::write_dictionary("Basis dictionary", basis_dict, group);
+}
 }  // namespace
 
 VolumeData::VolumeData(const bool subfile_exists, detail::OpenGroup&& group,
@@ -184,12 +258,28 @@ VolumeData::VolumeData(const bool subfile_exists, detail::OpenGroup&& group,
 
 // Write Volume Data stored in a vector of `ElementVolumeData` to
 // an `observation_group` in a `VolumeData` file.
+void VolumeData::set_write_options(WriteOptions write_options) {
+  detail::check_write_options(write_options);
+  write_options_ = std::move(write_options);
+  write_options_set_ = true;
+}
+
+WriteOptions VolumeData::data_vector_write_options() const {
+  // Tensor components in double precision are typically written by
+  // post-processing tools and read back soon, so by default they are fast to
+  // write and can be memory-mapped
+  return write_options_set_ ? write_options_ : WriteOptions::uncompressed();
+}
+
 void VolumeData::write_volume_data(
     const size_t observation_id, const double observation_value,
     const std::vector<ElementVolumeData>& elements,
     const std::optional<std::vector<char>>& serialized_domain,
     const std::optional<std::vector<char>>& serialized_functions_of_time) {
   const std::string path = "ObservationId" + std::to_string(observation_id);
+  // Load the observation index before creating the new observation group so
+  // the index we update below is consistent with the groups in the file
+  static_cast<void>(observation_index());
   detail::OpenGroup observation_group(volume_data_group_.id(), path,
                                       AccessType::ReadWrite);
   if (contains_attribute(observation_group.id(), "", "observation_value")) {
@@ -201,6 +291,7 @@ void VolumeData::write_volume_data(
   }
   h5::write_to_attribute(observation_group.id(), "observation_value",
                          observation_value);
+  invalidate_observation_metadata(observation_id);
   // Get first element to extract the component names and dimension
   const auto get_component_name = [](const auto& component) {
     ASSERT(component.name.find_last_of('/') == std::string::npos,
@@ -222,8 +313,7 @@ void VolumeData::write_volume_data(
     h5::write_to_attribute(volume_data_group_.id(), "dimension",
                            elements.front().extents.size());
   }
-  const auto dim =
-      h5::read_value_attribute<size_t>(volume_data_group_.id(), "dimension");
+  const size_t dim = get_dimension();
   // Extract Tensor Data one component at a time
   std::vector<size_t> total_extents;
   std::string grid_names;
@@ -249,8 +339,8 @@ void VolumeData::write_volume_data(
     const auto fill_and_write_contiguous_tensor_data =
         [&bases, &component_name, &dim, &elements, &grid_names, i,
          &observation_group, &quadratures, &total_connectivity,
-         &pole_connectivity, &total_extents,
-         &total_points_so_far](const auto contiguous_tensor_data_ptr) {
+         &pole_connectivity, &total_extents, &total_points_so_far,
+         this](const auto contiguous_tensor_data_ptr) {
           for (const auto& element : elements) {
             if (UNLIKELY(i == 0)) {
               // True if first tensor component being accessed
@@ -291,8 +381,22 @@ void VolumeData::write_volume_data(
                 std::get<type_from_variant>(tensor_component.data).begin(),
                 std::get<type_from_variant>(tensor_component.data).end());
           }  // for each element
+          if constexpr (std::is_same_v<
+                            std::decay_t<decltype(*contiguous_tensor_data_ptr)>,
+                            std::vector<double>>) {
+            if (write_options_.is_float_tensor_component(component_name)) {
+              const std::vector<float> float_tensor_data(
+                  contiguous_tensor_data_ptr->begin(),
+                  contiguous_tensor_data_ptr->end());
+              h5::write_data(observation_group.id(), float_tensor_data,
+                             {float_tensor_data.size()}, component_name, false,
+                             write_options_);
+              return;
+            }
+          }
           h5::write_data(observation_group.id(), *contiguous_tensor_data_ptr,
-                         {contiguous_tensor_data_ptr->size()}, component_name);
+                         {contiguous_tensor_data_ptr->size()}, component_name,
+                         false, write_options_);
         };
 
     if (elements[0].tensor_components[i].data.index() == 0) {
@@ -321,21 +425,10 @@ void VolumeData::write_volume_data(
   std::vector<char> grid_names_as_chars(grid_names.begin(), grid_names.end());
   h5::write_data(observation_group.id(), grid_names_as_chars,
                  {grid_names_as_chars.size()}, "grid_names");
-  // Write the coded quadrature, along with the dictionary
-  const auto io_quadratures = Spectral::all_quadratures();
-  std::vector<std::string> quadrature_dict(io_quadratures.size());
-  alg::transform(io_quadratures, quadrature_dict.begin(),
-                 get_output<Spectral::Quadrature>);
-  h5_detail::write_dictionary("Quadrature dictionary", quadrature_dict,
-                              observation_group);
+  // Write the coded quadratures and bases, along with the dictionaries
+  write_spectral_dictionaries(observation_group);
   h5::write_data(observation_group.id(), quadratures, {quadratures.size()},
                  "quadratures");
-  // Write the coded basis, along with the dictionary
-  const auto io_bases = Spectral::all_bases();
-  std::vector<std::string> basis_dict(io_bases.size());
-  alg::transform(io_bases, basis_dict.begin(), get_output<Spectral::Basis>);
-  h5_detail::write_dictionary("Basis dictionary", basis_dict,
-                              observation_group);
   h5::write_data(observation_group.id(), bases, {bases.size()}, "bases");
   // Write the Connectivity
   h5::write_data(observation_group.id(), total_connectivity,
@@ -359,6 +452,11 @@ void VolumeData::write_volume_data(
     h5::write_data(observation_group.id(), *serialized_functions_of_time,
                    {serialized_functions_of_time->size()}, "functions_of_time");
   }
+  // Add the observation to the index only once it is complete
+  insert_into_observation_index(
+      observation_id, observation_value,
+      ElementMetadata{std::move(grid_names_as_chars), std::move(total_extents),
+                      std::move(bases), std::move(quadratures)});
 }
 
 // Write new connectivity connections given a std::vector of observation ids
@@ -391,8 +489,18 @@ void VolumeData::write_tensor_component(
   const std::string path = "ObservationId" + std::to_string(observation_id);
   detail::OpenGroup observation_group(volume_data_group_.id(), path,
                                       AccessType::ReadWrite);
-  h5::write_data(observation_group.id(), contiguous_tensor_data, component_name,
-                 overwrite_existing);
+  const WriteOptions write_options = data_vector_write_options();
+  if (write_options.is_float_tensor_component(component_name)) {
+    const std::vector<float> float_tensor_data(contiguous_tensor_data.begin(),
+                                               contiguous_tensor_data.end());
+    h5::write_data(observation_group.id(), float_tensor_data,
+                   {float_tensor_data.size()}, component_name,
+                   overwrite_existing, write_options);
+  } else {
+    h5::write_data(observation_group.id(), contiguous_tensor_data,
+                   component_name, overwrite_existing, write_options);
+  }
+  invalidate_observation_metadata(observation_id);
 }
 
 void VolumeData::write_tensor_component(
@@ -404,24 +512,288 @@ void VolumeData::write_tensor_component(
                                       AccessType::ReadWrite);
   h5::write_data(observation_group.id(), contiguous_tensor_data,
                  {contiguous_tensor_data.size()}, component_name,
-                 overwrite_existing);
+                 overwrite_existing, write_options_);
+  invalidate_observation_metadata(observation_id);
 }
 
-std::vector<size_t> VolumeData::list_observation_ids() const {
-  const auto names = get_group_names(volume_data_group_.id(), "");
-  const auto helper = [](const std::string& s) {
-    return std::stoul(s.substr(std::string("ObservationId").size()));
+std::string VolumeData::index_group_name() const {
+  return name_.substr(0, name_.size() - extension().size()) + index_extension();
+}
+
+auto VolumeData::observation_index() const -> const ObservationIndex& {
+  if (observation_index_.has_value()) {
+    return *observation_index_;
+  }
+  const hid_t group_id = volume_data_group_.id();
+  const auto group_names = get_group_names(group_id, "");
+  const auto sort_by_value = [](const gsl::not_null<ObservationIndex*> index) {
+    // Observations with the same value stay in the order they were written
+    std::stable_sort(index->observation_ids.begin(),
+                     index->observation_ids.end(),
+                     [&index](const size_t lhs, const size_t rhs) {
+                       return index->observation_values.at(lhs) <
+                              index->observation_values.at(rhs);
+                     });
   };
-  std::vector<size_t> obs_ids{
-      boost::make_transform_iterator(names.begin(), helper),
-      boost::make_transform_iterator(names.end(), helper)};
-  alg::sort(obs_ids, [this](const size_t lhs, const size_t rhs) {
-    return this->get_observation_value(lhs) < this->get_observation_value(rhs);
-  });
-  return obs_ids;
+  ObservationIndex index{};
+  const std::string index_name = index_group_name();
+  if (contains_dataset_or_group(group_.id(), "", index_name)) {
+    const detail::OpenGroup index_group(group_.id(), index_name,
+                                        AccessType::ReadOnly);
+    auto observation_ids =
+        read_rank1_dataset<size_t>(index_group.id(), "observation_ids");
+    const auto observation_values =
+        read_rank1_dataset<double>(index_group.id(), "observation_values");
+    const auto metadata_sets =
+        read_rank1_dataset<long>(index_group.id(), "metadata_sets");
+    const auto flat_metadata_set_ends =
+        read_rank1_dataset<size_t>(index_group.id(), "metadata_set_ends");
+    const size_t num_fields = element_metadata_names.size();
+    const size_t num_metadata_sets = flat_metadata_set_ends.size() / num_fields;
+    // Only trust the index if it lists exactly the observation groups in the
+    // file and all its metadata sets are complete. Files may have been
+    // modified by code that doesn't maintain the index, or writing an
+    // observation may have been interrupted.
+    const std::unordered_set<std::string> group_names_set(group_names.begin(),
+                                                          group_names.end());
+    bool is_valid =
+        observation_ids.size() == group_names.size() and
+        observation_values.size() == group_names.size() and
+        metadata_sets.size() == group_names.size() and
+        flat_metadata_set_ends.size() == num_metadata_sets * num_fields and
+        alg::all_of(
+            observation_ids,
+            [&group_names_set](const size_t observation_id) {
+              return group_names_set.count("ObservationId" +
+                                           std::to_string(observation_id)) == 1;
+            }) and
+        alg::all_of(metadata_sets, [&num_metadata_sets](const long set) {
+          return set < static_cast<long>(num_metadata_sets);
+        });
+    for (size_t field = 0; field < num_fields and is_valid; ++field) {
+      is_valid =
+          rank1_dataset_size(index_group.id(),
+                             gsl::at(element_metadata_names, field)) ==
+          (num_metadata_sets == 0
+               ? 0
+               : flat_metadata_set_ends[(num_metadata_sets - 1) * num_fields +
+                                        field]);
+    }
+    if (is_valid) {
+      for (size_t i = 0; i < observation_ids.size(); ++i) {
+        index.observation_values.emplace(observation_ids[i],
+                                         observation_values[i]);
+        // Negative metadata sets mark observations that have their element
+        // metadata only in their observation group
+        if (metadata_sets[i] >= 0) {
+          index.metadata_sets.emplace(observation_ids[i],
+                                      static_cast<size_t>(metadata_sets[i]));
+        }
+      }
+      index.metadata_set_ends.resize(num_metadata_sets);
+      for (size_t set = 0; set < num_metadata_sets; ++set) {
+        for (size_t field = 0; field < num_fields; ++field) {
+          gsl::at(index.metadata_set_ends[set], field) =
+              flat_metadata_set_ends[set * num_fields + field];
+        }
+      }
+      index.observation_ids = std::move(observation_ids);
+      index.is_stored = true;
+      sort_by_value(make_not_null(&index));
+      observation_index_ = std::move(index);
+      return *observation_index_;
+    }
+  }
+  // The index is missing or out of date, so read the observation value from
+  // every observation group
+  index.observation_ids.reserve(group_names.size());
+  for (const auto& group_name : group_names) {
+    const size_t observation_id =
+        std::stoul(group_name.substr(std::string("ObservationId").size()));
+    const detail::OpenGroup observation_group(group_id, group_name,
+                                              AccessType::ReadOnly);
+    index.observation_values.emplace(
+        observation_id, h5::read_value_attribute<double>(observation_group.id(),
+                                                         "observation_value"));
+    index.observation_ids.push_back(observation_id);
+  }
+  sort_by_value(make_not_null(&index));
+  observation_index_ = std::move(index);
+  return *observation_index_;
+}
+
+void VolumeData::insert_into_observation_index(
+    const size_t observation_id, const double observation_value,
+    ElementMetadata element_metadata) {
+  static_cast<void>(observation_index());
+  auto& index = *observation_index_;
+  const std::string index_name = index_group_name();
+  if (not index.is_stored) {
+    // Rewrite the index group from the observations we found by scanning the
+    // observation groups. Their element metadata stays in the observation
+    // groups.
+    if (contains_dataset_or_group(group_.id(), "", index_name)) {
+      CHECK_H5(H5Ldelete(group_.id(), index_name.c_str(), h5p_default()),
+               "Failed to delete the out-of-date observation index '"
+                   << index_name << "'");
+    }
+    index.metadata_sets.clear();
+    index.metadata_set_ends.clear();
+    index.last_metadata_set.reset();
+    const detail::OpenGroup index_group(group_.id(), index_name,
+                                        AccessType::ReadWrite);
+    write_spectral_dictionaries(index_group);
+    std::vector<double> observation_values(index.observation_ids.size());
+    alg::transform(
+        index.observation_ids, observation_values.begin(),
+        [&index](const size_t id) { return index.observation_values.at(id); });
+    append_to_rank1_dataset(index_group.id(), "grid_names",
+                            std::vector<char>{});
+    append_to_rank1_dataset(index_group.id(), "total_extents",
+                            std::vector<size_t>{});
+    append_to_rank1_dataset(index_group.id(), "bases", std::vector<int>{});
+    append_to_rank1_dataset(index_group.id(), "quadratures",
+                            std::vector<int>{});
+    append_to_rank1_dataset(index_group.id(), "metadata_set_ends",
+                            std::vector<size_t>{});
+    append_to_rank1_dataset(index_group.id(), "observation_ids",
+                            index.observation_ids);
+    append_to_rank1_dataset(index_group.id(), "observation_values",
+                            observation_values);
+    append_to_rank1_dataset(
+        index_group.id(), "metadata_sets",
+        std::vector<long>(index.observation_ids.size(), -1));
+    index.is_stored = true;
+  }
+  const detail::OpenGroup index_group(group_.id(), index_name,
+                                      AccessType::ReadWrite);
+
+  // Most observations have the same elements as the observation before, so
+  // reuse the last metadata set if it matches
+  if (not index.metadata_set_ends.empty() and
+      not index.last_metadata_set.has_value()) {
+    const size_t last_set = index.metadata_set_ends.size() - 1;
+    const auto range = [&index, &last_set](const size_t field) {
+      const size_t begin =
+          last_set == 0 ? 0
+                        : gsl::at(index.metadata_set_ends[last_set - 1], field);
+      return std::pair{
+          begin, gsl::at(index.metadata_set_ends[last_set], field) - begin};
+    };
+    index.last_metadata_set = ElementMetadata{
+        read_element_metadata<char>(index_group, "grid_names", range(0)),
+        read_element_metadata<size_t>(index_group, "total_extents", range(1)),
+        read_element_metadata<int>(index_group, "bases", range(2)),
+        read_element_metadata<int>(index_group, "quadratures", range(3))};
+  }
+  if (not index.last_metadata_set.has_value() or
+      index.last_metadata_set->grid_names != element_metadata.grid_names or
+      index.last_metadata_set->total_extents !=
+          element_metadata.total_extents or
+      index.last_metadata_set->bases != element_metadata.bases or
+      index.last_metadata_set->quadratures != element_metadata.quadratures) {
+    const std::array<size_t, 4> ends{
+        {append_to_rank1_dataset(index_group.id(), "grid_names",
+                                 element_metadata.grid_names),
+         append_to_rank1_dataset(index_group.id(), "total_extents",
+                                 element_metadata.total_extents),
+         append_to_rank1_dataset(index_group.id(), "bases",
+                                 element_metadata.bases),
+         append_to_rank1_dataset(index_group.id(), "quadratures",
+                                 element_metadata.quadratures)}};
+    append_to_rank1_dataset(index_group.id(), "metadata_set_ends",
+                            std::vector<size_t>(ends.begin(), ends.end()));
+    index.metadata_set_ends.push_back(ends);
+    index.last_metadata_set = std::move(element_metadata);
+  }
+  const size_t metadata_set = index.metadata_set_ends.size() - 1;
+
+  // Append the observation last, so an interrupted write leaves an index that
+  // doesn't list all observation groups and is rebuilt when it is read
+  append_to_rank1_dataset(index_group.id(), "observation_ids",
+                          std::vector<size_t>{observation_id});
+  append_to_rank1_dataset(index_group.id(), "observation_values",
+                          std::vector<double>{observation_value});
+  append_to_rank1_dataset(index_group.id(), "metadata_sets",
+                          std::vector<long>{static_cast<long>(metadata_set)});
+
+  index.observation_values[observation_id] = observation_value;
+  index.metadata_sets[observation_id] = metadata_set;
+  // Insert after all observations with a smaller or equal value to keep the
+  // index sorted
+  index.observation_ids.insert(
+      std::upper_bound(index.observation_ids.begin(),
+                       index.observation_ids.end(), observation_value,
+                       [&index](const double value, const size_t id) {
+                         return value < index.observation_values.at(id);
+                       }),
+      observation_id);
+}
+
+auto VolumeData::element_metadata_location(const size_t observation_id,
+                                           const std::string& name) const
+    -> std::pair<detail::OpenGroup, std::optional<std::pair<size_t, size_t>>> {
+  const auto& index = observation_index();
+  const auto found_set = index.metadata_sets.find(observation_id);
+  if (found_set == index.metadata_sets.end()) {
+    return {detail::OpenGroup(volume_data_group_.id(),
+                              "ObservationId" + std::to_string(observation_id),
+                              AccessType::ReadOnly),
+            std::nullopt};
+  }
+  const size_t set = found_set->second;
+  const size_t field = element_metadata_field(name);
+  const size_t begin =
+      set == 0 ? 0 : gsl::at(index.metadata_set_ends[set - 1], field);
+  return {
+      detail::OpenGroup(group_.id(), index_group_name(), AccessType::ReadOnly),
+      std::pair{begin, gsl::at(index.metadata_set_ends[set], field) - begin}};
+}
+
+auto VolumeData::observation_metadata(const size_t observation_id) const
+    -> ObservationMetadata& {
+  const auto& metadata_sets = observation_index().metadata_sets;
+  const auto found_set = metadata_sets.find(observation_id);
+  const std::optional<size_t> metadata_set =
+      found_set == metadata_sets.end()
+          ? std::nullopt
+          : std::optional<size_t>{found_set->second};
+  if (observation_metadata_.has_value() and metadata_set.has_value() and
+      observation_metadata_->metadata_set == metadata_set) {
+    // The observation shares its element metadata with the cached one. Only
+    // the tensor components may differ.
+    if (observation_metadata_->observation_id != observation_id) {
+      observation_metadata_->observation_id = observation_id;
+      observation_metadata_->tensor_components.reset();
+    }
+    return *observation_metadata_;
+  }
+  if (not observation_metadata_.has_value() or
+      observation_metadata_->observation_id != observation_id) {
+    observation_metadata_ = ObservationMetadata{};
+    observation_metadata_->observation_id = observation_id;
+    observation_metadata_->metadata_set = metadata_set;
+  }
+  return *observation_metadata_;
+}
+
+void VolumeData::invalidate_observation_metadata(const size_t observation_id) {
+  if (observation_metadata_.has_value() and
+      observation_metadata_->observation_id == observation_id) {
+    observation_metadata_.reset();
+  }
+}
+
+std::vector<size_t> VolumeData::list_observation_ids() const {
+  return observation_index().observation_ids;
 }
 
 double VolumeData::get_observation_value(const size_t observation_id) const {
+  const auto& observation_values = observation_index().observation_values;
+  const auto found_observation = observation_values.find(observation_id);
+  if (found_observation != observation_values.end()) {
+    return found_observation->second;
+  }
   const std::string path = "ObservationId" + std::to_string(observation_id);
   detail::OpenGroup observation_group(volume_data_group_.id(), path,
                                       AccessType::ReadOnly);
@@ -431,6 +803,10 @@ double VolumeData::get_observation_value(const size_t observation_id) const {
 
 std::vector<std::string> VolumeData::list_tensor_components(
     const size_t observation_id) const {
+  auto& metadata = observation_metadata(observation_id);
+  if (metadata.tensor_components.has_value()) {
+    return *metadata.tensor_components;
+  }
   auto tensor_components =
       get_group_names(volume_data_group_.id(),
                       "ObservationId" + std::to_string(observation_id));
@@ -446,20 +822,25 @@ std::vector<std::string> VolumeData::list_tensor_components(
                               non_tensor_components.end();
                      }),
       tensor_components.end());
+  metadata.tensor_components = tensor_components;
   return tensor_components;
 }
 
 std::vector<std::string> VolumeData::get_grid_names(
     const size_t observation_id) const {
-  const std::string path = "ObservationId" + std::to_string(observation_id);
-  detail::OpenGroup observation_group(volume_data_group_.id(), path,
-                                      AccessType::ReadOnly);
+  auto& metadata = observation_metadata(observation_id);
+  if (metadata.grid_names.has_value()) {
+    return *metadata.grid_names;
+  }
+  const auto [metadata_group, range] =
+      element_metadata_location(observation_id, "grid_names");
   const std::vector<char> names =
-      h5::read_data<1, std::vector<char>>(observation_group.id(), "grid_names");
+      read_element_metadata<char>(metadata_group, "grid_names", range);
   const std::string all_names(names.begin(), names.end());
   std::vector<std::string> grid_names{};
   boost::split(grid_names, all_names,
                [](const char c) { return c == h5::VolumeData::separator(); });
+  metadata.grid_names = grid_names;
   return grid_names;
 }
 
@@ -504,25 +885,182 @@ TensorComponent VolumeData::get_tensor_component(
   }
 }
 
-std::vector<std::vector<size_t>> VolumeData::get_extents(
-    const size_t observation_id) const {
+TensorComponent VolumeData::get_tensor_component(
+    const size_t observation_id, const std::string& tensor_component,
+    const std::vector<std::pair<size_t, size_t>>& offsets_and_lengths) const {
+  const bool use_float =
+      get_tensor_component_size_and_precision(observation_id, tensor_component)
+          .second;
+  const size_t total_length = std::accumulate(
+      offsets_and_lengths.begin(), offsets_and_lengths.end(), size_t{0},
+      [](const size_t sum, const std::pair<size_t, size_t>& offset_and_length) {
+        return sum + offset_and_length.second;
+      });
+  const auto read_selection = [this, &observation_id, &tensor_component,
+                               &offsets_and_lengths](auto data) {
+    gsl::span<typename decltype(data)::value_type> buffer{data.data(),
+                                                          data.size()};
+    read_tensor_component(make_not_null(&buffer), observation_id,
+                          tensor_component, offsets_and_lengths);
+    return TensorComponent{tensor_component, std::move(data)};
+  };
+  if (use_float) {
+    return read_selection(std::vector<float>(total_length));
+  } else {
+    return read_selection(DataVector(total_length));
+  }
+}
+
+std::pair<size_t, bool> VolumeData::get_tensor_component_size_and_precision(
+    const size_t observation_id, const std::string& tensor_component) const {
+  const std::string path = "ObservationId" + std::to_string(observation_id);
+  detail::OpenGroup observation_group(volume_data_group_.id(), path,
+                                      AccessType::ReadOnly);
+  // The identifiers are closed also if an error is thrown
+  const h5::detail::ScopedId dataset{
+      h5::open_dataset(observation_group.id(), tensor_component), H5Dclose};
+  hssize_t num_points = 0;
+  {
+    const h5::detail::ScopedId dataspace{h5::open_dataspace(dataset.id()),
+                                         H5Sclose};
+    num_points = H5Sget_simple_extent_npoints(dataspace.id());
+  }
+  CHECK_H5(num_points, "Failed to get the size of tensor component '"
+                           << tensor_component << "'");
+  const h5::detail::ScopedId dtype{H5Dget_type(dataset.id()), H5Tclose};
+  CHECK_H5(dtype.id(), "Failed to get the type of tensor component '"
+                           << tensor_component << "'");
+  const bool use_float = h5::types_equal(dtype.id(), h5::h5_type<float>());
+  return {static_cast<size_t>(num_points), use_float};
+}
+
+std::optional<std::pair<std::string, size_t>>
+VolumeData::get_tensor_component_file_location(
+    const size_t observation_id, const std::string& tensor_component) const {
+  const std::string path = "ObservationId" + std::to_string(observation_id);
+  detail::OpenGroup observation_group(volume_data_group_.id(), path,
+                                      AccessType::ReadOnly);
+  // The identifiers are closed also if an error is thrown
+  const h5::detail::ScopedId dataset{
+      h5::open_dataset(observation_group.id(), tensor_component), H5Dclose};
+  const hid_t dataset_id = dataset.id();
+  H5D_layout_t layout = H5D_LAYOUT_ERROR;
+  {
+    const h5::detail::ScopedId property_list{H5Dget_create_plist(dataset_id),
+                                             H5Pclose};
+    CHECK_H5(property_list.id(), "Failed to get the creation property list of '"
+                                     << tensor_component << "'");
+    layout = H5Pget_layout(property_list.id());
+  }
+  bool native_type = false;
+  {
+    const h5::detail::ScopedId dtype{H5Dget_type(dataset_id), H5Tclose};
+    CHECK_H5(dtype.id(), "Failed to get the type of tensor component '"
+                             << tensor_component << "'");
+    native_type = h5::types_equal(dtype.id(), h5::h5_type<double>()) or
+                  h5::types_equal(dtype.id(), h5::h5_type<float>());
+  }
+  // The offset is undefined if the dataset is not allocated in the file yet,
+  // or if it's stored in an external file
+  const haddr_t offset = H5Dget_offset(dataset_id);
+  std::optional<std::pair<std::string, size_t>> result{};
+  if (layout == H5D_CONTIGUOUS and native_type and offset != HADDR_UNDEF) {
+    const ssize_t name_size = H5Fget_name(dataset_id, nullptr, 0);
+    CHECK_H5(name_size, "Failed to get the file name");
+    std::string file_name(static_cast<size_t>(name_size) + 1, '\0');
+    CHECK_H5(H5Fget_name(dataset_id, file_name.data(), file_name.size()),
+             "Failed to get the file name");
+    file_name.resize(static_cast<size_t>(name_size));
+    // The file name is the one the file was opened with, which may be
+    // relative to the working directory
+    result = std::make_pair(file_system::get_absolute_path(file_name),
+                            static_cast<size_t>(offset));
+  }
+  return result;
+}
+
+template <typename T>
+void VolumeData::read_tensor_component(
+    const gsl::not_null<gsl::span<T>*> buffer, const size_t observation_id,
+    const std::string& tensor_component,
+    const std::optional<std::vector<std::pair<size_t, size_t>>>&
+        offsets_and_lengths) const {
+  const std::string path = "ObservationId" + std::to_string(observation_id);
+  detail::OpenGroup observation_group(volume_data_group_.id(), path,
+                                      AccessType::ReadOnly);
+  if (offsets_and_lengths.has_value()) {
+    h5::read_data(buffer, observation_group.id(), tensor_component,
+                  *offsets_and_lengths);
+  } else {
+    h5::read_data(buffer, observation_group.id(), tensor_component);
+  }
+}
+
+template <typename T>
+void VolumeData::read_tensor_components(
+    const gsl::not_null<gsl::span<T>*> buffer, const size_t observation_id,
+    const std::vector<std::string>& tensor_components,
+    const std::optional<std::vector<std::pair<size_t, size_t>>>&
+        offsets_and_lengths) const {
+  if (tensor_components.empty()) {
+    return;
+  }
+  if (UNLIKELY(buffer->size() % tensor_components.size() != 0)) {
+    ERROR("The buffer has size " << buffer->size()
+                                 << ", which is not a multiple of the number "
+                                    "of tensor components to read ("
+                                 << tensor_components.size() << ").");
+  }
+  const size_t num_points = buffer->size() / tensor_components.size();
   const std::string path = "ObservationId" + std::to_string(observation_id);
   detail::OpenGroup observation_group(volume_data_group_.id(), path,
                                       AccessType::ReadOnly);
-  const auto dim =
-      h5::read_value_attribute<size_t>(volume_data_group_.id(), "dimension");
+  for (size_t i = 0; i < tensor_components.size(); ++i) {
+    gsl::span<T> component_buffer{buffer->data() + i * num_points, num_points};
+    if (offsets_and_lengths.has_value()) {
+      h5::read_data(make_not_null(&component_buffer), observation_group.id(),
+                    tensor_components[i], *offsets_and_lengths);
+    } else {
+      h5::read_data(make_not_null(&component_buffer), observation_group.id(),
+                    tensor_components[i]);
+    }
+  }
+}
+
+std::vector<std::vector<size_t>> VolumeData::get_extents(
+    const size_t observation_id) const {
+  auto& metadata = observation_metadata(observation_id);
+  if (metadata.extents.has_value()) {
+    return *metadata.extents;
+  }
+  const auto [metadata_group, range] =
+      element_metadata_location(observation_id, "total_extents");
+  const size_t dim = get_dimension();
   const auto extents_per_element = static_cast<long>(dim);
-  const auto total_extents = h5::read_data<1, std::vector<size_t>>(
-      observation_group.id(), "total_extents");
+  const auto total_extents =
+      read_element_metadata<size_t>(metadata_group, "total_extents", range);
   std::vector<std::vector<size_t>> individual_extents;
   individual_extents.reserve(total_extents.size() / dim);
   for (auto iter = total_extents.begin(); iter != total_extents.end();
        iter += extents_per_element) {
     individual_extents.emplace_back(iter, iter + extents_per_element);
   }
+  metadata.extents = individual_extents;
   return individual_extents;
 }
 
+std::vector<std::pair<size_t, size_t>> VolumeData::get_offsets_and_lengths(
+    const size_t observation_id) const {
+  // Load the extents first, since that resets the cache if we're looking at a
+  // different observation
+  const auto all_extents = get_extents(observation_id);
+  auto& metadata = observation_metadata(observation_id);
+  if (not metadata.offsets_and_lengths.has_value()) {
+    metadata.offsets_and_lengths = offsets_and_lengths_for_grids(all_extents);
+  }
+  return *metadata.offsets_and_lengths;
+}
+
 std::pair<size_t, size_t> offset_and_length_for_grid(
     const std::string& grid_name,
     const std::vector<std::string>& all_grid_names,
@@ -544,29 +1082,34 @@ std::pair<size_t, size_t> offset_and_length_for_grid(
   }
 }
 
+std::vector<std::pair<size_t, size_t>> offsets_and_lengths_for_grids(
+    const std::vector<std::vector<size_t>>& all_extents) {
+  std::vector<std::pair<size_t, size_t>> result{};
+  result.reserve(all_extents.size());
+  size_t offset = 0;
+  for (const auto& extents : all_extents) {
+    const size_t length = alg::accumulate(extents, 1_st, std::multiplies<>{});
+    result.emplace_back(offset, length);
+    offset += length;
+  }
+  return result;
+}
+
 auto VolumeData::get_data_by_element(
     const std::optional<double> start_observation_value,
     const std::optional<double> end_observation_value,
     const std::optional<std::vector<std::string>>& components_to_retrieve) const
     -> std::vector<std::tuple<size_t, double, std::vector<ElementVolumeData>>> {
-  // First get list of all observations we need to retrieve
-  const auto names = get_group_names(volume_data_group_.id(), "");
-  const auto get_observation_id_from_group_name = [](const std::string& s) {
-    return std::stoul(s.substr(std::string("ObservationId").size()));
-  };
-  std::vector<size_t> obs_ids{
-      boost::make_transform_iterator(names.begin(),
-                                     get_observation_id_from_group_name),
-      boost::make_transform_iterator(names.end(),
-                                     get_observation_id_from_group_name)};
+  // First get list of all observations we need to retrieve. The observation
+  // index is already sorted by observation value.
+  const auto& index = observation_index();
   std::vector<std::tuple<size_t, double, std::vector<ElementVolumeData>>>
       result{};
-  result.reserve(obs_ids.size());
-  // Sort observation IDs and observation values into the result. This only
-  // copies observed times in
-  // [`start_observation_value`, `end_observation_value`]
-  for (const auto& observation_id : obs_ids) {
-    const double observation_value = get_observation_value(observation_id);
+  // Copy observed times in [`start_observation_value`,
+  // `end_observation_value`] into the result
+  for (const size_t observation_id : index.observation_ids) {
+    const double observation_value =
+        index.observation_values.at(observation_id);
     if (start_observation_value.value_or(
             std::numeric_limits<double>::lowest()) <= observation_value and
         observation_value <= end_observation_value.value_or(
@@ -575,11 +1118,6 @@ auto VolumeData::get_data_by_element(
                           std::vector<ElementVolumeData>{});
     }
   }
-  result.shrink_to_fit();
-  // Sort by observation_value
-  alg::sort(result, [](const auto& lhs, const auto& rhs) {
-    return std::get<1>(lhs) < std::get<1>(rhs);
-  });
 
   // Retrieve element data and insert into result
   for (auto& single_time_data : result) {
@@ -655,22 +1193,28 @@ auto VolumeData::get_data_by_element(
 }
 
 size_t VolumeData::get_dimension() const {
-  return h5::read_value_attribute<double>(volume_data_group_.id(), "dimension");
+  if (not dimension_.has_value()) {
+    dimension_ = static_cast<size_t>(
+        h5::read_value_attribute<double>(volume_data_group_.id(), "dimension"));
+  }
+  return *dimension_;
 }
 
 std::vector<std::vector<Spectral::Basis>> VolumeData::get_bases(
     const size_t observation_id) const {
-  const std::string path = "ObservationId" + std::to_string(observation_id);
-  detail::OpenGroup observation_group(volume_data_group_.id(), path,
-                                      AccessType::ReadOnly);
-  const auto dim =
-      h5::read_value_attribute<size_t>(volume_data_group_.id(), "dimension");
+  auto& metadata = observation_metadata(observation_id);
+  if (metadata.bases.has_value()) {
+    return *metadata.bases;
+  }
+  const auto [metadata_group, range] =
+      element_metadata_location(observation_id, "bases");
+  const size_t dim = get_dimension();
   const auto bases_per_element = static_cast<long>(dim);
 
   const std::vector<int> bases_coded =
-      h5::read_data<1, std::vector<int>>(observation_group.id(), "bases");
+      read_element_metadata<int>(metadata_group, "bases", range);
   const auto all_bases = h5_detail::decode_with_dictionary_name(
-      "Basis dictionary", bases_coded, observation_group);
+      "Basis dictionary", bases_coded, metadata_group);
 
   std::vector<std::vector<Spectral::Basis>> element_bases;
   for (auto iter = all_bases.begin(); iter != all_bases.end();
@@ -680,20 +1224,24 @@ std::vector<std::vector<Spectral::Basis>> VolumeData::get_bases(
         boost::make_transform_iterator(std::next(iter, bases_per_element),
                                        Spectral::to_basis));
   }
+  metadata.bases = element_bases;
   return element_bases;
 }
+
 std::vector<std::vector<Spectral::Quadrature>> VolumeData::get_quadratures(
     const size_t observation_id) const {
-  const std::string path = "ObservationId" + std::to_string(observation_id);
-  detail::OpenGroup observation_group(volume_data_group_.id(), path,
-                                      AccessType::ReadOnly);
-  const auto dim =
-      h5::read_value_attribute<size_t>(volume_data_group_.id(), "dimension");
+  auto& metadata = observation_metadata(observation_id);
+  if (metadata.quadratures.has_value()) {
+    return *metadata.quadratures;
+  }
+  const auto [metadata_group, range] =
+      element_metadata_location(observation_id, "quadratures");
+  const size_t dim = get_dimension();
   const auto quadratures_per_element = static_cast<long>(dim);
   const std::vector<int> quadratures_coded =
-      h5::read_data<1, std::vector<int>>(observation_group.id(), "quadratures");
+      read_element_metadata<int>(metadata_group, "quadratures", range);
   const auto all_quadratures = h5_detail::decode_with_dictionary_name(
-      "Quadrature dictionary", quadratures_coded, observation_group);
+      "Quadrature dictionary", quadratures_coded, metadata_group);
   std::vector<std::vector<Spectral::Quadrature>> element_quadratures;
   for (auto iter = all_quadratures.begin(); iter != all_quadratures.end();
        std::advance(iter, quadratures_per_element)) {
@@ -702,6 +1250,7 @@ std::vector<std::vector<Spectral::Quadrature>> VolumeData::get_quadratures(
         boost::make_transform_iterator(std::next(iter, quadratures_per_element),
                                        Spectral::to_quadrature));
   }
+  metadata.quadratures = element_quadratures;
   return element_quadratures;
 }
 
@@ -778,4 +1327,24 @@ GENERATE_INSTANTIATIONS(INSTANTIATE, (1, 2, 3))
 #undef INSTANTIATE
 #undef DIM
 
+#define TYPE(data) BOOST_PP_TUPLE_ELEM(0, data)
+
+#define INSTANTIATE(_, data)                                            \
+  template void h5::VolumeData::read_tensor_component(                  \
+      const gsl::not_null<gsl::span<TYPE(data)>*> buffer,               \
+      const size_t observation_id, const std::string& tensor_component, \
+      const std::optional<std::vector<std::pair<size_t, size_t>>>&      \
+          offsets_and_lengths) const;                                   \
+  template void h5::VolumeData::read_tensor_components(                 \
+      const gsl::not_null<gsl::span<TYPE(data)>*> buffer,               \
+      const size_t observation_id,                                      \
+      const std::vector<std::string>& tensor_components,                \
+      const std::optional<std::vector<std::pair<size_t, size_t>>>&      \
+          offsets_and_lengths) const;
+
+GENERATE_INSTANTIATIONS(INSTANTIATE, (float, double))
+
+#undef INSTANTIATE
+#undef TYPE
+
 }  // namespace h5
@@ -3,17 +3,21 @@
 
 #pragma once
 
+#include <array>
 #include <cstddef>
 #include <cstdint>
 #include <optional>
 #include <string>
 #include <tuple>
+#include <unordered_map>
 #include <utility>
 #include <vector>
 
 #include "IO/H5/Object.hpp"
 #include "IO/H5/OpenGroup.hpp"
+#include "IO/H5/WriteOptions.hpp"
 #include "Utilities/ErrorHandling/Error.hpp"
+#include "Utilities/Gsl.hpp"
 
 /// \cond
 class DataVector;
@@ -66,6 +70,33 @@ namespace h5 {
  * `h5::offset_and_length_for_grid` function to compute the offset into the
  * contiguous dataset that corresponds to a particular grid.
  *
+ * \par Observation index
+ * The subfile keeps an index of all observation IDs, their observation values
+ * and the element metadata (grid names, extents, bases and quadratures) of
+ * each observation in the group `SUBFILE_NAME.idx` next to the subfile group.
+ * The index is stored in extensible datasets that are appended to whenever
+ * `write_volume_data()` is called, so writing an observation takes the same
+ * time no matter how many observations are already in the subfile. Listing the
+ * observations doesn't require opening every observation group, and
+ * observations with the same elements share a single copy of the element
+ * metadata in the index. Files written without the index (or with an index
+ * that has gone out of date) are handled by scanning all observation groups,
+ * and the index is rewritten the next time an observation is written. The
+ * element metadata and tensor component names of the most recently accessed
+ * observation are cached in memory, so repeated queries read each dataset only
+ * once. The cached element metadata is reused for other observations that
+ * share it in the index.
+ *
+ * \par Write options
+ * By default, tensor data is chunked and compressed, except for `DataVector`
+ * tensor components written with `write_tensor_component()`. Those are stored
+ * contiguously and uncompressed so they are fast to write and can be
+ * memory-mapped. Use `set_write_options()` to change how this subfile stores
+ * all tensor data it writes from then on, e.g. to disable compression or to
+ * store some tensor components in single precision. See `h5::WriteOptions`
+ * for details. The options are not stored in the file, so they only apply to
+ * the data written through this object.
+ *
  * \par Domain and FunctionsOfTime
  * A serialized representation of the domain and the functions of time can be
  * written into the subfile alongside the tensor data. Reconstructing the domain
@@ -107,6 +138,13 @@ class VolumeData : public h5::Object {
    */
   uint32_t get_version() const { return version_; }
 
+  /// Options that control how tensor data is written to the subfile
+  const WriteOptions& get_write_options() const { return write_options_; }
+
+  /// Set the options that control how tensor data is written to the subfile
+  /// from now on
+  void set_write_options(WriteOptions write_options);
+
   /// Insert tensor components at `observation_id` with floating point value
   /// `observation_value`. Optionally write a serialized representation of the
   /// domain and the functions of time into the subfile as well.
@@ -125,6 +163,10 @@ class VolumeData : public h5::Object {
   template <size_t SpatialDim>
   void extend_connectivity_data(const std::vector<size_t>& observation_ids);
 
+  /// @{
+  /// Write a single tensor component at `observation_id`. `DataVector` data is
+  /// stored contiguously and uncompressed unless `set_write_options()` was
+  /// called.
   void write_tensor_component(const size_t observation_id,
                               const std::string& component_name,
                               const DataVector& contiguous_tensor_data,
@@ -134,6 +176,7 @@ class VolumeData : public h5::Object {
                               const std::string& component_name,
                               const std::vector<float>& contiguous_tensor_data,
                               bool overwrite_existing = false);
+  /// @}
 
   /// List all the integral observation ids in the subfile
   ///
@@ -167,10 +210,87 @@ class VolumeData : public h5::Object {
   TensorComponent get_tensor_component(
       size_t observation_id, const std::string& tensor_component) const;
 
+  /// Read a tensor component with name `tensor_component` at observation id
+  /// `observation_id`, but only the ranges `offsets_and_lengths` of the
+  /// contiguous data, e.g. the data of a subset of the grids.
+  ///
+  /// Only the parts of the dataset that overlap the selected ranges are read
+  /// from disk. The data of the ranges is returned one after the other. The
+  /// ranges must be sorted by offset and must not overlap, e.g. a subset of
+  /// `get_offsets_and_lengths()`.
+  TensorComponent get_tensor_component(
+      size_t observation_id, const std::string& tensor_component,
+      const std::vector<std::pair<size_t, size_t>>& offsets_and_lengths) const;
+
+  /// The total number of values of the tensor component `tensor_component` at
+  /// observation id `observation_id`, and whether they are stored in single
+  /// precision. Use this information to allocate a buffer for
+  /// `read_tensor_component()` without reading the data.
+  std::pair<size_t, bool> get_tensor_component_size_and_precision(
+      size_t observation_id, const std::string& tensor_component) const;
+
+  /// Where the values of the tensor component `tensor_component` at
+  /// observation id `observation_id` are stored in the file, so they can be
+  /// memory-mapped instead of read.
+  ///
+  /// Returns the absolute path of the H5 file and the offset of the values in
+  /// it in bytes if the dataset is stored contiguously (and hence
+  /// uncompressed) in native byte order. Returns `std::nullopt` otherwise, e.g.
+  /// if the dataset is chunked or compressed. The number of values and their
+  /// precision is available from `get_tensor_component_size_and_precision()`.
+  std::optional<std::pair<std::string, size_t>>
+  get_tensor_component_file_location(size_t observation_id,
+                                     const std::string& tensor_component) const;
+
+  /// Read a tensor component with name `tensor_component` at observation id
+  /// `observation_id` from all grids in the file directly into the
+  /// preallocated `buffer`, avoiding any intermediate copies.
+  ///
+  /// The size of the `buffer` must match the number of values in the tensor
+  /// component. If the data is stored with a different precision than `T`
+  /// it is converted while reading.
+  ///
+  /// If `offsets_and_lengths` is specified, only these ranges of the data are
+  /// read into the `buffer`, one after the other. See the overload of
+  /// `get_tensor_component()` that takes `offsets_and_lengths`.
+  template <typename T>
+  void read_tensor_component(
+      gsl::not_null<gsl::span<T>*> buffer, size_t observation_id,
+      const std::string& tensor_component,
+      const std::optional<std::vector<std::pair<size_t, size_t>>>&
+          offsets_and_lengths = std::nullopt) const;
+
+  /// Read all `tensor_components` at observation id `observation_id` from all
+  /// grids directly into the preallocated `buffer`, opening the observation
+  /// group only once.
+  ///
+  /// The `buffer` is laid out as a row-major (components x points) array, so
+  /// the data of each tensor component is contiguous and follows the data of
+  /// the previous component. The size of the `buffer` must be the number of
+  /// `tensor_components` times the number of values in each component. If the
+  /// data is stored with a different precision than `T` it is converted while
+  /// reading.
+  ///
+  /// If `offsets_and_lengths` is specified, only these ranges of the data of
+  /// each component are read into the `buffer`. See the overload of
+  /// `get_tensor_component()` that takes `offsets_and_lengths`.
+  template <typename T>
+  void read_tensor_components(
+      gsl::not_null<gsl::span<T>*> buffer, size_t observation_id,
+      const std::vector<std::string>& tensor_components,
+      const std::optional<std::vector<std::pair<size_t, size_t>>>&
+          offsets_and_lengths = std::nullopt) const;
+
   /// Read the extents of all the grids stored in the file at the observation id
   /// `observation_id`
   std::vector<std::vector<size_t>> get_extents(size_t observation_id) const;
 
+  /// The offset and length of every grid's data within the contiguous tensor
+  /// data at the observation id `observation_id`, in the order of
+  /// `get_grid_names()`. See `h5::offsets_and_lengths_for_grids`.
+  std::vector<std::pair<size_t, size_t>> get_offsets_and_lengths(
+      size_t observation_id) const;
+
   /// Retrieve volume data for IDs in
   /// `[start_observation_value, end_observation_value]`.
   ///
@@ -222,13 +342,96 @@ class VolumeData : public h5::Object {
 
   const std::string& subfile_path() const override { return path_; }
 
+  /// The extension of the group that holds the observation index of the
+  /// subfile. See the documentation of `h5::VolumeData` for details.
+  static std::string index_extension() { return ".idx"; }
+
  private:
+  // The element metadata of an observation as it is stored in the file
+  struct ElementMetadata {
+    std::vector<char> grid_names{};
+    std::vector<size_t> total_extents{};
+    std::vector<int> bases{};
+    std::vector<int> quadratures{};
+  };
+
+  // Observation IDs sorted by their observation value, the observation value
+  // for each ID, and where to find the element metadata of each observation in
+  // the index group
+  struct ObservationIndex {
+    std::vector<size_t> observation_ids{};
+    std::unordered_map<size_t, double> observation_values{};
+    // The metadata set in the index group that holds the element metadata of
+    // the observation. Observations that aren't listed here (e.g. because the
+    // index was rebuilt from an older file) have their element metadata only
+    // in their observation group.
+    std::unordered_map<size_t, size_t> metadata_sets{};
+    // The end of each metadata set in the element metadata datasets of the
+    // index group, in the order grid_names, total_extents, bases, quadratures
+    std::vector<std::array<size_t, 4>> metadata_set_ends{};
+    // The most recently written metadata set, to detect when it can be reused
+    std::optional<ElementMetadata> last_metadata_set{};
+    // Whether the index group lists all observations in the subfile, so new
+    // observations can be appended to it
+    bool is_stored{false};
+  };
+
+  // Structural information about a single observation. Each entry is read
+  // from the file the first time it is requested.
+  struct ObservationMetadata {
+    size_t observation_id{};
+    std::optional<size_t> metadata_set{};
+    std::optional<std::vector<std::string>> grid_names{};
+    std::optional<std::vector<std::vector<size_t>>> extents{};
+    std::optional<std::vector<std::pair<size_t, size_t>>> offsets_and_lengths{};
+    std::optional<std::vector<std::vector<Spectral::Basis>>> bases{};
+    std::optional<std::vector<std::vector<Spectral::Quadrature>>> quadratures{};
+    std::optional<std::vector<std::string>> tensor_components{};
+  };
+
+  // Name of the group next to the subfile group that holds the index
+  std::string index_group_name() const;
+
+  // Load the observation index from the index group, or construct it by
+  // scanning all observation groups if the index group is missing or out of
+  // date
+  const ObservationIndex& observation_index() const;
+
+  // Append an observation to the index group, rewriting the index group first
+  // if it is missing or out of date
+  void insert_into_observation_index(size_t observation_id,
+                                     double observation_value,
+                                     ElementMetadata element_metadata);
+
+  // Open the group that holds the element metadata dataset `name` of the
+  // observation, and find the range of the dataset that belongs to the
+  // observation. The range is `std::nullopt` if the group is the observation
+  // group, so the whole dataset belongs to the observation.
+  std::pair<detail::OpenGroup, std::optional<std::pair<size_t, size_t>>>
+  element_metadata_location(size_t observation_id,
+                            const std::string& name) const;
+
+  // Metadata cache for `observation_id`. Only the most recently accessed
+  // observation is cached to keep memory usage bounded.
+  ObservationMetadata& observation_metadata(size_t observation_id) const;
+
+  // Forget all cached metadata for `observation_id`
+  void invalidate_observation_metadata(size_t observation_id);
+
+  // Options for `write_tensor_component` with `DataVector` data
+  WriteOptions data_vector_write_options() const;
+
   detail::OpenGroup group_{};
   std::string name_{};
   std::string path_{};
   uint32_t version_{};
   detail::OpenGroup volume_data_group_{};
   std::string header_{};
+  WriteOptions write_options_{};
+  bool write_options_set_{false};
+  mutable std::optional<size_t> dimension_{};
+  mutable std::optional<ObservationIndex> observation_index_{};
+  mutable std::optional<ObservationMetadata> observation_metadata_{};
 };
 
 /*!
@@ -245,6 +448,8 @@ class VolumeData : public h5::Object {
  * and `all_extents` arguments, respectively. This means you can retrieve this
  * information from an `h5::VolumeData` once and use it to call
  * `offset_and_length_for_grid` multiple times with different `grid_name`s.
+ * To find the data for many grids, prefer `h5::offsets_and_lengths_for_grids`,
+ * which handles all grids in a single pass.
  *
  * Here is an example for using this function:
  *
@@ -257,6 +462,22 @@ std::pair<size_t, size_t> offset_and_length_for_grid(
     const std::vector<std::string>& all_grid_names,
     const std::vector<std::vector<size_t>>& all_extents);
 
+/*!
+ * \brief Find the intervals within the contiguous dataset stored in
+ * `h5::VolumeData` that hold data for all grids.
+ *
+ * Returns the offset and length of every grid's data, in the order in which the
+ * grids are listed in `all_extents`. This is equivalent to calling
+ * `h5::offset_and_length_for_grid` for every grid, but takes only a single pass
+ * over the extents rather than a pass per grid. Pass the result of
+ * `h5::VolumeData::get_extents` as the `all_extents` argument, or use
+ * `h5::VolumeData::get_offsets_and_lengths` directly.
+ *
+ * \see `h5::VolumeData`
+ */
+std::vector<std::pair<size_t, size_t>> offsets_and_lengths_for_grids(
+    const std::vector<std::vector<size_t>>& all_extents);
+
 template <size_t Dim>
 Mesh<Dim> mesh_for_grid(
     const std::string& grid_name,
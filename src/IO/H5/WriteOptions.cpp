@@ -0,0 +1,58 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "IO/H5/WriteOptions.hpp"
+
+#include <ostream>
+#include <string>
+
+#include "Utilities/Algorithm.hpp"
+#include "Utilities/ErrorHandling/Error.hpp"
+#include "Utilities/StdHelpers.hpp"
+
+namespace h5 {
+WriteOptions WriteOptions::uncompressed() {
+  WriteOptions options{};
+  options.compression_level = 0;
+  options.chunk_size = 0;
+  return options;
+}
+
+bool WriteOptions::is_float_tensor_component(
+    const std::string& component_name) const {
+  return alg::found(float_tensor_components, component_name);
+}
+
+bool operator==(const WriteOptions& lhs, const WriteOptions& rhs) {
+  return lhs.compression_level == rhs.compression_level and
+         lhs.shuffle == rhs.shuffle and lhs.chunk_size == rhs.chunk_size and
+         lhs.float_tensor_components == rhs.float_tensor_components;
+}
+
+bool operator!=(const WriteOptions& lhs, const WriteOptions& rhs) {
+  return not(lhs == rhs);
+}
+
+std::ostream& operator<<(std::ostream& os, const WriteOptions& options) {
+  using ::operator<<;
+  return os << "(compression_level=" << options.compression_level
+            << ", shuffle=" << std::boolalpha << options.shuffle
+            << ", chunk_size=" << options.chunk_size
+            << ", float_tensor_components=" << options.float_tensor_components
+            << ")";
+}
+
+namespace detail {
+void check_write_options(const WriteOptions& options) {
+  if (options.compression_level > 9) {
+    ERROR_NO_TRACE("The compression level must be between 0 and 9, but is "
+                   << options.compression_level << ".");
+  }
+  if (options.compression_level > 0 and options.chunk_size == 0) {
+    ERROR_NO_TRACE(
+        "Contiguous datasets (chunk size 0) can't be compressed. Set the "
+        "compression level to 0 or choose a nonzero chunk size.");
+  }
+}
+}  // namespace detail
+}  // namespace h5
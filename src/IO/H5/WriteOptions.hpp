@@ -0,0 +1,65 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+/// \file
+/// Defines struct h5::WriteOptions
+
+#pragma once
+
+#include <cstddef>
+#include <iosfwd>
+#include <string>
+#include <vector>
+
+namespace h5 {
+/*!
+ * \ingroup HDF5Group
+ * \brief Options that control how datasets are stored in an H5 file.
+ *
+ * By default, datasets are split into chunks of about 128 KiB and compressed
+ * with gzip at level 5 after applying the byte-shuffle filter. This makes
+ * files considerably smaller, but writing (and reading) the data costs time.
+ * Lower compression levels or no compression at all are faster to write, which
+ * is useful for data that is read back soon and then deleted. Setting the
+ * `chunk_size` to zero stores datasets contiguously, which also allows
+ * memory-mapping them when reading (see `h5::VolumeData` and the Python module
+ * `spectre.IO.H5.MemoryMap`). HDF5 can only apply filters to chunked
+ * datasets, so contiguous datasets can't be compressed.
+ *
+ * Volume data written with `h5::VolumeData` can additionally be downcast to
+ * single precision. The tensor components listed in `float_tensor_components`
+ * are stored as `float` even if they are passed to the writer in double
+ * precision.
+ */
+struct WriteOptions {
+  /// gzip compression level between 0 (no compression) and 9 (smallest files).
+  /// Datasets are written uncompressed if the gzip filter is not available.
+  size_t compression_level = 5;
+  /// Apply the byte-shuffle filter before compressing. Only has an effect if
+  /// the data is compressed.
+  bool shuffle = true;
+  /// Target number of bytes per chunk, or zero to store datasets contiguously.
+  /// Powers of two are significantly faster to compress.
+  size_t chunk_size = 131'072;
+  /// Names of tensor components that are stored in single precision when
+  /// writing volume data.
+  std::vector<std::string> float_tensor_components{};
+
+  /// Options that store datasets contiguously and without compression
+  static WriteOptions uncompressed();
+
+  /// Whether or not the tensor component `component_name` is stored in single
+  /// precision
+  bool is_float_tensor_component(const std::string& component_name) const;
+};
+
+bool operator==(const WriteOptions& lhs, const WriteOptions& rhs);
+bool operator!=(const WriteOptions& lhs, const WriteOptions& rhs);
+
+std::ostream& operator<<(std::ostream& os, const WriteOptions& options);
+
+namespace detail {
+// Check that the combination of options is supported by HDF5
+void check_write_options(const WriteOptions& options);
+}  // namespace detail
+}  // namespace h5
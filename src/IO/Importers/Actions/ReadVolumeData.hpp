@@ -4,9 +4,11 @@
 #pragma once
 
 #include <cstddef>
+#include <memory>
 #include <optional>
 #include <string>
 #include <tuple>
+#include <unordered_map>
 #include <variant>
 #include <vector>
 
@@ -16,6 +18,8 @@
 #include "DataStructures/DataVector.hpp"
 #include "DataStructures/Tensor/Tensor.hpp"
 #include "Domain/BlockLogicalCoordinates.hpp"
+#include "Domain/BlockSpatialIndex.hpp"
+#include "Domain/DeserializationCache.hpp"
 #include "Domain/Domain.hpp"
 #include "Domain/ElementLogicalCoordinates.hpp"
 #include "Domain/Structure/ElementId.hpp"
@@ -41,7 +45,6 @@
 #include "Utilities/Literals.hpp"
 #include "Utilities/Overloader.hpp"
 #include "Utilities/Requires.hpp"
-#include "Utilities/Serialization/Serialize.hpp"
 #include "Utilities/TMPL.hpp"
 #include "Utilities/TaggedTuple.hpp"
 
@@ -442,10 +445,16 @@ struct ReadAllVolumeDataAndDistribute {
     // Open every file in turn
     std::optional<size_t> prev_observation_id{};
     double observation_value = std::numeric_limits<double>::signaling_NaN();
-    std::optional<Domain<Dim>> source_domain{};
-    std::unordered_map<std::string,
-                       std::unique_ptr<domain::FunctionsOfTime::FunctionOfTime>>
-        source_domain_functions_of_time{};
+    // The deserialized domain and functions of time are cached, so they are
+    // deserialized only once even if the data is imported repeatedly
+    std::shared_ptr<const Domain<Dim>> source_domain{};
+    std::shared_ptr<const domain::FunctionsOfTimeMap>
+        source_domain_functions_of_time =
+            std::make_shared<const domain::FunctionsOfTimeMap>();
+    // Bounding boxes of the source blocks, so the target points are only
+    // searched for in the blocks that may contain them. The domain and the
+    // observation are the same in all files, so this is built only once.
+    std::optional<BlockSpatialIndex<Dim>> source_spatial_index{};
     for (const std::string& file_name : file_paths) {
       // Open the volume data file
       h5::H5File<h5::AccessType::ReadOnly> h5file(file_name);
@@ -498,6 +507,13 @@ struct ReadAllVolumeDataAndDistribute {
       const auto source_bases = volume_file.get_bases(observation_id);
       const auto source_quadratures =
           volume_file.get_quadratures(observation_id);
+      const auto source_offsets_and_lengths =
+          volume_file.get_offsets_and_lengths(observation_id);
+      std::unordered_map<std::string, size_t> source_grid_indices{};
+      source_grid_indices.reserve(source_grid_names.size());
+      for (size_t i = 0; i < source_grid_names.size(); ++i) {
+        source_grid_indices.emplace(source_grid_names[i], i);
+      }
       std::vector<ElementId<Dim>> source_element_ids{};
       if (enable_interpolation) {
         // Need to parse all source grid names to element IDs only if
@@ -514,12 +530,13 @@ struct ReadAllVolumeDataAndDistribute {
                          << file_name << volume_file.subfile_path()
                          << "'. The domain is needed for interpolation.");
         }
-        if (source_domain.has_value()) {
+        if (source_domain != nullptr) {
 #ifdef SPECTRE_DEBUG
           // Check that the domain is the same in all files (only in debug mode)
           const auto deserialized_domain =
-              deserialize<Domain<Dim>>(serialized_domain->data());
-          if (*source_domain != deserialized_domain) {
+              domain::deserialize_domain_cached<Dim>(*serialized_domain);
+          if (deserialized_domain != source_domain and
+              *source_domain != *deserialized_domain) {
             ERROR_NO_TRACE(
                 "The domain in all volume files must be the same. Domain in "
                 "file '"
@@ -528,10 +545,11 @@ struct ReadAllVolumeDataAndDistribute {
           }
 #endif
         } else {
-          source_domain = deserialize<Domain<Dim>>(serialized_domain->data());
+          source_domain =
+              domain::deserialize_domain_cached<Dim>(*serialized_domain);
         }
         // Reconstruct functions of time from volume data file
-        if (source_domain_functions_of_time.empty() and
+        if (source_domain_functions_of_time->empty() and
             alg::any_of(source_domain->blocks(), [](const auto& block) {
               return block.is_time_dependent();
             })) {
@@ -543,10 +561,13 @@ struct ReadAllVolumeDataAndDistribute {
                            << "'. The functions of time are needed for "
                               "interpolating with time-dependent maps.");
           }
-          source_domain_functions_of_time = deserialize<std::unordered_map<
-              std::string,
-              std::unique_ptr<domain::FunctionsOfTime::FunctionOfTime>>>(
-              serialized_functions_of_time->data());
+          source_domain_functions_of_time =
+              domain::deserialize_functions_of_time_cached(
+                  *serialized_functions_of_time);
+        }
+        if (not source_spatial_index.has_value()) {
+          source_spatial_index.emplace(*source_domain, observation_value,
+                                       *source_domain_functions_of_time);
         }
       }
 
@@ -572,8 +593,8 @@ struct ReadAllVolumeDataAndDistribute {
           // Transform the target points to block logical coords in the source
           // domain
           const auto source_block_logical_coords = block_logical_coordinates(
-              *source_domain, target_points, observation_value,
-              source_domain_functions_of_time);
+              *source_domain, *source_spatial_index, target_points,
+              observation_value, *source_domain_functions_of_time);
           // Find the target points in the subset of source elements contained
           // in this volume file
           source_element_logical_coords = element_logical_coordinates(
@@ -588,8 +609,7 @@ struct ReadAllVolumeDataAndDistribute {
         } else {
           // When interpolation is disabled we process only volume files that
           // contain the exact element
-          if (std::find(source_grid_names.begin(), source_grid_names.end(),
-                        target_grid_name) == source_grid_names.end()) {
+          if (source_grid_indices.count(target_grid_name) == 0) {
             continue;
           }
           overlapping_source_element_ids.push_back(target_element_id);
@@ -607,9 +627,9 @@ struct ReadAllVolumeDataAndDistribute {
         for (const auto& source_element_id : overlapping_source_element_ids) {
           const auto source_grid_name = get_output(source_element_id);
           // Find the data offset that corresponds to this element
-          const auto element_data_offset_and_length =
-              h5::offset_and_length_for_grid(source_grid_name,
-                                             source_grid_names, source_extents);
+          const auto& element_data_offset_and_length =
+              source_offsets_and_lengths[source_grid_indices.at(
+                  source_grid_name)];
           // Extract this element's data from the read-in dataset
           auto source_element_data =
               detail::extract_element_data<FieldTagsList>(
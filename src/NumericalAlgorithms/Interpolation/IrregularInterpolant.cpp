@@ -243,22 +243,94 @@ DataVector Irregular<Dim>::interpolate(const DataVector& input) const {
 template <size_t Dim>
 void Irregular<Dim>::interpolate(const gsl::not_null<gsl::span<double>*> result,
                                  const gsl::span<const double>& input) const {
-  const size_t m = interpolation_matrix_.rows();
   const size_t k = interpolation_matrix_.columns();
   ASSERT(input.size() % k == 0,
          "Number of points in 'input', "
              << input.size()
              << ",\n must be a multiple of the source grid points, " << k
              << ", that was passed into the constructor");
-  const size_t number_of_components = input.size() / k;
+  interpolate(result, input, input.size() / k, k);
+}
+
+template <size_t Dim>
+void Irregular<Dim>::interpolate(const gsl::not_null<gsl::span<double>*> result,
+                                 const gsl::span<const float>& input) const {
+  const size_t k = interpolation_matrix_.columns();
+  ASSERT(input.size() % k == 0,
+         "Number of points in 'input', "
+             << input.size()
+             << ",\n must be a multiple of the source grid points, " << k
+             << ", that was passed into the constructor");
+  interpolate(result, input, input.size() / k, k);
+}
+
+template <size_t Dim>
+void Irregular<Dim>::interpolate(const gsl::not_null<gsl::span<double>*> result,
+                                 const gsl::span<const double>& input,
+                                 const size_t number_of_components,
+                                 const size_t input_stride) const {
+  const size_t m = interpolation_matrix_.rows();
+  const size_t k = interpolation_matrix_.columns();
+  ASSERT(input_stride >= k, "The input stride, "
+                                << input_stride
+                                << ", must be at least the number of source "
+                                   "grid points, "
+                                << k);
+  ASSERT(number_of_components == 0 or
+             input.size() >= (number_of_components - 1) * input_stride + k,
+         "The 'input' of size " << input.size() << " is too small for "
+                                << number_of_components
+                                << " components with stride " << input_stride);
   ASSERT(result->size() == number_of_components * m,
          "The result must be of size " << number_of_components * m
                                        << " but got " << result->size());
-  dgemm_<true>('N', 'N', interpolation_matrix_.rows(), number_of_components,
-               interpolation_matrix_.columns(), 1.0,
-               interpolation_matrix_.data(), interpolation_matrix_.rows(),
-               input.data(), interpolation_matrix_.columns(), 0.0,
-               result->data(), interpolation_matrix_.rows());
+  if (number_of_components == 0) {
+    return;
+  }
+  // The input is a k x number_of_components matrix with leading dimension
+  // input_stride
+  dgemm_<true>('N', 'N', m, number_of_components, k, 1.0,
+               interpolation_matrix_.data(), interpolation_matrix_.spacing(),
+               input.data(), input_stride, 0.0, result->data(), m);
+}
+
+template <size_t Dim>
+void Irregular<Dim>::interpolate(const gsl::not_null<gsl::span<double>*> result,
+                                 const gsl::span<const float>& input,
+                                 const size_t number_of_components,
+                                 const size_t input_stride) const {
+  const size_t m = interpolation_matrix_.rows();
+  const size_t k = interpolation_matrix_.columns();
+  ASSERT(input_stride >= k, "The input stride, "
+                                << input_stride
+                                << ", must be at least the number of source "
+                                   "grid points, "
+                                << k);
+  ASSERT(number_of_components == 0 or
+             input.size() >= (number_of_components - 1) * input_stride + k,
+         "The 'input' of size " << input.size() << " is too small for "
+                                << number_of_components
+                                << " components with stride " << input_stride);
+  ASSERT(result->size() == number_of_components * m,
+         "The result must be of size " << number_of_components * m
+                                       << " but got " << result->size());
+  // There's no BLAS routine for mixed precision, so we multiply by hand. The
+  // loops run over the columns of the (column-major) interpolation matrix so
+  // its memory is traversed contiguously, and all components are accumulated
+  // in the same pass over the matrix.
+  std::fill(result->begin(), result->end(), 0.);
+  for (size_t j = 0; j < k; ++j) {
+    const double* const matrix_column =
+        interpolation_matrix_.data() + j * interpolation_matrix_.spacing();
+    for (size_t c = 0; c < number_of_components; ++c) {
+      double* const result_component = result->data() + c * m;
+      const double input_value =
+          static_cast<double>(input[c * input_stride + j]);
+      for (size_t i = 0; i < m; ++i) {
+        result_component[i] += matrix_column[i] * input_value;
+      }
+    }
+  }
 }
 
 template <size_t Dim>
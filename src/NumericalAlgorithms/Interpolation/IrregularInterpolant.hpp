@@ -68,9 +68,38 @@ class Irregular {
   DataVector interpolate(const DataVector& input) const;
   /// @}
 
+  /// @{
   /// \brief Interpolate multiple variables on the grid to the target points.
+  ///
+  /// The `input` can be in single precision, e.g. when it was read from a
+  /// volume data file that stores single-precision data. The interpolation is
+  /// accumulated in double precision in that case as well, so the input
+  /// doesn't have to be converted to double precision first.
   void interpolate(gsl::not_null<gsl::span<double>*> result,
                    const gsl::span<const double>& input) const;
+  void interpolate(gsl::not_null<gsl::span<double>*> result,
+                   const gsl::span<const float>& input) const;
+  /// @}
+
+  /// @{
+  /// \brief Interpolate `number_of_components` variables on the grid to the
+  /// target points at once.
+  ///
+  /// The data of component `c` on the grid starts at `input[c * input_stride]`,
+  /// so the components don't have to be contiguous. For example, the data of
+  /// one element can be interpolated directly out of a buffer that holds the
+  /// data of many elements, one tensor component after the other. The
+  /// `result` holds the interpolated components one after the other. Double
+  /// precision data is interpolated with a single matrix-matrix
+  /// multiplication. Single precision data is accumulated in double precision
+  /// in one pass over the interpolation matrix.
+  void interpolate(gsl::not_null<gsl::span<double>*> result,
+                   const gsl::span<const double>& input,
+                   size_t number_of_components, size_t input_stride) const;
+  void interpolate(gsl::not_null<gsl::span<double>*> result,
+                   const gsl::span<const float>& input,
+                   size_t number_of_components, size_t input_stride) const;
+  /// @}
 
  private:
   friend bool operator==(const Irregular& lhs, const Irregular& rhs) {
@@ -43,6 +43,33 @@ def _list_tensor_components(observation):
     return components
 
 
+def _list_observations(vol_subfile):
+    """List observation groups and their observation values
+
+    Uses the observation index stored next to the subfile (see
+    'spectre.IO.H5.H5Vol') if it is available and up to date. Otherwise, reads
+    the observation value from every observation group.
+    """
+    keys = list(vol_subfile.keys())
+    index_name = vol_subfile.name[: -len(".vol")] + ".idx"
+    index_group = vol_subfile.file.get(index_name)
+    if (
+        isinstance(index_group, h5py.Group)
+        and "observation_ids" in index_group
+        and "observation_values" in index_group
+    ):
+        index = [
+            (f"ObservationId{obs_id}", obs_value)
+            for obs_id, obs_value in zip(
+                index_group["observation_ids"][()],
+                index_group["observation_values"][()],
+            )
+        ]
+        if sorted(key for key, _ in index) == sorted(keys):
+            return index
+    return [(key, vol_subfile[key].attrs["observation_value"]) for key in keys]
+
+
 def _xmf_dtype(dtype: type):
     assert dtype in [
         np.dtype("float32"),
@@ -365,10 +392,7 @@ def generate_xdmf(
 
         # Sort timesteps by time
         temporal_ids_and_values = sorted(
-            [
-                (key, vol_subfile[key].attrs["observation_value"])
-                for key in vol_subfile.keys()
-            ],
+            _list_observations(vol_subfile),
             key=lambda key_and_time: key_and_time[1],
         )
 
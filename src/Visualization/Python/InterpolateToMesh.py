@@ -120,6 +120,7 @@ def interpolate_to_mesh(
         quadratures = source_vol.get_quadratures(obs)
         tensor_names = source_vol.list_tensor_components(obs)
         grid_names = source_vol.get_grid_names(obs)
+        offsets_and_lengths = source_vol.get_offsets_and_lengths(obs)
         obs_value = source_vol.get_observation_value(obs)
 
         if components_to_interpolate:
@@ -144,8 +145,8 @@ def interpolate_to_mesh(
 
         volume_data = []
         # iterate over elements
-        for grid_name, extent, basis, quadrature in zip(
-            grid_names, extents, bases, quadratures
+        for grid_name, extent, basis, quadrature, (offset, length) in zip(
+            grid_names, extents, bases, quadratures, offsets_and_lengths
         ):
             source_mesh = Spectral.Mesh[dim](extent, basis, quadrature)
 
@@ -154,9 +155,6 @@ def interpolate_to_mesh(
             )
 
             tensor_comps = []
-            offset, length = spectre_h5.offset_and_length_for_grid(
-                grid_name, grid_names, extents
-            )
             # iterate over tensors
             for j, tensor in enumerate(tensors):
                 component_data = DataVector(
@@ -11,7 +11,7 @@ import matplotlib.animation
 import matplotlib.pyplot as plt
 import numpy as np
 
-from spectre.IO.Exporter import interpolate_to_points
+from spectre.IO.Exporter import InterpolationPlan
 from spectre.Visualization.OpenVolfiles import (
     open_volfiles,
     open_volfiles_command,
@@ -141,15 +141,18 @@ def plot_along_line(
         fontsize=9,
     )
 
+    # Set up the interpolation once and reuse it for all observations
+    interpolation_plan = InterpolationPlan[len(target_coords)](
+        h5_files,
+        subfile_name=subfile_name,
+        target_points=target_coords,
+        extrapolate_into_excisions=extrapolate_into_excisions,
+        num_threads=num_threads,
+    )
+
     def update_plot(obs_id, obs_time):
-        vars_on_line = interpolate_to_points(
-            h5_files,
-            subfile_name=subfile_name,
-            observation_id=obs_id,
-            tensor_components=vars,
-            target_points=target_coords,
-            extrapolate_into_excisions=extrapolate_into_excisions,
-            num_threads=num_threads,
+        vars_on_line = interpolation_plan.interpolate(
+            observation_id=obs_id, tensor_components=vars
         )
         for y, var_name, line in zip(vars_on_line, vars, lines):
             line.set_data(x, y)
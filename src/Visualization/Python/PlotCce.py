@@ -16,7 +16,7 @@ from spectre.Visualization.Plot import (
     apply_stylesheet_command,
     show_or_save_plot_command,
 )
-from spectre.Visualization.ReadH5 import available_subfiles, to_dataframe
+from spectre.Visualization.ReadH5 import available_subfiles, read_cce_modes
 
 logger = logging.getLogger(__name__)
 
@@ -135,23 +135,23 @@ def plot_cce(
                 choices=cce_subfiles,
             )
 
-        suffix = ".dat" if backward_cce_group is not None else ""
-
-        # Only take the columns that we need and prefix the columns with their
-        # quantity so we can have just one DataFrame
-        data = pd.concat(
-            [
-                to_dataframe(cce_subfile.get(quantity + suffix))
-                .set_index("time")[modes]
-                .add_prefix(quantity)
-                for quantity in plot_quantities
-            ],
-            axis=1,
+        # Only read the modes and times that we need and prefix the columns
+        # with their quantity so we can have just one DataFrame
+        ell_and_m = list(
+            dict.fromkeys(
+                tuple(int(i) for i in mode.split("_")[1].split(","))
+                for mode in modes
+            )
         )
-
-    # Restrict to x-bounds if we have any
-    if x_bounds:
-        data = data[(data.index >= x_bounds[0]) & (data.index <= x_bounds[1])]
+        data = {}
+        for quantity in plot_quantities:
+            time, mode_data = read_cce_modes(
+                cce_subfile, quantity, ell_and_m, time_range=x_bounds or None
+            )
+            for (l, m), coefficients in zip(ell_and_m, mode_data.T):
+                data[f"{quantity}Real Y_{l},{m}"] = coefficients.real
+                data[f"{quantity}Imag Y_{l},{m}"] = coefficients.imag
+        data = pd.DataFrame(data, index=time)
 
     # Set up the plots
     if fig is None:
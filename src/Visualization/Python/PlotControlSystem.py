@@ -17,7 +17,7 @@ from spectre.Visualization.Plot import (
     apply_stylesheet_command,
     show_or_save_plot_command,
 )
-from spectre.Visualization.ReadH5 import available_subfiles, to_dataframe
+from spectre.Visualization.ReadH5 import SegmentedDat, available_subfiles
 
 logger = logging.getLogger(__name__)
 
@@ -63,29 +63,27 @@ def plot_control_system(
         # No size control
         return [key for key in control_system_dir.keys() if "Size" not in key]
 
-    # Given an h5 file and a subfile, make sure that the subfile exists inside
-    # the h5 file. Then return the subfile as a DataFrame (with "Time" as the
-    # index)
-    def check_control_system_file(
-        h5_filename: str,
-        h5file: h5py.File,
-        control_system_name: str,
-        component_name: str,
-    ):
+    # Given a control system and component name, make sure that the subfile
+    # exists in the h5 files. Then return the relevant columns of the subfile
+    # across all h5 files as a DataFrame (with "Time" as the index). Only the
+    # rows within the x-bounds are read.
+    def read_control_system_file(control_system_name: str, component_name: str):
         subfile_path = (
             f"/ControlSystems/{control_system_name}/{component_name}.dat"
         )
-        subfile = h5file.get(subfile_path)
-        if subfile_path is None:
-            raise RequiredChoiceError(
-                (
-                    f"Unable to open control system subfile '{subfile_path}'"
-                    f" from h5 file {h5_filename}."
-                ),
-                choices=available_subfiles(h5file, extension=".dat"),
-            )
-
-        return to_dataframe(subfile).set_index("Time")
+        try:
+            subfile = SegmentedDat(reduction_files, subfile_path)
+        except KeyError as err:
+            with h5py.File(reduction_files[0], "r") as h5file:
+                raise RequiredChoiceError(
+                    str(err.args[0]),
+                    choices=available_subfiles(h5file, extension=".dat"),
+                ) from err
+        with subfile:
+            return subfile.to_dataframe(
+                columns=["Time"] + relevant_columns,
+                time_range=x_bounds or None,
+            ).set_index("Time")
 
     # Given an h5 file name and a control system name, return a list of all
     # components for that control system
@@ -126,46 +124,33 @@ def plot_control_system(
         if "Shape" not in system or with_shape
     }
 
-    # Open every h5file. For each h5file, turn each component of each control
-    # system into a DataFrame and concat it with the large data frame
+    # Turn each component of each control system into a DataFrame that spans
+    # all h5files and concat it with the large data frame. We assume the
+    # components of all control systems have the same indexes (times) so we
+    # concat along axis=1
     data = pd.DataFrame()
-    for reduction_file in reduction_files:
-        h5file = h5py.File(reduction_file)
-        file_df = pd.DataFrame()
-
-        for system in control_system_components:
-            for component in control_system_components[system]:
-                tmp_data = check_control_system_file(
-                    reduction_file, h5file, system, component
+    for system in control_system_components:
+        for component in control_system_components[system]:
+            tmp_data = read_control_system_file(system, component)
+            tmp_data = extract_relevant_columns(tmp_data, system, component)
+            data = pd.concat([data, tmp_data], axis=1)
+
+        if "Shape" not in system or show_all_m:
+            continue
+
+        # If this is the shape system and we don't want to show all m, we
+        # take the L2 norm over all m for a given l
+        for l in range(2, shape_l_max + 1):
+            component_prefix = f"l{l}m"
+            for column in relevant_columns:
+                components_to_norm = [
+                    f"{system}{component_prefix}{m}{column}"
+                    for m in range(-l, l + 1)
+                ]
+
+                data[f"{system}{component_prefix}{column}"] = np.sqrt(
+                    np.square(data[components_to_norm].to_numpy()).sum(axis=1)
                 )
-                tmp_data = extract_relevant_columns(tmp_data, system, component)
-                # When we concat DataFrames from within an H5 file together, we
-                # assume they have the same indexes (times) so we concat along
-                # axis=1
-                file_df = pd.concat([file_df, tmp_data], axis=1)
-
-            if "Shape" not in system or show_all_m:
-                continue
-
-            # If this is the shape system and we don't want to show all m, we
-            # take the L2 norm over all m for a given l
-            for l in range(2, shape_l_max + 1):
-                component_prefix = f"l{l}m"
-                for column in relevant_columns:
-                    components_to_norm = [
-                        f"{system}{component_prefix}{m}{column}"
-                        for m in range(-l, l + 1)
-                    ]
-
-                    file_df[f"{system}{component_prefix}{column}"] = np.sqrt(
-                        np.square(file_df[components_to_norm].to_numpy()).sum(
-                            axis=1
-                        )
-                    )
-
-        # When concating the large DataFrames from each H5 file together, we
-        # assume all the columns are the same so we concat along axis=0
-        data = pd.concat([data, file_df])
 
     # If we aren't showing all m for shape control, modify the shape components
     # that are being plotted
@@ -179,10 +164,6 @@ def plot_control_system(
             for l in range(2, shape_l_max + 1):
                 control_system_components[system].append(f"l{l}m")
 
-    # Restrict data to bounds
-    if x_bounds:
-        data = data[(data.index >= x_bounds[0]) & (data.index <= x_bounds[1])]
-
     # Set up plots
     fig, axes = plt.subplots(2, 1, sharex=True)
 
@@ -16,7 +16,7 @@ from spectre.Visualization.Plot import (
     apply_stylesheet_command,
     show_or_save_plot_command,
 )
-from spectre.Visualization.ReadH5 import available_subfiles
+from spectre.Visualization.ReadH5 import available_subfiles, to_dataframe
 
 logger = logging.getLogger(__name__)
 
@@ -197,19 +197,19 @@ def plot_dat_command(
             marker="." if len(dat_file) < 20 else None,
         )
 
-        # Plot the selected quantities
-        for function, label in functions.items():
+        # Read only the selected quantities
+        for function in functions:
             if function not in legend:
                 raise RequiredChoiceError(
                     f"Unknown function '{function}'.", choices=legend
                 )
+        data = to_dataframe(
+            dat_file, columns=list(dict.fromkeys([x_axis, *functions]))
+        )
 
-            plt.plot(
-                dat_file[:, legend.index(x_axis)],
-                dat_file[:, legend.index(function)],
-                label=label,
-                **plot_kwargs,
-            )
+    # Plot the selected quantities
+    for function, label in functions.items():
+        plt.plot(data[x_axis], data[function], label=label, **plot_kwargs)
 
     # Configure the axes
     if y_logscale:
@@ -34,6 +34,19 @@ def split_iteration_sequence(data: pd.DataFrame) -> List[pd.DataFrame]:
     return [data.iloc[split_index] for split_index in split_indices]
 
 
+def _read_residuals(residuals_subfile: h5py.Dataset) -> pd.DataFrame:
+    """Read only the columns that we plot. Not all subfiles have a walltime."""
+    legend = list(residuals_subfile.attrs["Legend"])
+    columns = [
+        column
+        for column in ["Iteration", "Walltime", "Residual"]
+        if column in legend
+    ]
+    return to_dataframe(residuals_subfile, columns=columns).set_index(
+        "Iteration"
+    )
+
+
 def plot_elliptic_convergence(
     h5_file,
     fig=None,
@@ -59,15 +72,11 @@ def plot_elliptic_convergence(
                 f" subfiles: {all_subfiles}"
             )
         linear_residuals = split_iteration_sequence(
-            to_dataframe(open_h5file[linear_residuals_subfile_name]).set_index(
-                "Iteration"
-            )
+            _read_residuals(open_h5file[linear_residuals_subfile_name])
         )
         nonlinear_residuals = (
             split_iteration_sequence(
-                to_dataframe(
-                    open_h5file[nonlinear_residuals_subfile_name]
-                ).set_index("Iteration")
+                _read_residuals(open_h5file[nonlinear_residuals_subfile_name])
             )
             if nonlinear_residuals_subfile_name in open_h5file
             else None
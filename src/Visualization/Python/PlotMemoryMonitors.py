@@ -18,7 +18,7 @@ from spectre.Visualization.Plot import (
     apply_stylesheet_command,
     show_or_save_plot_command,
 )
-from spectre.Visualization.ReadH5 import available_subfiles, to_dataframe
+from spectre.Visualization.ReadH5 import SegmentedDat, available_subfiles
 
 logger = logging.getLogger(__name__)
 
@@ -86,59 +86,39 @@ def plot_memory_monitors_command(
 
         return list(memory_monitor_dir.keys())
 
-    # Given an h5 file and a subfile, make sure that the subfile exists inside
-    # the h5 file. Then return the subfile as a DataFrame (with "Time" as the
-    # index)
-    def check_memory_monitor_file(
-        h5_filename: str, h5file: h5py.File, subfile_name: str
-    ):
+    # Given the name of a subfile, read the subfile from all reduction files
+    # and sum all the columns that list totals for each node. Only the rows
+    # within the x-bounds are read.
+    def total_over_nodes(subfile_name: str):
         subfile_path = f"/MemoryMonitors/{subfile_name}"
-        subfile = h5file.get(subfile_path)
-        if subfile_path is None:
-            raise RequiredChoiceError(
-                (
-                    f"Unable to open memory subfile '{subfile_path}'"
-                    f" from h5 file {h5_filename}."
-                ),
-                choices=available_subfiles(h5file, extension=".dat"),
-            )
-
-        return to_dataframe(subfile).set_index("Time")
-
-    # Given a DataFrame, sum all the columns that list totals for each node
-    def total_over_nodes(df: pd.DataFrame):
-        cols_to_sum = [
-            col
-            for col in df.columns
-            if col == "Size (MB)" or "Size on node" in col
-        ]
-        return df[cols_to_sum].sum(axis=1)
+        try:
+            subfile = SegmentedDat(reduction_files, subfile_path)
+        except KeyError as err:
+            with h5py.File(reduction_files[0], "r") as h5file:
+                raise RequiredChoiceError(
+                    str(err.args[0]),
+                    choices=available_subfiles(h5file, extension=".dat"),
+                ) from err
+        with subfile:
+            cols_to_sum = [
+                col
+                for col in subfile.legend
+                if col == "Size (MB)" or "Size on node" in col
+            ]
+            df = subfile.to_dataframe(
+                columns=["Time"] + cols_to_sum, time_range=x_bounds or None
+            ).set_index("Time")
+        return df.sum(axis=1)
 
     # Get a list of all components that we have monitored from the first
     # reductions file
     memory_filenames = check_memory_monitor_dir(reduction_files[0])
 
-    # Open every h5file. For each h5file, turn each subfile into a DataFrame.
-    # Then concat all DataFrames together into one that's indexed by the
-    # subfile/component name.
+    # Read every subfile across all h5files into a DataFrame that's indexed by
+    # the subfile/component name.
     totals_df = pd.DataFrame()
-    for reduction_file in reduction_files:
-        h5file = h5py.File(reduction_file)
-        local_totals_df = pd.DataFrame()
-
-        for subfile_name in memory_filenames:
-            df = check_memory_monitor_file(reduction_file, h5file, subfile_name)
-            local_totals_df[subfile_name] = total_over_nodes(df)
-
-        totals_df = pd.concat([totals_df, local_totals_df])
-
-    # Restrict to x-bounds if there are any
-    for subfile in memory_filenames:
-        if x_bounds is not None:
-            totals_df[subfile] = totals_df[subfile][
-                (totals_df.index >= x_bounds[0])
-                & (totals_df.index <= x_bounds[1])
-            ]
+    for subfile_name in memory_filenames:
+        totals_df[subfile_name] = total_over_nodes(subfile_name)
 
     # Need .dat because all other components have that extension
     the_rest_str = "The Rest.dat"
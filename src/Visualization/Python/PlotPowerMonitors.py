@@ -1,9 +1,11 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
+import functools
 import logging
+import operator
 from itertools import cycle
-from typing import Iterable, Optional, Sequence, Tuple, Union
+from typing import Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 import click
 import matplotlib.pyplot as plt
@@ -14,7 +16,12 @@ from matplotlib.ticker import MaxNLocator
 import spectre.IO.H5 as spectre_h5
 from spectre.DataStructures import DataVector
 from spectre.Domain import Domain, deserialize_domain
-from spectre.IO.H5.IterElements import iter_elements, stripped_element_name
+from spectre.IO.H5.IterElements import (
+    Element,
+    iter_elements,
+    map_reduce_elements,
+    stripped_element_name,
+)
 from spectre.NumericalAlgorithms.LinearOperators import power_monitors
 from spectre.Spectral import Basis
 from spectre.support.CliExceptions import RequiredChoiceError
@@ -49,6 +56,66 @@ def find_block_or_group(
     return None
 
 
+def _element_power_monitors(
+    block_ids: Set[int],
+    skip_filtered_modes: int,
+    element: Element,
+    tensor_data: np.ndarray,
+) -> List[Tuple[int, str, float, List[np.ndarray]]]:
+    """Power monitors of the element, combined as an L2 norm over the tensor
+    components
+
+    Returns a list with the element's block ID, name, time, and power monitors
+    in every dimension, or an empty list if the element is skipped.
+    """
+    # Skip elements in blocks that weren't selected, and FD elements because we
+    # can't compute power monitors for them
+    if element.id.block_id not in block_ids or any(
+        basis == Basis.FiniteDifference for basis in element.mesh.basis()
+    ):
+        return []
+    all_modes = [
+        np.zeros(element.mesh.extents(d) - skip_filtered_modes)
+        for d in range(element.dim)
+    ]
+    for component in tensor_data:
+        modes = power_monitors(DataVector(component), element.mesh)
+        for d, modes_dim in enumerate(modes):
+            num_modes = len(modes_dim) - skip_filtered_modes
+            all_modes[d] += np.array(modes_dim)[:num_modes] ** 2
+    for d in range(element.dim):
+        all_modes[d] = np.sqrt(all_modes[d])
+    return [(element.id.block_id, str(element.id), element.time, all_modes)]
+
+
+def _element_power_monitors_serial(
+    volfiles: Union[spectre_h5.H5Vol, Iterable[spectre_h5.H5Vol]],
+    obs_id: Optional[int],
+    tensor_components: Sequence[str],
+    selected_block_ids: Set[int],
+    element_patterns: Optional[Sequence[str]],
+    skip_filtered_modes: int,
+):
+    for element, tensor_data in iter_elements(
+        volfiles, obs_id, tensor_components, element_patterns=element_patterns
+    ):
+        yield from _element_power_monitors(
+            selected_block_ids, skip_filtered_modes, element, tensor_data
+        )
+
+
+def _selected_block_ids(
+    block_or_group_names: Sequence[str],
+    domain: Union[Domain[1], Domain[2], Domain[3]],
+) -> Set[int]:
+    return set(
+        block.id
+        for block in domain.blocks
+        if find_block_or_group(block.id, block_or_group_names, domain)
+        is not None
+    )
+
+
 def plot_power_monitors(
     volfiles: Union[spectre_h5.H5Vol, Iterable[spectre_h5.H5Vol]],
     obs_id: Optional[int],
@@ -60,7 +127,79 @@ def plot_power_monitors(
     skip_filtered_modes: int = 0,
     figsize: Optional[Tuple[float, float]] = None,
 ):
-    plot_over_time = obs_id is None
+    _plot_element_power_monitors(
+        _element_power_monitors_serial(
+            volfiles,
+            obs_id,
+            tensor_components,
+            _selected_block_ids(block_or_group_names, domain),
+            element_patterns,
+            skip_filtered_modes,
+        ),
+        plot_over_time=obs_id is None,
+        block_or_group_names=block_or_group_names,
+        domain=domain,
+        dimension_labels=dimension_labels,
+        figsize=figsize,
+    )
+
+
+def plot_power_monitors_parallel(
+    h5_files: Union[str, Sequence[str]],
+    subfile_name: str,
+    obs_id: Optional[int],
+    tensor_components: Sequence[str],
+    block_or_group_names: Sequence[str],
+    domain: Union[Domain[1], Domain[2], Domain[3]],
+    dimension_labels: Sequence[str] = [r"$\xi$", r"$\eta$", r"$\zeta$"],
+    element_patterns: Optional[Sequence[str]] = None,
+    skip_filtered_modes: int = 0,
+    figsize: Optional[Tuple[float, float]] = None,
+    num_processes: Optional[int] = None,
+):
+    """Same as 'plot_power_monitors', but computes the power monitors in
+    parallel over the files and observations
+
+    Takes the paths to the H5 files and the name of the volume data subfile
+    instead of open volume files. See
+    'spectre.IO.H5.IterElements.map_reduce_elements' for details.
+    """
+    # The results are in the order of the files and observations, so the time
+    # series are ordered by time
+    all_element_modes = map_reduce_elements(
+        h5_files,
+        subfile_name,
+        functools.partial(
+            _element_power_monitors,
+            _selected_block_ids(block_or_group_names, domain),
+            skip_filtered_modes,
+        ),
+        operator.iadd,
+        obs_ids=obs_id,
+        tensor_components=tensor_components,
+        element_patterns=element_patterns,
+        # Power monitors are computed from DataVectors, which hold doubles
+        dtype=np.float64,
+        num_processes=num_processes,
+    )
+    _plot_element_power_monitors(
+        all_element_modes or [],
+        plot_over_time=obs_id is None,
+        block_or_group_names=block_or_group_names,
+        domain=domain,
+        dimension_labels=dimension_labels,
+        figsize=figsize,
+    )
+
+
+def _plot_element_power_monitors(
+    all_element_modes: Iterable[Tuple[int, str, float, List[np.ndarray]]],
+    plot_over_time: bool,
+    block_or_group_names: Sequence[str],
+    domain: Union[Domain[1], Domain[2], Domain[3]],
+    dimension_labels: Sequence[str],
+    figsize: Optional[Tuple[float, float]],
+):
     # One column per block or group
     num_cols = len(block_or_group_names)
     # One row per dimension if plotted over time to declutter the plots
@@ -95,41 +234,15 @@ def plot_power_monitors(
         num_elements = np.zeros(num_cols, dtype=int)
         max_error = np.zeros((num_cols, domain.dim))
 
-    for element, tensor_data in iter_elements(
-        volfiles, obs_id, tensor_components, element_patterns=element_patterns
-    ):
-        # Skip FD elements because we can't compute power monitors for them
-        if any(
-            basis == Basis.FiniteDifference for basis in element.mesh.basis()
-        ):
-            continue
-
-        # Find the subplot for this element's block, or skip the element if its
-        # block wasn't selected
+    for block_id, element_name, time, all_modes in all_element_modes:
         subplot_index = find_block_or_group(
-            element.id.block_id, block_or_group_names, domain
+            block_id, block_or_group_names, domain
         )
-        if subplot_index is None:
-            continue
-
-        # Compute power monitors and take L2 norm over tensor components
-        all_modes = [
-            np.zeros(element.mesh.extents(d) - skip_filtered_modes)
-            for d in range(element.dim)
-        ]
-        for component in tensor_data:
-            modes = power_monitors(DataVector(component), element.mesh)
-            for d, modes_dim in enumerate(modes):
-                num_modes = len(modes_dim) - skip_filtered_modes
-                all_modes[d] += np.array(modes_dim)[:num_modes] ** 2
-        for d in range(element.dim):
-            all_modes[d] = np.sqrt(all_modes[d])
-
         if plot_over_time:
             # Collect time series of modes
             all_mode_time_series[subplot_index].setdefault(
-                element.id, []
-            ).append((element.time, all_modes))
+                element_name, []
+            ).append((time, all_modes))
         else:
             # Plot modes directly
             ax = axes[0][subplot_index]
@@ -325,6 +438,17 @@ def plot_power_monitors(
         " filtered, zeroing them out."
     ),
 )
+@click.option(
+    "--num-processes",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help=(
+        "Number of worker processes to compute the power monitors with. "
+        "The files and observations are distributed over the processes."
+    ),
+)
 # Plotting options
 @click.option("--figsize", nargs=2, type=float, help="Figure size in inches.")
 @apply_stylesheet_command()
@@ -340,6 +464,7 @@ def plot_power_monitors_command(
     list_elements,
     element_patterns,
     over_time,
+    num_processes,
     **kwargs,
 ):
     """Plot power monitors from volume data
@@ -433,6 +558,22 @@ def plot_power_monitors_command(
     # Close the H5 file because we're done with preprocessing
     open_h5_file.close()
 
+    # Plot in parallel if requested. The worker processes open the files
+    # themselves.
+    if num_processes != 1:
+        plot_power_monitors_parallel(
+            h5_files,
+            subfile_name,
+            obs_id=obs_id,
+            tensor_components=vars,
+            domain=domain,
+            block_or_group_names=block_or_group_names,
+            element_patterns=element_patterns,
+            num_processes=num_processes,
+            **kwargs,
+        )
+        return
+
     # Plot!
     import rich.progress
 
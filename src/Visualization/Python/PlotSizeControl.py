@@ -10,14 +10,13 @@ import click
 import h5py
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 
 from spectre.support.CliExceptions import RequiredChoiceError
 from spectre.Visualization.Plot import (
     apply_stylesheet_command,
     show_or_save_plot_command,
 )
-from spectre.Visualization.ReadH5 import available_subfiles, to_dataframe
+from spectre.Visualization.ReadH5 import SegmentedDat, available_subfiles
 
 logger = logging.getLogger(__name__)
 
@@ -40,35 +39,23 @@ def plot_size_control(
         "" if object_label.lower() == "none" else object_label.upper()
     )
 
-    def check_diagnostics_file(h5_filename):
-        with h5py.File(h5_filename, "r") as h5file:
-            # See src/ControlSystem/ControlErrors/Size.cpp for path
-            diagnostics_file_name = (
-                f"ControlSystems/Size{object_label}/Diagnostics.dat"
-            )
-            diagnostics_data = h5file.get(diagnostics_file_name)
-            if diagnostics_data is None:
+    # See src/ControlSystem/ControlErrors/Size.cpp for path
+    diagnostics_file_name = f"ControlSystems/Size{object_label}/Diagnostics.dat"
+    for reduction_file in reduction_files:
+        with h5py.File(reduction_file, "r") as h5file:
+            if diagnostics_file_name not in h5file:
                 raise RequiredChoiceError(
                     (
                         "Unable to open diagnostic file"
                         f" '{diagnostics_file_name}' from h5 file"
-                        f" {h5_filename}."
+                        f" {reduction_file}."
                     ),
                     choices=available_subfiles(h5file, extension=".dat"),
                 )
 
-            return to_dataframe(diagnostics_data)
-
-    data = pd.concat(
-        check_diagnostics_file(reduction_file)
-        for reduction_file in reduction_files
-    )
-
-    # Restrict data to bounds
-    if x_bounds:
-        data = data[
-            (data["Time"] >= x_bounds[0]) & (data["Time"] <= x_bounds[1])
-        ]
+    # Read the data from all segments, restricted to bounds
+    with SegmentedDat(reduction_files, diagnostics_file_name) as diagnostics:
+        data = diagnostics.to_dataframe(time_range=x_bounds or None)
 
     # Set up plots
     fig, axes = plt.subplots(7, 1, sharex=True)
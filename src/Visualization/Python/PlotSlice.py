@@ -14,7 +14,7 @@ import numpy as np
 import rich
 
 import spectre.IO.H5 as spectre_h5
-from spectre.IO.Exporter import interpolate_to_points
+from spectre.IO.Exporter import InterpolationPlan
 from spectre.Visualization.OpenVolfiles import (
     open_volfiles,
     open_volfiles_command,
@@ -192,17 +192,20 @@ def plot_slice(
         fontsize=9,
     )
 
+    # Set up the interpolation once and reuse it for all observations
+    interpolation_plan = InterpolationPlan[3](
+        h5_files,
+        subfile_name=subfile_name,
+        target_points=target_coords.reshape(3, np.prod(num_samples)),
+        extrapolate_into_excisions=extrapolate_into_excisions,
+        num_threads=num_threads,
+    )
+
     # Interpolate data and plot the slice
     def plot_slice(obs_id, time):
         data = np.array(
-            interpolate_to_points(
-                h5_files,
-                subfile_name=subfile_name,
-                observation_id=obs_id,
-                tensor_components=[var_name],
-                target_points=target_coords.reshape(3, np.prod(num_samples)),
-                extrapolate_into_excisions=extrapolate_into_excisions,
-                num_threads=num_threads,
+            interpolation_plan.interpolate(
+                observation_id=obs_id, tensor_components=[var_name]
             )[0]
         ).reshape(num_samples)
         contours_filled = plt.contourf(
@@ -5,7 +5,6 @@
 import logging
 
 import click
-import h5py
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -15,6 +14,7 @@ from spectre.Visualization.Plot import (
     apply_stylesheet_command,
     show_or_save_plot_command,
 )
+from spectre.Visualization.ReadH5 import SegmentedDat
 
 
 def import_A_and_B(
@@ -22,29 +22,15 @@ def import_A_and_B(
     subfile_name_aha="ApparentHorizons/ControlSystemAhA_Centers.dat",
     subfile_name_ahb="ApparentHorizons/ControlSystemAhB_Centers.dat",
 ):
-    A_data = []
-    B_data = []
-
-    for filename in filenames:
-        with h5py.File(filename, "r") as file:
-            A_data.append(
-                np.array(
-                    file[subfile_name_aha][:, [0, 4, 5, 6]]
-                )  # 0 ->time,  4 -> x, 5 -> y, 6 -> z
-            )
-            B_data.append(
-                np.array(
-                    file[subfile_name_ahb][:, [0, 4, 5, 6]]
-                )  # 0 ->time,  4 -> x, 5 -> y, 6 -> z
-            )
-
-    if A_data and B_data:
-        A = np.concatenate(A_data)
-        B = np.concatenate(B_data)
-        min_length = min(len(A), len(B))
-        return A[:min_length], B[:min_length]
-    else:
+    if not filenames:
         return None, None
+    # Columns: 0 -> time, 4 -> x, 5 -> y, 6 -> z
+    with SegmentedDat(filenames, subfile_name_aha) as subfile_aha:
+        A = subfile_aha.read(columns=[0, 4, 5, 6])
+    with SegmentedDat(filenames, subfile_name_ahb) as subfile_ahb:
+        B = subfile_ahb.read(columns=[0, 4, 5, 6])
+    min_length = min(len(A), len(B))
+    return A[:min_length], B[:min_length]
 
 
 def plot_trajectory(AhA: np.ndarray, AhB: np.ndarray, fig=None):
@@ -3,7 +3,7 @@
 
 import logging
 from pathlib import Path
-from typing import Iterable, List, Tuple, Union
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
 import h5py
 import numpy as np
@@ -53,8 +53,127 @@ def available_subfiles(
     return sorted(subfiles)
 
 
+def _find_row(
+    dataset: h5py.Dataset,
+    before: Callable[[np.ndarray], np.ndarray],
+    first_row: int = 0,
+    last_row: Optional[int] = None,
+) -> int:
+    """First row in [first_row, last_row) of an h5py '.dat' subfile whose time
+    isn't 'before' the time we're looking for
+
+    The first column of the subfile must be the time, sorted in ascending
+    order. The row is found by bisection, like in
+    'spectre.IO.H5.H5Dat.get_rows_in_time_range', so only few values of the
+    time column are read. Returns 'last_row' if all rows are 'before'.
+    """
+    # Stop bisecting at this number of rows and read their times all at once
+    rows_per_read = 256
+    if last_row is None:
+        last_row = len(dataset)
+    while last_row - first_row > rows_per_read:
+        row = first_row + (last_row - first_row) // 2
+        if before(dataset[row, 0]):
+            first_row = row + 1
+        else:
+            last_row = row
+    times = dataset[first_row:last_row, 0]
+    return first_row + int(np.count_nonzero(before(times)))
+
+
+def _rows_in_time_range(
+    dataset: h5py.Dataset,
+    start_time: float,
+    end_time: float,
+    num_rows: Optional[int] = None,
+) -> slice:
+    """Rows of an h5py '.dat' subfile with a time in [start_time, end_time]
+
+    Only the first 'num_rows' rows are searched if specified.
+    """
+    first_row = _find_row(
+        dataset, lambda time: time < start_time, last_row=num_rows
+    )
+    end_row = _find_row(
+        dataset, lambda time: time <= end_time, first_row, last_row=num_rows
+    )
+    return np.s_[first_row:end_row]
+
+
+def _column_indices(
+    legend: Sequence[str],
+    columns: Optional[Sequence[Union[str, int]]],
+    subfile_name: str,
+) -> List[int]:
+    """Indices of the 'columns' (names or indices) in the 'legend'
+
+    Returns all columns if 'columns' is None. Negative indices count from the
+    last column, like in Python, and are converted to non-negative indices.
+    """
+    legend = list(legend)
+    if columns is None:
+        return list(range(len(legend)))
+    column_indices = []
+    for column in columns:
+        if isinstance(column, str):
+            try:
+                column = legend.index(column)
+            except ValueError:
+                raise KeyError(
+                    f"No column '{column}' in subfile '{subfile_name}'."
+                    f" Available columns are: {legend}"
+                )
+        else:
+            column = int(column)
+            if not -len(legend) <= column < len(legend):
+                raise IndexError(
+                    f"Column index {column} is out of range for subfile"
+                    f" '{subfile_name}' with {len(legend)} columns."
+                )
+            column %= len(legend)
+        column_indices.append(column)
+    return column_indices
+
+
+def _read_columns(
+    dataset: h5py.Dataset, rows, column_indices: Sequence[int]
+) -> np.ndarray:
+    """Read only the selected rows and columns of an h5py '.dat' subfile
+
+    The selection is passed to HDF5 as a hyperslab, so only the selected data
+    is read from disk. The 'column_indices' must be non-negative (see
+    '_column_indices'). The 'rows' can be a slice or anything else NumPy can
+    index rows with, like a boolean mask or an array of indices. Since h5py
+    supports only one such fancy index per selection, the range of rows that
+    covers these rows is read and the rows are selected in NumPy.
+    """
+    # h5py can only select columns in increasing order
+    unique_columns, columns_order = np.unique(
+        column_indices, return_inverse=True
+    )
+    columns = (
+        np.s_[:] if len(unique_columns) == dataset.shape[1] else unique_columns
+    )
+    if isinstance(rows, slice) and (rows.step is None or rows.step > 0):
+        data = dataset[rows, columns]
+    else:
+        row_indices = np.arange(dataset.shape[0])[rows]
+        if len(row_indices) == 0:
+            data = np.zeros((0, len(unique_columns)), dtype=dataset.dtype)
+        else:
+            first_row = np.min(row_indices)
+            end_row = np.max(row_indices) + 1
+            data = dataset[first_row:end_row, columns][row_indices - first_row]
+    if np.array_equal(unique_columns, column_indices):
+        return data
+    return data[:, columns_order]
+
+
 def to_dataframe(
-    open_subfile: Union[h5py.Dataset, "spectre.IO.H5.H5Dat"], slice=None
+    open_subfile: Union[h5py.Dataset, "spectre.IO.H5.H5Dat"],
+    slice=None,
+    time_range: Optional[Tuple[float, float]] = None,
+    columns: Optional[Sequence[Union[str, int]]] = None,
 ) -> "pandas.DataFrame":
     """Convert a '.dat' subfile to a Pandas DataFrame
 
@@ -74,25 +193,276 @@ def to_dataframe(
         or a spectre.IO.H5.H5Dat subfile, typically from a reductions file.
       slice: A numpy slice object to choose specific rows. Defaults to None. If
         you try to slice columns, an error will occur.
+      time_range: Tuple of (start_time, end_time) to select only the rows with
+        a time in this range (inclusive). The first column of the subfile must
+        be the time, sorted in ascending order. The rows are found by bisecting
+        the time column, so only the selected rows are read from disk.
+        Mutually exclusive with 'slice'.
+      columns: Names or indices of the columns to read. Defaults to all
+        columns. Only the selected columns are read from disk, so this is much
+        faster than selecting columns of the DataFrame for subfiles with many
+        columns.
 
     Returns: Pandas DataFrame with column names read from the "Legend"
-      attribute of the dat file.
+      attribute of the dat file. The data type of the subfile is preserved.
     """
     import pandas as pd
 
+    if slice is not None and time_range is not None:
+        raise ValueError("Specify either 'slice' or 'time_range', not both.")
+
     try:
         # SpECTRE H5 dat subfile
-        data = np.asarray(open_subfile.get_data())
         legend = open_subfile.get_legend()
     except AttributeError:
         # h5py subfile
-        data = open_subfile
-        legend = open_subfile.attrs["Legend"]
+        legend = list(open_subfile.attrs["Legend"])
+        column_indices = _column_indices(legend, columns, open_subfile.name)
+        if time_range is not None:
+            rows = _rows_in_time_range(open_subfile, *time_range)
+        elif slice is not None:
+            rows = slice
+        else:
+            rows = np.s_[:]
+        data = _read_columns(open_subfile, rows, column_indices)
+    else:
+        column_indices = _column_indices(
+            legend, columns, open_subfile.subfile_path()
+        )
+        if time_range is not None:
+            data = np.asarray(
+                open_subfile.get_rows_in_time_range(
+                    *time_range, columns=column_indices
+                )
+            )
+        elif columns is not None:
+            data = np.asarray(
+                open_subfile.get_data_subset(
+                    column_indices,
+                    num_rows=open_subfile.get_dimensions()[0],
+                )
+            )
+        else:
+            data = np.asarray(open_subfile.get_data())
+        if slice:
+            data = data[slice]
+
+    return pd.DataFrame(data, columns=[legend[i] for i in column_indices])
 
-    if slice:
-        data = data[slice]
 
-    return pd.DataFrame(data, columns=legend)
+def read_cce_modes(
+    cce_subfile: h5py.Group,
+    bondi_variable_name: str,
+    modes: Sequence[Tuple[int, int]],
+    time_range: Optional[Tuple[float, float]] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Read spherical harmonic modes of a Bondi variable from a Cce subfile
+
+    Only the time column and the real and imaginary parts of the requested
+    modes are read from disk, and only in the requested time window. This is
+    much faster than reading the full Bondi variable when you need a few modes
+    of a long run.
+
+    Arguments:
+      cce_subfile: An open h5py group of a SpECTRE '.cce' subfile, or of a
+        group in the older CCE output format where each Bondi variable is a
+        '.dat' subfile.
+      bondi_variable_name: Name of the Bondi variable, e.g. "Strain" or "Psi4".
+      modes: List of (l, m) modes to read.
+      time_range: Tuple of (start_time, end_time) to read only the rows with a
+        time in this range (inclusive). The rows are found by bisecting the
+        time column.
+
+    Returns: The times, an array of shape (rows,), and the complex mode
+      coefficients, an array of shape (rows, modes).
+    """
+    dataset = cce_subfile.get(bondi_variable_name)
+    if dataset is None:
+        dataset = cce_subfile.get(bondi_variable_name + ".dat")
+    if dataset is None:
+        raise KeyError(
+            f"No Bondi variable '{bondi_variable_name}' in Cce subfile"
+            f" '{cce_subfile.name}'. Available Bondi variables are:"
+            f" {list(cce_subfile.keys())}"
+        )
+    columns = [0]
+    for l, m in modes:
+        columns.extend([f"Real Y_{l},{m}", f"Imag Y_{l},{m}"])
+    column_indices = _column_indices(
+        dataset.attrs["Legend"], columns, dataset.name
+    )
+    if time_range is None:
+        rows = np.s_[:]
+    else:
+        rows = _rows_in_time_range(dataset, *time_range)
+    data = _read_columns(dataset, rows, column_indices)
+    return data[:, 0], data[:, 1::2] + 1j * data[:, 2::2]
+
+
+class SegmentedDat:
+    """A '.dat' subfile across the H5 files of multiple segments
+
+    Simulations that are restarted from checkpoints write their reductions into
+    a new H5 file per segment, like 'Segment*/BbhReductions.h5'. This class
+    presents the '.dat' subfile 'subfile_name' in all of these files as a single
+    table without reading or copying the data up front. Only the shape and a
+    few times of each segment are read when the class is constructed. Data is
+    read when requested with 'read' or 'to_dataframe', and only the selected
+    rows and columns are read.
+
+    The H5 files must be ordered in time, and the time (first column) must be
+    sorted within each segment. When a segment starts at an earlier time than
+    the previous segments ended, e.g. because the simulation was restarted from
+    an earlier checkpoint, the rows of the previous segments at or after this
+    time are hidden. So the data from the latest segment takes precedence.
+
+    Use it as a context manager to close the files when done:
+
+        with SegmentedDat(reduction_files, "Norms.dat") as norms:
+            df = norms.to_dataframe(columns=["Time", "L2Norm(Psi)"])
+
+    Arguments:
+      h5_files: Paths to H5 files or open h5py files, ordered in time. Files
+        that are passed as paths are opened for reading until 'close' is
+        called.
+      subfile_name: Name of the '.dat' subfile in each of the H5 files. The
+        '.dat' extension is optional.
+      missing_ok: Skip H5 files that don't contain the subfile. Otherwise,
+        raise a 'KeyError'.
+    """
+
+    def __init__(
+        self,
+        h5_files: Union[
+            str, Path, h5py.File, Iterable[Union[str, Path, h5py.File]]
+        ],
+        subfile_name: str,
+        missing_ok: bool = False,
+    ):
+        if not subfile_name.endswith(".dat"):
+            subfile_name += ".dat"
+        self.subfile_name = subfile_name
+        if isinstance(h5_files, (str, Path, h5py.File)):
+            h5_files = [h5_files]
+        self._opened_files = []
+        self._datasets = []
+        try:
+            for h5_file in h5_files:
+                if not isinstance(h5_file, h5py.File):
+                    h5_file = h5py.File(h5_file, "r")
+                    self._opened_files.append(h5_file)
+                dataset = h5_file.get(subfile_name)
+                if dataset is None:
+                    if missing_ok:
+                        continue
+                    raise KeyError(
+                        f"Unable to open subfile '{subfile_name}' from h5 file"
+                        f" {h5_file.filename}."
+                    )
+                self._datasets.append(dataset)
+            if not self._datasets:
+                raise KeyError(
+                    f"Unable to open subfile '{subfile_name}' from any of the"
+                    " h5 files."
+                )
+            self.legend = list(self._datasets[0].attrs["Legend"])
+            for dataset in self._datasets[1:]:
+                if list(dataset.attrs["Legend"]) != self.legend:
+                    raise ValueError(
+                        f"The legend of subfile '{subfile_name}' in h5 file"
+                        f" {dataset.file.filename} differs from the legend in"
+                        f" {self._datasets[0].file.filename}."
+                    )
+        except Exception:
+            self.close()
+            raise
+        # Number of rows of each segment that aren't superseded by later
+        # segments
+        self._num_rows = [len(dataset) for dataset in self._datasets]
+        next_start_time = None
+        for i in reversed(range(len(self._datasets))):
+            dataset = self._datasets[i]
+            if next_start_time is not None:
+                self._num_rows[i] = _find_row(
+                    dataset,
+                    lambda time: time < next_start_time,
+                    last_row=self._num_rows[i],
+                )
+            if self._num_rows[i] > 0:
+                next_start_time = dataset[0, 0]
+
+    def close(self):
+        """Close the H5 files that were opened by this class"""
+        for h5_file in self._opened_files:
+            h5_file.close()
+        self._opened_files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Number of rows across all segments, and number of columns"""
+        return sum(self._num_rows), len(self.legend)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def _column_indices(
+        self, columns: Optional[Sequence[Union[str, int]]]
+    ) -> List[int]:
+        return _column_indices(self.legend, columns, self.subfile_name)
+
+    def read(
+        self,
+        columns: Optional[Sequence[Union[str, int]]] = None,
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> np.ndarray:
+        """Read the data across all segments
+
+        Arguments:
+          columns: Names or indices of the columns to read. Defaults to all
+            columns.
+          time_range: Tuple of (start_time, end_time) to read only the rows
+            with a time in this range (inclusive).
+
+        Returns: Array of shape (rows, columns).
+        """
+        column_indices = self._column_indices(columns)
+        data = []
+        for dataset, num_rows in zip(self._datasets, self._num_rows):
+            if num_rows == 0:
+                continue
+            if time_range is None:
+                rows = np.s_[:num_rows]
+            else:
+                rows = _rows_in_time_range(dataset, *time_range, num_rows)
+                if rows.stop == rows.start:
+                    continue
+            data.append(_read_columns(dataset, rows, column_indices))
+        if not data:
+            return np.zeros((0, len(column_indices)))
+        return np.concatenate(data)
+
+    def to_dataframe(
+        self,
+        columns: Optional[Sequence[Union[str, int]]] = None,
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> "pandas.DataFrame":
+        """Read the data across all segments into a Pandas DataFrame
+
+        Takes the same arguments as 'read'. The columns of the DataFrame are
+        named by the legend of the subfile.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(
+            self.read(columns=columns, time_range=time_range),
+            columns=[self.legend[i] for i in self._column_indices(columns)],
+        )
 
 
 def select_observation(
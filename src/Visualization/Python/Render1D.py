@@ -22,7 +22,11 @@ from spectre.Domain import (
     deserialize_domain,
     deserialize_functions_of_time,
 )
-from spectre.IO.H5.IterElements import Element, iter_elements
+from spectre.IO.H5.IterElements import (
+    Element,
+    iter_elements,
+    map_reduce_elements,
+)
 from spectre.Spectral import Basis
 from spectre.support.CliExceptions import RequiredChoiceError
 from spectre.support.Logging import configure_logging
@@ -35,6 +39,25 @@ from spectre.Visualization.PlotDatFile import parse_functions
 logger = logging.getLogger(__name__)
 
 
+def _element_bounds(element: Element, vars_data: np.ndarray):
+    """Bounds of the element's coordinates and data in both x and y"""
+    return (
+        np.min(element.inertial_coordinates),
+        np.max(element.inertial_coordinates),
+        np.nanmin(vars_data),
+        np.nanmax(vars_data),
+    )
+
+
+def _combine_bounds(bounds, other_bounds):
+    return (
+        min(bounds[0], other_bounds[0]),
+        max(bounds[1], other_bounds[1]),
+        min(bounds[2], other_bounds[2]),
+        max(bounds[3], other_bounds[3]),
+    )
+
+
 def get_bounds(volfiles, obs_ids, vars):
     """Get the bounds in both x and y over all observations, vars, and files"""
     x_bounds = [np.inf, -np.inf]
@@ -48,6 +71,30 @@ def get_bounds(volfiles, obs_ids, vars):
     return x_bounds, y_bounds
 
 
+def get_bounds_parallel(
+    h5_files, subfile_name, obs_ids, vars, num_processes=None
+):
+    """Same as 'get_bounds', but processes the files and observations in
+    parallel
+
+    Takes the paths to the H5 files and the name of the volume data subfile
+    instead of open volume files. See
+    'spectre.IO.H5.IterElements.map_reduce_elements' for details.
+    """
+    bounds = map_reduce_elements(
+        h5_files,
+        subfile_name,
+        _element_bounds,
+        _combine_bounds,
+        obs_ids=obs_ids,
+        tensor_components=vars,
+        num_processes=num_processes,
+    )
+    if bounds is None:
+        return [np.inf, -np.inf], [np.inf, -np.inf]
+    return [bounds[0], bounds[1]], [bounds[2], bounds[3]]
+
+
 def plot_element(
     element: Element,
     vars_data: np.ndarray,
@@ -244,6 +291,17 @@ def plot_element(
     type=float,
     help="Delay between frames in milliseconds",
 )
+@click.option(
+    "--num-processes",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help=(
+        "Number of worker processes to compute the bounds of the animation "
+        "with. The files and observations are distributed over the processes."
+    ),
+)
 # Plotting options
 @click.option(
     "--x-label",
@@ -292,6 +350,7 @@ def render_1d_command(
     title,
     step,
     interval,
+    num_processes,
     **plot_element_kwargs,
 ):
     """Render 1D data"""
@@ -385,7 +444,22 @@ def render_1d_command(
     plt.legend(legend_items.values(), legend_items.keys())
     title_handle = plt.title(title if title else f"t = {obs_value:g}")
     if animate and not (x_bounds and y_bounds):
-        data_bounds = get_bounds(volfiles, obs_ids, vars)
+        if num_processes == 1:
+            data_bounds = get_bounds(volfiles, obs_ids, vars)
+        else:
+            # The bounds are computed in worker processes that open the files
+            # themselves, so close the files until the workers are done
+            for open_h5_file in open_h5_files:
+                open_h5_file.close()
+            data_bounds = get_bounds_parallel(
+                h5_files, subfile_name, obs_ids, vars, num_processes
+            )
+            open_h5_files = [
+                spectre_h5.H5File(filename, "r") for filename in h5_files
+            ]
+            volfiles = [
+                h5file.get_vol(subfile_name) for h5file in open_h5_files
+            ]
         if not x_bounds:
             x_bounds = data_bounds[0]
         if not y_bounds:
@@ -1,9 +1,13 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
+import dataclasses
+import functools
 import importlib
 import inspect
 import logging
+import multiprocessing
+import pickle
 import re
 from dataclasses import dataclass
 from functools import cached_property
@@ -24,7 +28,11 @@ from spectre.DataStructures.Tensor import (
     Tensor,
     tnsr,
 )
-from spectre.IO.H5.IterElements import Element, iter_elements
+from spectre.IO.H5.IterElements import (
+    Element,
+    iter_elements,
+    map_reduce_elements,
+)
 from spectre.NumericalAlgorithms.LinearOperators import definite_integral
 from spectre.Spectral import Mesh
 from spectre.support.CliExceptions import RequiredChoiceError
@@ -478,6 +486,132 @@ class Kernel:
         return parse_kernel_output(output, self.output_name, num_points)
 
 
+def _collect_tensor_args(kernels: Sequence[Kernel]) -> Dict[str, TensorArg]:
+    """All tensors that are needed to apply the kernels, by dataset name"""
+    all_tensors: Dict[str, TensorArg] = {}
+    for kernel in kernels:
+        for tensor_arg in kernel.args:
+            # Skip non-tensors
+            if not isinstance(tensor_arg, TensorArg):
+                continue
+            tensor_name = tensor_arg.dataset_name
+            tensor_type = tensor_arg.tensor_type
+            if tensor_name in all_tensors:
+                assert all_tensors[tensor_name].tensor_type == tensor_type, (
+                    "Two tensor arguments with the same name "
+                    f"'{tensor_name}' have different types: "
+                    f"'{all_tensors[tensor_name].tensor_type}' "
+                    f"and '{tensor_type}'"
+                )
+            else:
+                all_tensors[tensor_name] = tensor_arg
+    logger.debug("Input datasets: " + str(list(all_tensors.keys())))
+    return all_tensors
+
+
+def _integrate_element(
+    kernels: Sequence[Kernel],
+    all_tensors: Dict[str, TensorArg],
+    element: Element,
+    tensor_data: Optional[np.ndarray] = None,
+) -> Dict[float, Dict[str, float]]:
+    """Volume integrals of the kernels over the element
+
+    The 'tensor_data' holds the components of all tensors in 'all_tensors', one
+    tensor after the other, on this element. Returns the integrals of the
+    volume and of all tensor components of the kernels, keyed by the
+    observation value so integrals of different elements and observations can
+    be combined with '_add_integrals'.
+    """
+    all_tensor_data = {}
+    component_offset = 0
+    for tensor_name, tensor_arg in all_tensors.items():
+        num_components = len(tensor_arg.component_names)
+        all_tensor_data[tensor_name] = tensor_arg.tensor_type(
+            tensor_data[component_offset : component_offset + num_components]
+        )
+        component_offset += num_components
+    # The tensor data holds only this element's data
+    element = dataclasses.replace(element, data_slice=slice(None))
+    # Integrate volume
+    integrals = {
+        "Volume": definite_integral(element.det_jacobian.get(), element.mesh)
+    }
+    # Integrate kernels
+    for kernel in kernels:
+        transformed_tensors = kernel(all_tensor_data, element)
+        for output_name, transformed_tensor in transformed_tensors.items():
+            for i, component in enumerate(transformed_tensor):
+                integrals[
+                    output_name + transformed_tensor.component_suffix(i)
+                ] = definite_integral(
+                    element.det_jacobian.get() * component, element.mesh
+                )
+    return {element.time: integrals}
+
+
+def _add_integrals(
+    integrals: Dict[float, Dict[str, float]],
+    other_integrals: Dict[float, Dict[str, float]],
+) -> Dict[float, Dict[str, float]]:
+    for time, other_obs_integrals in other_integrals.items():
+        obs_integrals = integrals.setdefault(time, {})
+        for name, integral in other_obs_integrals.items():
+            obs_integrals[name] = obs_integrals.get(name, 0.0) + integral
+    return integrals
+
+
+def _integrals_over_time(
+    integrals: Dict[float, Dict[str, float]],
+) -> Dict[str, Sequence[float]]:
+    """Turn integrals keyed by observation value into time series"""
+    times = sorted(integrals.keys())
+    result: Dict[str, Sequence[float]] = {"Time": times}
+    for time in times:
+        for name in integrals[time]:
+            result.setdefault(
+                name, np.array([integrals[t][name] for t in times])
+            )
+    return result
+
+
+def integrate_volume_data(
+    h5_files: Union[str, Sequence[str]],
+    subfile_name: str,
+    kernels: Sequence[Kernel],
+    num_processes: Optional[int] = None,
+) -> Dict[str, Sequence[float]]:
+    """Volume integrals of the 'kernels' over the data in the 'h5_files'
+
+    Same as 'transform_volume_data' with 'integrate=True', but the files and
+    observations are processed in parallel. See
+    'spectre.IO.H5.IterElements.map_reduce_elements' for details. The kernels
+    are passed to the worker processes when they are forked. On platforms that
+    don't fork worker processes the kernels must be picklable, i.e. defined at
+    module level.
+
+    Returns: The integrals of the volume and of every tensor component of all
+      kernels at every observation, and the observation values (named 'Time').
+    """
+    all_tensors = _collect_tensor_args(kernels)
+    tensor_components = [
+        component_name
+        for tensor_arg in all_tensors.values()
+        for component_name in tensor_arg.component_names
+    ]
+    integrals = map_reduce_elements(
+        h5_files,
+        subfile_name,
+        functools.partial(_integrate_element, kernels, all_tensors),
+        _add_integrals,
+        tensor_components=tensor_components,
+        # Tensors hold DataVectors, which are double precision
+        dtype=np.float64,
+        num_processes=num_processes,
+    )
+    return _integrals_over_time(integrals or {})
+
+
 def transform_volume_data(
     volfiles: Union[spectre_h5.H5Vol, Iterable[spectre_h5.H5Vol]],
     kernels: Sequence[Kernel],
@@ -506,55 +640,55 @@ def transform_volume_data(
       None, or the volume integrals if 'integrate' is True.
     """
     # Collect all tensor components that we need to apply the kernels
-    all_tensors: Dict[str, TensorArg] = {}
-    for kernel in kernels:
-        for tensor_arg in kernel.args:
-            # Skip non-tensors
-            if not isinstance(tensor_arg, TensorArg):
-                continue
-            tensor_name = tensor_arg.dataset_name
-            tensor_type = tensor_arg.tensor_type
-            if tensor_name in all_tensors:
-                assert all_tensors[tensor_name].tensor_type == tensor_type, (
-                    "Two tensor arguments with the same name "
-                    f"'{tensor_name}' have different types: "
-                    f"'{all_tensors[tensor_name].tensor_type}' "
-                    f"and '{tensor_type}'"
-                )
-            else:
-                all_tensors[tensor_name] = tensor_arg
-    logger.debug("Input datasets: " + str(list(all_tensors.keys())))
-
-    if integrate:
-        # We collect integrals in this dict and return it
-        integrals: Dict[str, Sequence[float]] = {}
-    else:
-        # We collect output dataset names for logging so the user can find them
-        output_names = set()
+    all_tensors = _collect_tensor_args(kernels)
 
     if isinstance(volfiles, spectre_h5.H5Vol):
         volfiles = [volfiles]
+
+    # For integrals we call the kernels elementwise, take the integral over the
+    # elements, and sum up the contributions. We don't write anything back to
+    # disk.
+    if integrate:
+        tensor_components = [
+            component_name
+            for tensor_arg in all_tensors.values()
+            for component_name in tensor_arg.component_names
+        ]
+        integrals: Dict[float, Dict[str, float]] = {}
+        for volfile in volfiles:
+            for item in iter_elements(
+                volfile, None, tensor_components, dtype=np.float64
+            ):
+                if tensor_components:
+                    element, tensor_data = item
+                else:
+                    element, tensor_data = item, None
+                _add_integrals(
+                    integrals,
+                    _integrate_element(
+                        kernels, all_tensors, element, tensor_data
+                    ),
+                )
+        return _integrals_over_time(integrals)
+
+    # We collect output dataset names for logging so the user can find them
+    output_names = set()
+
     for volfile in volfiles:
-        all_observation_ids = volfile.list_observation_ids()
-        num_obs = len(all_observation_ids)
-        if integrate and "Time" not in integrals:
-            integrals["Time"] = [
-                volfile.get_observation_value(obs_id)
-                for obs_id in all_observation_ids
-            ]
-
-        for i_obs, obs_id in enumerate(all_observation_ids):
-            # Load tensor data for all kernels
+        for obs_id in volfile.list_observation_ids():
+            # Load tensor data for all kernels. Tensors hold DataVectors, which
+            # are double precision, so single-precision data is converted while
+            # reading. The tensors reference the arrays without copying them,
+            # so we keep the arrays alive until the kernels are done.
+            all_tensor_arrays = {
+                tensor_name: volfile.get_tensor_components(
+                    obs_id, tensor_arg.component_names, dtype=np.float64
+                )
+                for tensor_name, tensor_arg in all_tensors.items()
+            }
             all_tensor_data = {
                 tensor_name: tensor_arg.tensor_type(
-                    np.array(
-                        [
-                            volfile.get_tensor_component(
-                                obs_id, component_name
-                            ).data
-                            for component_name in tensor_arg.component_names
-                        ]
-                    )
+                    all_tensor_arrays[tensor_name], copy=False
                 )
                 for tensor_name, tensor_arg in all_tensors.items()
             }
@@ -562,36 +696,6 @@ def transform_volume_data(
                 np.prod(volfile.get_extents(obs_id), axis=1)
             )
 
-            # For integrals we call the kernels elementwise, take the integral
-            # over the elements, and sum up the contributions. We then skip
-            # ahead to the next observation because we're not writing anything
-            # back to disk.
-            if integrate:
-                for element in iter_elements(volfile, obs_id):
-                    # Integrate volume
-                    volume = integrals.setdefault("Volume", np.zeros(num_obs))
-                    volume[i_obs] += definite_integral(
-                        element.det_jacobian.get(), element.mesh
-                    )
-                    # Integrate kernels
-                    for kernel in kernels:
-                        transformed_tensors = kernel(all_tensor_data, element)
-                        for (
-                            output_name,
-                            transformed_tensor,
-                        ) in transformed_tensors.items():
-                            for i, component in enumerate(transformed_tensor):
-                                component_integral = integrals.setdefault(
-                                    output_name
-                                    + transformed_tensor.component_suffix(i),
-                                    np.zeros(num_obs),
-                                )
-                                component_integral[i_obs] += definite_integral(
-                                    element.det_jacobian.get() * component,
-                                    element.mesh,
-                                )
-                continue
-
             # Apply kernels
             for kernel in kernels:
                 # Elementwise kernels need to slice the tensor data into
@@ -652,10 +756,7 @@ def transform_volume_data(
                             contiguous_tensor_data=component,
                             overwrite_existing=force,
                         )
-    if integrate:
-        return integrals
-    else:
-        logger.info(f"Output datasets: {output_names}")
+    logger.info(f"Output datasets: {output_names}")
 
 
 def parse_input_names(ctx, param, all_values):
@@ -776,6 +877,18 @@ def parse_kernels(kernels, exec_files, map_input_names, interactive=False):
     is_flag=True,
     help="Overwrite existing data.",
 )
+@click.option(
+    "--num-processes",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help=(
+        "Number of worker processes to compute the integrals with. "
+        "Only used if the '--integrate' flag is set. Falls back to a single "
+        "process if the kernels can't be passed to worker processes."
+    ),
+)
 def transform_volume_data_command(
     h5files,
     subfile_name,
@@ -786,6 +899,7 @@ def transform_volume_data_command(
     output,
     output_subfile,
     force,
+    num_processes,
     **kwargs,
 ):
     """Transform volume data with Python functions
@@ -847,8 +961,6 @@ def transform_volume_data_command(
                 choices=available_subfile_names,
             )
 
-    volfiles = [h5file.get_vol(subfile_name) for h5file in open_h5_files]
-
     # Load kernels
     if not kernels:
         raise click.UsageError("No '--kernel' / '-k' specified.")
@@ -856,7 +968,36 @@ def transform_volume_data_command(
         parse_kernels(kernels, exec_files, map_input_names, interactive=True)
     )
 
+    # Integrate in parallel if requested. The kernels are passed to the worker
+    # processes, so they must be picklable. Kernels loaded from '--exec' files
+    # are only defined in this process, so they can't be passed to worker
+    # processes that aren't forked from it.
+    if integrate and num_processes != 1:
+        try:
+            pickle.dumps(kernels)
+            if exec_files and multiprocessing.get_start_method() != "fork":
+                raise ValueError(
+                    "Kernels from '--exec' files are only available in "
+                    "forked worker processes."
+                )
+        except Exception as err:
+            logger.warning(
+                "Integrating in a single process because the kernels can't be"
+                f" passed to worker processes: {err}"
+            )
+            num_processes = 1
+    if integrate and num_processes != 1:
+        # The worker processes open the files themselves, so close them here
+        for open_h5_file in open_h5_files:
+            open_h5_file.close()
+        integrals = integrate_volume_data(
+            h5files, subfile_name, kernels, num_processes=num_processes
+        )
+        _write_integrals(integrals, output, output_subfile)
+        return
+
     # Apply!
+    volfiles = [h5file.get_vol(subfile_name) for h5file in open_h5_files]
     import rich.progress
 
     progress = rich.progress.Progress(
@@ -877,38 +1018,43 @@ def transform_volume_data_command(
             **kwargs,
         )
         progress.update(task_id, completed=len(volfiles))
-
-    # Write integrals to output file or print to terminal
     if integrate:
-        integral_values = np.stack(list(integrals.values())).T
-        integral_names = list(integrals.keys())
-        if output:
-            if output.endswith(".h5"):
-                if not output_subfile:
-                    raise click.UsageError(
-                        "The '--output-subfile' option is required "
-                        "when writing to H5 files."
-                    )
-                if not output_subfile.startswith("/"):
-                    output_subfile = "/" + output_subfile
-                if output_subfile.endswith(".dat"):
-                    output_subfile = output_subfile[:-4]
-                with spectre_h5.H5File(output, "a") as open_output_file:
-                    integrals_file = open_output_file.insert_dat(
-                        output_subfile, legend=integral_names, version=1
-                    )
-                    integrals_file.append(integral_values)
-            else:
-                np.savetxt(
-                    output, integral_values, header=",".join(integral_names)
+        _write_integrals(integrals, output, output_subfile)
+
+
+def _write_integrals(
+    integrals: Dict[str, Sequence[float]],
+    output: Optional[str],
+    output_subfile: Optional[str],
+):
+    """Write integrals to output file or print to terminal"""
+    integral_values = np.stack(list(integrals.values())).T
+    integral_names = list(integrals.keys())
+    if output:
+        if output.endswith(".h5"):
+            if not output_subfile:
+                raise click.UsageError(
+                    "The '--output-subfile' option is required "
+                    "when writing to H5 files."
+                )
+            if not output_subfile.startswith("/"):
+                output_subfile = "/" + output_subfile
+            if output_subfile.endswith(".dat"):
+                output_subfile = output_subfile[:-4]
+            with spectre_h5.H5File(output, "a") as open_output_file:
+                integrals_file = open_output_file.insert_dat(
+                    output_subfile, legend=integral_names, version=1
                 )
+                integrals_file.append(integral_values)
         else:
-            import rich.table
+            np.savetxt(output, integral_values, header=",".join(integral_names))
+    else:
+        import rich.table
 
-            table = rich.table.Table(*integral_names, box=None)
-            for i in range(len(integral_values)):
-                table.add_row(*[f"{v:g}" for v in integral_values[i]])
-            rich.print(table)
+        table = rich.table.Table(*integral_names, box=None)
+        for i in range(len(integral_values)):
+            table.add_row(*[f"{v:g}" for v in integral_values[i]])
+        rich.print(table)
 
 
 if __name__ == "__main__":
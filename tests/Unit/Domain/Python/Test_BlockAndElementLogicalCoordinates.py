@@ -11,6 +11,7 @@ import spectre.IO.H5 as spectre_h5
 from spectre.DataStructures import DataVector
 from spectre.DataStructures.Tensor import Frame, tnsr
 from spectre.Domain import (
+    BlockSpatialIndex,
     ElementId,
     block_logical_coordinates,
     deserialize_domain,
@@ -70,6 +71,56 @@ class TestBlockAndElementLogicalCoordinates(unittest.TestCase):
         )
         self.assertEqual(logical_coords[element_id].offsets, [0])
 
+    def test_block_spatial_index(self):
+        volfile_name = os.path.join(
+            unit_test_src_path(), "Visualization/Python/VolTestData0.h5"
+        )
+        with spectre_h5.H5File(volfile_name, "r") as open_h5_file:
+            volfile = open_h5_file.get_vol("/element_data")
+            obs_id = volfile.list_observation_ids()[0]
+            serialized_domain = volfile.get_domain(obs_id)
+            serialized_fot = volfile.get_functions_of_time(obs_id)
+
+        # This domain is [0, 2 pi]^3
+        domain = deserialize_domain[3](serialized_domain)
+        functions_of_time = deserialize_functions_of_time(serialized_fot)
+        spatial_index = BlockSpatialIndex[3](
+            domain, time=0.0, functions_of_time=functions_of_time
+        )
+        self.assertEqual(spatial_index.number_of_blocks, 1)
+        lower, upper = spatial_index.bounding_boxes[0]
+        self.assertTrue(all(x < 0.0 for x in lower))
+        self.assertTrue(all(x > 2.0 * np.pi for x in upper))
+        self.assertEqual(spatial_index.candidate_blocks([np.pi] * 3), [0])
+        self.assertEqual(spatial_index.candidate_blocks([100.0] * 3), [])
+
+        inertial_coords = tnsr.I[DataVector, 3, Frame.Inertial](
+            3 * [DataVector([np.pi, 100.0])]
+        )
+        expected = block_logical_coordinates(
+            domain,
+            inertial_coords,
+            time=0.0,
+            functions_of_time=functions_of_time,
+        )
+        block_logical_coords = block_logical_coordinates(
+            domain,
+            inertial_coords,
+            time=0.0,
+            functions_of_time=functions_of_time,
+            spatial_index=spatial_index,
+        )
+        self.assertEqual(len(block_logical_coords), 2)
+        self.assertIsNone(block_logical_coords[1])
+        self.assertIsNone(expected[1])
+        self.assertEqual(
+            block_logical_coords[0].id.get_index(), expected[0].id.get_index()
+        )
+        npt.assert_allclose(
+            np.array(block_logical_coords[0].data),
+            np.array(expected[0].data),
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
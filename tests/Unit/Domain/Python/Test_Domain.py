@@ -66,6 +66,14 @@ class TestDomain(unittest.TestCase):
         )
         npt.assert_allclose(inertial_coord, [[np.pi]] * 3)
 
+        # Deserializing the same data again reuses the cached objects
+        self.assertIs(deserialize_domain[3](serialized_domain), domain)
+        name, function_of_time = next(iter(functions_of_time.items()))
+        self.assertIs(
+            deserialize_functions_of_time(serialized_fot)[name],
+            function_of_time,
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
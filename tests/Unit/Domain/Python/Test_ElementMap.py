@@ -9,8 +9,9 @@ import numpy.testing as npt
 
 import spectre.IO.H5 as spectre_h5
 from spectre.DataStructures import DataVector
-from spectre.DataStructures.Tensor import Frame, tnsr
+from spectre.DataStructures.Tensor import Frame, InverseJacobian, Jacobian, tnsr
 from spectre.Domain import (
+    BatchedElementMaps,
     ElementId,
     ElementMap,
     deserialize_domain,
@@ -21,6 +22,7 @@ from spectre.Domain.CoordinateMaps import (
 )
 from spectre.Domain.Creators import Interval
 from spectre.Informer import unit_test_src_path
+from spectre.Spectral import Basis, Mesh, Quadrature, logical_coordinates
 
 
 class TestElementMap(unittest.TestCase):
@@ -95,6 +97,102 @@ class TestElementMap(unittest.TestCase):
             np.array([[0.0, np.pi], [0.0, 2 * np.pi], [0.0, 2 * np.pi]]),
         )
 
+    def test_batched_element_maps(self):
+        volfile_name = os.path.join(
+            unit_test_src_path(), "Visualization/Python/VolTestData0.h5"
+        )
+        with spectre_h5.H5File(volfile_name, "r") as open_h5_file:
+            volfile = open_h5_file.get_vol("/element_data")
+            obs_id = volfile.list_observation_ids()[0]
+            time = volfile.get_observation_value(obs_id)
+            domain = deserialize_domain[3](volfile.get_domain(obs_id))
+            functions_of_time = deserialize_functions_of_time(
+                volfile.get_functions_of_time(obs_id)
+            )
+
+        element_ids = [
+            ElementId[3]("[B0,(L1I1,L0I0,L0I0)]"),
+            ElementId[3]("[B0,(L1I0,L0I0,L0I0)]"),
+        ]
+        meshes = [
+            Mesh[3](3, Basis.Legendre, Quadrature.GaussLobatto),
+            Mesh[3]([4, 2, 3], Basis.Legendre, Quadrature.Gauss),
+        ]
+        element_maps = BatchedElementMaps[3](element_ids, meshes, domain)
+        self.assertEqual(element_maps.number_of_grid_points, 27 + 24)
+        inertial_coords = element_maps.inertial_coordinates(
+            time, functions_of_time
+        )
+        jacobian, inv_jacobian, det_jacobian = element_maps.jacobians(
+            time, functions_of_time
+        )
+        self.assertEqual(inertial_coords.shape, (3, 27 + 24))
+        self.assertEqual(jacobian.shape, (9, 27 + 24))
+        self.assertEqual(inv_jacobian.shape, (9, 27 + 24))
+        self.assertEqual(det_jacobian.shape, (27 + 24,))
+        offset = 0
+        for element_id, mesh in zip(element_ids, meshes):
+            points = slice(offset, offset + mesh.number_of_grid_points())
+            offset += mesh.number_of_grid_points()
+            element_map = ElementMap(element_id, domain)
+            xi = logical_coordinates(mesh)
+            npt.assert_allclose(
+                inertial_coords[:, points],
+                element_map(xi, time, functions_of_time),
+            )
+            expected_jacobian = element_map.jacobian(
+                xi, time, functions_of_time
+            )
+            npt.assert_allclose(
+                Jacobian[DataVector, 3](jacobian[:, points]),
+                expected_jacobian,
+                atol=1e-14,
+            )
+            npt.assert_allclose(
+                InverseJacobian[DataVector, 3](inv_jacobian[:, points]),
+                element_map.inv_jacobian(xi, time, functions_of_time),
+                atol=1e-14,
+            )
+            # Elements have size (pi, 2 pi, 2 pi) and logical size 2
+            npt.assert_allclose(det_jacobian[points], 0.5 * np.pi**3)
+        # The cached time-independent parts give the same result again
+        npt.assert_allclose(
+            element_maps.jacobians(time, functions_of_time)[0], jacobian
+        )
+        # Errors in the parallel evaluation of the maps are propagated, here
+        # because the functions of time are missing
+        with self.assertRaises((IndexError, RuntimeError)):
+            element_maps.inertial_coordinates(time)
+        with self.assertRaises(ValueError):
+            BatchedElementMaps[3](element_ids, meshes[:1], domain)
+
+    def test_batched_element_maps_time_independent(self):
+        # Full domain is [0, 2], elements are [0, 1] and [1, 2]
+        domain = Interval(
+            lower_x=[0.0],
+            upper_x=[2.0],
+            is_periodic_in_x=[False],
+            initial_refinement_level_x=[1],
+            initial_number_of_grid_points_in_x=[3],
+        ).create_domain()
+        element_ids = [
+            ElementId[1]("[B0,(L1I1)]"),
+            ElementId[1]("[B0,(L1I0)]"),
+        ]
+        meshes = [
+            Mesh[1](3, Basis.Legendre, Quadrature.GaussLobatto),
+            Mesh[1](2, Basis.Legendre, Quadrature.GaussLobatto),
+        ]
+        element_maps = BatchedElementMaps[1](element_ids, meshes, domain)
+        npt.assert_allclose(
+            element_maps.inertial_coordinates(),
+            [[1.0, 1.5, 2.0, 0.0, 1.0]],
+        )
+        jacobian, inv_jacobian, det_jacobian = element_maps.jacobians()
+        npt.assert_allclose(jacobian, 0.5 * np.ones((1, 5)))
+        npt.assert_allclose(inv_jacobian, 2.0 * np.ones((1, 5)))
+        npt.assert_allclose(det_jacobian, 0.5 * np.ones(5))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,236 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "Framework/TestingFramework.hpp"
+
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <cstddef>
+#include <limits>
+#include <memory>
+#include <random>
+#include <vector>
+
+#include "DataStructures/DataVector.hpp"
+#include "DataStructures/Index.hpp"
+#include "DataStructures/Tensor/Tensor.hpp"
+#include "Domain/Block.hpp"
+#include "Domain/BlockLogicalCoordinates.hpp"
+#include "Domain/BlockSpatialIndex.hpp"
+#include "Domain/CoordinateMaps/CoordinateMap.hpp"
+#include "Domain/CoordinateMaps/CoordinateMap.tpp"
+#include "Domain/CoordinateMaps/Distribution.hpp"
+#include "Domain/CoordinateMaps/Rotation.hpp"
+#include "Domain/CoordinateMaps/Wedge.hpp"
+#include "Domain/Creators/Brick.hpp"
+#include "Domain/Creators/Sphere.hpp"
+#include "Domain/Creators/TimeDependence/UniformTranslation.hpp"
+#include "Domain/Domain.hpp"
+#include "Domain/DomainHelpers.hpp"
+#include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
+#include "Domain/Structure/OrientationMap.hpp"
+#include "Framework/TestHelpers.hpp"
+#include "Utilities/Algorithm.hpp"
+#include "Utilities/Gsl.hpp"
+#include "Utilities/Literals.hpp"
+
+namespace {
+// Checks that the index finds the same blocks and block-logical coordinates as
+// trying all blocks, and that the bounding boxes contain their blocks
+template <size_t Dim>
+void test_spatial_index(
+    const Domain<Dim>& domain, const double lower, const double upper,
+    const double time = std::numeric_limits<double>::signaling_NaN(),
+    const domain::FunctionsOfTimeMap& functions_of_time = {}) {
+  MAKE_GENERATOR(generator);
+  const BlockSpatialIndex<Dim> spatial_index{domain, time, functions_of_time};
+  REQUIRE(spatial_index.number_of_blocks() == domain.blocks().size());
+  REQUIRE(spatial_index.bounding_boxes().size() == domain.blocks().size());
+
+  // Random points in a region that covers the domain and some space outside
+  const size_t num_points = 200;
+  std::uniform_real_distribution<> dist(lower, upper);
+  const auto x = make_with_random_values<tnsr::I<DataVector, Dim>>(
+      make_not_null(&generator), make_not_null(&dist), DataVector(num_points));
+  const auto expected =
+      block_logical_coordinates(domain, x, time, functions_of_time);
+  const auto result = block_logical_coordinates(domain, spatial_index, x, time,
+                                                functions_of_time);
+  REQUIRE(result.size() == num_points);
+  size_t num_points_in_domain = 0;
+  for (size_t s = 0; s < num_points; ++s) {
+    CAPTURE(s);
+    REQUIRE(result[s].has_value() == expected[s].has_value());
+    if (not expected[s].has_value()) {
+      continue;
+    }
+    ++num_points_in_domain;
+    CHECK(result[s]->id == expected[s]->id);
+    CHECK(result[s]->data == expected[s]->data);
+    // The containing block is a candidate
+    tnsr::I<double, Dim> point{};
+    for (size_t d = 0; d < Dim; ++d) {
+      point.get(d) = x.get(d)[s];
+    }
+    const auto candidates = spatial_index.candidate_blocks(point);
+    CHECK(alg::found(candidates, expected[s]->id.get_index()));
+    CHECK(std::is_sorted(candidates.begin(), candidates.end()));
+  }
+  // Make sure the test isn't vacuous
+  CHECK(num_points_in_domain > 0);
+
+  // The bounding boxes contain random points in their blocks, not only the
+  // points at which the block maps were sampled
+  std::uniform_real_distribution<> logical_dist(-1., 1.);
+  const auto logical_coords =
+      make_with_random_values<tnsr::I<DataVector, Dim, Frame::BlockLogical>>(
+          make_not_null(&generator), make_not_null(&logical_dist),
+          DataVector(num_points));
+  for (const auto& block : domain.blocks()) {
+    const auto inertial_coords =
+        block.is_time_dependent()
+            ? block.moving_mesh_grid_to_inertial_map()(
+                  block.moving_mesh_logical_to_grid_map()(logical_coords), time,
+                  functions_of_time)
+            : block.stationary_map()(logical_coords);
+    const auto& [box_lower, box_upper] =
+        spatial_index.bounding_boxes()[block.id()];
+    for (size_t d = 0; d < Dim; ++d) {
+      CHECK(min(inertial_coords.get(d)) >= gsl::at(box_lower, d));
+      CHECK(max(inertial_coords.get(d)) <= gsl::at(box_upper, d));
+    }
+  }
+
+  // Points far away from the domain have no candidates
+  const tnsr::I<double, Dim> far_away_point(10. * (upper - lower) + upper);
+  CHECK(spatial_index.candidate_blocks(far_away_point).empty());
+}
+
+void test_rectilinear() {
+  test_spatial_index(
+      Domain<1>(
+          maps_for_rectilinear_domains<Frame::Inertial>(
+              Index<1>{4},
+              std::array<std::vector<double>, 1>{{{0.0, 0.1, 0.5, 0.7, 1.0}}},
+              {Index<1>{}}),
+          corners_for_rectilinear_domains(Index<1>{4})),
+      -0.5, 1.5);
+  test_spatial_index(
+      Domain<2>(maps_for_rectilinear_domains<Frame::Inertial>(
+                    Index<2>{3, 4},
+                    std::array<std::vector<double>, 2>{
+                        {{0.0, 0.2, 0.5, 1.0}, {0.0, 0.3, 0.6, 0.8, 1.0}}},
+                    {Index<2>{}}),
+                corners_for_rectilinear_domains(Index<2>{3, 4})),
+      -0.5, 1.5);
+  test_spatial_index(
+      Domain<3>(maps_for_rectilinear_domains<Frame::Inertial>(
+                    Index<3>{3, 3, 3},
+                    std::array<std::vector<double>, 3>{{{0.0, 0.2, 0.5, 1.0},
+                                                        {0.0, 0.3, 0.6, 1.0},
+                                                        {0.0, 0.1, 0.8, 1.0}}},
+                    {Index<3>{}}),
+                corners_for_rectilinear_domains(Index<3>{3, 3, 3})),
+      -0.5, 1.5);
+}
+
+void test_shell() {
+  const auto shell = domain::creators::Sphere(
+      1., 3., domain::creators::Sphere::Excision{}, 0_st, 3_st, true);
+  const auto domain = shell.create_domain();
+  test_spatial_index(domain, -3.5, 3.5);
+
+  // Points on and near block boundaries are assigned to the same blocks as
+  // without the index
+  const BlockSpatialIndex<3> spatial_index{domain};
+  const double eps = 1e-14;
+  const std::array<double, 5> thetas{{M_PI_4, M_PI_4 + eps, M_PI_4 - eps,
+                                      M_PI_4 + 10 * eps, M_PI_4 - 10 * eps}};
+  tnsr::I<DataVector, 3> x{thetas.size()};
+  for (size_t i = 0; i < thetas.size(); ++i) {
+    get<0>(x)[i] = 2. * sin(gsl::at(thetas, i));
+    get<1>(x)[i] = 0.;
+    get<2>(x)[i] = 2. * cos(gsl::at(thetas, i));
+  }
+  const auto expected = block_logical_coordinates(domain, x);
+  const auto result = block_logical_coordinates(domain, spatial_index, x);
+  for (size_t i = 0; i < thetas.size(); ++i) {
+    REQUIRE(result[i].has_value());
+    CHECK(result[i]->id == expected[i]->id);
+    CHECK(result[i]->data == expected[i]->data);
+  }
+}
+
+void test_time_dependent_brick() {
+  const auto uniform_translation =
+      domain::creators::time_dependence::UniformTranslation<3>(
+          0.0, {{0.1, 0.2, 0.3}});
+  const auto brick = domain::creators::Brick(
+      {{-0.1, -0.2, -0.3}}, {{0.1, 0.2, 0.3}}, {{0, 0, 0}}, {{3, 3, 3}},
+      {{false, false, false}}, uniform_translation.get_clone());
+  const auto domain = brick.create_domain();
+  const auto functions_of_time = uniform_translation.functions_of_time();
+  test_spatial_index(domain, -0.5, 0.5, 0.0, functions_of_time);
+  // The bounding boxes move with the domain
+  test_spatial_index(domain, -0.5, 0.5, 1.0, functions_of_time);
+  const BlockSpatialIndex<3> index_at_start{domain, 0.0, functions_of_time};
+  const BlockSpatialIndex<3> index_later{domain, 1.0, functions_of_time};
+  CHECK(index_later.bounding_boxes()[0].first[2] ==
+        approx(index_at_start.bounding_boxes()[0].first[2] + 0.3));
+}
+
+// A wedge with an opening angle close to pi and a non-adapted equiangular map
+// bulges far out between the sampled points, so the padded bounding box misses
+// part of the block. Rotating the wedge moves the bulge off the coordinate
+// axes, where the samples would otherwise catch it.
+void test_strongly_curved_block() {
+  std::vector<std::unique_ptr<
+      domain::CoordinateMapBase<Frame::BlockLogical, Frame::Inertial, 2>>>
+      maps{};
+  maps.push_back(
+      domain::make_coordinate_map_base<Frame::BlockLogical, Frame::Inertial>(
+          domain::CoordinateMaps::Wedge<2>(
+              1., 2., 1., 1., OrientationMap<2>::create_aligned(), true,
+              domain::CoordinateMaps::Wedge<2>::WedgeHalves::Both,
+              domain::CoordinateMaps::Distribution::Linear, {{0.98 * M_PI}},
+              false),
+          domain::CoordinateMaps::Rotation<2>(M_PI_4)));
+  const Domain<2> domain{std::move(maps)};
+  const BlockSpatialIndex<2> spatial_index{domain};
+
+  // This point is in the block, but outside its bounding box
+  const tnsr::I<double, 2> point{{{1.99, 0.}}};
+  CHECK(spatial_index.bounding_boxes()[0].second[0] < get<0>(point));
+  CHECK(spatial_index.candidate_blocks(point).empty());
+  tnsr::I<DataVector, 2> x{1_st};
+  get<0>(x)[0] = get<0>(point);
+  get<1>(x)[0] = get<1>(point);
+  const auto expected = block_logical_coordinates(domain, x);
+  REQUIRE(expected[0].has_value());
+  const auto result = block_logical_coordinates(domain, spatial_index, x);
+  REQUIRE(result[0].has_value());
+  CHECK(result[0]->id == expected[0]->id);
+  CHECK(result[0]->data == expected[0]->data);
+  std::vector<size_t> candidate_blocks{};
+  const auto single_point_result = block_logical_coordinates_single_point(
+      make_not_null(&candidate_blocks), point, domain, spatial_index);
+  REQUIRE(single_point_result.has_value());
+  CHECK(single_point_result->id == expected[0]->id);
+  CHECK(single_point_result->data == expected[0]->data);
+
+  // Points outside the domain are still not found
+  const tnsr::I<double, 2> outside_point{{{0.5, 0.}}};
+  CHECK_FALSE(block_logical_coordinates_single_point(
+                  make_not_null(&candidate_blocks), outside_point, domain,
+                  spatial_index)
+                  .has_value());
+}
+}  // namespace
+
+SPECTRE_TEST_CASE("Unit.Domain.BlockSpatialIndex", "[Domain][Unit]") {
+  test_rectilinear();
+  test_shell();
+  test_time_dependent_brick();
+  test_strongly_curved_block();
+}
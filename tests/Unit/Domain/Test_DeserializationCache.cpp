@@ -0,0 +1,77 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "Framework/TestingFramework.hpp"
+
+#include <array>
+#include <cstddef>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "DataStructures/DataVector.hpp"
+#include "Domain/Creators/Rectangle.hpp"
+#include "Domain/Creators/RegisterDerivedWithCharm.hpp"
+#include "Domain/DeserializationCache.hpp"
+#include "Domain/Domain.hpp"
+#include "Domain/FunctionsOfTime/FunctionOfTime.hpp"
+#include "Domain/FunctionsOfTime/PiecewisePolynomial.hpp"
+#include "Domain/FunctionsOfTime/RegisterDerivedWithCharm.hpp"
+#include "Utilities/Serialization/Serialize.hpp"
+
+namespace {
+std::vector<char> serialized_functions_of_time(const double value) {
+  domain::FunctionsOfTimeMap functions_of_time{};
+  functions_of_time["Translation"] =
+      std::make_unique<domain::FunctionsOfTime::PiecewisePolynomial<0>>(
+          0.0, std::array<DataVector, 1>{{{value}}}, 1.0);
+  return serialize(functions_of_time);
+}
+
+void test_domain() {
+  const domain::creators::Rectangle domain_creator{
+      {{-1., -1.}}, {{1., 1.}}, {{0, 0}}, {{4, 4}}, {{false, false}}};
+  const auto domain = domain_creator.create_domain();
+  const auto serialized_domain = serialize(domain);
+  const auto cached_domain =
+      domain::deserialize_domain_cached<2>(serialized_domain);
+  CHECK(*cached_domain == domain);
+  CHECK(domain::deserialize_domain_cached<2>(serialized_domain) ==
+        cached_domain);
+  const domain::creators::Rectangle other_domain_creator{
+      {{-1., -1.}}, {{2., 1.}}, {{0, 0}}, {{4, 4}}, {{false, false}}};
+  const auto other_domain = other_domain_creator.create_domain();
+  const auto other_cached_domain =
+      domain::deserialize_domain_cached<2>(serialize(other_domain));
+  CHECK(*other_cached_domain == other_domain);
+  CHECK(other_cached_domain != cached_domain);
+  domain::clear_deserialization_cache();
+  CHECK(domain::deserialize_domain_cached<2>(serialized_domain) !=
+        cached_domain);
+}
+
+void test_functions_of_time() {
+  const auto serialized = serialized_functions_of_time(1.);
+  const auto cached_functions_of_time =
+      domain::deserialize_functions_of_time_cached(serialized);
+  CHECK(cached_functions_of_time->at("Translation")->func(0.5)[0] ==
+        DataVector{1.});
+  CHECK(domain::deserialize_functions_of_time_cached(serialized) ==
+        cached_functions_of_time);
+  // Least recently used entries are evicted
+  for (size_t i = 0; i < domain::deserialization_cache_size; ++i) {
+    domain::deserialize_functions_of_time_cached(
+        serialized_functions_of_time(static_cast<double>(i) + 2.));
+  }
+  CHECK(domain::deserialize_functions_of_time_cached(serialized) !=
+        cached_functions_of_time);
+  domain::clear_deserialization_cache();
+}
+}  // namespace
+
+SPECTRE_TEST_CASE("Unit.Domain.DeserializationCache", "[Domain][Unit]") {
+  domain::creators::register_derived_with_charm();
+  domain::FunctionsOfTime::register_derived_with_charm();
+  test_domain();
+  test_functions_of_time();
+}
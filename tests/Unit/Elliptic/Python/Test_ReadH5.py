@@ -80,6 +80,12 @@ class TestReadH5(unittest.TestCase):
             volfile = h5file.get_vol(subfile_name)
             matrix = read_matrix(volfile)
         npt.assert_array_equal(matrix, expected_matrix)
+        # Test reading matrix from the files in parallel
+        for num_processes in [1, 2]:
+            matrix = read_matrix(
+                filename, subfile_name, num_processes=num_processes
+            )
+            npt.assert_array_equal(matrix, expected_matrix)
 
 
 if __name__ == "__main__":
@@ -12,7 +12,11 @@ from click.testing import CliRunner
 from spectre.DataStructures import DataVector
 from spectre.DataStructures.Tensor import Scalar, tnsr
 from spectre.Informer import unit_test_build_path, unit_test_src_path
-from spectre.IO.Exporter import interpolate_tensors_to_points
+from spectre.IO.Exporter import (
+    InterpolationPlan,
+    interpolate_tensors_to_points,
+    interpolate_to_points,
+)
 from spectre.IO.Exporter.InterpolateToPoints import (
     interpolate_to_points_command,
 )
@@ -48,6 +52,48 @@ class TestInterpolateToPoints(unittest.TestCase):
         )
         self.assertAlmostEqual(psi.get()[0], -0.07059806932542323)
 
+    def test_interpolation_plan(self):
+        obs_ids = list_observations(
+            open_volfiles([self.h5_filename], "/element_data")
+        )[0]
+        target_points = np.array([3 * [0.0], 3 * [2 * np.pi]]).T
+        plan = InterpolationPlan[3](
+            self.h5_filename, "element_data", target_points=target_points
+        )
+        # The domain is time dependent, so the target points are mapped again
+        # for every observation, starting from their mapping at the previous
+        # observation. Also go back in time to map them from a later time.
+        for obs_id in obs_ids + obs_ids[::-1]:
+            expected = interpolate_to_points(
+                self.h5_filename,
+                "element_data",
+                observation_id=obs_id,
+                tensor_components=["Psi", "Phi_x"],
+                target_points=target_points,
+            )
+            npt.assert_allclose(
+                plan.interpolate(obs_id, ["Psi", "Phi_x"]), expected
+            )
+        npt.assert_allclose(
+            plan.interpolate(obs_ids[0], ["Psi"])[0][0], -0.07059806932542323
+        )
+        npt.assert_allclose(
+            plan.interpolate(obs_ids[0], ["Psi"], single_precision=True)[0][0],
+            -0.07059806932542323,
+            rtol=1e-6,
+        )
+        # The target points must have the dimension of the plan
+        with self.assertRaises(ValueError):
+            InterpolationPlan[2](
+                self.h5_filename, "element_data", target_points=target_points
+            )
+        # The plan must have the dimension of the volume data
+        plan_2d = InterpolationPlan[2](
+            self.h5_filename, "element_data", target_points=target_points[:2]
+        )
+        with self.assertRaises(RuntimeError):
+            plan_2d.interpolate(obs_ids[0], ["Psi"])
+
     def test_cli(self):
         runner = CliRunner()
         result = runner.invoke(
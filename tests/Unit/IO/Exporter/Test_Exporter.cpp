@@ -4,8 +4,11 @@
 #include "Framework/TestingFramework.hpp"
 
 #include <array>
+#include <cmath>
 #include <cstddef>
 #include <string>
+#include <type_traits>
+#include <utility>
 #include <vector>
 #ifdef _OPENMP
 #include <omp.h>
@@ -89,6 +92,16 @@ SPECTRE_TEST_CASE("Unit.IO.Exporter", "[Unit]") {
             .epsilon(10. * std::numeric_limits<float>::epsilon())
             .scale(1.0);
     CHECK(interpolated_data[0][0] == custom_approx(1.));
+    // Return the interpolated data in single precision
+    const auto interpolated_data_float = interpolate_to_points<2, float>(
+        h5_file_name, "/VolumeData", ObservationId{123}, {"Psi"},
+        {{{0., 0.5, 2.}, {0., -0.5, 0.}}});
+    static_assert(std::is_same_v<decltype(interpolated_data_float),
+                                 const std::vector<std::vector<float>>>);
+    CHECK(interpolated_data_float[0][0] == custom_approx(1.));
+    CHECK(interpolated_data_float[0][1] == custom_approx(0.5));
+    // Points outside the domain are NaN
+    CHECK(std::isnan(interpolated_data_float[0][2]));
     // Delete the test file
     if (file_system::check_if_file_exists(h5_file_name)) {
       file_system::rm(h5_file_name, true);
@@ -183,6 +196,26 @@ SPECTRE_TEST_CASE("Unit.IO.Exporter", "[Unit]") {
     // This point is interpolated
     Approx approx_interpolated = Approx::custom().epsilon(1.e-6).scale(1.0);
     CHECK(psi_interpolated[5] == approx_interpolated(psi_expected[5]));
+    {
+      INFO("Interpolation plan");
+      InterpolationPlan<3> plan{h5_file_name, "/VolumeData",
+                                target_points_array, true};
+      // The first call sets up the plan and the second one reuses it
+      CHECK(plan.interpolate(ObservationId{123}, {"Psi"}) == interpolated_data);
+      CHECK(plan.interpolate(ObservationStep{0}, {"Psi"}) == interpolated_data);
+      const auto interpolated_data_float =
+          plan.interpolate<float>(ObservationId{123}, {"Psi"});
+      REQUIRE(interpolated_data_float.size() == 1);
+      REQUIRE(interpolated_data_float[0].size() == num_target_points);
+      for (size_t i = 0; i < num_target_points; ++i) {
+        CHECK(interpolated_data_float[0][i] ==
+              static_cast<float>(interpolated_data[0][i]));
+      }
+      // Moving the plan keeps its state
+      auto moved_plan = std::move(plan);
+      CHECK(moved_plan.interpolate(ObservationId{123}, {"Psi"}) ==
+            interpolated_data);
+    }
     // Delete the test file
     if (file_system::check_if_file_exists(h5_file_name)) {
       file_system::rm(h5_file_name, true);
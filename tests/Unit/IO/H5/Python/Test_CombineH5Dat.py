@@ -156,6 +156,64 @@ class TestCombineH5Dat(unittest.TestCase):
             npt.assert_allclose(h5file["Powers/Pow.dat"], self.pow_joined)
             self.assertEqual(h5file.attrs["InputSource.yaml"], self.test_yaml)
 
+    def test_incremental(self):
+        combine_h5_dat(
+            output=self.output_file_path,
+            h5files=self.input_file_paths[:2],
+            force=None,
+            incremental=True,
+        )
+        with h5py.File(self.output_file_path) as h5file:
+            npt.assert_allclose(
+                h5file["Waves.dat"],
+                np.concatenate((self.wave_1, self.wave_2), axis=0),
+            )
+            npt.assert_equal(
+                h5file["Waves.dat"].attrs["CombinedNumRows"], [100, 100]
+            )
+
+        # The second segment continues to run before it is restarted from an
+        # earlier checkpoint in the third segment
+        wave_2_continued = np.array(
+            [[t, 0.0, 0.0] for t in np.arange(20.0, 25.0, 0.1)]
+        )
+        with h5py.File(self.input_file_paths[1], "r+") as h5file:
+            h5file["Waves.dat"].resize(150, axis=0)
+            h5file["Waves.dat"][100:] = wave_2_continued
+        combine_h5_dat(
+            output=self.output_file_path,
+            h5files=self.input_file_paths[:2],
+            force=None,
+            incremental=True,
+        )
+        with h5py.File(self.output_file_path) as h5file:
+            self.assertEqual(len(h5file["Waves.dat"]), 250)
+            npt.assert_allclose(h5file["Waves.dat"][200:], wave_2_continued)
+        combine_h5_dat(
+            output=self.output_file_path,
+            h5files=self.input_file_paths,
+            force=None,
+            incremental=True,
+        )
+        with h5py.File(self.output_file_path) as h5file:
+            npt.assert_allclose(h5file["Waves.dat"], self.wave_joined)
+            npt.assert_allclose(h5file["Powers/Pow.dat"], self.pow_joined)
+            npt.assert_equal(
+                h5file["Waves.dat"].attrs["CombinedNumRows"], [100, 150, 100]
+            )
+            self.assertEqual(h5file.attrs["InputSource.yaml"], self.test_yaml)
+
+        # Only the input file that was combined last can grow
+        with h5py.File(self.input_file_paths[0], "r+") as h5file:
+            h5file["Waves.dat"].resize(101, axis=0)
+        with self.assertRaisesRegex(ValueError, "has changed since"):
+            combine_h5_dat(
+                output=self.output_file_path,
+                h5files=self.input_file_paths,
+                force=None,
+                incremental=True,
+            )
+
     def test_cli(self):
         runner = CliRunner()
         result = runner.invoke(
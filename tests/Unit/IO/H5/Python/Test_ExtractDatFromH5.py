@@ -3,6 +3,7 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
+import importlib.util
 import os
 import shutil
 import unittest
@@ -143,6 +144,52 @@ class TestExtractDatFromH5(unittest.TestCase):
         # We don't test the '--list' flag as this is effectively just
         # available_subfiles()
 
+    def test_binary_formats(self):
+        with spectre_h5.H5File(self.h5_filename, "r") as h5file:
+            datfile = h5file.get_dat("/Group0/MemoryData")
+            expected_legend = datfile.get_legend()
+            expected_memory_data = np.array(datfile.get_data())
+
+        formats = ["npy", "npz"]
+        if importlib.util.find_spec("pyarrow") is not None:
+            formats += ["feather", "parquet"]
+        for format in formats:
+            with self.subTest(format=format):
+                extract_dat_files(
+                    self.h5_filename,
+                    out_dir=self.created_dir,
+                    num_cores=2,
+                    precision=16,
+                    force=True,
+                    format=format,
+                )
+                memory_data_path = os.path.join(
+                    self.created_dir, "Group0", "MemoryData." + format
+                )
+                if format == "npy":
+                    memory_data = np.load(memory_data_path)
+                elif format == "npz":
+                    with np.load(memory_data_path) as npz:
+                        memory_data = npz["data"]
+                        self.assertEqual(list(npz["legend"]), expected_legend)
+                else:
+                    import pandas as pd
+
+                    df = getattr(pd, "read_" + format)(memory_data_path)
+                    self.assertEqual(list(df.columns), expected_legend)
+                    memory_data = df.to_numpy()
+                npt.assert_equal(memory_data, expected_memory_data)
+
+        with self.assertRaisesRegex(ValueError, "output directory"):
+            extract_dat_files(
+                self.h5_filename,
+                out_dir=None,
+                num_cores=1,
+                precision=16,
+                subfiles=["TimeSteps2.dat"],
+                format="npy",
+            )
+
     def test_cli(self):
         runner = CliRunner()
         result = runner.invoke(
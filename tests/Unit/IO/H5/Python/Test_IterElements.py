@@ -3,6 +3,7 @@
 # Distributed under the MIT License.
 # See LICENSE.txt for details.
 
+import operator
 import os
 import unittest
 from dataclasses import FrozenInstanceError
@@ -11,16 +12,38 @@ import numpy as np
 import numpy.testing as npt
 
 import spectre.IO.H5 as spectre_h5
-from spectre.Domain import ElementId, deserialize_functions_of_time
+from spectre.Domain import (
+    ElementId,
+    ElementMap,
+    deserialize_domain,
+    deserialize_functions_of_time,
+)
 from spectre.Informer import unit_test_src_path
 from spectre.IO.H5.IterElements import (
+    _element_geometry_cache,
+    _ObservationData,
+    clear_element_geometry_cache,
     include_element,
     iter_elements,
+    map_reduce_elements,
+    set_element_geometry_cache_size,
     stripped_element_name,
 )
 from spectre.Spectral import Basis, Mesh, Quadrature, logical_coordinates
 
 
+def _max_abs_data(element, tensor_data):
+    return np.max(np.abs(tensor_data))
+
+
+def _num_elements(elements):
+    return len(elements)
+
+
+def _list_num_elements(elements):
+    return [len(elements)]
+
+
 class TestIterElements(unittest.TestCase):
     def setUp(self):
         self.volfile_name = os.path.join(
@@ -160,6 +183,206 @@ class TestIterElements(unittest.TestCase):
                 ),
                 1,
             )
+            # Only the data of the selected elements is read
+            all_data = {
+                str(element.id): data
+                for element, data in iter_elements(
+                    volfile, obs_id, tensor_components=tensor_components
+                )
+            }
+            selected_elements = list(
+                iter_elements(
+                    volfile,
+                    obs_id,
+                    tensor_components=tensor_components,
+                    element_patterns=["B0,(L1I1*)"],
+                )
+            )
+            self.assertEqual(len(selected_elements), 1)
+            element, data = selected_elements[0]
+            npt.assert_equal(data, all_data[str(element.id)])
+            # The data is returned in the precision it is stored in, unless
+            # another precision is requested
+            self.assertEqual(data.dtype, np.float64)
+            for element, data in iter_elements(
+                volfile,
+                obs_id,
+                tensor_components=tensor_components,
+                dtype=np.float32,
+            ):
+                self.assertEqual(data.dtype, np.float32)
+                npt.assert_allclose(
+                    data, all_data[str(element.id)], rtol=1e-6, atol=1e-6
+                )
+
+    def test_prefetch(self):
+        tensor_components = ["Psi", "Error(Psi)"]
+        with spectre_h5.H5File(self.volfile_name, "r") as open_h5_file:
+            volfile = open_h5_file.get_vol(self.subfile_name)
+            expected_elements = list(
+                iter_elements(volfile, None, tensor_components)
+            )
+            for prefetch, memory_budget in [(1, None), (3, None), (2, 0)]:
+                elements = list(
+                    iter_elements(
+                        [volfile, volfile],
+                        None,
+                        tensor_components,
+                        prefetch=prefetch,
+                        prefetch_memory_budget=memory_budget,
+                    )
+                )
+                self.assertEqual(len(elements), 2 * len(expected_elements))
+                for (element, data), (expected_element, expected_data) in zip(
+                    elements, 2 * expected_elements
+                ):
+                    self.assertEqual(element.id, expected_element.id)
+                    self.assertEqual(element.time, expected_element.time)
+                    npt.assert_equal(data, expected_data)
+            # Stop the iteration early
+            for element, data in iter_elements(
+                volfile, None, tensor_components, prefetch=1
+            ):
+                break
+            # Errors in the background thread are raised in the iteration
+            with self.assertRaises(RuntimeError):
+                list(
+                    iter_elements(
+                        volfile, None, ["NonexistentComponent"], prefetch=1
+                    )
+                )
+            with self.assertRaises(ValueError):
+                list(iter_elements(volfile, None, prefetch=-1))
+
+    def test_observation_nbytes(self):
+        observation = _ObservationData(
+            dim=3,
+            grid_names=["[B0,(L0I0,L0I0,L0I0)]"],
+            grid_indices=[0],
+            extents=[[2, 3, 4]],
+            bases=[3 * [Basis.Legendre]],
+            quadratures=[3 * [Quadrature.GaussLobatto]],
+            offsets_and_lengths=[(0, 24)],
+            time=0.0,
+            domain=None,
+            functions_of_time=None,
+            tensor_data=np.zeros((2, 24), dtype=np.float32),
+            num_time_dependent_points=24,
+        )
+        # Tensor data, plus coordinates, Jacobian, inverse Jacobian, and its
+        # determinant in double precision
+        self.assertEqual(observation.nbytes, 2 * 24 * 4 + 24 * 22 * 8)
+
+    def test_element_geometry_cache(self):
+        clear_element_geometry_cache()
+        with spectre_h5.H5File(self.volfile_name, "r") as open_h5_file:
+            volfile = open_h5_file.get_vol(self.subfile_name)
+            # Iterate the same observation twice
+            elements = list(iter_elements([volfile, volfile], None))
+            domain = deserialize_domain[3](
+                volfile.get_domain(volfile.list_observation_ids()[0])
+            )
+        self.assertEqual(len(elements), 4)
+        self.assertEqual(len(_element_geometry_cache), 2)
+        for element, same_element in zip(elements[:2], elements[2:]):
+            self.assertEqual(element.id, same_element.id)
+            self.assertIs(element.map, same_element.map)
+            self.assertIs(
+                element.logical_coordinates, same_element.logical_coordinates
+            )
+            # The ElementLogical -> Grid coordinates are reused for the
+            # elements in time-dependent blocks
+            self.assertIs(
+                element._geometry._observation_geometry.maps,
+                same_element._geometry._observation_geometry.maps,
+            )
+            # The domain is time dependent, so the inertial coordinates and
+            # Jacobians of all elements are computed at once. Compare to the
+            # element map.
+            element_map = ElementMap(element.id, domain)
+            args = (
+                element.logical_coordinates,
+                element.time,
+                element.functions_of_time,
+            )
+            npt.assert_allclose(
+                element.inertial_coordinates, element_map(*args)
+            )
+            npt.assert_allclose(
+                element.jacobian, element_map.jacobian(*args), atol=1e-14
+            )
+            npt.assert_allclose(
+                element.inv_jacobian,
+                element_map.inv_jacobian(*args),
+                atol=1e-14,
+            )
+            npt.assert_allclose(element.det_jacobian, same_element.det_jacobian)
+        # The cache is bounded, but always holds the last element
+        set_element_geometry_cache_size(0)
+        self.assertEqual(len(_element_geometry_cache), 1)
+        with self.assertRaises(ValueError):
+            set_element_geometry_cache_size(-1)
+        set_element_geometry_cache_size(2**20)
+        clear_element_geometry_cache()
+        self.assertEqual(len(_element_geometry_cache), 0)
+
+    def test_map_reduce_elements(self):
+        tensor_components = ["Psi", "Error(Psi)"]
+        with spectre_h5.H5File(self.volfile_name, "r") as open_h5_file:
+            volfile = open_h5_file.get_vol(self.subfile_name)
+            expected_max = max(
+                np.max(np.abs(data))
+                for _, data in iter_elements(volfile, None, tensor_components)
+            )
+            num_obs = len(volfile.list_observation_ids())
+        for num_processes in [1, 2]:
+            self.assertEqual(
+                map_reduce_elements(
+                    [self.volfile_name, self.volfile_name],
+                    self.subfile_name,
+                    _max_abs_data,
+                    max,
+                    tensor_components=tensor_components,
+                    num_processes=num_processes,
+                ),
+                expected_max,
+            )
+            # Per-observation map, summing the number of elements
+            self.assertEqual(
+                map_reduce_elements(
+                    [self.volfile_name, self.volfile_name],
+                    self.subfile_name,
+                    _num_elements,
+                    operator.add,
+                    per_observation=True,
+                    num_processes=num_processes,
+                ),
+                2 * 2 * num_obs,
+            )
+            # The elements of an observation in all files are mapped together
+            self.assertEqual(
+                map_reduce_elements(
+                    [self.volfile_name, self.volfile_name],
+                    self.subfile_name,
+                    _list_num_elements,
+                    operator.add,
+                    per_observation=True,
+                    num_processes=num_processes,
+                ),
+                num_obs * [2 * 2],
+            )
+            # No elements selected
+            self.assertIsNone(
+                map_reduce_elements(
+                    self.volfile_name,
+                    self.subfile_name,
+                    _num_elements,
+                    max,
+                    element_patterns=["B1,*"],
+                    per_observation=True,
+                    num_processes=num_processes,
+                )
+            )
 
 
 if __name__ == "__main__":
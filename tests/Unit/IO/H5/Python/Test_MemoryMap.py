@@ -0,0 +1,119 @@
+# Distributed under the MIT License.
+# See LICENSE.txt for details.
+
+import os
+import shutil
+import unittest
+
+import h5py
+import numpy as np
+import numpy.testing as npt
+
+import spectre.IO.H5 as spectre_h5
+from spectre.Informer import unit_test_build_path, unit_test_src_path
+from spectre.IO.H5.IterElements import iter_elements
+from spectre.IO.H5.MemoryMap import map_tensor_component, map_tensor_components
+
+
+class TestMemoryMap(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = os.path.join(
+            unit_test_build_path(), "IO/H5/Python/MemoryMap"
+        )
+        self.filename = os.path.join(self.test_dir, "TestVolume.h5")
+        os.makedirs(self.test_dir, exist_ok=True)
+        shutil.copyfile(
+            os.path.join(
+                unit_test_src_path(), "Visualization/Python", "VolTestData0.h5"
+            ),
+            self.filename,
+        )
+        self.subfile_name = "/element_data"
+        self.tensor_components = ["Psi", "Error(Psi)"]
+        # Rewrite some datasets without chunking and compression so they are
+        # stored contiguously
+        with h5py.File(self.filename, "a") as open_h5_file:
+            volfile = open_h5_file["element_data.vol"]
+            obs_group = volfile[sorted(volfile.keys())[0]]
+            for component in self.tensor_components:
+                data = np.array(obs_group[component])
+                del obs_group[component]
+                obs_group.create_dataset(component, data=data)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_map_tensor_component(self):
+        with spectre_h5.H5File(self.filename, "r") as open_h5_file:
+            volfile = open_h5_file.get_vol(self.subfile_name)
+            obs_id = volfile.list_observation_ids()[0]
+            # Contiguous dataset is memory-mapped
+            self.assertIsNotNone(
+                volfile.get_tensor_component_file_location(obs_id, "Psi")
+            )
+            psi = map_tensor_component(volfile, obs_id, "Psi")
+            self.assertIsInstance(psi, np.memmap)
+            self.assertFalse(psi.flags.writeable)
+            npt.assert_equal(
+                psi, volfile.get_tensor_component_array(obs_id, "Psi")
+            )
+            # Chunked dataset falls back to reading
+            self.assertIsNone(
+                volfile.get_tensor_component_file_location(
+                    obs_id, "InertialCoordinates_x"
+                )
+            )
+            x = map_tensor_component(volfile, obs_id, "InertialCoordinates_x")
+            self.assertNotIsInstance(x, np.memmap)
+            self.assertFalse(x.flags.writeable)
+            npt.assert_equal(
+                x,
+                volfile.get_tensor_component_array(
+                    obs_id, "InertialCoordinates_x"
+                ),
+            )
+            # Multiple components, memory-mapped or read
+            for tensor_components in [
+                self.tensor_components,
+                self.tensor_components + ["InertialCoordinates_x"],
+            ]:
+                data = map_tensor_components(volfile, obs_id, tensor_components)
+                self.assertFalse(data.flags.writeable)
+                npt.assert_equal(
+                    data,
+                    volfile.get_tensor_components(obs_id, tensor_components),
+                )
+
+    def test_iter_elements(self):
+        with spectre_h5.H5File(self.filename, "r") as open_h5_file:
+            volfile = open_h5_file.get_vol(self.subfile_name)
+            obs_id = volfile.list_observation_ids()[0]
+            for element_patterns in [None, ["B0,(L1I1*)"]]:
+                expected = list(
+                    iter_elements(
+                        volfile,
+                        obs_id,
+                        self.tensor_components,
+                        element_patterns=element_patterns,
+                    )
+                )
+                mapped = list(
+                    iter_elements(
+                        volfile,
+                        obs_id,
+                        self.tensor_components,
+                        element_patterns=element_patterns,
+                        memory_map=True,
+                    )
+                )
+                self.assertEqual(len(mapped), len(expected))
+                for (element, data), (expected_element, expected_data) in zip(
+                    mapped, expected
+                ):
+                    self.assertEqual(element.id, expected_element.id)
+                    self.assertFalse(data.flags.writeable)
+                    npt.assert_equal(data, expected_data)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -4,6 +4,7 @@
 import os
 import unittest
 
+import h5py
 import numpy as np
 from click.testing import CliRunner
 
@@ -11,7 +12,7 @@ import spectre.IO.H5 as spectre_h5
 from spectre import Informer
 from spectre.DataStructures import DataVector
 from spectre.IO.H5 import ElementVolumeData, TensorComponent, combine_h5
-from spectre.IO.H5.CombineH5 import combine_h5_command
+from spectre.IO.H5.CombineH5 import combine_h5_command, combine_h5_vol
 from spectre.Spectral import Basis, Quadrature
 
 
@@ -29,6 +30,9 @@ class TestCombineH5(unittest.TestCase):
         self.file_names = [self.file_name1, self.file_name2]
         self.subfile_name = "/element_data"
 
+        self.file_name3 = os.path.join(
+            Informer.unit_test_build_path(), "IO/TestVolumeData2.h5"
+        )
         self.output_file = os.path.join(
             Informer.unit_test_build_path(), "IO/TestOutput.h5"
         )
@@ -37,6 +41,8 @@ class TestCombineH5(unittest.TestCase):
             os.remove(self.file_name1)
         if os.path.isfile(self.file_name2):
             os.remove(self.file_name2)
+        if os.path.isfile(self.file_name3):
+            os.remove(self.file_name3)
         if os.path.isfile(self.output_file):
             os.remove(self.output_file)
 
@@ -145,9 +151,119 @@ class TestCombineH5(unittest.TestCase):
             os.remove(self.file_name1)
         if os.path.isfile(self.file_name2):
             os.remove(self.file_name2)
+        if os.path.isfile(self.file_name3):
+            os.remove(self.file_name3)
         if os.path.isfile(self.output_file):
             os.remove(self.output_file)
 
+    def write_next_segment(self, restarted_observation_value=1.3):
+        # Write a third file, like from a segment that was restarted from the
+        # checkpoint at observation 1 and continued to observation 2. The
+        # restarted segment can record a different value for observation 1.
+        self.restarted_data = np.array([1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7])
+        with spectre_h5.H5File(file_name=self.file_name3, mode="a") as h5_file:
+            h5_file.insert_vol(self.subfile_name, version=0)
+            h5_file.close_current_object()
+            vol_file = h5_file.get_vol(self.subfile_name)
+            for observation_id, observation_value in [
+                (1, restarted_observation_value),
+                (2, 9.0),
+            ]:
+                vol_file.write_volume_data(
+                    observation_id,
+                    observation_value,
+                    [
+                        ElementVolumeData(
+                            element_name="[B0(L0I0,L0I0,L1I0)]",
+                            components=[
+                                TensorComponent(
+                                    "field_1", DataVector(self.restarted_data)
+                                ),
+                                TensorComponent(
+                                    "field_2", DataVector(self.restarted_data)
+                                ),
+                            ],
+                            extents=3 * [2],
+                            basis=3 * [Basis.Legendre],
+                            quadrature=3 * [Quadrature.Gauss],
+                        )
+                    ],
+                )
+
+    def check_combined_segments(self, restarted_observation_value=1.3):
+        with spectre_h5.H5File(file_name=self.output_file, mode="r") as h5_file:
+            output_vol = h5_file.get_vol(self.subfile_name)
+            self.assertEqual(output_vol.list_observation_ids(), [1, 0, 2])
+            self.assertEqual(output_vol.get_observation_value(2), 9.0)
+            # The observation value is also taken from the restarted segment
+            self.assertEqual(
+                output_vol.get_observation_value(1), restarted_observation_value
+            )
+            # The element in the restarted segment replaces the element in the
+            # first segment
+            self.assertEqual(
+                output_vol.get_grid_names(1),
+                ["[B0(L0I0,L0I0,L1I0)]", "[B1(L1I0,L0I0,L0I0)]"],
+            )
+            np.testing.assert_allclose(
+                np.array(output_vol.get_tensor_component(1, "field_1").data),
+                np.concatenate(
+                    [self.restarted_data, self.tensor_component_data2[1]]
+                ),
+            )
+            np.testing.assert_allclose(
+                np.array(output_vol.get_tensor_component(2, "field_1").data),
+                self.restarted_data,
+            )
+            self.assertEqual(
+                len(output_vol.get_tensor_component(0, "field_1").data), 16
+            )
+
+    def test_combine_segments(self):
+        self.write_next_segment()
+        combine_h5(
+            self.file_names + [self.file_name3],
+            self.subfile_name,
+            self.output_file,
+            False,
+        )
+        self.check_combined_segments()
+
+    def test_combine_parallel(self):
+        self.write_next_segment()
+        combine_h5_vol(
+            self.file_names + [self.file_name3],
+            self.subfile_name,
+            self.output_file,
+            check_src=False,
+            num_jobs=2,
+        )
+        self.check_combined_segments()
+        # The output file is written by the volume data writer, including the
+        # observation index
+        with h5py.File(self.output_file, "r") as open_h5_file:
+            index_group = open_h5_file["element_data.idx"]
+            np.testing.assert_equal(
+                index_group["observation_ids"][()], [1, 0, 2]
+            )
+            np.testing.assert_equal(
+                index_group["observation_values"][()], [1.3, 7.0, 9.0]
+            )
+
+    def test_combine_differing_observation_values(self):
+        self.write_next_segment(restarted_observation_value=1.5)
+        for num_jobs in [1, 2]:
+            if os.path.isfile(self.output_file):
+                os.remove(self.output_file)
+            combine_h5_vol(
+                self.file_names + [self.file_name3],
+                self.subfile_name,
+                self.output_file,
+                check_src=False,
+                num_jobs=num_jobs,
+            )
+            self.check_combined_segments(restarted_observation_value=1.5)
+
     def test_combine_h5(self):
         # Run the combine_h5 command and check if any feature (for eg.
         # connectivity length has increased due to combining two files)
@@ -248,6 +364,8 @@ class TestCombineH5(unittest.TestCase):
                 "-o",
                 self.output_file,
                 "--check-src",
+                "-j",
+                "2",
             ],
             catch_exceptions=False,
         )
@@ -3,7 +3,9 @@
 
 #include "Framework/TestingFramework.hpp"
 
+#include <algorithm>
 #include <array>
+#include <chrono>
 #include <cstddef>
 #include <cstdint>
 #include <hdf5.h>
@@ -20,6 +22,7 @@
 #include "DataStructures/Matrix.hpp"
 #include "IO/Connectivity.hpp"
 #include "IO/H5/AccessType.hpp"
+#include "IO/H5/BufferedDatWriter.hpp"
 #include "IO/H5/CheckH5.hpp"
 #include "IO/H5/Dat.hpp"
 #include "IO/H5/File.hpp"
@@ -34,6 +37,7 @@
 #include "Utilities/FileSystem.hpp"
 #include "Utilities/Formaline.hpp"
 #include "Utilities/GetOutput.hpp"
+#include "Utilities/Gsl.hpp"
 #include "Utilities/MakeString.hpp"
 #include "Utilities/TMPL.hpp"
 
@@ -399,6 +403,153 @@ void test_dat_read() {
     file_system::rm(h5_file_name, true);
   }
 }
+
+void test_buffered_dat_writer() {
+  const std::string h5_file_name("Unit.IO.H5.Dat.BufferedDatWriter.h5");
+  if (file_system::check_if_file_exists(h5_file_name)) {
+    file_system::rm(h5_file_name, true);
+  }
+  const std::vector<std::string> legend{"Time", "Value"};
+  h5::H5File<h5::AccessType::ReadWrite> h5_file(h5_file_name);
+  auto& dat_file = h5_file.insert<h5::Dat>("/Values", legend);
+  {
+    h5::BufferedDatWriter writer{make_not_null(&dat_file), 3};
+    CHECK(writer.max_buffered_rows() == 3);
+    CHECK_FALSE(writer.max_buffer_time().has_value());
+    writer.append(std::vector<double>{0.0, 1.0});
+    writer.append(std::vector<double>{1.0, 2.0});
+    CHECK(writer.number_of_buffered_rows() == 2);
+    CHECK(dat_file.get_dimensions() == std::array<hsize_t, 2>{{0, 2}});
+    // Flushes when the buffer is full
+    writer.append(std::vector<std::vector<double>>{{2.0, 3.0}, {3.0, 4.0}});
+    CHECK(writer.number_of_buffered_rows() == 1);
+    CHECK(dat_file.get_dimensions() == std::array<hsize_t, 2>{{3, 2}});
+    Matrix rows(2, 2);
+    rows(0, 0) = 4.0;
+    rows(0, 1) = 5.0;
+    rows(1, 0) = 5.0;
+    rows(1, 1) = 6.0;
+    writer.append(rows);
+    CHECK(writer.number_of_buffered_rows() == 0);
+    CHECK(dat_file.get_dimensions() == std::array<hsize_t, 2>{{6, 2}});
+    writer.append(std::vector<double>{6.0, 7.0});
+    writer.flush();
+    CHECK(writer.number_of_buffered_rows() == 0);
+    CHECK(dat_file.get_dimensions() == std::array<hsize_t, 2>{{7, 2}});
+    CHECK_THROWS_WITH(writer.append(std::vector<double>{1.0}),
+                      Catch::Matchers::ContainsSubstring(
+                          "Cannot add columns to Dat files. Current number of "
+                          "columns is 2 but received 1 entries."));
+    // Flushes on destruction
+    writer.append(std::vector<double>{7.0, 8.0});
+  }
+  CHECK(dat_file.get_dimensions() == std::array<hsize_t, 2>{{8, 2}});
+  {
+    // Flushes when the first buffered row is too old
+    h5::BufferedDatWriter writer{make_not_null(&dat_file), 100,
+                                 std::chrono::duration<double>(0.0)};
+    writer.append(std::vector<double>{8.0, 9.0});
+    CHECK(writer.number_of_buffered_rows() == 0);
+    CHECK(dat_file.get_dimensions() == std::array<hsize_t, 2>{{9, 2}});
+  }
+  const Matrix data = dat_file.get_data();
+  for (size_t i = 0; i < 9; ++i) {
+    CHECK(data(i, 0) == static_cast<double>(i));
+    CHECK(data(i, 1) == static_cast<double>(i + 1));
+  }
+  CHECK_THROWS_WITH(h5::BufferedDatWriter(make_not_null(&dat_file), 0),
+                    Catch::Matchers::ContainsSubstring(
+                        "The maximum number of buffered rows must be "
+                        "positive."));
+  {
+    h5::BufferedDatWriter writer{make_not_null(&dat_file)};
+    CHECK_THROWS_WITH(
+        h5::BufferedDatWriter(make_not_null(&dat_file)),
+        Catch::Matchers::ContainsSubstring("already has a buffered writer"));
+    // Closing the subfile flushes the writer and detaches it
+    writer.append(std::vector<double>{9.0, 10.0});
+    CHECK(writer.is_open());
+    h5_file.close_current_object();
+    CHECK_FALSE(writer.is_open());
+    CHECK(writer.number_of_buffered_rows() == 0);
+    CHECK_THROWS_WITH(writer.append(std::vector<double>{10.0, 11.0}),
+                      Catch::Matchers::ContainsSubstring(
+                          "its Dat subfile was closed"));
+    // Flushing an empty buffer is fine, and so is destroying the writer
+    writer.flush();
+  }
+  CHECK(h5_file.get<h5::Dat>("/Values").get_dimensions() ==
+        std::array<hsize_t, 2>{{10, 2}});
+  h5_file.close_current_object();
+  if (file_system::check_if_file_exists(h5_file_name)) {
+    file_system::rm(h5_file_name, true);
+  }
+}
+
+void test_rows_in_time_range() {
+  const std::string h5_file_name("Unit.IO.H5.Dat.RowsInTimeRange.h5");
+  if (file_system::check_if_file_exists(h5_file_name)) {
+    file_system::rm(h5_file_name, true);
+  }
+  const std::vector<std::string> legend{"Time", "Value", "Other"};
+  h5::H5File<h5::AccessType::ReadWrite> h5_file(h5_file_name);
+  auto& dat_file = h5_file.insert<h5::Dat>("/Values", legend);
+  CHECK(dat_file.get_rows_in_time_range(0.0, 1.0).rows() == 0);
+  CHECK(dat_file.get_rows_in_time_range(0.0, 1.0).columns() == 3);
+  // Enough rows to bisect, with repeated times like after a restart
+  std::vector<double> times{};
+  for (size_t i = 0; i < 1000; ++i) {
+    times.push_back(0.01 * static_cast<double>(i));
+  }
+  for (size_t i = 0; i < 100; ++i) {
+    times.push_back(5.0 + 0.01 * static_cast<double>(i));
+  }
+  std::sort(times.begin(), times.end());
+  std::vector<std::vector<double>> rows{};
+  for (const double time : times) {
+    rows.push_back({time, 2.0 * time, -time});
+  }
+  dat_file.append(rows);
+  const auto check_time_range = [&dat_file, &times](const double start_time,
+                                                    const double end_time) {
+    std::vector<size_t> expected_rows{};
+    for (size_t i = 0; i < times.size(); ++i) {
+      if (times[i] >= start_time and times[i] <= end_time) {
+        expected_rows.push_back(i);
+      }
+    }
+    CAPTURE(start_time);
+    CAPTURE(end_time);
+    const Matrix all_columns =
+        dat_file.get_rows_in_time_range(start_time, end_time);
+    REQUIRE(all_columns.rows() == expected_rows.size());
+    REQUIRE(all_columns.columns() == 3);
+    const Matrix some_columns = dat_file.get_rows_in_time_range(
+        start_time, end_time, std::vector<size_t>{2, 0});
+    REQUIRE(some_columns.rows() == expected_rows.size());
+    REQUIRE(some_columns.columns() == 2);
+    for (size_t i = 0; i < expected_rows.size(); ++i) {
+      const double time = times[expected_rows[i]];
+      CHECK(all_columns(i, 0) == time);
+      CHECK(all_columns(i, 1) == 2.0 * time);
+      CHECK(some_columns(i, 0) == -time);
+      CHECK(some_columns(i, 1) == time);
+    }
+  };
+  check_time_range(0.0, 10.0);
+  check_time_range(-1.0, 0.0);
+  check_time_range(2.005, 3.0);
+  check_time_range(5.0, 5.5);
+  check_time_range(4.995, 5.005);
+  check_time_range(9.99, 20.0);
+  check_time_range(10.0, 20.0);
+  check_time_range(-2.0, -1.0);
+  check_time_range(3.0, 2.0);
+  h5_file.close_current_object();
+  if (file_system::check_if_file_exists(h5_file_name)) {
+    file_system::rm(h5_file_name, true);
+  }
+}
 }  // namespace
 
 // [[TimeOut, 10]]
@@ -406,4 +557,6 @@ SPECTRE_TEST_CASE("Unit.IO.H5.Dat", "[Unit][IO][H5]") {
   test_errors();
   test_core_functionality();
   test_dat_read();
+  test_buffered_dat_writer();
+  test_rows_in_time_range();
 }
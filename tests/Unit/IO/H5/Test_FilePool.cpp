@@ -0,0 +1,121 @@
+// Distributed under the MIT License.
+// See LICENSE.txt for details.
+
+#include "Framework/TestingFramework.hpp"
+
+#include <chrono>
+#include <filesystem>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "IO/H5/AccessType.hpp"
+#include "IO/H5/Dat.hpp"
+#include "IO/H5/File.hpp"
+#include "IO/H5/FilePool.hpp"
+#include "IO/H5/Header.hpp"
+#include "Utilities/FileSystem.hpp"
+
+namespace {
+void write_dat_file(const std::string& file_name, const size_t num_rows) {
+  if (file_system::check_if_file_exists(file_name)) {
+    file_system::rm(file_name, true);
+  }
+  h5::H5File<h5::AccessType::ReadWrite> h5_file(file_name);
+  auto& dat_file = h5_file.insert<h5::Dat>(
+      "/Dat", std::vector<std::string>{"Time", "Value"});
+  for (size_t i = 0; i < num_rows; ++i) {
+    dat_file.append(
+        std::vector<double>{static_cast<double>(i), static_cast<double>(i)});
+  }
+}
+
+void test_file_pool() {
+  const std::string file_name_a{"Unit.IO.H5.FilePool.A.h5"};
+  const std::string file_name_b{"Unit.IO.H5.FilePool.B.h5"};
+  write_dat_file(file_name_a, 2);
+  write_dat_file(file_name_b, 3);
+  h5::clear_file_pool();
+  CHECK(h5::file_pool_size() == 32);
+
+  {
+    INFO("Files and subfiles are reused");
+    const auto file = h5::pooled_file<h5::AccessType::ReadOnly>(file_name_a);
+    CHECK(h5::pooled_file<h5::AccessType::ReadOnly>(file_name_a) == file);
+    CHECK(h5::pooled_file<h5::AccessType::ReadOnly>("./" + file_name_a) ==
+          file);
+    const auto& dat_file = file->get_or_reuse<h5::Dat>("/Dat");
+    CHECK(dat_file.get_dimensions()[0] == 2);
+    CHECK(&file->get_or_reuse<h5::Dat>("Dat") == &dat_file);
+    CHECK(&file->get_or_reuse<h5::Dat>("/Dat.dat") == &dat_file);
+    // Opening a different subfile closes the current one
+    CHECK(file->get_or_reuse<h5::Header>("/header").subfile_path() ==
+          "/header");
+    CHECK(file->get_or_reuse<h5::Dat>("/Dat").get_dimensions()[0] == 2);
+  }
+  {
+    INFO("Least recently used files are closed");
+    std::weak_ptr file_a =
+        h5::pooled_file<h5::AccessType::ReadOnly>(file_name_a);
+    CHECK_FALSE(file_a.expired());
+    h5::set_file_pool_size(1);
+    CHECK_FALSE(file_a.expired());
+    const auto file_b = h5::pooled_file<h5::AccessType::ReadOnly>(file_name_b);
+    CHECK(file_a.expired());
+    CHECK(file_b->get_or_reuse<h5::Dat>("/Dat").get_dimensions()[0] == 3);
+    h5::set_file_pool_size(0);
+    CHECK(h5::pooled_file<h5::AccessType::ReadOnly>(file_name_b) != file_b);
+    h5::set_file_pool_size(32);
+  }
+  {
+    INFO("Files are reopened when they change");
+    std::weak_ptr file = h5::pooled_file<h5::AccessType::ReadOnly>(file_name_a);
+    std::filesystem::last_write_time(
+        file_name_a, std::filesystem::last_write_time(file_name_a) +
+                         std::chrono::seconds(1));
+    std::weak_ptr reopened_file =
+        h5::pooled_file<h5::AccessType::ReadOnly>(file_name_a);
+    CHECK(file.expired());
+    CHECK_FALSE(reopened_file.expired());
+    // Writing to the file releases the pooled read-only handle
+    {
+      h5::H5File<h5::AccessType::ReadWrite> h5_file(file_name_a, true);
+      h5_file.get<h5::Dat>("/Dat").append(std::vector<double>{2., 2.});
+    }
+    CHECK(reopened_file.expired());
+    CHECK(h5::pooled_file<h5::AccessType::ReadOnly>(file_name_a)
+              ->get_or_reuse<h5::Dat>("/Dat")
+              .get_dimensions()[0] == 3);
+  }
+  {
+    INFO("Read-write files");
+    const auto file = h5::pooled_file<h5::AccessType::ReadWrite>(file_name_a);
+    CHECK(h5::pooled_file<h5::AccessType::ReadWrite>(file_name_a) == file);
+    file->get<h5::Dat>("/Dat").append(std::vector<double>{3., 3.});
+    file->close_current_object();
+    h5::release_pooled_file(file_name_a);
+    CHECK(h5::pooled_file<h5::AccessType::ReadWrite>(file_name_a) != file);
+  }
+  {
+    INFO("Forgetting the pool doesn't close the files");
+    const auto file = h5::pooled_file<h5::AccessType::ReadOnly>(file_name_b);
+    const auto& dat_file = file->get_or_reuse<h5::Dat>("/Dat");
+    h5::set_file_pool_size(2);
+    h5::forget_file_pool();
+    CHECK(h5::file_pool_size() == 2);
+    CHECK(h5::pooled_file<h5::AccessType::ReadOnly>(file_name_b) != file);
+    CHECK(&file->get_or_reuse<h5::Dat>("/Dat") == &dat_file);
+    CHECK(dat_file.get_dimensions()[0] == 3);
+    h5::set_file_pool_size(32);
+  }
+
+  h5::clear_file_pool();
+  for (const auto& file_name : {file_name_a, file_name_b}) {
+    if (file_system::check_if_file_exists(file_name)) {
+      file_system::rm(file_name, true);
+    }
+  }
+}
+}  // namespace
+
+SPECTRE_TEST_CASE("Unit.IO.H5.FilePool", "[Unit][IO][H5]") { test_file_pool(); }
@@ -81,6 +81,44 @@ class TestIOH5File(unittest.TestCase):
             outdata_array = np.asarray(datfile.get_data())
             npt.assert_array_equal(outdata_array[0], self.data_1_array)
 
+    # Test whether data can be added to the dat file in blocks
+    def test_buffered_append_dat(self):
+        with spectre_h5.H5File(file_name=self.file_name, mode="a") as h5file:
+            datfile = h5file.insert_dat(
+                path="/element_data", legend=["Time", "Value"], version=0
+            )
+            with spectre_h5.BufferedDatWriter(
+                datfile, max_buffered_rows=3
+            ) as writer:
+                writer.append(self.data_1)
+                writer.append(self.data_2)
+                self.assertEqual(writer.number_of_buffered_rows, 2)
+                self.assertEqual(datfile.get_dimensions(), [0, 2])
+                writer.append([self.data_1, self.data_2])
+                self.assertEqual(writer.number_of_buffered_rows, 1)
+                self.assertEqual(datfile.get_dimensions(), [3, 2])
+            self.assertEqual(writer.number_of_buffered_rows, 0)
+            npt.assert_array_equal(
+                np.asarray(datfile.get_data()),
+                [self.data_1, self.data_2, self.data_1, self.data_2],
+            )
+            with self.assertRaisesRegex(
+                RuntimeError, "Cannot add columns to Dat files"
+            ):
+                writer.append([1.0, 2.0, 3.0])
+            # Closing the subfile flushes the writer and detaches it
+            writer = spectre_h5.BufferedDatWriter(datfile)
+            writer.append(self.data_1)
+            h5file.close_current_object()
+            self.assertFalse(writer.is_open)
+            self.assertEqual(writer.number_of_buffered_rows, 0)
+            with self.assertRaisesRegex(
+                RuntimeError, "its Dat subfile was closed"
+            ):
+                writer.append(self.data_1)
+            datfile = h5file.get_dat("/element_data")
+            self.assertEqual(datfile.get_dimensions(), [5, 2])
+
     # Test whether data can be added to the cce file correctly
     def test_append_cce(self):
         with spectre_h5.H5File(file_name=self.file_name, mode="a") as h5file:
@@ -378,6 +416,30 @@ class TestIOH5File(unittest.TestCase):
         h5file2.close()
         h5file3.close()
 
+    def test_file_pool(self):
+        max_size = spectre_h5.file_pool_size()
+        spectre_h5.set_file_pool_size(1)
+        self.assertEqual(spectre_h5.file_pool_size(), 1)
+        spectre_h5.release_pooled_h5file(self.file_name)
+        spectre_h5.clear_file_pool()
+        # Forgetting the pool keeps its size
+        spectre_h5.forget_file_pool()
+        self.assertEqual(spectre_h5.file_pool_size(), 1)
+        spectre_h5.set_file_pool_size(max_size)
+        # Files in child processes are independent of the parent
+        with spectre_h5.H5File(file_name=self.file_name, mode="a") as h5file:
+            h5file.insert_dat(
+                path="/element_data", legend=["Time", "Value"], version=0
+            )
+        pid = os.fork()
+        if pid == 0:
+            with spectre_h5.H5File(self.file_name, "r") as h5file:
+                os._exit(0 if h5file.all_dat_files() else 1)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        with spectre_h5.H5File(file_name=self.file_name, mode="r") as h5file:
+            self.assertEqual(h5file.all_dat_files(), ["/element_data.dat"])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -3,11 +3,14 @@
 
 #include "Framework/TestingFramework.hpp"
 
+#include <algorithm>
 #include <cstddef>
 #include <cstdint>
 #include <hdf5.h>
 #include <memory>
 #include <string>
+#include <type_traits>
+#include <utility>
 #include <vector>
 
 #include "DataStructures/DataVector.hpp"
@@ -23,12 +26,15 @@
 #include "IO/H5/File.hpp"
 #include "IO/H5/TensorData.hpp"
 #include "IO/H5/VolumeData.hpp"
+#include "IO/H5/WriteOptions.hpp"
 #include "NumericalAlgorithms/Spectral/Basis.hpp"
 #include "NumericalAlgorithms/Spectral/Quadrature.hpp"
 #include "NumericalAlgorithms/SphericalHarmonics/Spherepack.hpp"
 #include "NumericalAlgorithms/SphericalHarmonics/Strahlkorper.hpp"
 #include "Utilities/ConstantExpressions.hpp"
 #include "Utilities/FileSystem.hpp"
+#include "Utilities/GetOutput.hpp"
+#include "Utilities/Gsl.hpp"
 #include "Utilities/Serialization/Serialize.hpp"
 
 namespace {
@@ -298,6 +304,96 @@ void test() {
     CHECK(get<DataType>(
               volume_file.get_tensor_component(observation_ids[i], "U").data) ==
           extra_tensor_component);
+    {
+      INFO("read_tensor_component");
+      const auto [size, use_float] =
+          volume_file.get_tensor_component_size_and_precision(
+              observation_ids[i], "U");
+      CHECK(size == extra_tensor_component.size());
+      CHECK(use_float == std::is_same_v<DataType, std::vector<float>>);
+      // Read into buffers of both precisions
+      std::vector<float> float_buffer(size);
+      std::vector<double> double_buffer(size);
+      gsl::span<float> float_span{float_buffer.data(), size};
+      gsl::span<double> double_span{double_buffer.data(), size};
+      volume_file.read_tensor_component(make_not_null(&float_span),
+                                        observation_ids[i], "U");
+      volume_file.read_tensor_component(make_not_null(&double_span),
+                                        observation_ids[i], "U");
+      CHECK(float_buffer == std::vector<float>(extra_tensor_component.begin(),
+                                               extra_tensor_component.end()));
+      CHECK(double_buffer == std::vector<double>(extra_tensor_component.begin(),
+                                                 extra_tensor_component.end()));
+      gsl::span<double> too_small_span{double_buffer.data(), size - 1};
+      CHECK_THROWS_WITH(
+          volume_file.read_tensor_component(make_not_null(&too_small_span),
+                                            observation_ids[i], "U"),
+          Catch::Matchers::ContainsSubstring("The buffer has size"));
+    }
+    {
+      INFO("read_tensor_components");
+      const std::vector<std::string> components{"S", "U", "T_x"};
+      const size_t num_points = 16;
+      std::vector<double> buffer(components.size() * num_points);
+      gsl::span<double> buffer_span{buffer.data(), buffer.size()};
+      volume_file.read_tensor_components(make_not_null(&buffer_span),
+                                         observation_ids[i], components);
+      for (size_t k = 0; k < components.size(); ++k) {
+        const auto expected = get<DataType>(
+            volume_file.get_tensor_component(observation_ids[i], components[k])
+                .data);
+        for (size_t j = 0; j < num_points; ++j) {
+          CHECK(buffer[k * num_points + j] == static_cast<double>(expected[j]));
+        }
+      }
+      gsl::span<double> invalid_span{buffer.data(), buffer.size() - 1};
+      CHECK_THROWS_WITH(
+          volume_file.read_tensor_components(make_not_null(&invalid_span),
+                                             observation_ids[i], components),
+          Catch::Matchers::ContainsSubstring("not a multiple"));
+    }
+    {
+      INFO("Read selected ranges");
+      const auto all_data = get<DataType>(
+          volume_file.get_tensor_component(observation_ids[i], "U").data);
+      // Adjacent ranges are merged, and empty ranges are skipped
+      const std::vector<std::pair<size_t, size_t>> offsets_and_lengths{
+          {1, 2}, {3, 1}, {6, 0}, {8, 8}};
+      const auto selected_data =
+          get<DataType>(volume_file
+                            .get_tensor_component(observation_ids[i], "U",
+                                                  offsets_and_lengths)
+                            .data);
+      DataType expected_data(11);
+      std::copy(all_data.begin() + 1, all_data.begin() + 4,
+                expected_data.begin());
+      std::copy(all_data.begin() + 8, all_data.end(),
+                expected_data.begin() + 3);
+      CHECK(selected_data == expected_data);
+      // Read the last grid only into a buffer for each component
+      std::vector<double> buffer(2 * 8);
+      gsl::span<double> buffer_span{buffer.data(), buffer.size()};
+      volume_file.read_tensor_components(
+          make_not_null(&buffer_span), observation_ids[i], {"S", "T_x"},
+          std::vector<std::pair<size_t, size_t>>{{8, 8}});
+      const auto all_s = get<DataType>(
+          volume_file.get_tensor_component(observation_ids[i], "S").data);
+      const auto all_t_x = get<DataType>(
+          volume_file.get_tensor_component(observation_ids[i], "T_x").data);
+      for (size_t j = 0; j < 8; ++j) {
+        CHECK(buffer[j] == static_cast<double>(all_s[8 + j]));
+        CHECK(buffer[8 + j] == static_cast<double>(all_t_x[8 + j]));
+      }
+      CHECK_THROWS_WITH(
+          volume_file.get_tensor_component(
+              observation_ids[i], "U",
+              std::vector<std::pair<size_t, size_t>>{{8, 8}, {0, 8}}),
+          Catch::Matchers::ContainsSubstring("must be sorted"));
+      CHECK_THROWS_WITH(volume_file.get_tensor_component(
+                            observation_ids[i], "U",
+                            std::vector<std::pair<size_t, size_t>>{{10, 8}}),
+                        Catch::Matchers::ContainsSubstring("must lie within"));
+    }
   }
 
   {
@@ -315,6 +411,14 @@ void test() {
         grid_names.back(), all_grid_names, all_extents);
     CHECK(last_grid_offset_and_length.first == 8);
     CHECK(last_grid_offset_and_length.second == 8);
+    const std::vector<std::pair<size_t, size_t>> expected_offsets_and_lengths{
+        first_grid_offset_and_length, last_grid_offset_and_length};
+    CHECK(h5::offsets_and_lengths_for_grids(all_extents) ==
+          expected_offsets_and_lengths);
+    CHECK(volume_file.get_offsets_and_lengths(observation_id) ==
+          expected_offsets_and_lengths);
+    CHECK(h5::offsets_and_lengths_for_grids({{2, 3}, {4, 1}, {5, 5}}) ==
+          std::vector<std::pair<size_t, size_t>>{{0, 6}, {6, 4}, {10, 25}});
   }
 
   {
@@ -553,6 +657,181 @@ void test_extend_connectivity_data() {
     file_system::rm(h5_file_name, true);
   }
 }
+
+void test_write_options() {
+  const std::string h5_file_name("Unit.IO.H5.VolumeData.WriteOptions.h5");
+  if (file_system::check_if_file_exists(h5_file_name)) {
+    file_system::rm(h5_file_name, true);
+  }
+  const h5::WriteOptions default_options{};
+  CHECK(default_options.compression_level == 5);
+  CHECK(default_options.shuffle);
+  CHECK(default_options.chunk_size == 131'072);
+  CHECK(default_options.float_tensor_components.empty());
+  const auto uncompressed_options = h5::WriteOptions::uncompressed();
+  CHECK(uncompressed_options.compression_level == 0);
+  CHECK(uncompressed_options.chunk_size == 0);
+  CHECK(uncompressed_options != default_options);
+  CHECK(get_output(uncompressed_options) ==
+        "(compression_level=0, shuffle=true, chunk_size=0, "
+        "float_tensor_components=())");
+
+  const DataVector psi{1.0, 2.0, 3.0, 4.0};
+  const DataVector phi{-1.0, 0.5, 1.0 / 3.0, 4.0};
+  const std::vector<ElementVolumeData> element_data{
+      {"[B0,(L0I0)]",
+       {TensorComponent{"Psi", psi}, TensorComponent{"Phi", phi}},
+       {4},
+       {Spectral::Basis::Legendre},
+       {Spectral::Quadrature::GaussLobatto}}};
+  h5::H5File<h5::AccessType::ReadWrite> h5_file{h5_file_name};
+  auto& volume_file = h5_file.insert<h5::VolumeData>("/element_data", 0);
+  CHECK(volume_file.get_write_options() == default_options);
+  // Chunked and compressed by default
+  volume_file.write_volume_data(0, 0.0, element_data);
+  CHECK_FALSE(volume_file.get_tensor_component_file_location(0, "Psi"));
+  // Individual tensor components in double precision are contiguous and
+  // uncompressed by default
+  volume_file.write_tensor_component(0, "Chi", psi);
+  CHECK(volume_file.get_tensor_component_file_location(0, "Chi").has_value());
+  // Contiguous and uncompressed, with one component downcast to float
+  h5::WriteOptions options = h5::WriteOptions::uncompressed();
+  options.float_tensor_components = {"Phi", "Chi"};
+  CHECK(options.is_float_tensor_component("Phi"));
+  CHECK_FALSE(options.is_float_tensor_component("Psi"));
+  volume_file.set_write_options(options);
+  CHECK(volume_file.get_write_options() == options);
+  volume_file.write_volume_data(1, 1.0, element_data);
+  CHECK(volume_file.get_tensor_component_file_location(1, "Psi").has_value());
+  CHECK(volume_file.get_tensor_component_size_and_precision(1, "Psi") ==
+        std::pair<size_t, bool>{4, false});
+  CHECK(volume_file.get_tensor_component_size_and_precision(1, "Phi") ==
+        std::pair<size_t, bool>{4, true});
+  CHECK(get<DataVector>(volume_file.get_tensor_component(1, "Psi").data) ==
+        psi);
+  const auto phi_as_float =
+      get<std::vector<float>>(volume_file.get_tensor_component(1, "Phi").data);
+  for (size_t i = 0; i < phi.size(); ++i) {
+    CHECK(phi_as_float[i] == static_cast<float>(phi[i]));
+  }
+  // Writing individual tensor components also uses the options
+  volume_file.write_tensor_component(1, "Chi", psi);
+  CHECK(volume_file.get_tensor_component_size_and_precision(1, "Chi") ==
+        std::pair<size_t, bool>{4, true});
+  CHECK(volume_file.get_tensor_component_file_location(1, "Chi").has_value());
+  // Chunked but uncompressed
+  options = h5::WriteOptions{};
+  options.compression_level = 0;
+  options.chunk_size = 16;
+  volume_file.set_write_options(options);
+  volume_file.write_tensor_component(1, "Psi", psi, true);
+  CHECK_FALSE(volume_file.get_tensor_component_file_location(1, "Psi"));
+  CHECK(get<DataVector>(volume_file.get_tensor_component(1, "Psi").data) ==
+        psi);
+  // Empty data can be written with any options
+  volume_file.write_tensor_component(1, "Empty", DataVector{});
+  CHECK(volume_file.get_tensor_component_size_and_precision(1, "Empty") ==
+        std::pair<size_t, bool>{0, false});
+
+  CHECK_THROWS_WITH(
+      [&volume_file]() {
+        h5::WriteOptions invalid_options{};
+        invalid_options.compression_level = 10;
+        volume_file.set_write_options(invalid_options);
+      }(),
+      Catch::Matchers::ContainsSubstring(
+          "The compression level must be between 0 and 9"));
+  CHECK_THROWS_WITH(
+      [&volume_file]() {
+        h5::WriteOptions invalid_options{};
+        invalid_options.chunk_size = 0;
+        volume_file.set_write_options(invalid_options);
+      }(),
+      Catch::Matchers::ContainsSubstring(
+          "Contiguous datasets (chunk size 0) can't be compressed"));
+  CHECK(volume_file.get_write_options() == options);
+
+  h5_file.close_current_object();
+  if (file_system::check_if_file_exists(h5_file_name)) {
+    file_system::rm(h5_file_name, true);
+  }
+}
+
+void test_observation_index() {
+  const std::string h5_file_name("Unit.IO.H5.VolumeData.ObservationIndex.h5");
+  if (file_system::check_if_file_exists(h5_file_name)) {
+    file_system::rm(h5_file_name, true);
+  }
+  const DataVector psi{1.0, 2.0, 3.0, 4.0};
+  const std::vector<ElementVolumeData> two_elements{
+      {"[B0,(L1I0)]",
+       {TensorComponent{"Psi", DataVector{1.0, 2.0}}},
+       {2},
+       {Spectral::Basis::Legendre},
+       {Spectral::Quadrature::GaussLobatto}},
+      {"[B0,(L1I1)]",
+       {TensorComponent{"Psi", DataVector{3.0, 4.0}}},
+       {2},
+       {Spectral::Basis::Legendre},
+       {Spectral::Quadrature::GaussLobatto}}};
+  const std::vector<ElementVolumeData> one_element{
+      {"[B0,(L0I0)]",
+       {TensorComponent{"Psi", psi}},
+       {4},
+       {Spectral::Basis::Chebyshev},
+       {Spectral::Quadrature::Gauss}}};
+  // Observations with the same elements share their element metadata in the
+  // index. The metadata is read correctly also when the elements change and
+  // change back.
+  const std::vector<std::pair<size_t, const std::vector<ElementVolumeData>*>>
+      observations{{3, &two_elements},
+                   {1, &two_elements},
+                   {2, &one_element},
+                   {0, &two_elements}};
+  const auto check_observations =
+      [&observations](const h5::VolumeData& volume_file) {
+        CHECK(volume_file.list_observation_ids() ==
+              std::vector<size_t>{0, 1, 2, 3});
+        for (const auto& [observation_id, elements] : observations) {
+          CAPTURE(observation_id);
+          CHECK(volume_file.get_observation_value(observation_id) ==
+                static_cast<double>(observation_id));
+          const auto grid_names = volume_file.get_grid_names(observation_id);
+          const auto extents = volume_file.get_extents(observation_id);
+          const auto bases = volume_file.get_bases(observation_id);
+          const auto quadratures = volume_file.get_quadratures(observation_id);
+          REQUIRE(grid_names.size() == elements->size());
+          for (size_t i = 0; i < elements->size(); ++i) {
+            CHECK(grid_names[i] == (*elements)[i].element_name);
+            CHECK(extents[i] == (*elements)[i].extents);
+            CHECK(bases[i] == (*elements)[i].basis);
+            CHECK(quadratures[i] == (*elements)[i].quadrature);
+          }
+          CHECK(volume_file.list_tensor_components(observation_id) ==
+                std::vector<std::string>{"Psi"});
+        }
+      };
+  {
+    h5::H5File<h5::AccessType::ReadWrite> h5_file{h5_file_name};
+    auto& volume_file = h5_file.insert<h5::VolumeData>("/element_data", 0);
+    for (const auto& [observation_id, elements] : observations) {
+      volume_file.write_volume_data(
+          observation_id, static_cast<double>(observation_id), *elements);
+    }
+    check_observations(volume_file);
+    // The index group is not listed as a volume data subfile
+    CHECK(h5_file.all_files<h5::VolumeData>("/") ==
+          std::vector<std::string>{"/element_data.vol"});
+  }
+  {
+    // Reopening the file reads the index from disk
+    const h5::H5File<h5::AccessType::ReadOnly> h5_file{h5_file_name};
+    check_observations(h5_file.get<h5::VolumeData>("/element_data"));
+  }
+  if (file_system::check_if_file_exists(h5_file_name)) {
+    file_system::rm(h5_file_name, true);
+  }
+}
 }  // namespace
 
 // [[TimeOut, 20]]
@@ -563,6 +842,8 @@ SPECTRE_TEST_CASE("Unit.IO.H5.VolumeData", "[Unit][IO][H5]") {
   test_extend_connectivity_data<1>();
   test_extend_connectivity_data<2>();
   test_extend_connectivity_data<3>();
+  test_write_options();
+  test_observation_index();
 
 #ifdef SPECTRE_DEBUG
   CHECK_THROWS_WITH(
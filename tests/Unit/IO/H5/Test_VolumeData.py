@@ -4,6 +4,7 @@
 import os
 import unittest
 
+import h5py
 import numpy as np
 import numpy.testing as npt
 
@@ -142,6 +143,55 @@ class TestVolumeData(unittest.TestCase):
                 expected_obs_values[obs_id],
             )
 
+    # Test that the observation index is written and that files without an
+    # up-to-date index can still be read and get a new index
+    def test_observation_index(self):
+        self.h5_file.close()
+        self.assertEqual(spectre_h5.H5Vol.index_extension(), ".idx")
+        with h5py.File(self.file_name, "r") as open_h5_file:
+            index_group = open_h5_file["element_data.idx"]
+            npt.assert_equal(index_group["observation_ids"][()], [0, 1])
+            npt.assert_equal(index_group["observation_values"][()], [7.0, 1.3])
+            # Both observations have the same elements, so they share their
+            # element metadata
+            npt.assert_equal(index_group["metadata_sets"][()], [0, 0])
+            npt.assert_equal(
+                index_group["metadata_set_ends"][()],
+                [len(index_group["grid_names"]), 6, 6, 6],
+            )
+            self.assertIsNone(index_group["observation_ids"].maxshape[0])
+        with h5py.File(self.file_name, "a") as open_h5_file:
+            del open_h5_file["element_data.idx"]
+        self.h5_file = spectre_h5.H5File(file_name=self.file_name, mode="a")
+        vol_file = self.h5_file.get_vol(path="/element_data")
+        self.assertEqual(vol_file.list_observation_ids(), [1, 0])
+        self.assertEqual(vol_file.get_observation_value(0), 7.0)
+        self.assertEqual(
+            vol_file.get_grid_names(0),
+            ["[B0(L0I0,L0I0,L1I0)]", "[B0(L0I0,L0I0,L1I1)]"],
+        )
+        # Writing another observation rewrites the index
+        vol_file.write_volume_data(2, 9.0, [self.element_vol_data_grid_1[0]])
+        self.h5_file.close()
+        with h5py.File(self.file_name, "r") as open_h5_file:
+            index_group = open_h5_file["element_data.idx"]
+            npt.assert_equal(index_group["observation_ids"][()], [1, 0, 2])
+            npt.assert_equal(
+                index_group["observation_values"][()], [1.3, 7.0, 9.0]
+            )
+            npt.assert_equal(index_group["metadata_sets"][()], [-1, -1, 0])
+        self.h5_file = spectre_h5.H5File(file_name=self.file_name, mode="r")
+        vol_file = self.h5_file.get_vol(path="/element_data")
+        self.assertEqual(vol_file.list_observation_ids(), [1, 0, 2])
+        self.assertEqual(
+            vol_file.get_grid_names(1),
+            ["[B0(L0I0,L0I0,L1I0)]", "[B0(L0I0,L0I0,L1I1)]"],
+        )
+        self.assertEqual(vol_file.get_grid_names(2), ["[B0(L0I0,L0I0,L1I0)]"])
+        self.assertEqual(vol_file.get_extents(2), [[2, 2, 2]])
+        self.assertEqual(vol_file.get_bases(2), [3 * [Basis.Legendre]])
+        self.assertEqual(vol_file.get_quadratures(2), [3 * [Quadrature.Gauss]])
+
     # Test to make sure information about the computation elements was found
     def test_grids(self):
         obs_id = self.vol_file.list_observation_ids()[0]
@@ -190,6 +240,136 @@ class TestVolumeData(unittest.TestCase):
                 expected_tensor_component_data,
             )
 
+    def test_get_tensor_component_array(self):
+        obs_id = 0
+        expected_field_1 = np.concatenate(self.tensor_component_data[:2])
+        # Allocate a new array with the stored precision
+        field_1 = self.vol_file.get_tensor_component_array(
+            observation_id=obs_id, tensor_component="field_1"
+        )
+        self.assertIsInstance(field_1, np.ndarray)
+        self.assertEqual(field_1.dtype, np.float64)
+        npt.assert_equal(field_1, expected_field_1)
+        # Read into caller-supplied buffers in place
+        all_fields = np.zeros((2, 16))
+        for component_name, out in zip(["field_1", "field_2"], all_fields):
+            result = self.vol_file.get_tensor_component_array(
+                obs_id, component_name, out=out
+            )
+            self.assertIs(result, out)
+        npt.assert_equal(all_fields[0], expected_field_1)
+        npt.assert_equal(
+            all_fields[1],
+            np.concatenate(self.tensor_component_data[1::-1]),
+        )
+        # Convert to single precision while reading
+        field_1_float = np.zeros(16, dtype=np.float32)
+        self.vol_file.get_tensor_component_array(
+            obs_id, "field_1", out=field_1_float
+        )
+        npt.assert_allclose(field_1_float, expected_field_1, rtol=1e-6)
+        # Invalid buffers
+        with self.assertRaises(ValueError):
+            self.vol_file.get_tensor_component_array(
+                obs_id, "field_1", out=np.zeros(16, dtype=np.int32)
+            )
+        with self.assertRaises(ValueError):
+            self.vol_file.get_tensor_component_array(
+                obs_id, "field_1", out=np.zeros((16, 2))[:, 0]
+            )
+
+    def test_get_tensor_components(self):
+        obs_id = 0
+        tensor_data = self.vol_file.get_tensor_components(
+            obs_id, ["field_2", "field_1"]
+        )
+        self.assertEqual(tensor_data.shape, (2, 16))
+        self.assertEqual(tensor_data.dtype, np.float64)
+        npt.assert_equal(
+            tensor_data[0], np.concatenate(self.tensor_component_data[1::-1])
+        )
+        npt.assert_equal(
+            tensor_data[1], np.concatenate(self.tensor_component_data[:2])
+        )
+        tensor_data_float = self.vol_file.get_tensor_components(
+            obs_id, ["field_2", "field_1"], dtype=np.float32
+        )
+        self.assertEqual(tensor_data_float.dtype, np.float32)
+        npt.assert_allclose(tensor_data_float, tensor_data, rtol=1e-6)
+        self.assertEqual(
+            self.vol_file.get_tensor_components(obs_id, []).shape, (0, 16)
+        )
+        with self.assertRaises(ValueError):
+            self.vol_file.get_tensor_components(
+                obs_id, ["field_1"], dtype=np.int32
+            )
+
+    def test_read_selected_grids(self):
+        obs_id = 0
+        offsets_and_lengths = self.vol_file.get_offsets_and_lengths(obs_id)
+        selected_offsets_and_lengths = offsets_and_lengths[1:]
+        npt.assert_equal(
+            self.vol_file.get_tensor_components(
+                obs_id,
+                ["field_1", "field_2"],
+                offsets_and_lengths=selected_offsets_and_lengths,
+            ),
+            self.tensor_component_data[1::-1],
+        )
+        npt.assert_equal(
+            self.vol_file.get_tensor_component_array(
+                obs_id,
+                "field_1",
+                offsets_and_lengths=selected_offsets_and_lengths,
+            ),
+            self.tensor_component_data[1],
+        )
+        npt.assert_equal(
+            np.asarray(
+                self.vol_file.get_tensor_component(
+                    obs_id,
+                    "field_2",
+                    offsets_and_lengths=selected_offsets_and_lengths,
+                ).data
+            ),
+            self.tensor_component_data[0],
+        )
+
+    def test_write_options(self):
+        self.assertEqual(
+            self.vol_file.get_write_options(), spectre_h5.WriteOptions()
+        )
+        self.assertIsNone(
+            self.vol_file.get_tensor_component_file_location(0, "field_1")
+        )
+        write_options = spectre_h5.WriteOptions(
+            compression_level=0,
+            chunk_size=0,
+            float_tensor_components=["field_3"],
+        )
+        self.assertEqual(write_options, spectre_h5.WriteOptions.uncompressed())
+        self.vol_file.set_write_options(write_options)
+        self.assertEqual(self.vol_file.get_write_options(), write_options)
+        self.vol_file.write_tensor_component(
+            0, "field_3", DataVector(self.tensor_component_data[0:2].flatten())
+        )
+        self.assertEqual(
+            self.vol_file.get_tensor_component_size_and_precision(0, "field_3"),
+            (16, True),
+        )
+        self.assertIsNotNone(
+            self.vol_file.get_tensor_component_file_location(0, "field_3")
+        )
+        npt.assert_allclose(
+            self.vol_file.get_tensor_component_array(0, "field_3"),
+            self.tensor_component_data[0:2].flatten(),
+            rtol=1e-7,
+        )
+        with self.assertRaisesRegex(RuntimeError, "can't be compressed"):
+            spectre_h5.WriteOptions(chunk_size=0)
+        with self.assertRaisesRegex(RuntimeError, "between 0 and 9"):
+            spectre_h5.WriteOptions(compression_level=10)
+
     def test_get_data_by_element(self):
         obs_id = 0
         volume_data = self.vol_file.get_data_by_element(None, None, None)
@@ -290,6 +470,13 @@ class TestVolumeData(unittest.TestCase):
             ),
             (0, 8),
         )
+        self.assertEqual(
+            spectre_h5.offsets_and_lengths_for_grids(all_extents),
+            [(0, 8), (8, 8)],
+        )
+        self.assertEqual(
+            self.vol_file.get_offsets_and_lengths(obs_id), [(0, 8), (8, 8)]
+        )
 
     # Tests that ExtendConnectivity generates the connectivity dataset
     # length correctly
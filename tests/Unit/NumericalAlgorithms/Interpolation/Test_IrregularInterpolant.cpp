@@ -3,13 +3,16 @@
 
 #include "Framework/TestingFramework.hpp"
 
+#include <algorithm>
 #include <array>
 #include <cstddef>
+#include <limits>
 #include <memory>
 #include <optional>
 #include <pup.h>
 #include <random>
 #include <string>
+#include <vector>
 
 #include "DataStructures/DataBox/Tag.hpp"
 #include "DataStructures/DataVector.hpp"
@@ -204,6 +207,65 @@ void test_interpolate_to_points(const Mesh<Dim>& mesh) {
         get<0>(get<TestTags::Vector<Dim>>(src_vars)));
     CHECK_ITERABLE_APPROX(
         result_dv, get<0>(get<TestTags::Vector<Dim>>(expected_dest_vars)));
+
+    // Interpolate single-precision data
+    std::vector<float> src_vars_float(src_vars.size());
+    std::transform(src_vars.data(), src_vars.data() + src_vars.size(),
+                   src_vars_float.begin(), [](const double value) {
+                     return static_cast<float>(value);
+                   });
+    DataVector result_float_input(expected_dest_vars.size());
+    gsl::span<double> result_float_input_view{result_float_input.data(),
+                                              result_float_input.size()};
+    irregular_interpolant.interpolate(
+        make_not_null(&result_float_input_view),
+        gsl::span<const float>{src_vars_float.data(), src_vars_float.size()});
+    Approx float_approx =
+        Approx::custom()
+            .epsilon(100. * std::numeric_limits<float>::epsilon())
+            .scale(1.0);
+    CHECK_ITERABLE_CUSTOM_APPROX(
+        result_float_input,
+        DataVector(expected_dest_vars.data(), expected_dest_vars.size()),
+        float_approx);
+
+    // Interpolate components that are not contiguous, as if they were stored
+    // in a buffer with the data of other elements in between
+    const size_t num_source_points = src_vars.number_of_grid_points();
+    const size_t num_components = src_vars.number_of_independent_components;
+    const size_t stride = num_source_points + 3;
+    std::vector<double> strided_src_vars(num_components * stride,
+                                         std::numeric_limits<double>::max());
+    std::vector<float> strided_src_vars_float(
+        num_components * stride, std::numeric_limits<float>::max());
+    for (size_t c = 0; c < num_components; ++c) {
+      for (size_t k = 0; k < num_source_points; ++k) {
+        strided_src_vars[c * stride + k] =
+            src_vars.data()[c * num_source_points + k];
+        strided_src_vars_float[c * stride + k] =
+            src_vars_float[c * num_source_points + k];
+      }
+    }
+    DataVector result_strided(expected_dest_vars.size());
+    gsl::span<double> result_strided_view{result_strided.data(),
+                                          result_strided.size()};
+    irregular_interpolant.interpolate(
+        make_not_null(&result_strided_view),
+        gsl::span<const double>{strided_src_vars.data(),
+                                strided_src_vars.size()},
+        num_components, stride);
+    CHECK_ITERABLE_APPROX(
+        result_strided,
+        DataVector(expected_dest_vars.data(), expected_dest_vars.size()));
+    irregular_interpolant.interpolate(
+        make_not_null(&result_strided_view),
+        gsl::span<const float>{strided_src_vars_float.data(),
+                               strided_src_vars_float.size()},
+        num_components, stride);
+    CHECK_ITERABLE_CUSTOM_APPROX(
+        result_strided,
+        DataVector(expected_dest_vars.data(), expected_dest_vars.size()),
+        float_approx);
   }
 }
 
@@ -65,6 +65,38 @@ class TestPlotEllipticConvergence(unittest.TestCase):
         # gets written out.
         self.assertTrue(os.path.exists(output_filename))
 
+    def test_without_walltime(self):
+        h5_filename = os.path.join(self.test_dir, "ResidualsNoWalltime.h5")
+        with spectre_h5.H5File(h5_filename, "w") as h5_file:
+            linear_residuals = h5_file.insert_dat(
+                "/GmresResiduals",
+                legend=["Iteration", "Residual"],
+                version=0,
+            )
+            linear_residuals.append([0, 1.0])
+            linear_residuals.append([1, 0.5])
+            h5_file.close_current_object()
+            nonlinear_residuals = h5_file.insert_dat(
+                "/NewtonRaphsonResiduals",
+                legend=["Iteration", "Residual"],
+                version=0,
+            )
+            nonlinear_residuals.append([0, 1.0])
+            nonlinear_residuals.append([1, 0.5])
+        output_filename = os.path.join(self.test_dir, "output_no_walltime.pdf")
+        runner = CliRunner()
+        result = runner.invoke(
+            plot_elliptic_convergence_command,
+            [
+                h5_filename,
+                "-o",
+                output_filename,
+            ],
+            catch_exceptions=False,
+        )
+        self.assertEqual(result.exit_code, 0)
+        self.assertTrue(os.path.exists(output_filename))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
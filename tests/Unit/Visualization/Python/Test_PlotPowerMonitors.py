@@ -80,7 +80,7 @@ class TestPlotPowerMonitors(unittest.TestCase):
         self.assertTrue(os.path.exists(self.plot_filename))
         os.remove(self.plot_filename)
 
-        # Test plotting over time
+        # Test plotting over time, computing the power monitors in parallel
         result = runner.invoke(
             plot_power_monitors_command,
             [
@@ -94,6 +94,8 @@ class TestPlotPowerMonitors(unittest.TestCase):
                 "-y",
                 "Psi",
                 "--over-time",
+                "-j",
+                "2",
                 "-o",
                 self.plot_filename,
             ],
@@ -2,17 +2,21 @@
 # See LICENSE.txt for details.
 
 import os
+import shutil
 import unittest
 from pathlib import Path
 
 import h5py
 import numpy as np
+import numpy.testing as npt
 import pandas.testing as pdt
 
 import spectre.Informer as spectre_informer
 import spectre.IO.H5 as spectre_h5
 from spectre.Visualization.ReadH5 import (
+    SegmentedDat,
     available_subfiles,
+    read_cce_modes,
     select_observation,
     to_dataframe,
 )
@@ -90,6 +94,198 @@ class TestReadH5(unittest.TestCase):
             self.assertEqual(num_rows, 1)
             self.assertEqual(num_cols, df2.shape[1])
             pdt.assert_frame_equal(df2_one_row, df_one_row)
+            open_file.close_current_object()
+
+            df2_time_range = to_dataframe(
+                open_file.get_dat("/TimeSteps2"), time_range=(0.005, 1.0)
+            )
+            pdt.assert_frame_equal(df2_time_range, df_one_row)
+        # Time range from h5py subfile
+        with h5py.File(
+            os.path.join(self.data_dir, "DatTestData.h5"), "r"
+        ) as open_file:
+            subfile = open_file["TimeSteps2.dat"]
+            pdt.assert_frame_equal(
+                to_dataframe(subfile, time_range=(0.005, 1.0)), df_one_row
+            )
+            pdt.assert_frame_equal(
+                to_dataframe(subfile, time_range=(0.0, 0.01)), df
+            )
+            self.assertEqual(
+                len(to_dataframe(subfile, time_range=(1.0, 2.0))), 0
+            )
+            with self.assertRaises(ValueError):
+                to_dataframe(subfile, slice=np.s_[1:], time_range=(0.0, 1.0))
+            # Select columns
+            columns = ["Slab size", "Time", 3]
+            expected_columns = ["Slab size", "Time", "Minimum time step"]
+            df_columns = to_dataframe(subfile, columns=columns)
+            pdt.assert_frame_equal(df_columns, df[expected_columns])
+            pdt.assert_frame_equal(
+                to_dataframe(subfile, time_range=(0.005, 1.0), columns=columns),
+                df_one_row[expected_columns],
+            )
+            pdt.assert_frame_equal(
+                to_dataframe(subfile, slice=np.s_[1:], columns=columns),
+                df_one_row[expected_columns],
+            )
+            # Negative column indices and fancy row selections
+            pdt.assert_frame_equal(
+                to_dataframe(subfile, columns=["Slab size", "Time", -1]),
+                df[["Slab size", "Time", df.columns[-1]]],
+            )
+            for rows in (
+                np.array([True, False]),
+                np.array([1, 0]),
+                np.s_[::-1],
+                np.array([], dtype=int),
+            ):
+                pdt.assert_frame_equal(
+                    to_dataframe(subfile, slice=rows, columns=columns),
+                    df[expected_columns].iloc[rows].reset_index(drop=True),
+                )
+            with self.assertRaisesRegex(KeyError, "No column 'Nonexistent'"):
+                to_dataframe(subfile, columns=["Nonexistent"])
+            with self.assertRaisesRegex(IndexError, "out of range"):
+                to_dataframe(subfile, columns=[100])
+        with spectre_h5.H5File(
+            os.path.join(self.data_dir, "DatTestData.h5"), "r"
+        ) as open_file:
+            pdt.assert_frame_equal(
+                to_dataframe(open_file.get_dat("/TimeSteps2"), columns=columns),
+                df_columns,
+            )
+            open_file.close_current_object()
+            pdt.assert_frame_equal(
+                to_dataframe(
+                    open_file.get_dat("/TimeSteps2"),
+                    time_range=(0.005, 1.0),
+                    columns=columns,
+                ),
+                df_one_row[expected_columns],
+            )
+
+    def test_read_cce_modes(self):
+        test_dir = Path(
+            spectre_informer.unit_test_build_path(),
+            "Visualization/ReadH5/CceModes",
+        )
+        test_dir.mkdir(parents=True, exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        bondi_variables = [
+            "EthInertialRetardedTime",
+            "News",
+            "Psi0",
+            "Psi1",
+            "Psi2",
+            "Psi3",
+            "Psi4",
+            "Strain",
+        ]
+        # Columns are the time and the real and imaginary parts of all modes
+        # up to l_max = 2
+        data = np.random.rand(10, 19)
+        data[:, 0] = np.arange(10.0)
+        with spectre_h5.H5File(str(test_dir / "Cce.h5"), "w") as open_file:
+            cce_subfile = open_file.insert_cce(
+                path="SpectreR0100", l_max=2, version=0
+            )
+            for row in data:
+                cce_subfile.append(
+                    {bondi_variable: row for bondi_variable in bondi_variables}
+                )
+        with h5py.File(test_dir / "Cce.h5", "r") as open_file:
+            cce_subfile = open_file["SpectreR0100.cce"]
+            time, modes = read_cce_modes(
+                cce_subfile, "Strain", [(2, 2), (1, 0)]
+            )
+            npt.assert_equal(time, data[:, 0])
+            self.assertEqual(modes.shape, (10, 2))
+            npt.assert_equal(modes[:, 0], data[:, 17] + 1j * data[:, 18])
+            npt.assert_equal(modes[:, 1], data[:, 5] + 1j * data[:, 6])
+            time, modes = read_cce_modes(
+                cce_subfile, "Psi4", [(2, -2)], time_range=(2.5, 5.0)
+            )
+            npt.assert_equal(time, [3.0, 4.0, 5.0])
+            npt.assert_equal(modes[:, 0], data[3:6, 9] + 1j * data[3:6, 10])
+            with self.assertRaisesRegex(KeyError, "No Bondi variable"):
+                read_cce_modes(cce_subfile, "Psi5", [(2, 2)])
+            with self.assertRaisesRegex(KeyError, "No column 'Real Y_3,3'"):
+                read_cce_modes(cce_subfile, "Psi4", [(3, 3)])
+
+    def test_segmented_dat(self):
+        test_dir = Path(
+            spectre_informer.unit_test_build_path(),
+            "Visualization/ReadH5/SegmentedDat",
+        )
+        test_dir.mkdir(parents=True, exist_ok=True)
+        self.addCleanup(shutil.rmtree, test_dir)
+        legend = ["Time", "Value", "Other"]
+        # The second segment restarts at an earlier time than the first segment
+        # ended, and the third segment has no data
+        segment_times = [
+            np.arange(0.0, 5.0, 0.25),
+            np.arange(4.0, 10.0, 0.25),
+            np.array([]),
+            np.arange(10.0, 12.0, 0.5),
+        ]
+        segment_files = []
+        for i, times in enumerate(segment_times):
+            segment_file = test_dir / f"Segment{i}.h5"
+            with spectre_h5.H5File(str(segment_file), "a") as open_file:
+                datfile = open_file.insert_dat(
+                    "/Group/Values", legend=legend, version=0
+                )
+                if len(times) > 0:
+                    datfile.append(
+                        np.stack([times, 2.0 * times, -times], axis=1)
+                    )
+            segment_files.append(segment_file)
+        expected_times = np.concatenate(
+            [np.arange(0.0, 4.0, 0.25), segment_times[1], segment_times[3]]
+        )
+        with SegmentedDat(segment_files, "Group/Values") as segmented_dat:
+            self.assertEqual(segmented_dat.legend, legend)
+            self.assertEqual(segmented_dat.shape, (len(expected_times), 3))
+            self.assertEqual(len(segmented_dat), len(expected_times))
+            npt.assert_equal(
+                segmented_dat.read(),
+                np.stack(
+                    [expected_times, 2.0 * expected_times, -expected_times],
+                    axis=1,
+                ),
+            )
+            # Select columns by name or index, in any order
+            npt.assert_equal(
+                segmented_dat.read(columns=["Other", 0]),
+                np.stack([-expected_times, expected_times], axis=1),
+            )
+            # Select a time range across segments
+            df = segmented_dat.to_dataframe(
+                columns=["Time", "Value"], time_range=(3.0, 10.5)
+            )
+            self.assertEqual(list(df.columns), ["Time", "Value"])
+            selected_times = expected_times[
+                (expected_times >= 3.0) & (expected_times <= 10.5)
+            ]
+            npt.assert_equal(df["Time"], selected_times)
+            npt.assert_equal(df["Value"], 2.0 * selected_times)
+            self.assertEqual(
+                segmented_dat.read(time_range=(20.0, 30.0)).shape, (0, 3)
+            )
+            with self.assertRaisesRegex(KeyError, "No column 'Nonexistent'"):
+                segmented_dat.read(columns=["Nonexistent"])
+        # Missing subfiles
+        with self.assertRaisesRegex(KeyError, "Unable to open subfile"):
+            SegmentedDat(segment_files, "Nonexistent")
+        with h5py.File(segment_files[2], "a") as open_file:
+            del open_file["Group/Values.dat"]
+        with self.assertRaisesRegex(KeyError, "Unable to open subfile"):
+            SegmentedDat(segment_files, "Group/Values")
+        with SegmentedDat(
+            segment_files, "Group/Values.dat", missing_ok=True
+        ) as segmented_dat:
+            self.assertEqual(len(segmented_dat), len(expected_times))
 
     def test_select_observation(self):
         with spectre_h5.H5File(
@@ -16,7 +16,11 @@ from spectre.Domain.Creators import Interval
 from spectre.Informer import unit_test_build_path
 from spectre.IO.H5 import ElementVolumeData, TensorComponent
 from spectre.Spectral import Basis, Mesh, Quadrature
-from spectre.Visualization.Render1D import render_1d_command
+from spectre.Visualization.Render1D import (
+    get_bounds,
+    get_bounds_parallel,
+    render_1d_command,
+)
 
 
 class TestRender1D(unittest.TestCase):
@@ -78,6 +82,24 @@ class TestRender1D(unittest.TestCase):
     def tearDown(self):
         shutil.rmtree(self.test_dir)
 
+    def test_get_bounds(self):
+        with spectre_h5.H5File(self.h5file, "r") as open_h5file:
+            volfile = open_h5file.get_vol("/VolumeData")
+            obs_ids = volfile.list_observation_ids()
+            x_bounds, y_bounds = get_bounds([volfile], obs_ids, ["U"])
+        np.testing.assert_allclose(x_bounds, [0.0, 1.0])
+        for num_processes in [1, 2]:
+            self.assertEqual(
+                get_bounds_parallel(
+                    [self.h5file],
+                    "VolumeData",
+                    obs_ids,
+                    ["U"],
+                    num_processes=num_processes,
+                ),
+                (x_bounds, y_bounds),
+            )
+
     def test_render_1d(self):
         # Can't easily test the layout of the plot, so we just test that the
         # script runs without error and produces output.
@@ -19,6 +19,7 @@ from spectre.PointwiseFunctions.Punctures import adm_mass_integrand
 from spectre.Spectral import Mesh
 from spectre.Visualization.TransformVolumeData import (
     Kernel,
+    integrate_volume_data,
     parse_pybind11_signatures,
     snake_case_to_camel_case,
     transform_volume_data,
@@ -214,6 +215,22 @@ class TestTransformVolumeData(unittest.TestCase):
         # particularly precise
         npt.assert_allclose(integrals["Sinusoid"], 64.0, rtol=1e-2)
 
+        # Integrate in parallel
+        for open_h5_file in open_h5_files:
+            open_h5_file.close()
+        for num_processes in [1, 2]:
+            parallel_integrals = integrate_volume_data(
+                self.h5_filename,
+                "/element_data",
+                kernels=kernels,
+                num_processes=num_processes,
+            )
+            self.assertEqual(
+                list(parallel_integrals.keys()), list(integrals.keys())
+            )
+            for name, integral in integrals.items():
+                npt.assert_allclose(parallel_integrals[name], integral)
+
     def test_cli(self):
         runner = CliRunner()
         cli_flags = [
@@ -270,6 +287,20 @@ class TestTransformVolumeData(unittest.TestCase):
         )
         self.assertEqual(result.exit_code, 0)
         self.assertIn("63.88", result.output)
+        result = runner.invoke(
+            transform_volume_data_command,
+            cli_flags
+            + [
+                "-k",
+                "sinusoid",
+                "--integrate",
+                "-j",
+                "2",
+            ],
+            catch_exceptions=False,
+        )
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("63.88", result.output)
 
         output_filename = os.path.join(self.test_dir, "integrals.h5")
         result = runner.invoke(